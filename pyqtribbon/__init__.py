@@ -2,3 +2,12 @@ from .constants import *  # noqa: F401, F403
 from .logger import *  # noqa: F401, F403
 from .ribbonbar import RibbonBar  # noqa: F401
 from .version import __version__  # noqa: F401
+
+
+def __getattr__(name: str):
+    # pyqtribbon.qt_exception_hook installs the exception hook lazily
+    if name == "qt_exception_hook":
+        from . import logger
+
+        return logger.qt_exception_hook
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,1358 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from qtpy import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x01\x03\
+\x0a\
+\x52\x69\x62\x62\x6f\x6e\x42\x61\x72\x20\x7b\x0a\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x6e\x6f\x6e\x65\x3b\x0a\x20\x20\
+\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x74\x72\x61\x6e\x73\x70\x61\x72\x65\x6e\x74\x3b\
+\x0a\x7d\x0a\x0a\x52\x69\x62\x62\x6f\x6e\x54\x69\x74\x6c\x65\x57\
+\x69\x64\x67\x65\x74\x20\x7b\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\
+\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x31\x30\x70\x78\x3b\
+\x0a\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\
+\x63\x6f\x6c\x6f\x72\x3a\x20\x74\x72\x61\x6e\x73\x70\x61\x72\x65\
+\x6e\x74\x3b\x0a\x7d\x0a\x0a\x52\x69\x62\x62\x6f\x6e\x53\x74\x61\
+\x63\x6b\x65\x64\x57\x69\x64\x67\x65\x74\x20\x7b\x0a\x20\x20\x20\
+\x20\x62\x6f\x72\x64\x65\x72\x3a\x20\x6e\x6f\x6e\x65\x3b\x0a\x20\
+\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\
+\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x62\x61\x63\x6b\
+\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x24\x62\
+\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x43\x6f\x6c\x6f\x72\x3b\x0a\
+\x7d\x0a\
+\x00\x00\x01\x9e\
+\x00\
+\x00\x05\x76\x78\x9c\xad\x54\x3d\x4f\xc3\x30\x10\x9d\xc9\xaf\x30\
+\x55\x47\x22\xb5\x20\x16\x57\x0c\x6d\x07\x96\x56\x02\x8a\xc4\x50\
+\x75\x70\x6c\x93\x5a\x38\x3e\xcb\x76\x50\x2b\xc4\x7f\xc7\x89\x13\
+\x52\xd2\x84\x0f\xd1\x2c\x71\xee\xfc\x9e\xdf\xbb\x3b\x27\x7a\x10\
+\x49\x02\x6a\xaa\xb5\x14\x94\x38\x01\x6a\x96\x3b\x07\x0a\xe3\x8c\
+\xab\x3c\x16\x8a\x15\x61\x30\xe8\x2d\x42\xfe\x11\x19\x49\x39\x46\
+\x0a\x14\x9f\x44\xef\x51\x14\xd0\x8f\x00\x32\xc0\xd6\x49\xf9\x5a\
+\xb9\xbd\xe4\x37\x83\x55\x46\xa4\x1c\x6c\xda\x5c\x17\x3f\xc0\x96\
+\x9c\x89\x3c\x3b\xc6\x55\x1a\x6c\x9e\x50\x50\xce\x80\x8c\xc1\x88\
+\x54\x28\x8c\x34\x61\x4c\xa8\x74\xd2\xce\x6b\xb0\xa2\xf0\x84\x91\
+\xdf\xb8\x75\x21\x5f\x2e\x31\x8a\xaf\xf5\xee\x17\x1e\x16\xc4\xa4\
+\x7c\xb0\x59\x6b\xd0\xb9\x5e\x02\xf3\xa1\xd1\xdf\x2d\x75\xb0\x5c\
+\x9e\xd6\x60\x02\xfe\xb8\x2c\x6c\x08\xeb\x23\x8b\x73\xe2\x78\x0a\
+\x66\x7f\x81\xbe\x7e\xaf\xa8\xa7\x92\x53\xc3\x49\x7f\x66\xee\x0f\
+\xe4\xca\xd9\x4a\x62\x02\x86\x71\x53\x0f\x42\x19\x21\xf4\x25\x35\
+\x90\x2b\x16\x53\x90\xe0\x73\xce\x10\x65\x35\x31\x1e\x76\x58\x67\
+\x92\xcc\x88\xc1\xd8\x91\xc4\x73\x9d\x55\xc6\x62\xc9\x9f\x7d\x4f\
+\xc6\xa3\x42\xf0\x67\xb0\xea\x54\x88\x76\x31\x60\xcb\x25\xa7\x8e\
+\xb3\x82\x2a\x68\x8a\x6b\xf3\x57\x7a\x87\x2c\x48\xc1\xd0\x90\x50\
+\xea\x45\xcc\x0b\x59\x3d\x3c\xe7\xdf\x10\xb5\x87\xfd\x00\xb6\x85\
+\x57\x5f\x85\x43\x70\x51\x8a\x4e\x4f\xfd\xea\x4a\x92\xb6\xb8\xbb\
+\x62\x50\x9e\x04\x4b\xb9\x6b\x95\x7c\xdc\x20\x43\xa8\x82\x36\x7b\
+\x62\x43\xfc\x05\xb2\x18\x95\xed\xef\x6e\xce\xb0\x09\x35\x47\xdf\
+\x2f\xfd\x38\xf6\x77\xf8\x04\xe4\xb8\x55\xaa\x0e\x6c\xbd\xa3\x5d\
+\x91\x5b\xff\x2f\xe1\x66\xff\xcf\x6a\xb4\xe9\xc2\x65\x3d\x31\xe9\
+\x42\x58\xd7\xd9\xbb\x7a\x94\x3e\x00\xf7\xbe\xdc\x2a\
+\x00\x00\x00\x64\
+\x0a\
+\x52\x69\x62\x62\x6f\x6e\x54\x61\x62\x42\x61\x72\x20\x7b\x0a\x20\
+\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\x3a\x20\x24\x74\
+\x61\x62\x46\x6f\x6e\x74\x53\x69\x7a\x65\x3b\x0a\x7d\x0a\x0a\x52\
+\x69\x62\x62\x6f\x6e\x54\x69\x74\x6c\x65\x4c\x61\x62\x65\x6c\x20\
+\x7b\x0a\x20\x20\x20\x20\x66\x6f\x6e\x74\x2d\x73\x69\x7a\x65\x3a\
+\x20\x24\x74\x69\x74\x6c\x65\x46\x6f\x6e\x74\x53\x69\x7a\x65\x3b\
+\x0a\x7d\x0a\
+\x00\x00\x05\x32\
+\x0a\
+\x52\x69\x62\x62\x6f\x6e\x41\x70\x70\x6c\x69\x63\x61\x74\x69\x6f\
+\x6e\x42\x75\x74\x74\x6f\x6e\x3a\x3a\x6d\x65\x6e\x75\x2d\x69\x6e\
+\x64\x69\x63\x61\x74\x6f\x72\x20\x7b\x0a\x20\x20\x20\x20\x69\x6d\
+\x61\x67\x65\x3a\x20\x6e\x6f\x6e\x65\x3b\x0a\x7d\x0a\x0a\x52\x69\
+\x62\x62\x6f\x6e\x54\x6f\x6f\x6c\x42\x75\x74\x74\x6f\x6e\x5b\x62\
+\x75\x74\x74\x6f\x6e\x53\x74\x79\x6c\x65\x3d\x22\x53\x6d\x61\x6c\
+\x6c\x22\x5d\x3a\x3a\x6d\x65\x6e\x75\x2d\x69\x6e\x64\x69\x63\x61\
+\x74\x6f\x72\x2c\x0a\x52\x69\x62\x62\x6f\x6e\x54\x6f\x6f\x6c\x42\
+\x75\x74\x74\x6f\x6e\x5b\x62\x75\x74\x74\x6f\x6e\x53\x74\x79\x6c\
+\x65\x3d\x22\x4d\x65\x64\x69\x75\x6d\x22\x5d\x3a\x3a\x6d\x65\x6e\
+\x75\x2d\x69\x6e\x64\x69\x63\x61\x74\x6f\x72\x20\x7b\x0a\x20\x20\
+\x20\x20\x73\x75\x62\x63\x6f\x6e\x74\x72\x6f\x6c\x2d\x6f\x72\x69\
+\x67\x69\x6e\x3a\x20\x70\x61\x64\x64\x69\x6e\x67\x3b\x0a\x20\x20\
+\x20\x20\x73\x75\x62\x63\x6f\x6e\x74\x72\x6f\x6c\x2d\x70\x6f\x73\
+\x69\x74\x69\x6f\x6e\x3a\x20\x72\x69\x67\x68\x74\x3b\x0a\x20\x20\
+\x20\x20\x72\x69\x67\x68\x74\x3a\x20\x2d\x35\x70\x78\x3b\x0a\x7d\
+\x0a\x0a\x52\x69\x62\x62\x6f\x6e\x54\x6f\x6f\x6c\x42\x75\x74\x74\
+\x6f\x6e\x5b\x62\x75\x74\x74\x6f\x6e\x53\x74\x79\x6c\x65\x3d\x22\
+\x4c\x61\x72\x67\x65\x22\x5d\x5b\x70\x6f\x70\x75\x70\x4d\x6f\x64\
+\x65\x3d\x22\x30\x22\x5d\x3a\x3a\x6d\x65\x6e\x75\x2d\x69\x6e\x64\
+\x69\x63\x61\x74\x6f\x72\x2c\x0a\x52\x69\x62\x62\x6f\x6e\x54\x6f\
+\x6f\x6c\x42\x75\x74\x74\x6f\x6e\x5b\x62\x75\x74\x74\x6f\x6e\x53\
+\x74\x79\x6c\x65\x3d\x22\x4c\x61\x72\x67\x65\x22\x5d\x5b\x70\x6f\
+\x70\x75\x70\x4d\x6f\x64\x65\x3d\x22\x32\x22\x5d\x3a\x3a\x6d\x65\
+\x6e\x75\x2d\x69\x6e\x64\x69\x63\x61\x74\x6f\x72\x20\x7b\x0a\x20\
+\x20\x20\x20\x73\x75\x62\x63\x6f\x6e\x74\x72\x6f\x6c\x2d\x6f\x72\
+\x69\x67\x69\x6e\x3a\x20\x70\x61\x64\x64\x69\x6e\x67\x3b\x0a\x20\
+\x20\x20\x20\x73\x75\x62\x63\x6f\x6e\x74\x72\x6f\x6c\x2d\x70\x6f\
+\x73\x69\x74\x69\x6f\x6e\x3a\x20\x62\x6f\x74\x74\x6f\x6d\x3b\x0a\
+\x20\x20\x20\x20\x62\x6f\x74\x74\x6f\x6d\x3a\x20\x2d\x35\x70\x78\
+\x3b\x0a\x7d\x0a\x0a\x52\x69\x62\x62\x6f\x6e\x43\x61\x74\x65\x67\
+\x6f\x72\x79\x2c\x20\x52\x69\x62\x62\x6f\x6e\x43\x61\x74\x65\x67\
+\x6f\x72\x79\x53\x63\x72\x6f\x6c\x6c\x41\x72\x65\x61\x2c\x20\x52\
+\x69\x62\x62\x6f\x6e\x43\x61\x74\x65\x67\x6f\x72\x79\x53\x63\x72\
+\x6f\x6c\x6c\x41\x72\x65\x61\x43\x6f\x6e\x74\x65\x6e\x74\x73\x20\
+\x7b\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x3a\x20\x6e\x6f\
+\x6e\x65\x3b\x0a\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\
+\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x74\x72\x61\x6e\x73\x70\
+\x61\x72\x65\x6e\x74\x3b\x0a\x7d\x0a\x0a\x52\x69\x62\x62\x6f\x6e\
+\x54\x61\x62\x42\x61\x72\x3a\x3a\x74\x61\x62\x20\x7b\x0a\x09\x70\
+\x61\x64\x64\x69\x6e\x67\x2d\x6c\x65\x66\x74\x3a\x20\x31\x30\x70\
+\x78\x3b\x0a\x09\x70\x61\x64\x64\x69\x6e\x67\x2d\x72\x69\x67\x68\
+\x74\x3a\x20\x31\x30\x70\x78\x3b\x0a\x7d\x0a\x0a\x52\x69\x62\x62\
+\x6f\x6e\x54\x61\x62\x42\x61\x72\x3a\x3a\x74\x61\x62\x3a\x73\x65\
+\x6c\x65\x63\x74\x65\x64\x20\x7b\x0a\x09\x62\x6f\x72\x64\x65\x72\
+\x2d\x62\x6f\x74\x74\x6f\x6d\x3a\x20\x33\x70\x78\x20\x73\x6f\x6c\
+\x69\x64\x20\x62\x6c\x75\x65\x3b\x0a\x7d\x0a\x0a\x52\x69\x62\x62\
+\x6f\x6e\x54\x61\x62\x42\x61\x72\x3a\x3a\x74\x61\x62\x3a\x21\x73\
+\x65\x6c\x65\x63\x74\x65\x64\x20\x7b\x0a\x09\x62\x6f\x72\x64\x65\
+\x72\x2d\x62\x6f\x74\x74\x6f\x6d\x3a\x20\x6e\x6f\x6e\x65\x3b\x0a\
+\x7d\x0a\x0a\x52\x69\x62\x62\x6f\x6e\x54\x61\x62\x42\x61\x72\x3a\
+\x3a\x74\x61\x62\x3a\x68\x6f\x76\x65\x72\x3a\x21\x73\x65\x6c\x65\
+\x63\x74\x65\x64\x20\x7b\x0a\x20\x20\x20\x20\x70\x61\x64\x64\x69\
+\x6e\x67\x2d\x6c\x65\x66\x74\x3a\x20\x31\x30\x70\x78\x3b\x0a\x09\
+\x62\x6f\x72\x64\x65\x72\x2d\x62\x6f\x74\x74\x6f\x6d\x3a\x20\x33\
+\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x67\x72\x61\x79\x3b\x0a\x7d\
+\x0a\x0a\x52\x69\x62\x62\x6f\x6e\x50\x6f\x70\x75\x70\x57\x69\x64\
+\x67\x65\x74\x20\x7b\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\
+\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\x64\x20\x67\x72\x61\x79\
+\x3b\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\
+\x69\x75\x73\x3a\x20\x35\x70\x78\x3b\x0a\x20\x20\x20\x20\x62\x61\
+\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\
+\x77\x68\x69\x74\x65\x3b\x0a\x7d\x0a\x0a\x51\x4d\x65\x6e\x75\x20\
+\x7b\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x3a\x20\x6e\x6f\
+\x6e\x65\x3b\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x72\
+\x61\x64\x69\x75\x73\x3a\x20\x35\x70\x78\x3b\x0a\x20\x20\x20\x20\
+\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\
+\x3a\x20\x77\x68\x69\x74\x65\x3b\x0a\x7d\x0a\x0a\x51\x4d\x65\x6e\
+\x75\x3a\x73\x65\x6c\x65\x63\x74\x65\x64\x20\x7b\x0a\x20\x20\x20\
+\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\
+\x72\x3a\x20\x23\x65\x30\x65\x30\x65\x30\x3b\x0a\x7d\x0a\x0a\x52\
+\x69\x62\x62\x6f\x6e\x47\x61\x6c\x6c\x65\x72\x79\x20\x7b\x0a\x20\
+\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\
+\x6f\x6c\x69\x64\x20\x67\x72\x61\x79\x3b\x0a\x20\x20\x20\x20\x62\
+\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x35\x70\
+\x78\x3b\x0a\x7d\x0a\x0a\x52\x69\x62\x62\x6f\x6e\x47\x61\x6c\x6c\
+\x65\x72\x79\x42\x75\x74\x74\x6f\x6e\x20\x7b\x0a\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x31\x70\x78\x20\x73\x6f\x6c\x69\
+\x64\x20\x67\x72\x61\x79\x3b\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\
+\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x35\x70\x78\x3b\x0a\
+\x7d\x0a\x0a\x52\x69\x62\x62\x6f\x6e\x47\x61\x6c\x6c\x65\x72\x79\
+\x4c\x69\x73\x74\x57\x69\x64\x67\x65\x74\x20\x7b\x0a\x20\x20\x20\
+\x20\x62\x6f\x72\x64\x65\x72\x3a\x20\x6e\x6f\x6e\x65\x3b\x0a\x7d\
+\x0a\
+\x00\x00\x02\x02\
+\x00\
+\x00\x07\x3b\x78\x9c\xad\x55\x4d\x6f\xdb\x30\x0c\x3d\xc7\xbf\x42\
+\x03\x76\xea\x1a\x34\xf1\x96\x1c\x5c\xec\xd0\xe6\x34\x60\xc0\xb6\
+\x34\x40\xcf\x94\xc5\x3a\xc2\x64\x51\x90\xe5\x35\xc5\xb0\xff\x3e\
+\x45\x8e\x3f\xeb\x64\x59\x5b\x9f\x8c\x47\xf2\xf1\xf1\xcb\x5e\x4b\
+\xce\x49\xdf\x18\xa3\x64\x0a\x4e\x92\xbe\x2d\x9d\x23\x7d\xc9\xd6\
+\xc1\xf0\x1d\x34\xaa\x6f\xa6\x35\xb0\xdf\x11\xf3\x0f\x27\x2b\xd0\
+\x26\x2c\x36\x3b\x56\x90\x92\x82\x71\x55\xe2\x75\xc7\x36\xb5\x20\
+\x64\x59\x24\x6c\x61\x76\xd7\xd1\x9f\x28\xfa\xb1\x21\x52\xb7\x60\
+\x5f\xce\xb0\x1e\xd7\x9a\x24\x39\xea\x72\x2a\xb5\xd8\xc3\x54\x27\
+\x90\x39\x64\x98\x30\x4d\x1a\x3b\xd1\x1b\xe0\xa7\x34\x98\xd2\x1a\
+\x35\xae\x22\x9e\xf5\x64\x6c\xa4\x53\xf8\x15\x38\xaa\x37\x20\x3b\
+\x25\xc9\xa2\x38\x87\x62\x05\x0e\x33\xb2\x4f\x47\x79\x32\x8b\xa8\
+\xff\x87\xe9\x2e\xb5\xa4\xd4\x8d\x45\x18\x70\x56\x2d\x0d\x08\xa4\
+\x3f\x33\x4b\xa5\x16\xd3\x94\x14\x79\x9b\xb3\xa0\x0b\x03\x16\xb5\
+\x3b\x49\xb9\x22\xed\xbc\x4f\xf1\x6a\xea\xb0\xa1\xc7\x77\xca\xd2\
+\xe3\xa9\xa2\x5b\x9e\x3b\xf4\xd4\x9d\xf5\x19\xdb\x4f\x2f\xe9\x9c\
+\x06\x06\x49\x61\x3f\x5e\x3f\x8c\xc0\xf5\xc5\x61\x7e\x2f\x45\x86\
+\x6e\x40\x38\x3b\x5b\x5c\x75\x81\xbd\xe5\xff\x67\x83\x6b\xff\xea\
+\x72\x7b\xe7\x7f\x6e\x6c\x92\x38\xe0\x3e\x68\xd2\x1f\xf0\xa4\x25\
+\x18\x84\x4e\x72\xb0\x99\xd4\x53\x47\x26\x94\xd7\x22\x56\x66\x5b\
+\x37\xc0\x14\x3e\x78\x68\xd9\x85\x38\x79\x9d\x79\xe3\xe7\x91\x47\
+\x29\xdc\x36\x61\xf3\x59\x1d\xba\xab\xa1\x78\xd1\x7a\x6d\xb1\xe2\
+\x8f\x17\x8d\xd7\x00\x32\x20\x84\xd4\xd9\x21\xe9\x7c\xd6\x03\x0f\
+\xea\x06\x68\xa8\x62\x80\xd5\x02\xe3\xe6\xbb\xd8\x76\x2a\x29\x50\
+\x61\xea\x50\x5c\xb2\x1e\xbc\xa5\x5f\x68\xdb\x36\xee\x79\x83\x8c\
+\x66\xc8\x55\x8a\x8e\x35\xe8\xe9\x9b\x87\xb9\xde\xd5\xc9\xf6\xc4\
+\x87\x31\x66\x16\x9e\x8e\xab\x0a\x0a\x8e\x4e\xee\x90\xbd\xae\xef\
+\x63\xb3\x9b\xef\x21\x4d\xbd\xcb\x6a\x9f\xa2\xf3\x2b\xe8\x7e\xbc\
+\x79\xbd\x5d\x93\xe7\xb7\x32\x9a\xe5\x79\x8d\xcb\x6e\x0b\x2a\x11\
+\xa3\x1e\x57\x17\x6c\xee\xdf\x58\xd8\x01\xf6\x81\x7d\xf2\xef\x0f\
+\xfe\xec\xab\x48\xf6\x39\x1c\x0c\x03\xa5\xc8\xff\x4d\x7c\xcd\xc0\
+\x7d\xf3\xd9\xc5\x55\x34\xa9\x17\x69\x59\x75\xf3\x2f\x5d\x72\x5f\
+\xa3\
+\x00\x00\x01\xfa\
+\x00\
+\x00\x07\x33\x78\x9c\xad\x55\xcb\x6e\xdb\x30\x10\x3c\x4b\x5f\xc1\
+\x5c\xd3\x18\xb1\xd5\xda\x07\x05\x39\x24\x39\x15\x28\xd0\xd6\x31\
+\xd0\x33\x29\x6e\x68\xa2\x14\x97\xa0\xa8\xc6\x41\xd1\x7f\x2f\x4d\
+\x99\x7a\x45\x76\xdd\xa6\x3a\x09\xb3\xbb\xb3\xb3\x2f\x69\x2d\x19\
+\x43\x7d\x67\x8c\x92\x05\x75\x12\xf5\x7d\xed\x1c\xea\x2b\xb2\x0e\
+\x86\x2f\x54\x83\xfa\x6c\x3a\x03\xf9\x99\x12\xff\x30\xb4\x1c\x6c\
+\x4e\x32\xb3\x23\x15\x2a\xc9\x09\x53\x35\xdc\xf4\x6c\x33\x4b\xb9\
+\xac\xab\x9c\x2c\xcd\xee\x26\xfd\x95\xa6\x5f\x37\x88\xea\x9e\xda\
+\x7f\x67\x58\x4f\x6b\xcd\xf3\x12\x74\x3d\x93\x9a\xef\x61\x8c\x09\
+\x64\x49\x05\xe4\x44\xa3\x86\x5e\xf4\x86\xb2\x53\x1a\x4c\x6d\x8d\
+\x9a\x56\x91\xcd\x07\x32\x36\xd2\x29\xf8\x44\x19\xa8\xff\x40\x76\
+\x4a\x92\x05\x7e\x0e\xc5\x03\x75\x20\xd0\xbe\x1c\xe5\x11\x16\x40\
+\xff\x0d\xd3\x63\x61\x51\xa9\x3b\x0b\x74\xc4\xd9\xb4\x34\x20\xb4\
+\xf8\x2e\x2c\xd6\x9a\xcf\x0a\x54\xe8\x6d\xce\x52\x5d\x19\x6a\x41\
+\xbb\x93\x94\x0f\xa8\x9d\xf7\xa9\xde\x4c\x1d\x36\xf4\xf8\x4e\x59\
+\x7c\x3e\x55\x74\xc7\xf3\x08\x9e\xba\xb7\x3e\x53\xfb\xe9\x25\x9d\
+\xd3\xc0\x20\x29\xec\xc7\xdb\x87\x11\xb8\x3e\x3a\x28\xbf\x49\x2e\
+\xc0\x8d\x08\xe7\x67\x8b\x6b\x2e\x70\xb0\xfc\x7f\x6c\x70\xf4\x6f\
+\x2e\x77\x70\xfe\xe7\xc6\xe6\xb9\xa3\xcc\x07\x25\xc3\x01\x27\x1d\
+\xc1\x28\x34\x29\xa9\x15\x52\xcf\x1c\x9a\x50\x5e\x87\x58\x29\xb6\
+\x6e\x84\x29\x78\xf2\xd0\xaa\x0f\x31\xf4\x3a\xcb\xd6\xcf\x23\xcf\
+\x92\xbb\x6d\x4e\x16\xf3\x18\xba\x8b\x50\xb6\xec\xbc\xb6\xd0\xf0\
+\x67\xcb\xd6\x6b\x04\x19\xca\xb9\xd4\xe2\x90\x74\x31\x1f\x80\x07\
+\x75\x23\x34\x54\x31\xc2\xa2\xc0\xac\xfd\x2e\x76\x9d\xca\x2b\x50\
+\x50\x38\xe0\x57\x64\x00\x6f\xf1\x07\xd8\xae\x8d\x7b\xde\x20\xa3\
+\x1d\x72\x93\xa2\x67\x0d\x7a\x86\xe6\x71\xae\x8b\x98\x6c\x4f\x7c\
+\x18\xa3\xb0\xf4\xe5\xb8\xaa\xa0\xe0\xe8\xe4\x0e\xd9\x63\x7d\xef\
+\x47\x1f\xf6\xf6\x17\xd0\xff\x68\xb3\xb8\x55\xc9\xeb\x1b\x99\x64\
+\x7f\x5d\xdb\xaa\x5f\x7a\x93\x7c\xd2\xe3\xfa\x92\x2c\xfc\x1b\x09\
+\xb3\x27\xef\xc8\x07\xff\xfe\xe4\xcf\xbd\x89\x24\xb7\xe1\x50\x08\
+\x55\x0a\xfd\x5f\xc4\xd7\x4a\x99\x6f\x3a\xb9\xbc\x4e\x93\xb8\x40\
+\xab\xa6\x8b\xbf\x01\x39\xa8\x5c\xba\
+\x00\x00\x00\xf8\
+\x0a\
+\x52\x69\x62\x62\x6f\x6e\x42\x61\x72\x20\x7b\x0a\x20\x20\x20\x20\
+\x62\x6f\x72\x64\x65\x72\x3a\x20\x6e\x6f\x6e\x65\x3b\x0a\x20\x20\
+\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\
+\x6f\x72\x3a\x20\x74\x72\x61\x6e\x73\x70\x61\x72\x65\x6e\x74\x3b\
+\x0a\x7d\x0a\x0a\x52\x69\x62\x62\x6f\x6e\x54\x69\x74\x6c\x65\x57\
+\x69\x64\x67\x65\x74\x20\x7b\x0a\x20\x20\x20\x20\x62\x6f\x72\x64\
+\x65\x72\x2d\x72\x61\x64\x69\x75\x73\x3a\x20\x31\x30\x70\x78\x3b\
+\x0a\x20\x20\x20\x20\x62\x61\x63\x6b\x67\x72\x6f\x75\x6e\x64\x2d\
+\x63\x6f\x6c\x6f\x72\x3a\x20\x74\x72\x61\x6e\x73\x70\x61\x72\x65\
+\x6e\x74\x3b\x0a\x7d\x0a\x0a\x52\x69\x62\x62\x6f\x6e\x53\x74\x61\
+\x63\x6b\x65\x64\x57\x69\x64\x67\x65\x74\x20\x7b\x0a\x20\x20\x20\
+\x20\x62\x6f\x72\x64\x65\x72\x3a\x20\x6e\x6f\x6e\x65\x3b\x0a\x20\
+\x20\x20\x20\x62\x6f\x72\x64\x65\x72\x2d\x72\x61\x64\x69\x75\x73\
+\x3a\x20\x31\x30\x70\x78\x3b\x0a\x20\x20\x20\x20\x62\x61\x63\x6b\
+\x67\x72\x6f\x75\x6e\x64\x2d\x63\x6f\x6c\x6f\x72\x3a\x20\x77\x68\
+\x69\x74\x65\x3b\x0a\x7d\x0a\
+\x00\x00\x02\x96\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x43\x00\x00\x00\x41\x08\x06\x00\x00\x00\x8a\x02\x19\x78\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
+\xa8\x64\x00\x00\x02\x2b\x49\x44\x41\x54\x78\x5e\xed\x9a\xdb\x4a\
+\xe4\x40\x14\x45\x5b\x1f\xbc\x31\xff\x3e\xe2\x05\x7d\x13\x66\xfe\
+\x60\x1e\x86\xf9\x28\x51\xc1\xdb\x9b\x7a\x16\x26\x18\xc2\x8e\x93\
+\x9c\x54\x55\x92\xe2\x2c\x58\x44\xba\x2b\xdb\xaa\x4d\x3a\x9a\x74\
+\x76\xc1\x17\x7b\xcd\xb6\xe5\xbd\xd9\xd6\x42\x7f\x7d\xdf\xb2\xdf\
+\x6c\x03\x23\xca\xe8\x10\x65\x74\x88\x32\x3a\x44\x19\x1d\xc6\xfe\
+\x35\x99\x74\x56\xde\x2a\x71\x64\x74\x88\x32\x3a\xa4\x2a\xa3\x8a\
+\x8f\xd1\xdc\x32\x7e\x98\x37\xe6\x8b\xf9\x68\xfe\x34\x0f\xcd\x2a\
+\xe0\x04\xaa\x1c\x82\x22\xfa\x63\xff\x9a\x55\x14\xd2\x5f\x58\xab\
+\x82\xa3\xea\xd5\x54\xe3\xab\x28\x44\x2d\x0c\x15\x94\xf1\x6c\xaa\
+\xf1\xb8\xf9\x42\xd4\xa2\x70\x88\x73\x53\x8d\x6f\xdd\x74\x21\x6a\
+\x41\x38\x04\x0b\x65\xc1\x6a\x9f\xd6\xcd\x16\xa2\x16\x83\xdf\x71\
+\x60\xfe\x31\xd5\x7e\xad\xff\xcc\x23\x73\x53\xa8\x85\xe0\xff\xa8\
+\xb2\x10\xb5\x08\x1c\x43\x75\x85\xa8\x05\xe0\x58\xaa\x2a\x44\x4d\
+\x1e\xa7\x50\x4d\x21\x6a\xe2\x38\x95\x2a\x0a\x51\x93\x46\x0f\x9b\
+\x2f\x44\x4d\x18\xbd\x2c\xf5\x7f\x08\x57\xd1\xb3\xaf\xa4\xd5\x64\
+\x71\x0e\x25\x0b\x39\x36\xaf\x4d\x2e\x13\xf0\xaa\x79\xcd\x85\x9a\
+\x28\xce\xa5\x54\x21\x17\x66\x3f\xf7\xcc\x74\xd1\x0f\x6a\x4d\x41\
+\x89\x42\xee\xcd\x7e\xe6\x9d\xe9\xa2\x1f\xd4\x9a\x8a\xdc\x27\x55\
+\x95\x87\x2e\x54\x10\xa6\x24\x67\x21\x2a\x0b\x5d\xa8\x20\x4c\x4d\
+\xae\x42\x54\x0e\xba\x50\x41\x98\x83\x1c\x85\xa8\x0c\x74\xa1\x82\
+\x30\x17\xa9\x0b\x51\xfb\xa3\x0b\x15\x84\x39\x49\x59\x88\xda\x17\
+\x5d\xa8\x20\xcc\x4d\xaa\x42\xd4\x7e\xe8\x42\x05\x61\x09\x52\x14\
+\xa2\xf6\x41\x17\x2a\x08\x4b\x31\xb7\x10\x35\x1e\x5d\xa8\x20\x2c\
+\xc9\x9c\x42\xd4\x58\x74\xa1\x82\xb0\x34\xde\x42\xd4\x38\x74\xa1\
+\x82\x70\x09\x3c\x85\xa8\x31\xe8\x42\x05\xe1\x52\x4c\x2d\x44\xbd\
+\x8f\x2e\x54\x10\x2e\xc9\x94\x42\xd4\x7b\xe8\x42\x05\xe1\xd2\x8c\
+\xbd\xfc\x57\xaf\xa3\x0b\x15\x84\x6b\x60\xcc\x11\x32\xa4\x0b\x15\
+\x84\x6b\xc1\x5b\x88\x0b\x15\x84\x6b\xc2\x53\x88\x0b\x15\x84\x6b\
+\x63\x6a\x21\x2e\x54\x10\xa6\x86\x3b\xd6\x3c\xdb\xa1\xee\x59\xe6\
+\xd0\x85\x0a\xc2\xd4\x70\x3b\x5f\xfd\x9e\x5c\x8e\x62\x89\x27\x84\
+\x79\xfc\xe9\xc9\x74\x7f\x9f\x31\x11\xd6\x34\xea\xa9\xc6\xb9\x8f\
+\x3e\x6e\x81\xd1\x5f\x15\x2c\x51\xc6\x9b\xf9\xeb\xf3\xc7\x22\xfc\
+\x6e\xb6\xab\xe5\xc4\xbc\x34\x1f\xcc\xee\x67\x3b\xa5\xb7\xe6\xa9\
+\x59\xea\xe3\x18\x04\x41\x10\x04\x41\x10\x04\x41\x90\x80\xdd\xee\
+\x03\xf7\x7e\xd0\x13\xee\x30\x20\x55\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x02\x97\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x02\x4c\x49\x44\x41\x54\x78\x9c\xed\xdd\x3b\x6e\
+\x13\x41\x00\x87\xf1\x0f\x8a\x18\x89\x88\xb8\x40\x22\x91\xb8\x00\
+\x94\xd0\xe3\xdc\x20\x5c\x80\xc7\x0d\x78\x44\x81\x4b\x01\x01\x4e\
+\x40\x43\xe0\x00\x3c\xab\x44\x02\x41\x65\x5e\x09\x75\x28\x16\x24\
+\x84\x32\x8e\xbc\xbb\xec\x7f\x6d\x7f\x3f\x69\x9a\x2d\x66\x66\xe7\
+\xb3\x12\x27\xc5\x2e\x48\x92\x24\x49\x92\x24\x69\x51\x9c\x68\x71\
+\xae\x21\x70\x15\xd8\x00\x2e\x00\xe7\x81\xd3\x2d\xce\x9f\xf4\x13\
+\xf8\x08\xbc\x01\x9e\xfc\x1e\xdf\xa2\x3b\xfa\xcb\x29\xe0\x1e\xf0\
+\x15\x38\x5c\x90\xf1\x05\xd8\x02\x06\x2d\x9c\x5f\x23\x6b\xc0\x4b\
+\xf2\x07\x92\x1a\x2f\x80\xd5\xc6\xa7\x58\xd3\x1a\xb0\x77\xcc\x06\
+\x17\x61\xec\x11\x88\x30\x60\xb1\x3f\xf9\xff\x8e\x1d\x3a\xfe\x71\
+\x74\xff\x3f\xdc\xc4\xac\x8f\xcd\x46\x27\x3a\x85\x21\x93\x7f\xe1\
+\x3e\x00\x46\xcc\xcf\x37\x20\xa8\xee\x65\x04\x3c\xa2\x7c\xdf\x63\
+\x60\xa5\x8b\xcd\xdc\x9c\xb0\x89\x3b\x5d\x6c\x20\x6c\x93\xf2\xfd\
+\x5f\xef\x62\x03\xdb\x85\xc5\x1f\x76\xb1\x78\x4f\x44\xcf\xe0\x7d\
+\x61\xf1\x2b\x5d\x2c\xde\x13\x23\x8e\x3e\x83\x77\x5d\x2c\xbe\x5f\
+\x58\x7c\xb9\x8b\xc5\x7b\x62\x99\xa3\xcf\x60\x7f\xda\x89\xea\xfc\
+\x2b\xe2\xb0\xc5\xb9\x66\x59\x2b\xe7\x70\xb2\x85\x8d\xa8\x01\x03\
+\x84\x19\x20\xcc\x00\x61\x06\x08\x33\x40\x98\x01\xc2\x0c\x10\x66\
+\x80\x30\x03\x84\x19\x20\xcc\x00\x61\x06\x08\x33\x40\x98\x01\xc2\
+\x0c\x10\x66\x80\x30\x03\x84\x19\x20\xcc\x00\x61\x06\x08\x33\x40\
+\x98\x01\xc2\x0c\x10\x66\x80\x30\x03\x84\x19\x20\xcc\x00\x61\x06\
+\x08\x33\x40\x98\x01\xc2\x0c\x10\x66\x80\x30\x03\x84\x19\x20\xcc\
+\x00\x61\x06\x08\x33\x40\x98\x01\xc2\x0c\x10\x66\x80\x30\x03\x84\
+\x19\x20\xcc\x00\x61\x06\x08\x33\x40\x98\x01\xc2\x0c\x10\x66\x80\
+\xb0\x3a\x01\x0e\x0a\xd7\x17\xe9\x91\x65\x67\x0a\xd7\x7f\x4c\x3b\
+\x51\x9d\x00\x9f\x0a\xd7\x2f\xd7\x98\x6b\x56\x5d\x2a\x5c\xff\x3c\
+\xed\x44\x75\x02\xbc\x2e\x5c\xbf\x55\x63\xae\x59\x75\xbb\x70\xfd\
+\x55\x17\x8b\xdf\xa0\x07\x8f\xef\x0d\xda\xa2\x7c\xff\xd7\xba\xd8\
+\xc0\x90\xea\xf9\xf9\xa5\x4d\x6c\x03\xeb\xcc\xdf\xa3\x8b\xd7\x81\
+\xc7\xf4\xe0\xd1\xc5\x30\xf9\x53\xb0\xa8\xa3\xd3\xc7\x36\x0f\xa8\
+\x5e\x5e\x90\xbe\xe9\xbe\x8c\xe7\xc0\x52\xa3\x13\xad\x61\x15\xd8\
+\x6d\xb8\xf1\x79\x18\xbb\xc0\xb9\x86\x67\x59\xdb\x59\xe0\xd9\x31\
+\x1b\x9c\xe7\xb1\x43\xf0\x15\x26\x7f\x2c\x51\x7d\xfb\x19\x93\x3f\
+\x90\xae\xc6\x18\xb8\x4b\x0b\x3f\x76\xda\x7c\xde\xf3\x0a\xd5\x2b\
+\xac\x36\x80\x8b\x54\xaf\xb1\x9a\x97\xbf\x8e\x0f\x80\x0f\xc0\x5b\
+\xaa\x6f\x42\x4f\x81\xef\xd1\x1d\x49\x92\x24\x49\x92\x24\x69\xe6\
+\xfc\x02\xe1\x25\x00\x82\x22\xb9\xd2\x16\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\xef\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x02\xa4\x49\x44\x41\x54\x78\x9c\xed\xdd\x4b\x4e\
+\x14\x51\x18\xc5\xf1\x3f\x0c\x68\x51\x90\x1e\x98\x08\x89\x1b\xd0\
+\xa1\xce\x6d\x76\x80\x1b\xf0\xb1\x03\x44\x82\xee\xc3\x47\xc2\x98\
+\xb1\x8a\xba\x02\x27\xa2\x0b\xf0\x39\x82\x04\x23\xa3\x06\x95\xd6\
+\x21\x38\x28\x49\x8c\xe1\x36\x5d\x55\x97\x7b\xea\x71\x7e\xc9\x37\
+\xa9\x74\xee\xeb\x54\xaa\xaa\x3b\xe9\x5b\x60\x66\x66\x66\x66\x66\
+\x66\x66\x66\x6d\x31\x16\xb1\xad\x2e\x70\x03\x58\x00\x2e\x03\x97\
+\x80\x73\x11\xdb\x57\xfa\x05\x7c\x05\x3e\x02\x2f\xff\xd6\x77\xe9\
+\x88\xfe\x71\x06\xb8\x0f\xec\x01\x87\x2d\xa9\x5d\x60\x05\xe8\x44\
+\x58\xbf\x52\xe6\x80\x77\xe8\x17\x44\x55\x6f\x81\xd9\xd2\xab\x58\
+\xd0\x1c\xb0\x75\xc2\x00\xdb\x50\x5b\x08\x42\xe8\xd0\xee\x33\xff\
+\xff\xda\x20\xf1\xe5\xe8\xc1\x29\x4c\xa2\xee\xb5\x5c\x6a\x45\x73\
+\xe8\x32\xfc\x86\xfb\x14\xe8\xd1\x9c\x27\x20\xc8\xe6\xd2\x03\x9e\
+\x13\x9e\x77\x1f\x98\x49\x31\x98\x3b\x43\x06\xb1\x94\x62\x00\x62\
+\xcb\x84\xe7\x7f\x2b\xc5\x00\xd6\x03\x9d\x3f\x4b\xd1\x79\x45\x48\
+\xd7\xe0\x4b\xa0\xf3\xeb\x29\x3a\xaf\x88\x1e\xc7\xaf\xc1\xe7\x14\
+\x9d\xef\x07\x3a\x9f\x4a\xd1\x79\x45\x4c\x71\xfc\x1a\xec\xe7\x6d\
+\xa8\xc8\x4f\x11\x87\x11\xdb\xaa\xb3\x28\xeb\x30\x1e\x61\x20\x56\
+\x82\x03\x10\x73\x00\x62\x0e\x40\xcc\x01\x88\x39\x00\x31\x07\x20\
+\xe6\x00\xc4\x1c\x80\x98\x03\x10\x73\x00\x62\x0e\x40\xcc\x01\x88\
+\x39\x00\x31\x07\x20\xe6\x00\xc4\x1c\x80\x98\x03\x10\x73\x00\x62\
+\x0e\x40\xcc\x01\x88\x39\x00\x31\x07\x20\xe6\x00\xc4\x1c\x80\x98\
+\x03\x10\x73\x00\x62\x0e\x40\xcc\x01\x88\x39\x00\x31\x07\x20\xe6\
+\x00\xc4\x1c\x80\x98\x03\x10\x73\x00\x62\x0e\x40\xcc\x01\x88\x39\
+\x00\x31\x45\x00\x67\x81\x27\x64\x3b\x4e\xa9\x37\xd8\x38\xaa\x3d\
+\xe0\x31\x30\x79\x8a\xf3\x8e\x26\x34\x89\x51\xad\x0e\x69\x43\x5d\
+\xab\x09\xd7\x01\x48\xff\x47\xed\x71\x60\x40\x75\xcf\xb4\xdf\xc0\
+\x34\x70\x30\xc2\x67\xfd\x47\xed\x26\x48\x1d\xc0\x01\xb0\x96\xb8\
+\xcf\x3c\xd6\x18\xed\xec\x97\x2a\x7b\xed\x9b\x04\x1e\x51\xad\x5d\
+\x16\x77\x81\x87\xe4\xbb\x34\xd6\xf2\x1e\xd0\x24\xbe\x07\x34\x81\
+\x03\x10\x73\x00\x62\x0e\x40\xac\x48\x00\x83\xc0\xf1\x36\x6d\x59\
+\x76\x3e\x70\xfc\x67\xde\x86\x8a\x04\xf0\x2d\x70\xfc\x5a\x81\xb6\
+\xea\xea\x6a\xe0\xf8\x4e\xde\x86\x8a\x04\xf0\x21\x70\x7c\xb1\x40\
+\x5b\x75\x75\x37\x70\xfc\x7d\x8a\xce\x6f\x13\xfe\x12\x92\x6c\xfb\
+\x5e\xa1\x15\xc2\xf3\xbf\x99\x62\x00\x5d\xb2\x6f\x8e\xa1\x41\xac\
+\x03\xf3\x34\x6f\xeb\xe2\x79\xe0\x05\xe1\x79\x27\xdb\xba\x18\x86\
+\x9f\x05\x6d\xad\xa4\xdb\x36\x77\xc8\x5e\x5e\xa0\x9e\x74\x55\xea\
+\x0d\x30\x51\x6a\x45\x0b\x98\x05\x36\x4b\x0e\xbc\x09\xb5\x09\x5c\
+\x2c\xb9\x96\x85\x5d\x00\x5e\x9f\x30\xc0\x26\xd7\x06\xc2\x57\x98\
+\x1c\x99\x20\x7b\xfa\xe9\xa3\x5f\x90\x54\xd5\x07\xee\x11\xe1\xb2\
+\x13\xf3\x27\xe4\x19\xb2\x57\x58\x2d\x00\x57\xc8\x5e\x63\xd5\x94\
+\x6f\xc7\x03\x60\x1b\xf8\x44\xf6\x24\xf4\x0a\xf8\x21\x1d\x91\x99\
+\x99\x99\x99\x99\x99\x99\x99\xd5\xce\x1f\x04\x30\x93\x99\xe2\x44\
+\x30\x4b\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\x51\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x04\x06\x49\x44\x41\x54\x78\x9c\xed\x9d\xcf\x8b\
+\x4d\x61\x18\xc7\x3f\x73\x0d\x63\xae\xc1\x8e\xfc\x48\x29\x52\xfe\
+\x00\xc5\x4c\xc2\x82\x90\x85\x15\x76\x62\x61\x43\x14\x16\x64\x65\
+\x67\xe1\x47\x28\x4a\x58\x90\x95\x28\xca\xef\xb2\x20\xa5\x28\x16\
+\x4a\xc8\xef\xfc\xce\x6f\x0d\x46\xc6\xe2\xbd\x27\xb7\x3b\xef\x7b\
+\xe6\xdc\x73\xcf\xfb\x3e\xf7\x9c\xfb\x7c\xea\xd9\xdc\xa6\xf3\x7c\
+\x9f\xef\xf3\xdc\xf3\x9e\x39\xe7\x3d\x33\xa0\x28\x8a\xa2\x28\x8a\
+\xa2\x28\x8a\xa2\x28\x8a\xa2\xb4\x0a\x6d\xd2\x02\x32\x62\x24\xd0\
+\x03\xcc\x02\xa6\x01\x53\x81\x31\x40\x27\x30\x02\xf8\x01\x7c\x05\
+\x5e\x01\x0f\x80\x7b\xc0\x35\xe0\x16\xf0\x47\x40\x6f\xa6\x94\x84\
+\xf2\x8e\x06\x56\x01\x57\x30\x26\xf6\xa7\x88\xaf\xc0\x71\x60\x31\
+\xd0\x1e\x56\x7e\xe3\x74\x02\xfb\x81\xcf\x95\xd8\x57\xf9\xcc\x37\
+\x13\x81\x9d\x18\xf3\xd2\x98\xee\x8a\x27\xc0\x3a\xa0\x1c\xa0\x86\
+\x4c\xd8\xc3\xc0\x22\x76\x79\xcc\x57\x06\xb6\x03\xbd\x96\xbc\x59\
+\xc6\x4b\x60\x05\x39\x38\x3d\xbf\x61\xa0\xf8\xd7\x9e\x72\x75\x63\
+\x26\xd4\xa7\xf1\xb5\x71\x19\x18\xef\xa9\x9e\x4c\x70\x09\xcf\x92\
+\x36\x60\x2b\xd0\x17\x93\xcf\x67\xbc\x03\x16\x64\x5c\x53\x66\xf8\
+\x6e\x40\x3b\x70\x34\x26\x4f\x6d\x3c\x07\x0e\x03\x2b\x81\x19\x98\
+\xab\xa0\xa1\x95\x63\x95\x31\x6b\xc7\x5c\x60\x3d\x70\x8a\xe4\x6b\
+\x48\x1f\xb0\x3a\xc3\xba\x32\xc3\x67\x03\x3a\x80\xb3\x31\x39\xaa\
+\xcd\x39\x01\xcc\xa6\xfe\xab\xb1\x4e\x60\x39\x70\x23\x41\x9e\xbf\
+\xc0\xe6\x46\x0a\xf2\x81\xaf\x06\x74\x00\xe7\x62\x8e\x1f\xc5\x49\
+\x60\x72\x06\xf9\xc0\x7c\x33\xee\x0e\x92\xef\x2f\x4d\xf6\x4d\xf0\
+\xd1\x80\x24\xe6\xbf\x05\x16\x35\x98\xc7\x46\x3b\xb0\x85\xf8\xf5\
+\xa6\x8f\x26\x5a\x13\xb2\x6e\x40\x12\xf3\x6f\x02\xe3\x1a\xc8\x91\
+\x84\x6e\xcc\xe2\x1b\x37\x00\xbe\x35\x24\x22\xcb\x06\x24\x31\xff\
+\x22\xe6\xb6\x42\x08\xa6\x01\xcf\x62\xb4\x5c\x0a\xa4\x23\x96\xac\
+\x1a\x30\x0c\x38\x13\x73\xbc\x7e\xe0\x02\x30\xbc\x71\xc9\x75\x31\
+\x05\xfb\xef\x3a\x51\x2c\x0b\xac\x67\x00\x59\x34\x20\xc9\xe4\x9f\
+\xab\xfc\x9c\x04\xdd\xb8\xd7\x84\x17\x08\xdf\xb6\x68\xb4\x01\xcd\
+\x6e\x7e\xc4\x56\xdc\xfa\xd6\x0a\xea\x6a\xa8\x01\xcd\x7a\xda\xb1\
+\x31\x04\xb8\x83\x5d\xe3\x63\x04\xef\xa2\xa6\x6d\x40\x5e\x26\xbf\
+\x9a\xb9\xb8\xb5\xfa\xb8\x24\x4e\x44\x9a\x06\xe4\x69\xf2\x6b\xb9\
+\x8e\x5d\xef\x31\x29\x41\xf5\x36\x20\x8f\x93\x5f\xcd\x32\xec\x9a\
+\xbf\x20\x74\x1a\xaa\xa7\x01\x79\x9e\xfc\x88\xe1\x18\xb3\x6d\xda\
+\x67\x48\x08\x4a\xda\x80\xbc\x4f\x7e\x35\xa7\xb1\xeb\xdf\x28\x21\
+\x26\x49\x03\x8a\x64\x3e\xc0\x06\xec\x35\x1c\x95\x10\x33\x58\x03\
+\x8a\x70\xda\xa9\x65\x1e\xf6\x3a\xae\x49\x88\x89\x6b\x40\xd1\x26\
+\x3f\x62\x12\xf6\x5a\x9e\x4a\x88\x71\x19\x5b\xc4\xc9\x8f\x28\x63\
+\xaf\xe7\x83\x84\x98\xb8\xc9\x2e\xda\xe4\x47\xb4\x61\x1e\xcc\xd4\
+\xd6\xd4\x2b\x21\x26\xce\xe4\xa2\x4d\x7e\x44\x07\xf6\xba\x3e\x49\
+\x88\xa9\xd7\xfc\x3c\x4f\x7e\xc4\x58\xec\xb5\xbd\x90\x10\xd3\x6a\
+\xe6\x03\xcc\xc4\x5e\xdf\xed\xb4\x07\x0c\xb1\xaf\xf3\x3c\xb0\x14\
+\xf8\x15\x20\x97\x6f\xa6\x3b\x3e\x7f\x98\xf6\x80\x21\x1a\xb0\x10\
+\xf8\x49\xba\x35\xc3\x15\x9f\x30\xfb\x52\x43\xec\x45\xad\xa6\xc7\
+\xf1\xf9\xfd\xa0\x2a\x2a\x64\x69\x68\xda\x38\xe8\xbd\xca\xff\x94\
+\x30\xfb\x46\x6d\x3a\xe6\x07\xd4\x01\x98\xcb\x31\x69\xf3\xfb\x31\
+\xfb\xfe\x43\x6d\x8f\x9f\xe3\xd0\xf0\x1b\xe8\x4a\x7b\xd0\xb4\xe2\
+\x4b\x98\xd3\x4a\x2b\xb1\xc6\xf1\xf9\x55\xe0\x7b\x48\x21\x11\xf5\
+\xec\xdb\xf4\x15\x07\xbc\x57\x69\x98\x82\xfb\x25\x90\x95\x81\x34\
+\x0c\xa0\x0b\x38\x82\xff\xfd\xfa\xb6\xf8\x08\xec\x25\xdc\x22\xec\
+\xba\x0d\xfd\x19\x18\x15\x48\x43\xcb\xb2\x04\xf7\x20\xec\x10\xd4\
+\xd5\x12\x4c\x00\xde\xe3\xbe\x00\x68\x8a\x2d\x8a\x45\xa5\x4c\xfc\
+\xd6\xf5\x6d\x72\xd2\x8a\x4f\x07\x66\x2f\xaa\xcb\xfc\x47\xe4\xfb\
+\xa6\x62\x53\x33\xd8\xf3\x8c\x3e\xcc\x3d\x21\xc5\x03\x49\x9e\xe4\
+\x6d\x12\x53\x57\x70\x92\x3c\xc9\x3b\x24\xa6\xae\xe0\x24\x99\xfc\
+\x33\xe4\xf0\x6d\xfa\x3c\x50\xe4\x67\xd8\x4d\x8f\x9a\x2f\x88\x9a\
+\x2f\x88\x9a\x2f\x88\x9a\x2f\x88\x9a\x2f\x88\x9a\x2f\x88\x9a\x2f\
+\x88\x9a\x2f\x88\x9a\x2f\x88\x9a\x2f\x88\x9a\x2f\x88\x9a\x2f\x88\
+\x9a\x2f\x88\x9a\x2f\x88\x9a\x2f\x88\x9a\x2f\x88\x9a\x2f\x88\x9a\
+\x2f\x88\x9a\x2f\x88\x9a\x2f\x88\x9a\x2f\x88\x9a\x2f\x88\x9a\x2f\
+\x48\x51\xff\xf0\x47\x6e\xd8\x87\x9a\x2f\x46\x09\xf3\x22\x84\x9a\
+\x2f\x44\x09\xf7\x3b\x68\x6a\x7e\x20\x6c\x6f\x63\xaa\xf9\x01\xe9\
+\xc2\x34\xa1\x17\xf8\x06\xec\x46\xcd\x17\xa1\xe9\xff\xad\x94\xa2\
+\x28\x8a\xa2\x28\x8a\xa2\x28\x8a\x92\x03\xfe\x01\x32\x2e\x76\x21\
+\xaa\x00\x79\xb4\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x01\xbd\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x01\x72\x49\x44\x41\x54\x78\x9c\xed\xdb\xbd\x4a\
+\x03\x61\x18\x44\xe1\x13\x0b\xa3\xe0\x7d\x2b\x08\x62\xa7\x55\x2e\
+\xc2\x22\x78\x47\x36\x16\x62\x04\xcb\xb5\x88\x8d\x81\xfc\x14\x92\
+\x19\xf6\x3b\x0f\xd8\xa5\x78\x39\x13\x36\x36\x0b\x92\x24\x49\x1a\
+\xdb\x12\xb8\x07\xde\x81\x2f\xe0\x09\xb8\x8e\x5e\x34\x90\x25\xb0\
+\x06\xa6\x9d\xbf\xe7\xe4\x51\xa3\xd8\x17\x7f\x02\x3e\x83\x77\x0d\
+\xe1\x50\xfc\x09\xf8\xc8\x9d\x36\x7f\xc7\xe2\x4f\xc0\x43\xec\xba\
+\x99\x3b\x25\xfe\xfa\xf7\x73\xfa\x67\x97\xc0\x0b\x87\xe3\xbf\x02\
+\x57\xa9\x03\xe7\xcc\xf8\x41\xc6\x0f\x32\x7e\x90\xf1\x83\x8c\x1f\
+\x64\xfc\x20\xe3\x07\x19\x3f\xc8\xf8\x41\xc6\x0f\x32\x7e\x90\xf1\
+\x83\x8c\x1f\x64\xfc\x20\xe3\x07\x19\x3f\xc8\xf8\x41\xc6\x0f\x32\
+\x7e\x90\xf1\x83\x8c\x1f\x64\xfc\x20\xe3\x07\x19\x3f\xc8\xf8\x41\
+\xc6\x0f\x32\x7e\x90\xf1\x83\x8c\x1f\x64\xfc\x20\xe3\x07\x19\x3f\
+\xc8\x37\x53\xc2\xee\x30\x7e\xd4\x1b\x3e\x76\xfe\xb8\x48\x1f\xa0\
+\xf3\xba\xc5\x47\x50\x94\x3f\xc2\x05\xfc\x37\xb4\x80\x23\x14\x70\
+\x84\x02\x8e\x50\xc0\x11\x0a\x38\x42\x01\x47\x28\xe0\x08\x05\x1c\
+\xa1\x80\x23\x14\x70\x84\x02\x8e\x50\xc0\x11\x0a\x38\x42\x01\x47\
+\x28\xe0\x08\x05\x1c\xa1\x80\x23\x14\x70\x84\x02\x8e\x50\xc0\x11\
+\x0a\x38\x42\x01\x47\x28\xe0\x08\x05\x1c\xa1\x80\x23\x14\x70\x84\
+\x02\x8e\x50\xc0\x11\x0a\x38\x42\x01\x47\x28\xe0\x08\x05\x1c\xa1\
+\x80\x6f\xea\x14\x38\x65\x84\xc7\xd8\x75\x83\x38\x36\xc2\x06\x58\
+\xc4\xae\x1b\xc4\xa1\x11\xbe\xf1\x55\xde\xb3\xd8\x37\xc2\x2a\x79\
+\xd4\x68\x96\x6c\x9f\xf9\x1b\xb6\xdf\xfc\x15\x70\x13\xbd\x68\x50\
+\x0b\x7c\xee\x4b\x92\x34\x7f\x3f\xeb\xba\xa5\x49\xc4\xde\xdf\xb9\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\x55\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
+\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
+\xa8\x64\x00\x00\x01\xea\x49\x44\x41\x54\x78\x5e\xed\xda\xcb\x4a\
+\xc3\x40\x14\xc6\xf1\xe8\xc2\xeb\x83\x0b\x22\xb8\x10\x41\x10\x5c\
+\xf8\x08\x2e\xc4\x27\x72\x25\x28\xde\xba\xd4\x73\x68\x06\x31\x99\
+\x24\x33\xe9\x4c\x32\x97\xff\x0f\x3e\xda\xd5\xc0\xf9\x4e\x1b\x4a\
+\xd2\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\xa8\xd6\x89\xe4\x5a\
+\xf2\x26\xf9\x21\xb3\xa3\xfd\x69\x8f\xda\xa7\x97\x1b\x89\xed\x40\
+\x32\x2f\xda\x67\xcf\x5e\xfb\x6a\xf3\x2d\x39\xde\xbe\x45\x00\x1b\
+\x49\xef\x5b\xb0\xdf\xbe\x62\x25\x63\x0b\xb8\x6f\x5f\x11\x86\x77\
+\x9f\x7a\xf9\xb9\x92\xbc\x4a\x6c\xd7\x34\xe2\x16\xed\x4f\x7b\xe4\
+\x72\x0e\x00\x00\x00\x00\x00\x50\x2e\xbd\xd5\x3f\x76\xbb\x7f\x92\
+\xde\x3c\xba\x95\x7c\x49\x5e\x24\xe7\x92\x43\x09\xc6\x69\x47\x17\
+\x12\xbd\x09\xa7\xcf\x00\xee\x24\xa7\x12\x6f\x5a\x7e\xf7\xce\xde\
+\xa3\x84\x25\x0c\xd3\x6e\xb4\xa3\x6e\x6f\xba\x04\x2f\xfa\x9c\xe0\
+\x53\xd2\x3d\x48\xc3\x12\xec\x86\xca\xd7\xe8\x55\xc4\xfb\xe1\xd7\
+\xbb\xc4\x76\x98\x86\x25\xfc\x37\x56\xbe\xe6\x43\xe2\xed\x52\x62\
+\x3b\xcc\x84\x25\x6c\x4d\x95\xaf\xd1\x2e\xbd\xb9\x1c\x5c\xfb\x12\
+\xa2\x77\x74\x20\x79\x90\xd8\x0e\x36\x79\x92\x1c\x49\x6a\xb3\x58\
+\x37\x2c\xa1\x6f\xf1\x4e\x58\xc2\x9f\xd5\xba\x60\x09\x09\x74\x50\
+\xf3\x12\x92\x99\xbd\xc6\x25\x24\x37\x73\x4d\x4b\x48\x76\xd6\x1a\
+\x96\x90\xfc\x8c\x25\x2f\x21\x9b\xd9\x4a\x5c\x42\x76\x33\x95\xb4\
+\x84\x6c\x67\x29\x61\x09\xd9\xcf\x90\xf3\x00\xc5\x7c\x8b\x73\x1c\
+\xa4\x98\xf2\x8d\x9c\x06\x2a\xae\x7c\x23\x87\xc1\x8a\x2d\xdf\x48\
+\x79\xc0\xe2\xcb\x37\x52\x1c\xb4\x9a\xf2\x8d\x94\x06\xae\xae\x7c\
+\x23\x85\xc1\xab\x2d\xdf\x58\xb3\x80\xea\xcb\x37\xd6\x28\x82\xf2\
+\x3b\x96\x2c\x84\xf2\x07\x2c\x51\x0c\xe5\x4f\x88\x59\x10\xe5\x3b\
+\x8a\x51\x14\xe5\x7b\x0a\x59\x18\xe5\xcf\x14\xa2\x38\xca\xdf\xd1\
+\x2e\x05\x52\x7e\x20\x73\x8a\xa4\xfc\xc0\x7c\x0a\xa5\xfc\x48\x5c\
+\xff\x7b\x1f\xf5\xff\xf9\xb5\x73\xf9\x74\x8f\x85\x4f\x7e\x00\x73\
+\x97\x40\xf9\x01\xf9\x2e\x81\xf2\x23\x70\x5d\x02\xe5\x47\x34\xb5\
+\x04\xca\x5f\xc0\xd0\x12\x28\x7f\x41\xfa\xb3\xf2\x4c\xf2\xdc\x46\
+\xdf\xf3\x53\x13\x00\x00\x00\x00\x00\x00\x00\x00\x9b\xa6\xf9\x05\
+\x87\x2a\xa7\xa7\xac\xd4\x37\xe6\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x09\x49\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x08\xfe\x49\x44\x41\x54\x78\x9c\xed\x9d\x7f\x70\
+\x14\xe5\x19\xc7\x3f\xcf\x6e\x08\x60\x05\x12\x18\xa6\x4e\x5b\x05\
+\xa6\x22\x8c\x81\x21\x94\x32\xca\x0f\x2b\x02\x29\x50\x3a\x58\x41\
+\x04\x02\x76\x32\xa5\xa1\x20\x1d\xdb\xd1\x01\x6c\x3b\xa5\x30\x53\
+\xc7\x1f\x74\x6c\xfd\xc1\x60\xa5\x62\xe4\x47\x08\x06\x50\x42\x21\
+\x68\x82\x52\x35\x14\x6b\xa6\x04\x14\x04\x4a\x05\xfb\x07\xff\x11\
+\x52\xa8\x23\x10\x6e\x9f\xfe\x91\xbb\xdc\xe5\x72\x3f\x76\xef\xf6\
+\xb8\x3d\xb2\x9f\x99\x9d\xc9\xee\x3e\xef\xf3\x3e\xfb\xbe\xfb\x7e\
+\xdf\x67\x7f\x5d\xc0\xc7\xc7\xc7\xc7\xc7\xc7\xc7\xc7\xc7\xc7\xc7\
+\xc7\xc7\xa7\x2b\x21\xd9\x0e\x20\x3b\xa8\xdc\xf6\x28\xdf\x09\x28\
+\xdf\x15\x8b\x82\xb4\x5c\x09\x17\x2c\xa5\xf1\xdc\x5a\xf9\x67\x6a\
+\xc5\xbb\x18\xdf\x7a\x54\x1f\x50\xe5\x29\x60\x88\xcb\xae\x4f\xa8\
+\xf2\xab\x73\x2f\xc9\x5b\x4e\x0a\x75\xa1\x0e\x50\xb9\x75\x29\x6b\
+\x10\x1e\xcf\x64\x2d\xa2\xac\xf9\xcf\x5a\x59\x6e\xdb\x3e\x93\xc1\
+\x78\x89\xdb\x96\xea\x0a\x81\xa7\x23\x36\x5d\x00\xfe\x2a\x70\x2e\
+\x1d\xbf\xaa\x7c\x13\x61\x3a\x50\xd8\xbe\x51\x58\xf6\xc5\x4b\xf2\
+\x07\x3b\xe5\xbb\x44\x07\x0c\xf8\xb9\x0e\x32\x2d\x3e\x03\xba\x03\
+\x88\x50\xad\xad\x94\x7f\xfe\x8a\xfc\xd7\x0d\xff\x03\x7f\xa9\x05\
+\xc6\x55\xd6\x03\x0f\x06\x37\x5d\x56\x61\xe8\x99\xb5\xf2\x45\xb2\
+\xb2\x86\x1b\x01\x78\x9d\xfc\x00\x8f\x18\x4a\x77\x43\xc1\x50\x1a\
+\x6e\xed\x4f\xa9\x5b\x8d\x0f\x70\xf6\x4f\xd2\x52\x78\x8d\x52\x43\
+\x39\x14\xac\xa3\x87\x11\xe0\x11\x3b\x65\x1d\x8d\x80\xe1\x4b\xb4\
+\xf0\x8a\xf2\x43\x11\xbe\x91\x5a\xa8\x0e\x51\x2e\xaa\xf0\xf6\xa9\
+\x75\xf2\x79\x3a\x6e\x06\x2f\xd6\x4f\x04\x86\x01\x18\x30\xf5\xc4\
+\xcb\xf2\xb6\x3b\x01\x76\xe4\x8e\x25\x3a\x0d\x65\x6f\x70\xf5\xe8\
+\xa9\x97\x65\x44\xb2\x32\x79\x76\x9d\x0f\xf9\x99\x3e\xd8\x6a\xf1\
+\x17\x03\xfa\xa0\x29\xc7\xe8\x18\x51\xac\xa1\x8b\xf5\x8f\x27\x6e\
+\x61\x39\xab\xc4\x4a\xc5\x87\xa9\x0c\x08\xfd\xad\xad\x1c\x74\x2f\
+\xba\x8e\x58\x79\x34\xe4\x5d\x6d\x5f\x1d\x64\xa7\x8c\x2d\x09\x1a\
+\x56\xae\x63\xf3\x94\xad\xa6\xd2\xc7\x54\xb8\xce\x8b\x61\x5a\x3c\
+\x3e\xec\x1c\x2b\x53\x6c\x17\x4c\xa5\x57\xc8\xdf\xc9\x0d\x72\x29\
+\x7a\x7f\xd1\x6c\xcd\x2f\x2a\xd7\xd7\xef\x5c\xac\x23\x93\xf9\xba\
+\x73\xb1\x8e\x2c\x2a\xd7\xd7\x8b\x66\x6b\x7e\xf4\xbe\xd3\x2f\xca\
+\xc5\x88\xb8\x7b\xd9\x89\xcd\xd6\x08\x10\xe5\xb7\x12\xb6\x3d\x2d\
+\xf0\x96\x42\xc0\x4e\xd9\x28\xee\x02\x26\xb4\xfb\x15\x76\xaa\xf2\
+\x2f\x9b\xf6\xbf\x1e\x51\xae\xd5\x47\xd6\xcb\x31\xa7\x95\x1a\x09\
+\x46\x6c\xd1\x6c\xcd\x37\x0a\x78\x03\xb8\x9f\x00\x33\x8a\xca\xf5\
+\xfb\xc7\xd6\xcb\xc7\x31\x6d\xcb\xb5\xd8\xb8\x46\x1d\x42\x3f\x0a\
+\xe8\x3f\xb0\x4c\x67\x9e\xad\x90\xcb\x76\xeb\x8a\x85\xad\x0e\x30\
+\x60\x5c\x48\x76\x02\x06\x53\x3f\x79\x45\xfe\xed\xac\x9a\x36\x66\
+\xcf\x56\xf3\x54\x1f\xea\x09\x37\x6a\xe1\xd1\xf5\xf2\x84\x4d\xfb\
+\x6e\x08\x2f\x02\x13\x9d\xd6\x9b\xa8\x51\xcc\x5e\x0c\x12\xe5\x9e\
+\xe0\x6a\x81\x01\xfb\x46\x2c\xd4\xc9\x47\x5e\x95\xc3\x91\x76\x23\
+\x16\xea\x48\x94\x7a\xa0\x6f\xb0\x2d\xee\xea\x6d\x30\x00\x38\x69\
+\xb7\xae\x98\xb1\xd9\x31\x8a\x1c\xc2\x9f\xa6\xd8\xf8\x00\xd5\xd5\
+\x12\x30\x02\x2c\x35\x95\x56\x53\xc1\xb4\xb8\x6f\xe4\x4f\x75\x9e\
+\x5b\xf6\x09\xe2\x6f\x5f\xa2\x39\xba\x41\x4e\x8a\x30\xc9\x54\xce\
+\x07\x6d\xfa\x9a\xf0\x6e\x71\xb9\x8e\x0e\xd9\x14\x97\x6b\xb1\x09\
+\x75\xa6\xd2\x37\x68\xd3\x62\x58\x4c\x39\xba\x41\x4e\x46\xfb\x4b\
+\x54\x57\x2c\x6c\x75\x40\x30\xb5\x72\xdc\xbb\xb1\x38\xfc\x9a\x1c\
+\x37\x95\x17\x42\xfe\x4c\x8b\xe7\x46\x2d\xd2\x3e\x6e\xd9\xa7\x12\
+\x7f\xd3\x7a\x69\x32\x03\x4c\x36\x94\xf3\x41\xbb\x82\xbc\x00\xef\
+\x8c\x2e\xd3\xd1\xa3\xcb\xb4\x38\x2f\x40\xbd\xa1\xf4\x0b\xee\x6b\
+\xc9\x53\x4a\x0e\x6f\x90\xc6\x54\xea\xea\x64\xef\xc6\x01\x38\x25\
+\x1f\x56\x8b\x72\x2e\xe8\xf3\x16\xb3\x95\x75\xe3\x4b\xb5\xd0\x2d\
+\xfb\x54\xe2\xff\xb8\x42\x9a\x10\x4a\x0c\xa5\x39\xd4\x09\x22\xec\
+\x13\x61\x7f\x44\xe3\x37\x23\x4c\xfc\x47\x9c\xc6\xb7\x5b\x57\x24\
+\xb6\xae\x03\xc6\x94\x69\xbb\xbb\xbf\x57\x48\x87\x32\x63\xcb\x74\
+\x95\xc2\xef\x92\x54\xb2\xfa\x60\x85\xac\x8a\x2a\x37\x57\x61\xab\
+\xbd\x30\xdd\x23\x3a\xfe\x68\xc6\x96\x69\xb1\x42\x3d\xd0\x2f\x6a\
+\x57\x8b\x61\x50\xd2\x90\xa0\xf1\x21\x71\x5b\xc5\x22\xed\x11\x60\
+\x44\xed\x8f\xb9\xc4\xf0\x79\xb0\x42\xaa\x0c\xf8\x73\xd2\xb2\x2e\
+\x2f\xc9\x38\x58\x21\x4d\xa6\xf2\x58\x74\x39\x53\xf9\x45\xb2\xc6\
+\x4f\xd6\x56\x31\xed\x6d\x19\x25\xea\x00\xcb\xc6\x81\xc7\xb9\x7c\
+\x6a\xa8\x90\xc5\x02\x3f\x31\x95\x46\x43\xb9\xec\x85\x0e\x18\x5b\
+\xa6\xc5\xa2\x3c\x17\x5d\x4e\x94\xe7\xef\x2d\x0b\x4f\xcc\xa9\xb4\
+\x55\x2c\x6c\x49\xd0\x84\x87\xc3\xc3\xea\xc0\xa6\xe4\xc3\xca\x6b\
+\xd8\x8d\xff\x7b\x3f\xd6\x91\xa2\xd4\x0b\xf4\x05\x50\x68\x06\x88\
+\x5c\x57\x61\xf2\xfb\x1b\x3b\xa6\xa8\xa9\xd4\x15\x22\x2b\x93\xf0\
+\xf5\xc6\x4e\xfc\x13\x4a\xb5\x38\xcf\x6a\x4b\x35\x43\xd9\x8e\xc0\
+\x14\x09\x30\x29\x94\x1d\x99\x4a\xdf\x3c\x8b\x77\x27\xcd\x8f\x3f\
+\x12\x72\x22\x0b\xba\xde\x24\x8b\xbf\xa4\x54\x8b\xf3\xa4\x63\xaa\
+\x69\x0a\x25\x07\x36\x49\xe3\x81\x4a\x69\x32\xad\x8e\x29\xaa\xc0\
+\x3b\xf1\x3a\x21\x23\x1d\xe0\xf4\xe2\xc2\x6b\x24\x8a\x7f\xea\x02\
+\x1d\x62\xc0\x7e\x53\xe9\x17\xb4\x69\xee\x16\x60\x62\xdd\xa6\xf0\
+\x84\x5b\x57\x29\x4d\xdd\x02\x94\x98\x4a\x73\xd0\xa6\x20\x4f\xd9\
+\x37\x75\x81\x76\x7a\xac\xe9\xf9\x0b\xb1\x6c\x90\x28\xfe\x5e\x57\
+\x38\x23\x16\x1f\xb4\x9f\xf9\x16\x53\x6a\xab\x3a\x6b\x7c\x6d\x95\
+\x1c\x36\x09\xcb\x91\x01\x1f\xc9\x79\xce\x3a\xa9\x2b\x66\x6c\xe9\
+\x1e\x40\x2e\x90\x28\xfe\xea\x6a\xb9\xda\x2b\xc0\x43\x02\x1b\x51\
+\x26\xee\xad\x8a\x9f\x6a\xee\xad\x94\x26\x94\x12\x81\x8d\x37\xb7\
+\xf2\xa3\xda\x5a\xb9\xe2\xa4\xae\x58\xd8\xca\x68\x66\xcc\xd1\x1c\
+\x6d\xfa\x18\x7c\x45\xef\x9a\x9a\xce\xb7\xa4\xdd\x60\xda\x7c\xed\
+\xdd\xed\x1a\xa1\x27\x6d\xff\xab\xd9\x26\x49\x6f\x49\xdb\xbb\x1b\
+\x7a\xe3\x34\x3f\xd2\x9d\x71\xc0\xbe\x4c\xf8\xce\x6f\x65\x7c\xe8\
+\x8c\x16\xc5\xd6\x53\x3c\xc7\x12\x94\xeb\x8b\xc0\xca\x09\x13\xd4\
+\xf6\x93\x40\xbb\x2c\x5a\xa4\xdd\x4c\x65\x65\x84\xfc\xd8\x7a\xec\
+\x69\x2b\x90\xc8\x19\xbd\x7a\x7b\xee\x5d\x88\xcd\x9d\xab\x03\x03\
+\xd7\x38\x09\xe4\x03\x63\xfa\xf7\xa7\xaa\xb4\x54\xcb\x2b\x2b\xe5\
+\x82\x1b\xfe\x4b\x4b\xb5\xf0\x42\x33\xaf\x9a\x6d\x0f\x90\x00\xae\
+\x04\x2c\xd6\xda\x29\x6b\xab\x31\xe7\xcc\x0a\xcf\x01\xdb\x76\xe4\
+\x5e\x07\x00\xcc\x99\xa5\xcb\x80\x67\x23\x36\xb5\xa0\xec\x11\x83\
+\xd3\xc0\x57\x29\xba\xed\xa9\xca\x60\xe0\x07\x10\x7e\xc5\x51\x84\
+\x65\x55\xdb\xed\xbd\x17\xd4\x65\xe6\x80\x6d\x3b\x64\xcd\xbc\x99\
+\x9a\x07\x3c\x49\xdb\x89\x57\x00\xcc\x27\xa5\xc7\xfc\x61\x62\x9c\
+\x8d\xcf\x6e\xdd\x61\xaf\xf1\x21\x05\x09\x8a\x64\xfe\x03\xee\x64\
+\x47\x5b\xde\x0c\x8f\xaa\x74\x7c\x46\xfa\x89\xc5\xd6\x9d\xf2\xd4\
+\x82\x99\x7a\x4c\x94\x67\x14\x86\xa6\x5a\x4f\x1c\x8e\x8b\xc5\x13\
+\x9b\x76\xc9\x6e\x27\x85\xd2\x1a\x01\x99\xb8\x32\xce\xf4\xd5\xf6\
+\xe6\x9d\x52\x03\xba\xfb\xe1\x19\x8c\x32\x0c\x46\x2b\x7c\x1d\xa1\
+\x87\x63\x47\xca\x8a\xd0\x9f\x96\xc1\xa8\xcd\x3b\x39\x0c\xe2\x38\
+\xfa\xb4\x3a\x20\x13\xd2\x74\x7d\xe4\x4e\x74\x53\x0d\x8d\x40\xd2\
+\xfb\xfb\xf1\x28\xbb\x5f\xdb\x3b\x60\xe3\xce\xd4\x5e\x4d\x07\x17\
+\x3b\x60\x43\x4d\x78\xf8\x3f\x76\x30\xb9\x8c\xb4\x3c\x1d\x7b\x7b\
+\xc5\xae\xdc\x98\xe4\xdd\x3a\x51\xd2\x9a\x03\xe2\x6d\xef\x69\x63\
+\x62\xbb\x94\xe3\x13\xbb\x5b\x52\x99\x11\x09\xba\xc9\x46\x07\xe4\
+\x7a\x66\x75\x5d\x47\x80\xd3\x0e\xe8\x69\xe3\x9d\xb9\x78\x65\x97\
+\x4c\xf7\xee\x7d\xa7\x75\x7b\xc2\xf2\xe8\x69\x09\xb2\x33\x02\x9c\
+\xfa\xf4\x1a\x9e\x96\x20\x3b\x73\xc0\xf5\xcc\xac\x32\x81\xa7\x25\
+\x28\x9d\x39\xe0\x85\x5a\x3f\x0b\xea\x44\x26\xb2\xa0\x5c\x91\x9a\
+\x78\x78\x5a\x82\x6e\x4a\x63\x12\xce\x15\x3c\x2d\x41\xe9\xcc\x01\
+\x2b\x4a\xb2\x9f\x05\x3d\x53\x67\xe3\x7d\x1e\x2f\x4b\x90\x9f\x05\
+\xd9\xc7\x73\x23\x20\x57\xa4\xc9\xd3\x12\x74\xc7\xcc\xe4\x43\x78\
+\xe5\xc4\xd8\x52\xf3\xfb\xfd\x7e\x16\xd4\x89\x4c\xc8\x45\xae\x48\
+\x4d\x3c\x3c\x2d\x41\xe9\xf8\xcc\x15\x3c\x27\x41\x4f\xde\xeb\x30\
+\x7b\x89\x63\xed\xd8\x8f\x43\x7e\xf3\x37\x77\x24\x2e\xe7\x25\xc8\
+\x69\x5d\x5e\x23\xe7\x25\xc8\x69\x5d\x5e\xc3\x13\x12\xb4\xfc\x03\
+\xf7\x33\x96\x4c\xf8\xcc\x04\x9e\x90\xa0\xae\x8c\x27\x24\xa8\x2b\
+\xe3\x09\x09\xea\xca\xf8\x12\x94\x65\x7c\x09\xca\x32\xbe\x04\x65\
+\x19\x5f\x82\xb2\x8c\x2f\x41\x59\xc6\x97\xa0\x2c\xe3\x77\x40\x96\
+\xf1\xe7\x80\x2c\xe3\xcf\x01\x59\xc6\x93\x12\xf4\xc6\x08\x1d\xaf\
+\x30\x0e\x40\xa0\xe1\xa1\x23\xf2\xe1\x8d\x6a\xef\x49\x09\x32\x95\
+\xc9\x84\x7f\x3d\x6b\x35\x90\xf0\x80\x73\xd9\xde\x2d\x09\xb2\xfb\
+\x9d\xf0\xa5\xd0\xf7\xaf\xbb\x8a\xf4\xf6\x44\xce\xda\xbf\xc9\xb5\
+\x59\x79\x2e\xda\x6f\x2f\xd6\xc1\x11\xdf\x1e\x5f\xb4\xe1\x3a\x2e\
+\xb6\xee\xbd\xef\x1a\xae\xb5\x28\x53\x83\xab\xa7\x51\xb6\x8a\xc1\
+\x97\xd1\x76\xda\x76\x06\x4d\x0e\xae\xd6\x8b\x50\x9f\xc8\x6f\x2e\
+\xda\x2b\xdc\x8c\x32\x0f\xf8\x36\x80\xc0\xde\x19\x9f\xca\xf4\x44\
+\x7e\x13\x61\xab\x03\x76\x0f\xd7\x31\x62\xf1\x3e\x0e\x7e\x6b\xba\
+\x8b\xd0\x2a\xca\x3d\xd3\x8f\xcb\x47\xa9\x3a\xb0\xfd\xf4\x69\x4f\
+\x91\xce\x12\x65\x3d\x91\xff\xa8\xa0\x6b\x73\x41\x94\x85\xd3\x3e\
+\x93\x37\xd3\x71\xe2\xe8\xf1\xdf\x7b\xc5\x5a\x70\xf5\x2a\xd3\x55\
+\x29\x23\x38\x54\x55\x68\x10\x4d\x3c\xb9\xe5\x3a\x2a\x8c\x17\x6d\
+\xcb\x8e\x80\x7a\x94\xd7\xba\xf7\x60\xef\x7d\x4d\xd2\x92\xae\x6f\
+\x47\x92\x12\xac\x70\x4b\xdd\x50\x1d\x4c\x48\x2b\x95\xfa\x92\x13\
+\x1d\x7f\x13\xf4\x46\xa3\x6e\xa8\xae\x82\xf6\x0e\x68\x28\x39\x21\
+\x95\x6e\xf9\x4e\x49\xd3\x0d\x08\xbf\xd7\x93\x13\x8f\xd0\xd3\x23\
+\x93\xc7\x9b\x52\x07\x98\x16\x57\xda\xd3\x60\x65\xdc\x7b\x43\xc2\
+\x1f\x2d\xdf\x90\x58\xed\x67\x3f\xa2\x74\xfa\x95\xac\x74\x48\x2d\
+\xab\x51\x1a\xcd\xf0\xda\x64\xb4\x3d\x75\xbb\xe1\xb1\xd2\xf8\xba\
+\x3e\x16\x29\x0f\xa8\x0f\x6f\xd7\xcd\xc0\x7c\x17\x63\xc9\x05\xb6\
+\x8c\x3f\x2d\x0b\xdc\x74\x98\x96\xa2\x1d\x1a\xa4\x25\x96\xc1\xdd\
+\x22\x7c\xcd\xad\x80\xbc\x88\x2a\x5f\x1a\x16\x87\xee\x3e\x23\x75\
+\xd9\x8e\xc5\xc7\xc7\xc7\xc7\xc7\xc7\xc7\xc7\xc7\xc7\xc7\xc7\xc7\
+\x27\xb7\xf9\x3f\x93\xf4\x8b\x89\x2a\x4a\x04\x16\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\xe7\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x01\x9c\x49\x44\x41\x54\x78\x9c\xed\xdb\x4b\x4a\
+\x03\x51\x10\x40\xd1\x6b\x06\xb6\xe2\xc2\x03\x22\xb8\x80\x40\x16\
+\xe1\x40\x5c\x91\x23\x41\xf0\x83\xc3\x76\x90\x88\x9a\xd8\x9d\xf4\
+\xe7\x75\x57\x99\x7b\x20\xd3\x67\xd5\x2d\x11\x07\x0a\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x12\x39\xdb\x7e\x7a\xbb\
+\x04\x56\xc0\x3b\xf0\x04\x5c\x03\xd5\xf0\xb9\xfe\xbd\x0a\xb8\x01\
+\x9e\x81\x0f\x60\x0d\x5c\xf5\x79\x68\x05\xd4\x3b\x9f\x7b\x3c\x42\
+\x9b\x8a\x4d\xa3\xdd\x6e\xeb\xae\x0f\x2d\x80\xb7\x3f\x1e\xf2\x08\
+\xcd\x9a\xe2\xd7\x6c\x7e\x8a\x2c\xba\x3e\xf8\xd2\xf0\x98\x47\xd8\
+\xd7\x16\xbf\x06\x5e\xfb\x3c\x7a\xdb\xf2\xa0\x47\xf8\x76\x28\x7e\
+\xcd\xa6\x65\x91\x87\x4f\xfd\x08\xc5\x1b\x9d\x03\x77\x07\xbe\xc0\
+\x03\x70\xd1\xf7\x0b\x24\x36\x59\x1b\x8f\xb0\x6f\xf2\x26\x1e\xe1\
+\xdb\x6c\x2d\x3c\x42\x80\x06\xb3\x0f\x30\xa3\x30\xbb\x87\x19\x64\
+\x42\xe1\x76\x0e\x37\x50\x41\x61\x77\x0d\x3b\xd8\x88\xc2\xef\x18\
+\x7e\xc0\x01\xd2\xec\x96\x66\xd0\x0e\xd2\xed\x94\x6e\xe0\x16\x69\
+\x77\x49\x3b\xf8\x0f\xe9\x77\xc8\xbc\x40\xe6\xd9\x7f\xc9\xb8\x48\
+\xc6\x99\x5b\x65\x5a\x28\xd3\xac\x9d\x64\x58\x2c\xc3\x8c\x83\x44\
+\x5e\x30\xf2\x6c\xa3\x8a\xb8\x68\xc4\x99\x8a\x8a\xb4\x70\xa4\x59\
+\x26\x15\x61\xf1\x08\x33\xcc\x6a\xce\x00\x27\x1f\xff\xcb\x1c\x21\
+\x8c\xbf\x63\xca\x20\xc6\x6f\x30\x45\x18\xe3\x1f\x50\x32\x90\xf1\
+\x8f\x54\x22\x94\xf1\x3b\x1a\x33\x98\xf1\x7b\x1a\x23\x9c\xf1\x07\
+\x1a\x12\xd0\xf8\x23\xe9\x13\xd2\xf8\x23\xeb\x12\xd4\xf8\x85\x1c\
+\xfb\xb7\xf7\xfe\x0f\x43\x41\xc7\x7c\x77\xfb\x9d\x5f\x58\xdf\x23\
+\x18\x7f\x44\x5d\x8f\x60\xfc\x02\x8e\x3d\x82\xf1\x0b\x3a\x74\x04\
+\xe3\x4f\xa0\xe9\x08\xc6\x9f\x50\x05\x2c\x81\xc7\xed\x67\x89\xbf\
+\x6a\x4a\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x7d\x02\xa4\x46\xac\xdc\x18\xb4\x22\xb6\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\xec\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x01\xa1\x49\x44\x41\x54\x78\x9c\xed\xda\xbb\x4e\
+\xc3\x40\x10\x85\xe1\x93\x14\x98\x82\x07\x87\x0a\x24\xfa\xf0\x0e\
+\x14\x11\x4f\x04\x0f\x10\x21\x97\x50\xd8\x80\x48\x7c\xd9\xdd\xec\
+\x65\x26\xf9\x3f\x29\x4d\x64\xad\x66\xce\x71\xac\x14\x96\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x8c\x3a\x49\x0f\x92\
+\x3e\x24\xbd\x4b\xba\x1f\xbf\x43\x05\x37\x92\x5e\x25\x7d\x1d\x7d\
+\xde\x24\xdd\x36\x9c\xeb\x2a\xcc\x85\x4f\x09\x15\xac\x85\x4f\x09\
+\x05\x85\x86\x4f\x09\x05\xc4\x86\x4f\x09\x19\xa5\x86\x4f\x09\x19\
+\x74\x92\xf6\x5a\x0e\x78\x1f\x78\x0d\x7f\x51\x23\x85\xdc\xf9\x3f\
+\x77\x77\xcc\xb5\x08\x90\x12\x28\x25\x64\x72\x4e\x90\x94\x70\xa6\
+\x1c\x01\x52\x42\xa2\x9c\xc1\x51\x42\xa4\x12\x81\x51\x42\xa0\x92\
+\x41\x51\xc2\x8a\x1a\x01\x51\xc2\x8c\x9a\xc1\x50\xc2\x91\x16\x81\
+\x50\xc2\xa8\x65\x10\x57\x5f\x82\x85\x00\x2c\xcc\xd0\x84\xa5\xc5\
+\x2d\xcd\x52\x85\xc5\x85\x2d\xce\x54\x84\xe5\x45\x2d\xcf\x96\x85\
+\x87\x05\x3d\xcc\x98\xc4\xd3\x62\x9e\x66\x0d\xe2\x71\x21\x8f\x33\
+\x4f\xf2\xbc\x88\xe7\xd9\x25\x5d\xc0\x02\x72\xbc\x83\xdb\xc1\x27\
+\xb8\xdb\xc5\xdd\xc0\x01\xdc\xec\xe4\x66\xd0\x04\xe6\x77\x33\x3f\
+\x60\x06\x66\x77\x34\x3b\x58\x01\xe6\x76\x35\x37\x50\x05\x66\x76\
+\x36\x33\x48\x03\xcd\x77\x6f\x3e\x80\x01\xcd\x32\x20\xfc\x3f\xd5\
+\xb3\x20\xfc\x53\xd5\x32\x21\xfc\x79\xc5\xb3\x09\x7d\x3f\xff\x9a\
+\xdf\xbd\x2f\x9a\xd1\x73\xa9\x83\x2f\x4c\x48\x09\x4f\xb1\x87\x6e\
+\x25\x7d\x2e\x1c\x48\xf8\xff\xad\x95\x70\x90\xb4\x89\x39\x70\x2b\
+\xa9\x9f\x39\x8c\xf0\xa7\x2d\x95\xd0\x6b\xc8\x34\xca\xcb\xc4\x41\
+\x84\xbf\x6c\xae\x84\x5d\xca\x61\x77\x1a\x4a\xe8\x35\xfc\x84\x1e\
+\x45\xf8\x21\x3a\x0d\xcf\xfc\x83\x86\xec\x76\x1a\xb2\x4c\x16\xf5\
+\xec\xc2\xaf\x8d\xc8\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\xd4\xf5\x0d\x7a\x55\xad\x13\x93\x69\x6e\x6d\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x01\xb6\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x01\x6b\x49\x44\x41\x54\x78\x9c\xed\xdd\xbd\x4a\
+\x03\x51\x00\x44\xe1\x71\x0b\xa3\xe0\x73\x47\xb0\xb1\xb0\x4c\xe1\
+\x3b\xa4\x10\x1f\xc9\xc2\xca\x1f\x52\x89\x16\xdb\x69\xd4\x14\x61\
+\xcf\x90\x7b\x3e\x48\x9b\x5c\xe6\xc0\x6e\x9a\x65\x13\x49\x92\x24\
+\xb1\x2e\x93\x6c\x92\xbc\x27\x79\x4e\x72\x93\x64\x85\x9e\x68\x30\
+\x9b\x24\x9f\xdf\x3e\x0f\x31\xc2\x22\xa6\x24\x6f\xf9\x19\xc0\x08\
+\x0b\x7a\xc9\xfe\x00\x46\x58\xc8\x6d\x7e\x0f\x60\x84\x05\xac\x32\
+\x8f\x6c\x04\xd0\x79\x92\x6d\xfe\x8e\xf0\x98\xe4\x82\x3a\xe0\x08\
+\x8c\x50\xc0\x08\x05\x8c\x50\xc0\x08\x05\x8c\x50\xc0\x08\x05\x8c\
+\x50\xc0\x08\x05\x8c\x50\xc0\x08\x05\x8c\x50\xc0\x08\x05\x8c\x50\
+\xc0\x08\x05\x8c\x50\xc0\x08\x05\x8c\x50\xc0\x08\x05\x8c\x50\xc0\
+\x08\x05\x8c\x50\xc0\x08\x05\x8c\x50\xc0\x08\x05\x8c\x50\xc0\x08\
+\x05\x8c\x50\xc0\x08\x05\x8c\x50\xc0\x08\x05\x8c\x50\xc0\x08\x05\
+\x7c\x52\xa7\xc0\x21\x11\xae\xb1\xd3\x0d\xe2\xbf\xcb\xd1\xd3\x31\
+\x7e\x64\x3a\xc6\x97\x0c\xea\x83\x3e\xc0\x29\x3b\xe4\x12\xb4\xc6\
+\x4e\x77\xe2\xbc\x09\x83\xfc\x1b\x0a\x72\x7c\x90\xe3\x83\x1c\x1f\
+\xe4\xf8\x20\xc7\x07\x39\x3e\xc8\xf1\x41\x8e\x0f\x72\x7c\x90\xe3\
+\x83\x1c\x1f\xe4\xf8\x20\xc7\x07\x39\x3e\xc8\xf1\x41\x8e\x0f\x72\
+\x7c\x90\xe3\x83\x1c\x1f\xe4\xf8\x20\xc7\x07\x39\x3e\xc8\xf1\x41\
+\x8e\x0f\x72\x7c\x90\xe3\x83\x1c\x1f\xe4\xf8\x20\xc7\x07\x39\x3e\
+\xc8\xf1\x41\x8e\x0f\xf2\xc9\x14\xd8\x5d\x1c\x1f\x33\x65\x7e\x8f\
+\xb0\xe3\x43\xa6\x24\xbb\x38\x3e\xea\x3e\x8e\x8f\xba\xca\x1c\x61\
+\x97\xe4\x35\xf3\xeb\x6d\x1d\x1f\x70\x46\x1f\x40\x92\x24\x0d\xe0\
+\x0b\xd3\xae\xa6\x51\x1d\xb1\x6b\xba\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x04\x0c\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x03\xc1\x49\x44\x41\x54\x78\x9c\xed\x9c\x3b\x6b\
+\x15\x41\x14\xc7\x7f\x51\x4c\x02\x11\x93\x98\x80\x46\x04\x7b\x91\
+\x80\x5a\x18\x1b\x15\x2b\x0b\x35\xbd\x22\xe6\x03\x28\xf1\x41\xb4\
+\x8c\x29\x6c\xec\xf4\x4b\x58\xa8\x44\xf2\x09\x54\xf0\x51\xf8\x42\
+\x34\x6a\x15\xf1\x11\x6d\xf2\x30\xde\xc6\x22\x59\x8b\x51\x82\x97\
+\xdd\xb9\xbb\x73\x67\xe7\xcc\xdd\x7b\x7e\x70\x9a\xbd\x33\x73\xce\
+\x9c\xff\xee\xec\xce\xce\xde\x01\x45\x51\x14\x45\x51\x14\x45\x51\
+\x14\x45\x51\x94\x60\x6c\x14\xf0\xb9\x41\xc0\x67\x5b\xd0\x07\x8c\
+\x01\xd3\xc0\x07\xa0\x06\x24\x91\xdb\x0f\xe0\x06\xd0\x5d\x42\x3e\
+\x82\xd1\x0d\x5c\x01\x96\x90\x4f\xa8\xab\x3d\x02\xfa\x7d\x27\x26\
+\x04\x43\xc0\x33\xe4\x13\xe8\xc3\x66\x81\x5d\x7e\xd3\x53\x2e\x43\
+\xc0\x27\xe4\x13\xe7\xd3\xbe\x02\xc3\x3e\x93\x54\x16\x5d\x54\xe7\
+\xcc\xaf\xb7\x65\xe0\xa8\xbf\x54\x95\xc3\x55\xe4\x13\x55\xa6\xfd\
+\x06\x4e\x7b\xcb\x96\x67\xfa\xb0\xdf\x70\xef\x02\x87\x81\x9e\xba\
+\x7a\x59\xe5\x43\x51\x54\x84\x35\x60\x22\x60\x7c\xb9\x19\x23\x3b\
+\xe8\x8b\x96\x7a\xb1\x0a\xb0\x66\xf9\x2d\x01\x6e\x12\xd9\xdc\x65\
+\x9a\xf4\x40\xef\x35\xa8\x17\xab\x00\xa7\x30\x43\x8e\x4d\x84\x3b\
+\x44\x34\x57\xf8\x48\x7a\x90\x87\x1a\xd4\x8b\x55\x00\x30\x37\xdd\
+\x65\x4b\x99\x84\x88\xe6\x0a\xbf\x48\x0f\x70\x73\x83\x7a\x31\x0b\
+\x00\xb0\x07\xf8\x6c\x29\x97\x10\xc9\x5c\xc1\x35\x91\xb1\x0b\x00\
+\xb0\x03\x78\x6d\x29\x9b\x00\xf3\xc0\xde\x30\x21\xa7\x53\x65\x01\
+\xc0\x0c\x33\x0f\x2d\xe5\x13\xcc\x28\x70\xac\xfc\x90\xd3\xa9\xba\
+\x00\x60\x26\x9a\xb7\x2d\x75\x12\x04\xe7\x0a\xed\x20\x00\x40\x07\
+\xe6\x4d\xa9\x4d\x84\x35\xe0\x5a\x79\x21\xa7\xd3\x2e\x02\xfc\x63\
+\x1c\x58\xb5\xd4\x4f\x80\x5b\x04\x9c\x2b\xb4\x9b\x00\x90\x7f\xae\
+\xb0\xc9\x6f\xc8\xe9\xb8\x76\x64\x25\xa3\xde\x48\x39\x61\xfe\xc7\
+\xc1\x0c\xdf\x3f\x0b\xb4\x91\x67\xae\x70\xdd\x5f\xc8\xd9\xb8\x0a\
+\xf0\xca\x52\x57\xca\x5e\x14\xec\xfb\x30\xf0\xcd\xd2\xde\x97\x82\
+\xed\x05\x7d\xc7\x31\x13\xd0\x57\x5e\x8a\xc6\xf4\x06\x73\x35\xcd\
+\x66\xfc\xbe\xb3\xb9\x70\xf2\xe1\x7a\x05\x0c\x10\xd7\xb2\xe5\x22\
+\xb0\xd5\x31\x07\xfd\x96\x76\x4b\xa7\x19\xc7\x27\x69\xfc\x44\x11\
+\xc2\x56\x81\xe3\x4e\xbd\x5f\xa7\x25\x05\x00\x38\x81\x39\xfb\x24\
+\xcf\xfc\x66\x93\x8f\xa5\xfd\xd2\xf1\xe1\x78\x00\x98\x04\x9e\x93\
+\xfd\x74\xe4\xd3\x56\xfe\xfa\x9a\xc4\x7d\xd8\xa9\xc7\x8b\x00\x1d\
+\x8e\x8e\x7d\xb5\xd5\xca\x78\xc9\x43\x54\x2b\x3d\xed\x88\x0a\x20\
+\x8c\x0a\x20\x8c\x0a\x20\x8c\x0a\x20\x8c\x0a\x20\x8c\x0a\x20\x8c\
+\x0a\x20\x8c\x0a\x20\x8c\x0a\x20\x8c\x0a\x20\x4c\x68\x01\x06\x81\
+\x29\xe0\x25\x71\xfd\x87\xac\x86\x59\x1d\x9b\xc2\xbc\x28\x8c\x1a\
+\xd7\xb7\x80\xa3\x34\x5e\x53\x8d\xc1\x96\x30\xeb\x16\x65\xe5\xa1\
+\x69\x5c\x1c\x8f\x12\xc7\x42\x4c\x5e\x5b\xc5\xac\x5b\xf8\xce\x83\
+\x17\x8a\x3a\x1e\xa4\x35\xce\xfc\x7a\x5b\xc4\x3e\x1c\x79\x11\x20\
+\xc4\x3d\xe0\x3c\xd0\x1b\xc0\x8f\x6f\xfa\x81\x73\x65\x3b\x09\x21\
+\x40\x9e\xf1\x34\x56\xa2\x8c\xbd\xe8\xa5\x97\xb5\xe4\x78\xa0\xdc\
+\x30\x0b\x31\x42\x7a\x8c\xb6\x0f\xb7\xbc\x0c\x41\x21\x96\x24\x8b\
+\x96\x97\x42\xa4\x5f\x3a\x11\x13\x46\x05\x10\x46\x05\x10\x46\x05\
+\x10\x46\x05\x10\x46\x05\x10\x46\x05\x10\x46\x05\x10\x46\x05\x10\
+\x46\x05\x10\x46\x05\x10\x46\x05\x10\x46\x05\x10\x46\x05\x10\x46\
+\x05\x10\x46\x05\x10\x46\x05\x10\xc6\x45\x80\x5a\xc6\xf1\x46\x5b\
+\x96\x55\x89\x2d\x19\xc7\x57\x8a\x36\xe4\x22\xc0\x7c\xc6\xf1\xfd\
+\x0e\x6d\xb5\x2a\xfb\x32\x8e\x7f\x2f\xda\x90\x8b\x00\xef\x32\x8e\
+\x8f\x3b\xb4\xd5\xaa\x5c\xc8\x38\xfe\x36\x84\xf3\xb3\x64\x7f\x11\
+\x70\x39\xa5\xbc\xd8\x17\x64\x05\xc9\x1b\xe7\x84\xa5\xec\x99\x10\
+\x81\xf6\x61\xdf\x6a\x60\x1a\x38\xc2\xfa\xd6\xc5\x55\x10\xa0\x07\
+\xd3\xa7\xfb\x96\x72\x0b\x04\xfc\x00\xcd\x76\x16\xb4\xab\xd9\xb6\
+\x6d\xf6\x4e\x17\xf0\xb4\x84\x4e\xb4\xaa\x3d\x06\x3a\x9b\xca\xa8\
+\x03\xdb\x81\xb9\x26\x03\xaf\x82\xcd\x01\xdb\x9a\xcc\xa5\x33\x83\
+\xc0\x83\x06\x01\x56\xd9\x9e\x60\x4e\x44\x51\x3a\x31\x4f\x3f\x0b\
+\xc8\x27\x24\x94\x2d\x00\x97\xf0\x30\xec\xf8\xfc\x3e\xb3\x17\xf3\
+\x47\x8c\x51\x60\x37\x66\xff\xb4\xaa\xcc\x8e\x6b\x98\x0d\xf9\xde\
+\x63\x9e\x84\x66\x28\xb6\xe3\xa2\xa2\x28\x8a\xa2\x28\x8a\xa2\x28\
+\x8a\xa2\x28\x8a\xa2\xf0\x07\x1d\x48\xd8\x7f\x6a\x80\x88\x71\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\x32\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x03\xe7\x49\x44\x41\x54\x78\x9c\xed\x9d\x3d\x48\
+\x56\x51\x18\xc7\x7f\xaf\xf9\x91\x69\x39\xd5\xa0\x6d\x51\x44\x34\
+\x86\x61\x08\x35\x16\xba\xb4\xd4\xe0\x94\x14\x34\xd9\xd4\xc7\xe8\
+\x5e\x84\x50\x41\x43\x0a\x0d\xd5\xe4\xd2\xd0\x07\x11\x04\x95\x43\
+\x0d\x0e\x2d\x82\x10\x95\x44\xa1\x50\x99\xa4\x65\xa2\x0d\xc7\x40\
+\xe4\x7d\xee\x7b\xdf\x7b\xcf\xb9\xe7\xd1\xf7\xf9\xc1\x59\x5e\xe1\
+\x9e\xff\x3d\xbf\xfb\x9c\xfb\xf1\x9e\xeb\x0b\x86\x61\x18\x86\x61\
+\x18\x86\x61\x18\x86\x61\x18\x46\xad\x50\x8a\x1d\x00\x68\x00\x0e\
+\x01\xdd\xc0\x41\x60\x2f\xd0\x0e\xec\x00\x5a\x80\x5f\xc0\x3c\x30\
+\x03\x4c\x02\x13\xc0\x18\xf0\x1a\x98\x8b\x90\x77\x53\x50\x0f\xf4\
+\x02\xf7\x70\x83\xb8\x92\xa1\xfd\x05\x9e\x01\xfd\x40\x5b\xb1\xf1\
+\x01\xa8\x8b\xd0\x67\x6e\x5a\x80\x0b\xc0\x07\xb2\x0d\xba\xd4\x7e\
+\x02\xd7\x80\x8e\x02\xf6\xa1\x19\xb8\x09\xfc\x58\x6d\x37\x56\x3f\
+\x53\x4d\x09\xe8\x03\x3e\xe3\x77\xe0\xd7\xb7\x79\x60\x90\xb0\x03\
+\x32\x54\xa6\xdf\xeb\x01\xfb\xcb\x4d\x07\xf0\x9c\xb0\x03\xbf\xbe\
+\xbd\x07\xba\x02\xed\xcf\xd7\x32\xfd\x7d\x09\xd4\x57\x6e\x4e\xe0\
+\x4e\x9e\x45\x0e\xfe\xda\x73\xc4\x65\xfc\x5f\x68\x48\xfd\xa9\xe3\
+\x2c\xb0\x44\xba\xc1\x9a\x05\x46\x81\x01\xe0\x18\xae\x6a\xfe\x4f\
+\x23\x0d\xc0\x2e\xa0\x13\x38\x03\x8c\x00\x53\x29\xb7\xbb\x02\x0c\
+\xe3\x4e\xfa\xbe\xd8\x10\x02\x2e\x01\xcb\x54\x1e\x9c\x57\xc0\x69\
+\xaa\x9f\xb3\xeb\x80\xa3\xc0\x03\xd2\x49\x7e\x08\x34\xe5\xd9\xa1\
+\x35\xa8\x17\x70\x8e\xca\x83\x3f\x8e\x1b\x40\x1f\xec\xc1\x55\x4f\
+\x25\x09\x8f\xf0\x23\x41\xb5\x80\x13\x24\x1f\x91\x8b\xb8\x79\x79\
+\x4b\x80\xbe\x7b\x80\xe9\x84\xbe\x7d\x49\x50\x2b\xa0\x83\xe4\x13\
+\xee\x34\x70\x24\x70\x86\x76\xe0\x4d\x42\x06\x1f\x12\x54\x0a\x28\
+\x91\x7c\xa9\xf9\x11\xd8\x57\x50\x96\x56\xe0\x69\x42\x96\xbc\x12\
+\x54\x0a\xe8\x43\x0e\x36\x03\xec\x2f\x38\x4f\x23\xee\xc4\x9b\x24\
+\xe1\x09\xb0\x35\xc3\xb6\xd5\x09\x68\x41\xbe\xc3\x5d\x24\xfc\xb4\
+\x23\xd1\x84\x3b\xd2\x7d\x57\x82\x3a\x01\x03\x09\xa1\xae\x44\xcc\
+\x05\x61\x24\xa8\x12\x50\x8f\xfc\x60\xed\x1d\x7e\x6f\x80\xb2\xe2\
+\x7b\x3a\x52\x25\xa0\x37\x21\x90\xaf\xeb\x7c\x1f\xf8\xac\x04\x55\
+\x02\xee\x0b\x61\x5e\xc6\x0a\x94\x80\xaf\x4a\x50\x23\xa0\x01\xf9\
+\xcb\x94\x53\x31\x02\xa5\xc0\x47\x25\xa8\x11\xd0\x25\x04\x99\x45\
+\xf7\x17\x14\x79\x2b\x41\x8d\x80\x8b\x42\x90\xd1\x18\x61\xaa\x24\
+\x4f\x25\xa8\x11\x70\x57\x08\x72\x21\x46\x98\x0c\x64\x95\xa0\x46\
+\xc0\x98\x10\x44\xd3\xd5\x4f\x25\xb2\x4c\x47\x6a\x04\x7c\x12\x82\
+\xec\x8e\x11\x26\x07\xd5\x56\x82\x1a\x01\xdf\x84\x20\x59\x9e\xaf\
+\xc4\xa6\x9a\x4a\x50\x23\x60\xa1\x4c\x88\xe5\x18\x41\x3c\x91\xb6\
+\x12\xd4\x08\x98\x15\x82\x34\xc6\x08\xe3\x89\x34\x95\xa0\x46\x80\
+\xf4\x04\x74\x67\x8c\x30\x1e\x49\x53\x09\x2a\x04\x8c\x0b\x41\x0e\
+\xc7\x08\xe3\x99\x2c\x12\x32\x91\x67\x7d\xe3\xa4\xf0\xf9\x81\x1c\
+\xdb\xd4\xc2\x1f\xe0\x24\xf0\x38\x74\x47\x79\x04\x4c\x08\x9f\x77\
+\xe7\xd8\x66\x16\xb6\x01\xb7\x70\xeb\x34\xb3\xcc\xdd\x52\xfb\x8d\
+\x5b\x64\xa0\x96\xe3\x94\x0f\x3e\x45\xb1\x2b\x87\x6f\x0b\x39\x8a\
+\x6e\x85\xb3\x1d\xb7\xfc\xaf\x5c\x98\xa2\xee\x86\xeb\x70\x0b\x72\
+\x63\x0f\xfe\x0a\x19\x97\x40\xe6\x39\x52\xe7\x80\x17\xc2\xdf\xce\
+\xe7\xd8\xee\x46\x64\x81\x48\x2f\xbb\xf4\x53\xfe\x68\x58\xc2\xad\
+\x58\x2b\x02\x0d\x53\xd0\x70\xf0\xbd\x14\x68\x43\xbe\x21\x2b\xea\
+\xb1\x74\x33\xee\x25\x89\xef\x42\x8e\x90\x6d\x01\x37\xf8\xad\xc1\
+\xf7\x32\x81\xab\xc8\x01\x7b\x22\xe6\xaa\x19\x3a\x90\x4f\x84\xd3\
+\xb8\xe5\x82\x46\x60\x06\x91\xab\xe0\x2d\x91\x4b\xb4\x16\x68\xc6\
+\xbd\x16\x24\x49\x78\x8a\xbf\xf5\xf9\x86\x40\x27\x6e\x29\xa2\x24\
+\x21\xeb\x5a\x4c\xa3\x0a\x2e\x93\x7c\xd5\xe0\xeb\x25\x09\x43\xa0\
+\x04\xdc\x21\x59\x82\x55\x42\x60\xea\xa9\xfc\xa5\x86\x55\x42\x60\
+\x42\xae\xcf\x37\x52\x62\x12\x14\x60\x12\x14\x60\x12\x14\x60\x12\
+\x14\x60\x12\x14\x60\x12\x14\x60\x12\x14\x60\x12\x14\x60\x12\x14\
+\x60\x12\x14\x60\x12\x14\x60\x12\x14\x60\x12\x14\x60\x12\x14\x60\
+\x12\x14\x60\x12\x14\x60\x12\x14\x60\x12\x14\x60\x12\x14\x60\x12\
+\x14\x60\x12\x14\x60\x12\x14\x60\x12\x14\x10\xea\x5f\x52\x1a\x55\
+\x90\x46\xc2\x50\xb4\x74\x35\x42\x25\x09\x73\xe8\xf8\xa5\xa8\x4d\
+\x4d\x92\x84\x05\x36\xe8\xaf\x1d\x6d\x34\x24\x09\x23\x31\x43\xd5\
+\x1a\x4d\xb8\x39\x7f\x0e\x77\xe4\x8f\x60\xaf\x46\x45\xa1\x84\xcd\
+\xfb\x86\x61\x18\x86\x61\x18\x86\x61\x18\x86\xc4\x3f\x68\x04\x76\
+\x5e\xef\x4e\xe0\x63\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x08\x64\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x08\x19\x49\x44\x41\x54\x78\x9c\xed\x9d\x5b\x6c\
+\x15\x55\x14\x86\xbf\xa2\xb4\x34\xd0\x40\xb9\x84\x50\x6c\xc0\x88\
+\x60\x08\x72\x89\x01\x4c\xbc\x24\xc8\x4d\x1b\x04\x1f\x7c\xd1\x10\
+\x7d\x40\x41\xc4\x08\x98\x18\x35\xfa\x2a\x97\x28\x20\xc4\x28\x88\
+\x0f\xc6\x20\xf7\x48\xf0\x42\x62\x14\x84\xf8\x04\x0f\x22\xde\xe0\
+\x80\x80\x20\x31\x1a\x90\x16\x28\x2d\x08\xf4\xf8\xb0\xe6\x50\x38\
+\xce\xda\x33\x73\xce\xde\x33\x53\x98\x2f\xd9\x69\x32\x30\xfb\x5f\
+\xb3\x66\xce\xbe\xac\xbd\x67\x0d\x64\x64\x64\x64\x64\x64\x64\x64\
+\x64\x64\x64\xdc\x6c\x54\x24\x6d\x40\x00\x7d\x80\x51\xc0\x10\xe0\
+\x2e\x60\x30\xd0\x17\xe8\x0a\xd4\x7a\x7f\x01\xce\x03\x8d\xde\xdf\
+\xbf\x81\xdc\x35\x65\x2f\x70\x32\x56\xab\x23\x90\xb6\x1b\x50\x0d\
+\x4c\x00\x1e\xf2\xca\xdd\x94\x6f\x63\x1e\xf8\x11\xf8\x16\xd8\x0e\
+\x7c\x03\x5c\x28\xb3\xce\x1b\x8e\x7b\x80\xe5\xc0\x29\xc4\x61\x2e\
+\x4b\x13\xf0\x31\x72\xa3\xd3\xf6\x00\xc6\x4a\x15\x30\x0b\xf8\x0d\
+\xf7\x4e\xd7\xca\x21\x60\xa6\x67\xcb\x4d\x43\x35\x30\x1f\x38\x41\
+\x72\x8e\x2f\x2e\x27\x80\xb9\x9e\x6d\x37\x34\x53\x80\x23\x24\xef\
+\x70\xad\x1c\x06\x1a\x9c\x5d\xbd\x0f\x71\xb5\x81\xf5\xc0\x0a\xe0\
+\xb1\x12\xce\xcd\x01\xbb\x81\x03\xc0\x41\xa4\xd9\x68\xa6\x7d\xd4\
+\x03\xed\xa3\xa2\x1a\x60\x10\x32\x6a\x1a\x02\x8c\xf5\xfe\x46\x65\
+\x0b\xf0\x22\xf2\xcb\xe8\xf0\x4c\x03\x4e\x13\xfe\x29\x6c\x01\xd6\
+\x01\xd3\x81\x3a\x0b\xfa\x75\x5e\x5d\xeb\x81\xd6\x08\x76\xfc\x03\
+\x4c\xb5\xa0\x9f\x18\x95\xc0\x32\xa0\x8d\x70\x17\xbc\x1b\x98\x01\
+\x74\x77\x68\x53\x77\x4f\x63\x77\x48\x9b\xda\x80\x25\x40\x67\x87\
+\x36\x39\xa1\x16\xf8\x8e\x70\x17\xb9\x1d\x18\x9f\x80\x8d\x13\x90\
+\xb9\x41\x18\x1b\x77\x01\x3d\x12\xb0\xb1\x24\xea\x80\x9f\x08\xbe\
+\xa8\xfd\xc8\x64\x2b\x69\x26\x20\xfd\x4b\x90\xbd\xfb\xb0\xd3\x24\
+\x3a\x65\x10\x70\x94\xe0\x36\xfe\x55\xa4\x89\x4a\x0b\x95\xc0\x6b\
+\x04\xf7\x11\x47\x91\x6b\x4c\x25\x75\x04\x3b\xff\x00\x30\x22\x29\
+\x03\x43\x30\x14\xf8\x19\xf3\x35\x1c\x47\x46\x75\xa9\xa2\x16\x89\
+\xb7\x98\x0c\x5f\x03\x74\x4b\xca\xc0\x08\x74\x03\xd6\x12\xdc\x1c\
+\xa5\xa6\x4f\xa8\x24\xb8\xc3\x5d\x40\xc7\x8a\xbb\x54\x00\x0b\x31\
+\x5f\xd3\x4e\x52\x32\x3a\x5a\x86\x79\x18\x37\x2f\x39\xd3\xca\x66\
+\x1e\xe6\x61\xf4\x5b\xc9\x99\x26\x4c\xc1\x6c\xe0\x4b\xc9\x99\x66\
+\x8d\xe7\x31\x3f\x60\xd3\x92\x32\xac\x1e\xf3\x0c\x77\x41\x52\x86\
+\x39\x60\x11\xfa\x75\x9e\x02\xfa\x27\x61\xd4\x16\x83\x51\x6b\x70\
+\xd3\xe6\xf7\x47\x9e\xc8\x6d\xc8\x3c\xa2\xd9\x2b\xfb\xbd\x63\xb3\
+\x71\xe3\x8c\x0a\x24\x3c\xa2\x5d\xef\x26\x07\x9a\x46\x1e\x36\x18\
+\x73\x10\x09\x8a\xd9\xa4\x37\xb2\x60\x73\xc9\xa0\x5b\x28\x97\x80\
+\x55\x40\x3f\xcb\x36\x74\x43\x6e\xb4\xa6\x1b\x5b\x14\xb5\x1a\x3d\
+\xa4\xdc\x02\x0c\xb7\xac\xd7\x00\x9c\x51\xf4\x4c\xa5\x11\x79\x50\
+\x6c\x32\x02\x7d\xb2\x76\x10\xe8\x62\x59\xcf\x97\xf9\x8a\x01\x79\
+\x64\x86\x6b\x93\xe7\x80\xcb\x06\xbd\xa0\x72\x19\x59\x75\xb3\xc9\
+\xeb\x06\xbd\x17\x2c\x6b\xfd\x8f\x2a\xf4\x95\xac\x1c\x76\x97\xf6\
+\x26\x53\x9e\xf3\x0b\xe5\x0a\x32\x5a\xb3\x45\x25\x7a\x53\x74\x1c\
+\xc7\x21\x96\x59\x8a\x70\x1e\xbb\x81\xb5\x7e\x94\xd6\xec\x98\x9a\
+\xa3\xbe\x16\xed\x9b\x68\xd0\x7a\xc6\xa2\xce\x75\x54\xa0\x2f\xa0\
+\x6f\xb7\xac\xb5\x52\xd1\x29\xf4\x33\x4b\x80\xd1\xc8\x4a\x58\x57\
+\x60\x0c\xb0\x14\x73\x30\xed\x3d\xcb\x36\xee\x54\x74\x0e\xe2\x68\
+\xd6\xff\xa0\x22\x98\xc7\x6e\x3c\xbf\x3f\xfa\x68\xe7\x77\x24\x60\
+\xa6\x31\x0c\x38\xa6\x9c\xfb\x2f\x76\xc3\xc9\xa6\x5f\xc1\xfd\x16\
+\x75\xae\xf2\xa1\x22\xb6\xdb\xb2\xce\x1c\x45\xa7\x05\xb3\xf3\x0b\
+\x0c\x43\xff\x25\xcc\xb6\x6c\xeb\x1e\x45\xe7\x03\xcb\x3a\x54\xa3\
+\xb7\xc9\x33\x2c\x6b\x6d\x53\x74\x96\x44\xa8\x43\x8b\x4f\x7d\x61\
+\xd5\x52\x78\x56\xd1\x69\xc4\xf2\x90\xf4\x51\x45\xa8\x05\xfb\x6b\
+\xb8\x39\x45\x6b\x74\x84\x3a\xc6\x28\x75\xec\xb7\x6a\xa9\x84\xa4\
+\xb5\x5f\x5b\xa8\x89\x59\xa7\x90\x42\xda\x08\x67\x2b\xf2\xcb\xb0\
+\x89\x36\x83\x8d\xe2\x3c\xed\xff\xda\x0e\x53\x34\x01\x9f\x2b\xff\
+\x16\xaa\x5f\x2c\xf7\x06\xd8\xfe\x49\x83\x1e\xc6\x68\x8e\x50\x47\
+\x9b\x72\xfc\xd6\x88\xb6\x84\xe1\x4b\xe5\xf8\x38\x5b\x02\x7d\xd0\
+\x43\xce\x2e\x16\xa9\x1b\x7d\x74\x4e\x47\xac\x63\x80\x4f\x1d\x79\
+\xe0\x4f\x7b\x66\x5e\xa5\x5e\xd1\xba\x02\xf4\x0a\x3a\x39\xcc\x2f\
+\x60\x14\xfe\xe3\xda\x1c\x6e\x2e\xe8\x13\x9f\x63\x6b\x22\xd6\xd1\
+\x47\x39\xee\x62\xa7\xdb\x1f\xc8\x6e\xbd\x62\x3a\x21\xbe\x33\x12\
+\xe6\x06\x68\x5b\xfb\x6c\x0f\x3f\x0b\xbc\x8c\x44\x33\x5b\xbc\xb2\
+\x12\x78\x25\x62\x1d\xf7\x2a\xc7\xbf\x2f\xc3\x2e\x13\x9a\x2f\x02\
+\xb7\x45\x86\x69\x13\xb5\x4a\x72\x21\xce\x2d\x85\x56\x24\x08\x57\
+\x18\xb3\xe7\x23\x9e\xdf\x05\x7d\xbc\xbf\xab\x54\xa3\x02\xd0\x7c\
+\xd1\x21\x6f\x40\x81\xa8\x8e\x07\xb8\x05\xf8\x08\xff\x09\xdb\x79\
+\xe0\xb3\xb2\x2c\xd2\x29\xf9\x06\x84\x41\xdb\xe5\x36\xd2\x46\xe5\
+\x16\xe9\x09\x7c\x85\x1e\x1e\x58\xee\x50\x7b\x94\xa2\xb9\xcf\x46\
+\xe5\xda\x66\xab\x01\x36\x2a\xb7\xc4\x08\x64\x6f\xbf\xe6\xfc\x33\
+\xd8\x5f\x21\xbb\x96\xdb\x15\xdd\x23\x36\x2a\xd7\xde\xdb\x0a\x1c\
+\x62\xc5\xc4\x34\xa4\x79\xd1\x9c\xef\x22\x5c\x52\x4c\x6f\x45\xd7\
+\xca\xdb\x99\x17\x95\xca\xd3\xb0\xb7\xb3\x01\x89\x72\x9a\x9c\xbf\
+\x2a\x06\x3b\xaa\x14\x6d\x2b\x6f\x63\xa6\xf5\x06\x0c\x24\x78\xd1\
+\x66\x35\xd2\x31\xbb\xc6\xe9\x0d\x48\x6b\x13\xb4\x15\xb3\xf3\xdf\
+\x24\xbe\xed\x90\x4e\x9b\x20\xad\x13\x1e\x68\xa3\xf2\x12\x19\x82\
+\x1e\x1e\x69\x01\x9e\x8c\xd9\x9e\x92\x3b\xe1\x30\xf3\x00\x2d\x08\
+\x96\xe4\xee\xe0\x27\xf0\x7f\xba\x2f\x20\x9d\xf2\xd7\xf1\x9a\x43\
+\xad\x72\xfc\x5c\xd0\x89\x61\x42\x11\x7f\x29\xc7\xef\x08\x71\xae\
+\x2b\x1e\x50\x8e\x2f\x23\x7e\xe7\x83\xee\x0b\xcd\x77\x57\x09\x73\
+\x03\x9c\xce\xf2\x4a\x44\xd3\x5e\x17\xab\x15\xed\x94\x1c\x2d\xe8\
+\xa8\x37\xa0\xa7\x72\xfc\x78\xac\x56\xb4\x93\xc8\x0d\x18\x1b\xe2\
+\x5c\x57\x5c\xf4\x39\xd6\x88\xfd\xd5\xb9\xb0\x68\xbe\xb0\x12\x2f\
+\xeb\x8d\x3e\xe2\x48\x64\x5b\x36\xf0\xae\x8f\x2d\x2b\x12\xb2\xa5\
+\xac\x05\x99\xb0\xfc\xa0\x88\x4c\xb7\x25\x10\x91\x6a\x64\x9d\xe0\
+\xbc\x57\xde\x27\xb9\x44\x1b\x4f\xe3\xef\x1b\xab\x6b\x0f\x4b\x15\
+\x91\xf5\x36\x45\x4a\xa0\x82\xe4\xdf\x3d\xdb\x84\xbf\x6f\xde\xb6\
+\x29\x32\x45\x11\x71\xb1\x2d\xa5\x23\x61\xda\x96\xf2\x88\x4d\xa1\
+\x2e\xf8\x2f\x96\xc7\x11\x69\x4c\x33\x33\xf1\xf7\xc9\x69\x1c\x24\
+\x81\x5a\xad\x88\xb9\x5a\x1b\xee\x08\x68\x5b\x13\x57\xba\x10\x8b\
+\x6b\x73\x6e\x47\x61\x12\xba\x3f\xee\x73\x21\x58\x81\x6c\xbf\xf0\
+\x13\xdc\xe1\x42\x30\xe5\xec\xc2\xdf\x17\x39\x1c\x0e\x0c\xb4\x36\
+\x2f\x8f\x64\x1d\x89\x8b\x7a\x60\x33\x70\xd6\x2b\x5b\x88\x77\x66\
+\x3e\x19\xdd\x0f\x4e\xfb\xc4\x2a\x64\x23\x92\x9f\xf0\x7e\xe2\x59\
+\xa4\xa9\x47\xb2\x59\xf9\x75\x7c\x71\x24\xd1\xa8\x42\xdf\x40\x7c\
+\x8c\x18\x7c\x30\x57\x11\xcf\x23\x29\x5f\x5c\xb3\xd9\xa0\xbf\x31\
+\x06\xfd\x37\x0c\xfa\x73\x62\xd0\xa7\x1a\xfd\x55\xa5\x56\xec\xbf\
+\xa6\x5a\xcc\x59\x45\x3b\x8f\xfb\x58\xd0\x48\xf4\x71\xbf\xed\x97\
+\x14\x8d\x34\x28\x46\xe4\x91\x9c\x40\x2e\xd3\xd2\x98\x6e\x40\x93\
+\x43\xdd\x1a\xe4\xfd\x2f\x4d\x7b\xa2\x43\x6d\x5f\x3e\x35\x18\xb3\
+\x16\x77\x23\x01\x53\x8a\x84\x0d\x8e\x34\x2b\xbc\xba\xe3\xd6\x35\
+\xa2\x75\x86\x85\xb2\xd0\x91\xee\x10\xfc\x93\x84\x9c\x02\x6e\x73\
+\xa4\xb9\xd8\x47\xaf\x50\x4e\x92\x60\x2e\xb9\xa9\x98\xd3\xd5\xb8\
+\xca\x15\x54\x8f\x74\xb8\x67\xbc\xb2\x01\x77\xce\x37\x65\x06\x68\
+\x23\xe6\x4c\xbb\x7e\x2c\xc1\x6c\x60\x47\x4e\xd8\x34\x1f\xf3\x03\
+\xb6\x38\x39\xd3\xda\xe9\x8c\x3e\x2b\x2c\x94\x45\x24\x1f\x36\x8e\
+\x42\x05\xe6\x66\x27\x8f\xcc\xfe\x53\x91\xb2\x0c\x24\x2c\xbb\x0f\
+\xb3\xc1\xeb\xb0\x9f\xc6\xc6\x05\x35\x98\x3b\xdc\x3c\xb2\x40\x95\
+\xba\x30\x7c\x1d\xc1\x99\xd1\x73\xa4\x6f\x5b\xfb\xb5\x0c\x05\x7e\
+\xc1\x7c\x0d\x47\x70\xbb\xd3\xba\x2c\x06\x11\x7c\x13\x5a\x91\x94\
+\x2f\x69\xfa\x68\x42\x15\x62\x53\x50\xe2\xd6\x23\x24\xbb\x1f\x2a\
+\x14\xfd\x08\x6e\x8e\xf2\xc8\x84\x2d\xf6\xc9\x8b\x0f\x93\xd0\x63\
+\x3b\xc5\xcd\x4e\x6a\x9f\xfc\x62\x7a\xa0\x67\x13\x29\x2e\x3b\x49\
+\xe6\x46\x4c\x22\x78\xf0\x70\x6d\x87\x9b\xba\x36\x3f\x88\xce\x48\
+\x5e\xcd\xb0\xe9\xeb\xf7\x20\xb9\x17\x5c\xee\x39\xed\xe1\x69\x68\
+\x2b\x59\x7e\xc3\xe8\xc5\xb8\x79\xc1\x3b\x36\xa6\x10\xed\xeb\x48\
+\xad\xc8\x4e\x83\xa7\xb0\x33\xb9\xaa\x47\xb6\x8e\x6c\x26\xda\x07\
+\x1c\x4e\x12\xc3\x24\x2b\xae\xb1\x79\x7f\xe0\x1d\xe0\xf1\x12\xce\
+\x3d\xc4\xf5\x9f\x30\x39\x8c\x04\xdd\x9a\x68\xdf\xb9\xdd\x0d\x79\
+\xba\x7b\x20\x9d\xe4\x60\xe4\xc3\x6f\x63\x81\x3b\x4b\xd0\xdc\x88\
+\x4c\xc2\x5c\xbc\x88\x9e\x28\xe3\x80\x5f\x09\xff\x14\xc6\x5d\x0e\
+\x61\x3f\xd3\x62\xea\xa8\x42\xb2\x0b\x1e\x27\x79\x87\x17\xca\x31\
+\x64\x31\x25\x4d\x43\x63\xe7\x54\x22\x09\xee\x4c\x31\x76\xd7\x25\
+\x87\xac\xe1\x26\xfd\xbe\x5b\xe2\x14\x3e\x65\x78\x12\xf7\x4e\x4f\
+\xd5\xa7\x0c\x13\x37\xa0\x88\x2e\x48\x6e\xa2\xf1\xde\xdf\xe1\x84\
+\xcf\x69\xa4\xd1\x86\x4c\x0c\x77\x20\xd9\x1d\x77\xe0\xbf\xbd\x3d\
+\x11\xd2\x76\x03\x8a\xe9\x85\xff\xe7\x6c\x6b\x90\x11\x4f\x61\xe9\
+\xb3\x19\x79\xb2\xcf\xd1\xfe\x39\xdb\xc2\xa8\x69\x2f\xb2\x70\x94\
+\x91\x91\x91\x91\x91\x91\x91\x91\x91\x91\x91\x91\x0a\xfe\x03\x78\
+\xc7\xe1\xdf\x68\xf8\x52\xb9\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\x07\x70\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00\x07\x25\x49\x44\x41\x54\x78\x9c\xed\x9d\xdd\x6f\
+\x15\x45\x14\xc0\x7f\x94\xca\x87\xb6\x50\x2c\x48\x24\x9a\x48\x10\
+\x8c\xa9\x88\x80\x90\xa0\xf0\xa6\x31\x26\x26\x42\x8c\x0f\x06\x0d\
+\xfa\xe4\x83\xa8\x40\x42\x08\x09\x7f\x00\x12\xa3\xf1\x9b\xc4\xf8\
+\xe2\x07\x8a\x4f\x7e\xa0\x20\x10\xdf\xe4\x23\x50\x49\x34\x40\xc0\
+\xa8\x20\x16\xc4\x00\x2d\xd8\x96\xb6\x70\xc1\x87\xb3\x37\x85\xcb\
+\x9c\xed\xee\xec\xcc\x7e\xdc\xee\x2f\x99\x87\xce\xdd\x9e\x39\x67\
+\xce\xbd\xb3\xb3\x33\x67\xce\x42\x49\x49\x49\x49\x49\x49\x49\xc9\
+\x70\x64\x44\xd6\x0a\x0c\x41\x23\xd0\x06\xcc\x0d\xca\x3d\xc0\xed\
+\xc0\x6d\xc1\x67\x2d\xc1\x75\x5d\xc0\x65\xe0\x5f\xe0\x14\x70\x04\
+\x68\x07\xf6\x03\x87\x82\xcf\x4a\x22\x32\x01\x78\x1e\xd8\x02\xf4\
+\x02\x57\x13\x96\x5e\xe0\x5b\x60\x19\x83\x0e\x2b\x31\xb0\x08\xf8\
+\x12\xe8\x27\x79\xa7\x6b\xa5\x1f\xd8\x1c\xb4\x55\x12\x30\x1f\xd8\
+\x8b\xbf\x4e\xd7\xca\x5e\x60\x5e\x0a\xf6\xe5\x9a\xb5\x40\x85\xf4\
+\x3b\xbf\x5a\x2a\xc0\x1a\xef\x56\xe6\x94\x55\x64\xd7\xf1\xb5\x65\
+\x85\x67\x5b\x55\xb2\x9a\x05\xcd\x44\x66\x29\x37\x45\xb8\xf6\x6f\
+\x60\x17\xf0\x33\x70\x00\x99\xe9\x5c\x40\x66\x3e\xdd\xc1\x35\x4d\
+\xc8\x0d\x76\x1c\x30\x19\x98\x1d\x94\x87\x80\x3b\x22\xb4\x31\x00\
+\xcc\x01\x0e\x46\xb6\xa0\xe0\x6c\x23\xfc\x1b\xd9\x05\xbc\x03\x3c\
+\x4c\xb2\x2f\xc9\x88\x40\xc6\xbb\x81\xcc\xb0\x36\xbf\x4b\xd0\x4e\
+\xa1\x98\x8a\x3e\xee\x1f\x03\x96\x23\xdf\x68\xd7\x34\x05\xb2\x8f\
+\x2b\x6d\x57\x02\xdd\xea\x9e\x97\x31\x77\xc0\x19\xe0\xd6\x14\xda\
+\x6f\x05\xce\x2a\x3a\x2c\x4f\xa1\xfd\xeb\x68\x48\xbb\x41\x64\x48\
+\x30\xf1\x11\x70\x2e\x85\xf6\xcf\x06\x6d\x99\x58\x90\x42\xfb\xd7\
+\x91\x85\x03\x66\x28\xf5\xbb\x52\xd4\x61\xb7\x52\xaf\xe9\x56\x57\
+\x9c\xc4\xfc\xf3\xbf\xbb\xe6\xba\x51\xc0\x6b\xc1\xf5\x1d\xc0\xfa\
+\xa0\xce\x05\xd3\x15\x1d\x3a\x1c\xc9\xcf\x35\x9d\x98\x8d\xaf\x1d\
+\xff\xd7\x1b\xae\x59\xef\x48\x87\x56\x45\x87\x4e\x47\xf2\x73\x8d\
+\xb6\xd6\x33\xba\xe6\x3a\xd3\x2f\xe5\x94\x23\x1d\xc6\x28\x3a\xf4\
+\x39\x92\x1f\x99\x2c\xee\x01\xda\x30\xd2\x5f\xf3\xf7\x55\xc3\x35\
+\x57\x1c\xe9\xa0\x75\x74\xed\x97\xc0\x3b\x59\x38\x20\x2a\x9f\x18\
+\xea\x3e\x4e\x5d\x8b\x3a\x44\x7b\x12\xad\x65\x14\x32\xe6\x77\xe0\
+\xfe\x26\x1c\x47\x0f\xaf\x64\xb1\x16\xa4\x19\x99\xb6\x2e\xb9\xd0\
+\x23\xcf\x43\xd0\xb0\xa0\x74\x40\xc6\x94\x0e\xc8\x98\x24\xe3\xdd\
+\x54\xe0\x09\x64\x6d\x67\x3a\x30\x05\x99\xc6\xdd\x82\xdb\x9b\x65\
+\x18\x5d\xc0\x67\xc0\x6a\xe0\x62\xcc\xff\xb5\xb9\xe1\x0e\x00\x3d\
+\xc8\x94\xf9\x24\xf0\x1b\xf0\x13\x12\x40\xf0\xa7\x85\x3c\x2b\x66\
+\x22\xeb\xf9\x59\x6e\x25\xd6\x96\x8d\x16\x76\xb8\x6c\xbf\x02\x6c\
+\x05\xee\xb3\xd0\x23\x16\xab\x90\x6f\x41\xd6\x1d\x5e\x5b\x7a\x88\
+\x3f\x9c\xfa\xd0\xa3\x1f\x58\x19\x53\x8f\xc8\xac\xf5\xa4\x74\x3d\
+\x39\xa0\x5a\x9c\x6f\xf4\xcf\x27\x5f\x43\x4e\x6d\xf9\xc0\xc2\x26\
+\x9f\xfa\x54\x70\x1c\xf2\xb2\xc7\xb3\xc2\xb6\xe5\x1c\xf0\x36\x30\
+\xd6\xc2\x26\xdf\xba\xed\xb1\xd0\xc9\xc8\xa2\x90\x46\xce\x00\x1b\
+\x80\xc5\xc0\x34\x24\xac\x30\xf5\x05\x2d\x4b\x34\x9b\xc2\x18\x8d\
+\xd8\x38\x0d\xb1\x79\x03\xd2\x07\x9a\xac\x85\x2e\x14\xdd\xac\x08\
+\x3f\x46\x3a\x7b\xb8\xbe\xb0\x71\x80\x89\x56\xf4\x8d\xfe\xcf\x93\
+\x2a\xd9\x82\xbe\x7e\xff\x52\x52\xe1\x19\xe3\xca\x01\x20\x9b\xf9\
+\x26\x59\xfd\xc8\x2f\xc6\x9a\x17\x14\xc1\x9d\xf8\x09\x1d\x49\x13\
+\x97\x0e\x68\x42\x8f\x3b\x7a\x2e\xec\x1f\x87\x9a\xba\x3d\xa5\xd4\
+\x7f\xca\x60\x54\x5a\x11\x69\x56\xea\xff\xb3\x94\xd7\x8d\x3c\x91\
+\x9b\x78\xda\x52\x26\x8d\xe8\xf1\xf9\x5a\x68\x49\x51\x78\x00\xb3\
+\x5d\x87\x13\xc8\xd4\x26\x2b\x3d\x48\x5f\xc6\x66\x96\x22\xf0\x2f\
+\xf2\x7f\xb2\x66\x28\xd6\x61\xb6\xed\x87\x04\x32\x1b\x90\x38\x56\
+\x93\xdc\x99\x61\xff\xa4\x31\x57\xa9\xdf\x8d\xfd\x58\x99\x07\x9a\
+\x91\xe8\x3c\x13\xdb\x13\xc8\xbd\x82\x1e\x6f\xa4\xf5\xa5\x95\x03\
+\x0e\x44\xd5\x28\x87\x8c\x00\x3e\x44\xce\x98\x99\xf8\x2a\xa1\x7c\
+\xad\x6f\x54\x07\x84\xb1\x13\xf3\xcf\xe9\x31\x2b\xd5\xb2\xa7\x19\
+\xf8\x02\x7d\xf6\xb3\xd5\x41\x1b\x8f\x2b\xb2\xad\x7e\x59\x07\x15\
+\x61\xf7\x3b\x50\x34\x2d\x9a\x90\x73\x02\xeb\x80\xd3\xe8\x9d\x5f\
+\xc1\x8d\x5d\xda\xcd\xfd\x57\xed\x1f\xc2\xee\xce\x93\x94\x7a\xdb\
+\xa9\x5a\x54\x66\x20\x8f\xf9\x8f\x22\x87\x2b\xee\x44\x36\x79\x7c\
+\xf2\x26\xf0\x8b\x03\x39\x17\x94\x7a\xad\x2f\x43\xe9\xc6\xec\xcd\
+\x56\x2b\xd5\x86\xa6\x0d\x39\x4e\xaa\x7d\x4b\x7d\x95\xed\x58\x4e\
+\x13\x0d\x4c\x52\xda\xd0\x1c\x13\xca\x25\x45\x98\xeb\xc5\xb6\x46\
+\xe0\x2d\xb2\x59\xee\xde\x86\x1c\x6b\x72\xc5\x68\xa5\x9d\x4b\x36\
+\xc2\xd2\x70\x40\x0b\xb0\x43\x69\xc7\x67\xa9\x00\xaf\x03\x23\x1d\
+\xda\x02\x8e\x1d\xe0\x7b\x08\x1a\x09\x7c\xaf\xb4\xe1\xb3\xec\x40\
+\x6e\x96\x3e\x88\x3d\x04\x85\x8d\x7d\xbd\x98\x6f\x7e\xe3\x90\x53\
+\x26\x49\x79\x03\x99\xb6\xf9\xa4\x1b\x38\x11\x94\xed\xc8\x3c\xff\
+\x77\x8f\xed\x69\x6b\x4c\xbd\x36\xc2\x7c\x4e\x43\xe7\x10\x3e\xe6\
+\x9f\x42\xf6\xa0\x67\xe1\x7f\x06\xe4\x92\xd8\xd3\xd0\x30\xb4\xb1\
+\xd9\xc5\x83\x58\xd8\xb8\xbf\x89\x62\x75\xfa\xb5\x68\x0f\x62\xea\
+\x1a\x53\xd8\x52\xc4\x51\xa5\x7e\xb6\xad\x76\x01\x33\x80\x47\x94\
+\xcf\x36\x01\x4b\x91\x15\xc4\x22\xa2\xf5\x8d\xd6\x97\xa1\x0e\x68\
+\x8f\xd9\x48\x54\x16\x2b\xf5\xff\x00\x2f\x22\xdf\x98\xa2\xa2\xf5\
+\x8d\xd6\x97\xa1\x68\xcb\xd1\x27\x48\xb6\x1c\xad\x0d\x3f\x6b\x13\
+\xc8\xcc\x03\x56\xcb\xd1\x61\xf8\xda\x90\x39\xa2\xc8\x2c\xd2\x1a\
+\x93\x89\xb0\x0d\x19\xf5\x79\x23\x6c\x08\xba\x0c\xfc\xa8\x7c\xf6\
+\x8c\x9d\x8e\x80\xa4\x1c\x33\xf1\x47\x02\x99\x79\x40\xeb\x93\x9d\
+\xc8\x8c\xcf\x8a\x65\xe8\x0f\x16\xb6\x8f\xf0\xda\xec\xa7\xc8\x34\
+\xa3\x6f\xca\x2f\x4d\x22\x38\x2c\x2c\xc5\x36\xaf\x42\x3d\x3a\xe0\
+\x15\xcc\x36\xf5\x01\xe3\x93\x0a\xd7\x02\xb3\x8e\x63\xb7\x2c\x51\
+\x6f\x0e\x98\x88\xec\x93\x6b\xcf\x34\x89\x09\x0b\x4d\x3c\x8b\x84\
+\xe7\x2d\x41\x0e\x69\x4c\x40\x0e\x41\x87\x51\x64\x07\x8c\x41\x6c\
+\x9c\x8e\xd8\xbc\x01\x3d\xf3\xca\x55\x1c\x85\x26\x42\x3a\xc1\xb9\
+\x71\xb9\x19\x78\x8f\xa1\x13\x31\x65\x55\x9c\x05\xe7\x42\x3a\xe1\
+\xe9\x71\xd9\xe8\x59\x9f\x24\xc5\x79\x78\x3a\xc8\xa1\x83\xbc\x38\
+\xa0\x01\x37\x49\x5d\x7d\x95\xd5\x31\xed\x89\xcc\x0a\xfc\x25\x56\
+\x8d\x43\x5e\x1d\xd0\x0f\xbc\x1a\xd3\x96\xd8\xb4\x21\x09\xee\x5c\
+\x0f\x49\x71\xc9\xd3\x10\x54\x41\x4e\x4a\xb6\xc5\x35\x22\xc9\x9a\
+\xce\x5d\xc8\x31\xd5\x05\xc8\x0a\xe7\x14\xe4\xa4\x8a\xed\x31\xd5\
+\xb8\xba\x8c\x45\x66\x21\xcf\x92\x5e\x4e\xe8\xea\x31\xd5\x8b\xc8\
+\x31\xd5\xa3\x48\x34\xdc\x16\xe4\xbc\x44\x6c\xca\x5c\x11\x37\x52\
+\xe6\x8a\x18\x4e\x94\x0e\xc8\x98\xd2\x01\x19\x53\x8f\x0e\xf0\x99\
+\x6d\xb1\x2e\x70\x35\x0d\xd5\x88\x9a\x6d\xd1\xb7\x1e\xb9\xc5\xb7\
+\xe1\x1d\x06\xd9\xa6\x7c\xa0\xb9\x70\x40\x16\x43\xd0\x80\x52\xef\
+\xf3\x80\x77\x6d\xc7\x6a\x2b\xb6\xb5\x99\x1b\xbd\x93\x85\x03\xb4\
+\x28\x31\x57\xb1\x40\xa6\x6c\x8b\xb5\x75\x5a\x5b\x71\x73\x0e\x15\
+\x92\xa8\xa9\x8b\x6d\x89\x92\x6d\x71\x58\xa7\x2e\x6e\xc7\x6c\xfc\
+\x93\x29\xea\xb0\x44\xd1\x61\x5f\x8a\x3a\x00\xd9\x0c\x41\x5a\x94\
+\x58\x9a\x67\x8f\xb5\x34\xf5\x6a\x04\x5b\x3d\x11\xf6\x02\x07\x5f\
+\xa7\x6f\xae\x65\x22\x39\x7a\x81\x43\x16\x84\xbd\xc2\xe4\x38\xd2\
+\x09\x5a\x98\x77\x12\x9a\x03\xd9\xda\x06\xfa\xb0\x79\x85\x09\xc8\
+\x91\xd0\xb0\xf5\xf5\x2e\x64\xbf\x77\x11\xc9\x86\xc9\x86\x40\xc6\
+\xfb\xc0\xf9\x21\xda\xdc\x92\xa0\x1d\x6b\xb2\x7c\x8d\xd5\x7e\xa2\
+\x2d\x11\x74\x20\x6b\xee\xd5\xd7\x58\x9d\x46\x3a\xf3\x3c\x83\x09\
+\x43\x9a\x91\x40\xb1\x16\x6e\x7c\x8d\xd5\x94\x08\x6d\x0c\x04\xd7\
+\x1f\x8a\x6c\x41\x1d\xb0\x92\xec\x77\xb2\xaa\xc5\xfb\x36\x62\x5e\
+\x59\x43\xf6\xaf\x32\xf4\xb6\x81\x5e\x14\xe6\x91\x4d\x52\xc0\x3d\
+\xc0\x83\x29\xd8\x57\x18\x16\x22\x39\xd6\xfa\xf0\xd7\xe9\x7d\x48\
+\xb8\xa0\xb3\x88\xb5\x7a\x64\x3c\x92\xe6\xeb\x1b\x64\x03\x3c\x69\
+\xa7\xf7\x00\x5f\x23\x9b\xf7\x89\x03\x65\x5d\x93\xf7\xc4\x4b\x8d\
+\xc0\xbd\x0c\xbe\xd2\xbc\x1a\x7d\x31\x39\xf8\xac\x9a\x10\xaf\x13\
+\x39\xcf\x70\x9a\xc1\x68\x85\xea\x2b\xcd\x0f\x93\x20\x3e\xbf\xa4\
+\xa4\xa4\xa4\xa4\xa4\xa4\xa4\xc4\x07\xff\x03\x3c\x0a\xc1\x7f\x1c\
+\xa6\x3c\xca\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+"
+
+qt_resource_name = b"\
+\x00\x0a\
+\x0b\x80\x88\x5e\
+\x00\x70\
+\x00\x79\x00\x71\x00\x74\x00\x72\x00\x69\x00\x62\x00\x62\x00\x6f\x00\x6e\
+\x00\x05\
+\x00\x6f\xa6\x53\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x06\
+\x07\xac\x02\xc3\
+\x00\x73\
+\x00\x74\x00\x79\x00\x6c\x00\x65\x00\x73\
+\x00\x0e\
+\x02\x1b\xf8\xbe\
+\x00\x64\
+\x00\x65\x00\x66\x00\x61\x00\x75\x00\x6c\x00\x74\x00\x2e\x00\x71\x00\x73\x00\x73\x00\x2e\x00\x69\x00\x6e\
+\x00\x0b\
+\x05\x5b\x77\xfe\
+\x00\x62\
+\x00\x61\x00\x73\x00\x65\x00\x2e\x00\x71\x00\x73\x00\x73\x00\x2e\x00\x69\x00\x6e\
+\x00\x0c\
+\x08\x27\x12\x3e\
+\x00\x66\
+\x00\x6f\x00\x6e\x00\x74\x00\x73\x00\x2e\x00\x71\x00\x73\x00\x73\x00\x2e\x00\x69\x00\x6e\
+\x00\x08\
+\x08\x98\x55\xa3\
+\x00\x62\
+\x00\x61\x00\x73\x00\x65\x00\x2e\x00\x71\x00\x73\x00\x73\
+\x00\x0c\
+\x08\xdd\x93\xbe\
+\x00\x64\
+\x00\x65\x00\x62\x00\x75\x00\x67\x00\x2e\x00\x71\x00\x73\x00\x73\x00\x2e\x00\x69\x00\x6e\
+\x00\x09\
+\x09\xba\x8d\xc3\
+\x00\x64\
+\x00\x65\x00\x62\x00\x75\x00\x67\x00\x2e\x00\x71\x00\x73\x00\x73\
+\x00\x0b\
+\x0c\xe2\x21\xa3\
+\x00\x64\
+\x00\x65\x00\x66\x00\x61\x00\x75\x00\x6c\x00\x74\x00\x2e\x00\x71\x00\x73\x00\x73\
+\x00\x0b\
+\x00\xb0\x5d\x07\
+\x00\x6c\
+\x00\x69\x00\x6e\x00\x6b\x00\x69\x00\x6e\x00\x67\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x03\x8b\x57\xa7\
+\x00\x6d\
+\x00\x61\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x04\x01\x57\xa7\
+\x00\x6d\
+\x00\x69\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x04\xb2\x58\xc7\
+\x00\x75\
+\x00\x6e\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x05\x88\x12\xe7\
+\x00\x62\
+\x00\x61\x00\x63\x00\x6b\x00\x77\x00\x61\x00\x72\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\x88\x59\xc7\
+\x00\x6d\
+\x00\x6f\x00\x72\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x06\x98\x83\x27\
+\x00\x63\
+\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\xe1\x5a\x27\
+\x00\x64\
+\x00\x6f\x00\x77\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x06\
+\x07\xc3\x57\x47\
+\x00\x75\
+\x00\x70\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x08\x5d\x84\xe7\
+\x00\x66\
+\x00\x6f\x00\x72\x00\x77\x00\x61\x00\x72\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x08\xc8\x58\x67\
+\x00\x73\
+\x00\x61\x00\x76\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x0b\xb2\x58\x47\
+\x00\x72\
+\x00\x65\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x0c\x33\x5a\x87\
+\x00\x68\
+\x00\x65\x00\x6c\x00\x70\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x0f\x6e\x56\x07\
+\x00\x70\
+\x00\x79\x00\x74\x00\x68\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
+\x00\x00\x00\x1a\x00\x02\x00\x00\x00\x0e\x00\x00\x00\x0b\
+\x00\x00\x00\x2a\x00\x02\x00\x00\x00\x07\x00\x00\x00\x04\
+\x00\x00\x00\x3c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x5e\x00\x01\x00\x00\x00\x01\x00\x00\x01\x07\
+\x00\x00\x00\x7a\x00\x00\x00\x00\x00\x01\x00\x00\x02\xa9\
+\x00\x00\x00\x98\x00\x00\x00\x00\x00\x01\x00\x00\x03\x11\
+\x00\x00\x00\xae\x00\x01\x00\x00\x00\x01\x00\x00\x08\x47\
+\x00\x00\x00\xcc\x00\x01\x00\x00\x00\x01\x00\x00\x0a\x4d\
+\x00\x00\x00\xe4\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x4b\
+\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\x00\x00\x0d\x47\
+\x00\x00\x01\x1c\x00\x00\x00\x00\x00\x01\x00\x00\x0f\xe1\
+\x00\x00\x01\x30\x00\x00\x00\x00\x00\x01\x00\x00\x12\x7c\
+\x00\x00\x01\x44\x00\x00\x00\x00\x00\x01\x00\x00\x15\x6f\
+\x00\x00\x01\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x19\xc4\
+\x00\x00\x01\x78\x00\x00\x00\x00\x00\x01\x00\x00\x1b\x85\
+\x00\x00\x01\x8e\x00\x00\x00\x00\x00\x01\x00\x00\x1d\xde\
+\x00\x00\x01\xa6\x00\x00\x00\x00\x00\x01\x00\x00\x27\x2b\
+\x00\x00\x01\xbc\x00\x00\x00\x00\x00\x01\x00\x00\x29\x16\
+\x00\x00\x01\xce\x00\x00\x00\x00\x00\x01\x00\x00\x2b\x06\
+\x00\x00\x01\xea\x00\x00\x00\x00\x00\x01\x00\x00\x2c\xc0\
+\x00\x00\x02\x00\x00\x00\x00\x00\x00\x01\x00\x00\x30\xd0\
+\x00\x00\x02\x16\x00\x00\x00\x00\x00\x01\x00\x00\x35\x06\
+\x00\x00\x02\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x3d\x6e\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x1a\x00\x02\x00\x00\x00\x0e\x00\x00\x00\x0b\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x2a\x00\x02\x00\x00\x00\x07\x00\x00\x00\x04\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x3c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1\x50\xab\x1c\x30\
+\x00\x00\x00\x5e\x00\x01\x00\x00\x00\x01\x00\x00\x01\x07\
+\x00\x00\x01\xa1\x50\xab\x1c\x30\
+\x00\x00\x00\x7a\x00\x00\x00\x00\x00\x01\x00\x00\x02\xa9\
+\x00\x00\x01\xa1\x50\xcd\x52\x2c\
+\x00\x00\x00\x98\x00\x00\x00\x00\x00\x01\x00\x00\x03\x11\
+\x00\x00\x01\xa1\x50\xcd\x54\x00\
+\x00\x00\x00\xae\x00\x01\x00\x00\x00\x01\x00\x00\x08\x47\
+\x00\x00\x01\xa1\x50\xd9\xaf\xe8\
+\x00\x00\x00\xcc\x00\x01\x00\x00\x00\x01\x00\x00\x0a\x4d\
+\x00\x00\x01\xa1\x50\xd9\xcd\xc6\
+\x00\x00\x00\xe4\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x4b\
+\x00\x00\x01\xa1\x50\xcd\x54\x01\
+\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\x00\x00\x0d\x47\
+\x00\x00\x01\x97\x79\x3b\x78\x30\
+\x00\x00\x01\x1c\x00\x00\x00\x00\x00\x01\x00\x00\x0f\xe1\
+\x00\x00\x01\x97\x79\x3b\x78\x30\
+\x00\x00\x01\x30\x00\x00\x00\x00\x00\x01\x00\x00\x12\x7c\
+\x00\x00\x01\x97\x79\x3b\x78\x30\
+\x00\x00\x01\x44\x00\x00\x00\x00\x00\x01\x00\x00\x15\x6f\
+\x00\x00\x01\x97\x79\x3b\x78\x30\
+\x00\x00\x01\x5a\x00\x00\x00\x00\x00\x01\x00\x00\x19\xc4\
+\x00\x00\x01\x97\x79\x3b\x78\x30\
+\x00\x00\x01\x78\x00\x00\x00\x00\x00\x01\x00\x00\x1b\x85\
+\x00\x00\x01\x97\x79\x3b\x78\x30\
+\x00\x00\x01\x8e\x00\x00\x00\x00\x00\x01\x00\x00\x1d\xde\
+\x00\x00\x01\x97\x79\x3b\x78\x30\
+\x00\x00\x01\xa6\x00\x00\x00\x00\x00\x01\x00\x00\x27\x2b\
+\x00\x00\x01\x97\x79\x3b\x78\x30\
+\x00\x00\x01\xbc\x00\x00\x00\x00\x00\x01\x00\x00\x29\x16\
+\x00\x00\x01\x97\x79\x3b\x78\x30\
+\x00\x00\x01\xce\x00\x00\x00\x00\x00\x01\x00\x00\x2b\x06\
+\x00\x00\x01\x97\x79\x3b\x78\x30\
+\x00\x00\x01\xea\x00\x00\x00\x00\x00\x01\x00\x00\x2c\xc0\
+\x00\x00\x01\x97\x79\x3b\x78\x30\
+\x00\x00\x02\x00\x00\x00\x00\x00\x00\x01\x00\x00\x30\xd0\
+\x00\x00\x01\x97\x79\x3b\x78\x30\
+\x00\x00\x02\x16\x00\x00\x00\x00\x00\x01\x00\x00\x35\x06\
+\x00\x00\x01\x97\x79\x3b\x78\x30\
+\x00\x00\x02\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x3d\x6e\
+\x00\x00\x01\x97\x79\x3b\x78\x30\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
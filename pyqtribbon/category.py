@@ -2,10 +2,13 @@ import typing
 
 from qtpy import QtCore, QtGui, QtWidgets
 
-from .constants import RibbonCategoryStyle
+from .constants import Large, RibbonCategoryStyle, RibbonPanelScale
+from .layoutplanner import RibbonLayoutPlanCache, selectPanelScales
 from .panel import RibbonPanel
+from .proxystyle import polishRibbonChild
 from .separator import RibbonSeparator
-from .utils import DataFile
+from .toolbutton import RibbonToolButton
+from .utils import DataIcon
 
 if typing.TYPE_CHECKING:
     from .ribbonbar import RibbonBar  # noqa: F401
@@ -28,9 +31,42 @@ class RibbonCategoryScrollArea(QtWidgets.QScrollArea):
 class RibbonCategoryScrollAreaContents(QtWidgets.QFrame):
     """Scroll area contents for the gallery"""
 
+    def childEvent(self, event: QtCore.QChildEvent):
+        """Set the proxy style of the ribbon on the panels added to the category."""
+        super().childEvent(event)
+        if event.type() == QtCore.QEvent.Type.ChildPolished:
+            polishRibbonChild(self, event.child())
+
+
+class RibbonPanelCollapsedButton(RibbonToolButton):
+    """Button that replaces a collapsed panel, it shows the panel in a popup when clicked."""
+
     pass
 
 
+class RibbonPanelPopup(QtWidgets.QFrame):
+    """Popup to show a collapsed panel."""
+
+    #: Signal, the popup is hidden.
+    hidden = QtCore.Signal()
+
+    def __init__(self, parent=None):
+        """Create a new panel popup.
+
+        :param parent: The parent widget.
+        """
+        super().__init__(parent)
+        self.setWindowFlags(QtCore.Qt.WindowType.Popup)
+        self._popupLayout = QtWidgets.QHBoxLayout(self)
+        self._popupLayout.setContentsMargins(0, 0, 0, 0)
+        self._popupLayout.setSpacing(0)
+
+    def hideEvent(self, a0: QtGui.QHideEvent) -> None:
+        """Override the hide event to emit the hidden signal."""
+        super().hideEvent(a0)
+        self.hidden.emit()  # type: ignore
+
+
 class RibbonCategoryLayoutWidget(QtWidgets.QFrame):
     """The category layout widget's category scroll area to arrange the widgets in the category."""
 
@@ -61,13 +97,13 @@ class RibbonCategoryLayoutWidget(QtWidgets.QFrame):
 
         # Previous/Next buttons
         self._previousButton = RibbonCategoryLayoutButton(self)
-        self._previousButton.setIcon(QtGui.QIcon(DataFile("icons/backward.png")))
+        self._previousButton.setIcon(DataIcon("icons/backward.png"))
         self._previousButton.setIconSize(QtCore.QSize(12, 12))
         self._previousButton.setToolButtonStyle(QtCore.Qt.ToolButtonStyle.ToolButtonIconOnly)
         self._previousButton.setAutoRaise(True)
         self._previousButton.clicked.connect(self.scrollPrevious)  # type: ignore
         self._nextButton = RibbonCategoryLayoutButton(self)
-        self._nextButton.setIcon(QtGui.QIcon(DataFile("icons/forward.png")))
+        self._nextButton.setIcon(DataIcon("icons/forward.png"))
         self._nextButton.setIconSize(QtCore.QSize(12, 12))
         self._nextButton.setToolButtonStyle(QtCore.Qt.ToolButtonStyle.ToolButtonIconOnly)
         self._nextButton.setAutoRaise(True)
@@ -154,6 +190,24 @@ class RibbonCategory(RibbonCategoryLayoutWidget):
     _color: typing.Optional[QtGui.QColor]
     #: Maximum rows
     _maxRows: int = 6
+    #: cache of the layout plans of the panels
+    _layoutPlanCache: typing.Optional[RibbonLayoutPlanCache] = None
+    #: whether the widgets of the panels are wrapped in item widgets
+    _itemWidgetsEnabled: bool = True
+    #: whether the panels are scaled down when the category is not wide enough
+    _adaptiveScaling: bool = False
+    #: width of the buckets of available widths, the scales of the panels are memoized per bucket
+    _scaleBucketWidth: int = 16
+    #: memoized scales of the panels, keyed by the width bucket and the widths of the panels
+    _panelScalesCache: typing.Dict[typing.Tuple[int, typing.Tuple], typing.Tuple[RibbonPanelScale, ...]]
+    #: buttons that replace the collapsed panels
+    _collapsedButtons: typing.Dict[str, RibbonPanelCollapsedButton]
+    #: popup to show a collapsed panel
+    _panelPopup: typing.Optional[RibbonPanelPopup] = None
+    #: title of the panel shown in the popup
+    _popupPanelTitle: typing.Optional[str] = None
+    #: data of the panels that are built when the category is shown or its panels are requested
+    _pendingPanelsData: typing.Dict[str, typing.Dict]
 
     @typing.overload
     def __init__(
@@ -195,13 +249,167 @@ class RibbonCategory(RibbonCategoryLayoutWidget):
         self._panels = {}
         self._ribbon = parent  # type: RibbonBar
         self._color = color
+        self._panelScalesCache = {}
+        self._collapsedButtons = {}
+        self._pendingPanelsData = {}
 
     def setMaximumRows(self, rows: int):
-        """Set the maximum number of rows.
+        """Set the maximum number of rows, the widgets of the existing panels are re-placed.
 
         :param rows: The maximum number of rows.
         """
         self._maxRows = rows
+        for panel in self._panels.values():
+            panel.setMaximumRows(rows) if panel.maximumRows() != rows else None
+
+    def setLayoutPlanCache(self, cache: typing.Optional[RibbonLayoutPlanCache]):
+        """Set the cache of the layout plans of the panels, see RibbonPanel.setLayoutPlanCache().
+
+        :param cache: The cache, None to disable caching.
+        """
+        self._layoutPlanCache = cache
+        for panel in self._panels.values():
+            panel.setLayoutPlanCache(cache)
+
+    def setItemWidgetsEnabled(self, enabled: bool):
+        """Set whether the widgets added afterward to the panels are wrapped in item widgets, see
+        RibbonPanel.setItemWidgetsEnabled().
+
+        :param enabled: Whether the widgets are wrapped in item widgets.
+        """
+        self._itemWidgetsEnabled = enabled
+        for panel in self._panels.values():
+            panel.setItemWidgetsEnabled(enabled)
+
+    def adaptiveScaling(self) -> bool:
+        """Return whether the panels are scaled down when the category is not wide enough.
+
+        :return: Whether the panels are scaled down.
+        """
+        return self._adaptiveScaling
+
+    def setAdaptiveScaling(self, enabled: bool):
+        """Set whether the panels are scaled down when the category is not wide enough.
+
+        When enabled, the panels are scaled down from the right to the left, the large buttons are shown as medium
+        buttons, then as small buttons, and at last the panels are collapsed into buttons that show them in popups.
+
+        :param enabled: Whether the panels are scaled down.
+        """
+        self._adaptiveScaling = enabled
+        if enabled:
+            self.updatePanelScales()
+        else:
+            self._applyPanelScales([RibbonPanelScale.Large] * len(self._panels))
+
+    def updatePanelScales(self):
+        """Select and apply the scales of the panels for the current width of the category.
+
+        The widths of the panels at each scale are measured once by the panels, and the selected scales are
+        memoized per bucket of widths, so resizing only changes the panels whose scale changes.
+        """
+        if not self._adaptiveScaling or not self._panels or self._popupPanelTitle is not None:
+            return
+        widths = tuple(self._panelScaleWidths(title, panel) for title, panel in self._panels.items())
+        overhead = 0
+        for index in range(self._categoryLayout.count()):
+            widget = self._categoryLayout.itemAt(index).widget()
+            if isinstance(widget, RibbonSeparator):
+                overhead += widget.sizeHint().width()
+        bucket = max(self.contentsRect().width() - overhead, 0) // self._scaleBucketWidth
+        key = (bucket, widths)
+        if key not in self._panelScalesCache:
+            self._panelScalesCache.clear() if len(self._panelScalesCache) > 256 else None
+            self._panelScalesCache[key] = selectPanelScales(widths, bucket * self._scaleBucketWidth)
+        self._applyPanelScales(self._panelScalesCache[key])
+
+    def _panelScaleWidths(self, title: str, panel: RibbonPanel) -> typing.Tuple[int, ...]:
+        """Return the widths of a panel at the Large, Medium, Small and Collapsed scales.
+
+        :param title: The title of the panel.
+        :param panel: The panel.
+        :return: The widths of the panel.
+        """
+        return (
+            panel.scaleWidth(RibbonPanelScale.Large),
+            panel.scaleWidth(RibbonPanelScale.Medium),
+            panel.scaleWidth(RibbonPanelScale.Small),
+            self._collapsedButton(title).sizeHint().width(),
+        )
+
+    def _applyPanelScales(self, scales: typing.Sequence[RibbonPanelScale]):
+        """Apply the scales to the panels, the collapsed panels are hidden and replaced by buttons.
+
+        :param scales: The scales of the panels.
+        """
+        self.setUpdatesEnabled(False)
+        for (title, panel), scale in zip(self._panels.items(), scales):
+            panel.setScale(scale)
+            collapsed = scale == RibbonPanelScale.Collapsed
+            if collapsed or title in self._collapsedButtons:
+                self._collapsedButton(title).setVisible(collapsed)
+            panel.setVisible(not collapsed)
+        self.setUpdatesEnabled(True)
+
+    def _collapsedButton(self, title: str) -> RibbonPanelCollapsedButton:
+        """Return the button that replaces a collapsed panel, it is created on demand.
+
+        :param title: The title of the panel.
+        :return: The button.
+        """
+        if title not in self._collapsedButtons:
+            panel = self._panels[title]
+            button = RibbonPanelCollapsedButton(self)
+            button.setButtonStyle(Large)
+            button.setText(title)
+            button.setIcon(DataIcon("icons/more.png"))
+            button.setFixedHeight(panel.height())
+            button.setVisible(False)
+            button.clicked.connect(lambda: self.showPanelPopup(title))  # type: ignore
+            self._categoryLayout.insertWidget(self._categoryLayout.indexOf(panel) + 1, button)
+            self._collapsedButtons[title] = button
+        return self._collapsedButtons[title]
+
+    def showPanelPopup(self, title: str):
+        """Show a collapsed panel in a popup below its button.
+
+        :param title: The title of the panel.
+        """
+        panel = self._panels[title]
+        button = self._collapsedButton(title)
+        if self._panelPopup is None:
+            self._panelPopup = RibbonPanelPopup(self)
+            self._panelPopup.hidden.connect(self._restorePopupPanel)  # type: ignore
+        self._popupPanelTitle = title
+        self._categoryLayout.removeWidget(panel)
+        self._panelPopup.layout().addWidget(panel)
+        panel.setVisible(True)
+        self._panelPopup.adjustSize()
+        self._panelPopup.move(button.mapToGlobal(QtCore.QPoint(0, button.height())))
+        self._panelPopup.show()
+
+    def _restorePopupPanel(self):
+        """Put the panel shown in the popup back in the category once the popup is hidden."""
+        title, self._popupPanelTitle = self._popupPanelTitle, None
+        if title is None or title not in self._panels:
+            return
+        panel = self._panels[title]
+        self._panelPopup.layout().removeWidget(panel)
+        self._categoryLayout.insertWidget(self._categoryLayout.indexOf(self._collapsedButtons[title]), panel)
+        panel.setVisible(panel.scale() != RibbonPanelScale.Collapsed)
+        self.updatePanelScales()
+
+    def resizeEvent(self, a0: QtGui.QResizeEvent) -> None:
+        """Override the resize event to scale the panels to the new width."""
+        super().resizeEvent(a0)
+        if a0.size().width() != a0.oldSize().width():
+            self.updatePanelScales()
+
+    def showEvent(self, a0: QtGui.QShowEvent) -> None:
+        """Override the show event to build the pending panels and scale the panels to the width of the category."""
+        self.buildPendingPanels()
+        super().showEvent(a0)
+        self.updatePanelScales()
 
     def title(self) -> str:
         """Return the title of the category."""
@@ -228,6 +436,7 @@ class RibbonCategory(RibbonCategoryLayoutWidget):
             str,  # title of the panel
             typing.Dict,  # data of the panel
         ],
+        lazy: bool = False,
     ) -> typing.Dict[str, RibbonPanel]:
         """Add panels from a dictionary.
 
@@ -253,13 +462,20 @@ class RibbonCategory(RibbonCategoryLayoutWidget):
                                 }
                             },
                         }
+        :param lazy: Whether to keep the data and build the panels when the category is shown or its panels are
+                     requested, an empty dictionary is returned in this case.
         :return: A dictionary of the newly created panels.
         """
+        if lazy:
+            self._pendingPanelsData.update(data)
+            return {}
+        self.buildPendingPanels()
         panels = {}
         for title, panel_data in data.items():
             showPanelOptionButton = panel_data.get("showPanelOptionButton", True)
             panels[title] = self.addPanel(title, showPanelOptionButton)
             panels[title].addWidgetsBy(panel_data.get("widgets", {}))
+        self.updatePanelScales()
         return panels
 
     def addPanel(self, title: str, showPanelOptionButton=True) -> RibbonPanel:
@@ -269,6 +485,7 @@ class RibbonCategory(RibbonCategoryLayoutWidget):
         :param showPanelOptionButton: Whether to show the panel option button.
         :return: The newly created panel.
         """
+        self.buildPendingPanels()
         panel = RibbonPanel(title, maxRows=self._maxRows, showPanelOptionButton=showPanelOptionButton, parent=self)
         panel.setFixedHeight(
             self.height()
@@ -276,6 +493,8 @@ class RibbonCategory(RibbonCategoryLayoutWidget):
             - self._mainLayout.contentsMargins().top()
             - self._mainLayout.contentsMargins().bottom()
         )
+        panel.setLayoutPlanCache(self._layoutPlanCache)
+        panel.setItemWidgetsEnabled(self._itemWidgetsEnabled)
         self._panels[title] = panel
         self.addWidget(panel)  # type: ignore
         self.addWidget(RibbonSeparator(width=10))  # type: ignore
@@ -286,9 +505,14 @@ class RibbonCategory(RibbonCategoryLayoutWidget):
 
         :param title: The title of the panel.
         """
+        self.buildPendingPanels()
         # self._panelLayout.removeWidget(self._panels[title])
         self.removeWidget(self._panels[title])
         self._panels.pop(title)
+        if title in self._collapsedButtons:
+            button = self._collapsedButtons.pop(title)
+            self.removeWidget(button)
+            button.deleteLater()
 
     def takePanel(self, title: str) -> RibbonPanel:
         """Remove and return a panel from the category.
@@ -296,6 +520,7 @@ class RibbonCategory(RibbonCategoryLayoutWidget):
         :param title: The title of the panel.
         :return: The removed panel.
         """
+        self.buildPendingPanels()
         panel = self._panels[title]
         self.removePanel(title)
         return panel
@@ -306,6 +531,7 @@ class RibbonCategory(RibbonCategoryLayoutWidget):
         :param title: The title of the panel.
         :return: The panel.
         """
+        self.buildPendingPanels()
         return self._panels[title]
 
     def panels(self) -> typing.Dict[str, RibbonPanel]:
@@ -313,8 +539,19 @@ class RibbonCategory(RibbonCategoryLayoutWidget):
 
         :return: The panels.
         """
+        self.buildPendingPanels()
         return self._panels
 
+    def hasPendingPanels(self) -> bool:
+        """Return whether the category has panels added lazily that are not built yet."""
+        return bool(self._pendingPanelsData)
+
+    def buildPendingPanels(self):
+        """Build the panels added lazily, it is called when the category is shown or its panels are requested."""
+        if self._pendingPanelsData:
+            data, self._pendingPanelsData = self._pendingPanelsData, {}
+            self.addPanelsBy(data)
+
 
 class RibbonNormalCategory(RibbonCategory):
     """A normal category."""
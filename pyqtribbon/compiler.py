@@ -0,0 +1,238 @@
+"""Ahead-of-time compiler of ribbon specs.
+
+``RibbonBar.addCategoriesBy()`` interprets a nested dict at runtime: the method of every widget is looked up by name
+and the cells of the widgets are searched in the grid of the panels. The compiler turns the same spec into a Python
+module with a ``build(ribbon)`` function made of direct calls, the methods are resolved and the cells of the widgets
+are computed when the module is generated:
+
+.. code-block:: bash
+
+    python -m pyqtribbon.compiler ribbon.json -o ribbon_builder.py
+
+.. code-block:: python
+
+    from ribbon_builder import build
+
+    categories, widgets = build(ribbonbar)
+
+The spec is a dict of the form of the data of ``RibbonBar.addCategoriesBy()``, given as a dict or read from a JSON
+file, or a YAML file if PyYAML is installed. In JSON and YAML files, the values of ``style``, ``rowSpan`` and
+``mode`` can be given by name, e.g. ``"rowSpan": "Large"``, and the colors of the categories as color names.
+"""
+
+import argparse
+import json
+import os
+import sys
+import typing
+
+from qtpy import QtGui
+
+from .constants import RibbonButtonStyle, RibbonCategoryStyle, RibbonSpaceFindMode
+from .layoutplanner import RibbonPanelLayoutPlanner, layoutItemBy
+
+#: enums of the values that can be given by name in the specs, keyed by the name of the argument
+_namedValues: typing.Dict[str, typing.Type[typing.Any]] = {
+    "style": RibbonCategoryStyle,
+    "rowSpan": RibbonButtonStyle,
+    "mode": RibbonSpaceFindMode,
+}
+
+
+def _widgetCall(panelClass: type, type: str) -> typing.Tuple[str, typing.List[str]]:
+    """Return the call adding a type of widgets to a panel, the type is resolved like RibbonPanel.addWidgetsBy().
+
+    :param panelClass: The class of the panels, the type is looked up in its widgetFactories().
+    :param type: The type of the widget, e.g. Button, LargeButton, ComboBox, SmallComboBox, or a registered type.
+    :return: The source code of the callable, the add method of the panel or the factory of a type registered with
+             registerWidgetType(), and the arguments passed before the arguments of the widget.
+    """
+    from .panel import RibbonPanelWidgetMethod
+
+    factory = panelClass.widgetFactories().get(type.lower())
+    if factory is None:
+        raise ValueError(f"Unknown widget type {type!r}")
+    if isinstance(factory, RibbonPanelWidgetMethod):
+        return f"panel.{factory.name}", []
+    # the factory is registered at runtime, it is looked up in the table of the panel when the module is run
+    return f"panel.widgetFactories()[{type.lower()!r}]", ["panel"]
+
+
+def _namedValue(key: str, value: typing.Any) -> typing.Any:
+    """Return the enum value of an argument given by name.
+
+    :param key: The name of the argument.
+    :param value: The value of the argument.
+    :return: The enum value if the argument is an enum given by name, otherwise the value itself.
+    """
+    if key in _namedValues and isinstance(value, str):
+        try:
+            return _namedValues[key][value]
+        except KeyError:
+            raise ValueError(f"Invalid value {value!r} of {key}") from None
+    return value
+
+
+def _literal(value: typing.Any, names: typing.Set[str]) -> str:
+    """Return the source code of a value.
+
+    :param value: The value, a literal, a list, tuple or dict of values, an enum of pyqtribbon.constants or a color.
+    :param names: The names imported by the generated module, the names used by the source code are added.
+    :return: The source code.
+    """
+    if isinstance(value, (RibbonButtonStyle, RibbonCategoryStyle, RibbonSpaceFindMode)):
+        names.add(type(value).__name__)
+        return f"{type(value).__name__}.{value.name}"
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return repr(value)
+    if isinstance(value, QtGui.QColor):
+        names.add("QtGui")
+        return f"QtGui.QColor({value.red()}, {value.green()}, {value.blue()}, {value.alpha()})"
+    if isinstance(value, list):
+        return "[" + ", ".join(_literal(v, names) for v in value) + "]"
+    if isinstance(value, tuple):
+        return "(" + ", ".join(_literal(v, names) for v in value) + ("," if len(value) == 1 else "") + ")"
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{_literal(k, names)}: {_literal(v, names)}" for k, v in value.items()) + "}"
+    raise ValueError(f"The value {value!r} cannot be compiled")
+
+
+def compileSpec(
+    spec: typing.Dict[str, typing.Dict],
+    maxRows: int = 6,
+    source: str = "a dict",
+    panelClass: typing.Optional[type] = None,
+) -> str:
+    """Compile a ribbon spec into the source code of a builder module.
+
+    :param spec: The spec, a dict of the form of the data of RibbonBar.addCategoriesBy().
+    :param maxRows: The maximal number of rows of the panels the cells of the widgets are computed for, the
+                    widgets are placed at runtime if the panels have a different number of rows.
+    :param source: The description of the spec in the docstring of the module, e.g. the path of the spec file.
+    :param panelClass: The class whose widget factories resolve the types of the widgets, RibbonPanel if None. The
+                       types registered with registerWidgetType() must be registered when the module is run.
+    :return: The source code of the module.
+    """
+    if panelClass is None:
+        from .panel import RibbonPanel
+
+        panelClass = RibbonPanel
+    names = set()  # type: typing.Set[str]
+    body = []
+    for title, categoryData in spec.items():
+        style = _literal(_namedValue("style", categoryData.get("style", RibbonCategoryStyle.Normal)), names)
+        color = categoryData.get("color", None)
+        color = _literal(QtGui.QColor(color) if isinstance(color, str) else color, names)
+        body.append("")
+        body.append(f"    category = categories[{title!r}] = ribbon.addCategory({title!r}, {style}, {color})")
+        for panelTitle, panelData in categoryData.get("panels", {}).items():
+            showPanelOptionButton = _literal(panelData.get("showPanelOptionButton", True), names)
+            body.append(f"    panel = category.addPanel({panelTitle!r}, {showPanelOptionButton})")
+            widgets = panelData.get("widgets", {})
+            if not widgets:
+                continue
+            planner = RibbonPanelLayoutPlanner(maxRows)
+            cells, calls = [], []
+            for name, widgetData in widgets.items():
+                factory, arguments = _widgetCall(panelClass, widgetData.get("type", ""))
+                args = widgetData.get("args", ())
+                kwargs = widgetData.get("kwargs", widgetData.get("arguments", {}))
+                kwargs = {key: _namedValue(key, value) for key, value in kwargs.items()}
+                placement = planner.place(layoutItemBy(widgetData.get("type", ""), kwargs, panelClass))
+                cells.append((*placement[:4], int(placement.mode), placement.occupied))
+                arguments += [_literal(arg, names) for arg in args]
+                arguments += [f"{key}={_literal(value, names)}" for key, value in kwargs.items()]
+                calls.append(
+                    f"        widgets[{title!r}, {panelTitle!r}, {name!r}] = {factory}({', '.join(arguments)})"
+                )
+            state = planner.gridLayoutManager().state()
+            body.append(f"    with panel.batch({cells!r}, {state!r}, MAX_ROWS):")
+            body.extend(calls)
+        body.append("    category.updatePanelScales()")
+
+    lines = [f'"""Ribbon builder compiled from {source} by pyqtribbon.compiler, do not edit it by hand."""', ""]
+    if "QtGui" in names:
+        lines += ["from qtpy import QtGui", ""]
+    if names - {"QtGui"}:
+        lines += [f"from pyqtribbon.constants import {', '.join(sorted(names - {'QtGui'}))}", ""]
+    lines += [
+        "#: maximal number of rows of the panels the cells of the widgets are computed for",
+        f"MAX_ROWS = {maxRows!r}",
+        "",
+        "",
+        "def build(ribbon):",
+        '    """Add the categories to a ribbon bar.',
+        "",
+        "    :param ribbon: The ribbon bar.",
+        "    :return: The added categories keyed by title, and the added widgets keyed by the titles of the category",
+        "             and the panel and the name of the widget.",
+        '    """',
+        "    categories = {}",
+        "    widgets = {}",
+        *body,
+        "",
+        "    return categories, widgets",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def loadSpec(filename: typing.Union[str, os.PathLike]) -> typing.Dict[str, typing.Dict]:
+    """Load a ribbon spec from a JSON file, or a YAML file if PyYAML is installed.
+
+    :param filename: The path of the spec file, files with a .yaml or .yml extension are read as YAML.
+    :return: The spec.
+    """
+    with open(filename, encoding="utf-8") as file:
+        if os.path.splitext(filename)[1].lower() in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("PyYAML is required to load YAML specs") from None
+            return yaml.safe_load(file)
+        return json.load(file)
+
+
+def compileFile(
+    filename: typing.Union[str, os.PathLike],
+    output: typing.Optional[typing.Union[str, os.PathLike]] = None,
+    maxRows: int = 6,
+) -> str:
+    """Compile a spec file into a builder module.
+
+    :param filename: The path of the spec file, see loadSpec().
+    :param output: The path of the module to write, None to only return the source code.
+    :param maxRows: The maximal number of rows of the panels, see compileSpec().
+    :return: The source code of the module.
+    """
+    code = compileSpec(loadSpec(filename), maxRows, os.path.basename(filename))
+    if output is not None:
+        with open(output, "w", encoding="utf-8") as file:
+            file.write(code)
+    return code
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    """Compile a spec file from the command line.
+
+    :param argv: The command line arguments, sys.argv[1:] if None.
+    :return: The exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m pyqtribbon.compiler", description="Compile a ribbon spec into a Python builder module."
+    )
+    parser.add_argument("spec", help="the spec file, JSON, or YAML if PyYAML is installed")
+    parser.add_argument("-o", "--output", help="the module to write, the source code is printed if not given")
+    parser.add_argument("--max-rows", type=int, default=6, help="the maximal number of rows of the panels")
+    args = parser.parse_args(argv)
+    try:
+        code = compileFile(args.spec, args.output, args.max_rows)
+    except (OSError, ValueError, ImportError) as e:
+        parser.error(str(e))
+    if args.output is None:
+        sys.stdout.write(code)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -56,3 +56,24 @@ class RibbonButtonStyle(IntEnum):
 Small = RibbonButtonStyle.Small
 Medium = RibbonButtonStyle.Medium
 Large = RibbonButtonStyle.Large
+
+
+class RibbonPanelScale(IntEnum):
+    """Scale of a panel when the category is not wide enough, Large, Medium, Small, or Collapsed."""
+
+    Large = 0
+    Medium = 1
+    Small = 2
+    Collapsed = 3
+
+
+class RibbonStyleEngine(IntEnum):
+    """Engine that draws the ribbon style, StyleSheet (cascading to all the widgets) or ProxyStyle (ribbon widgets
+    only)."""
+
+    StyleSheet = 0
+    ProxyStyle = 1
+
+
+StyleSheet = RibbonStyleEngine.StyleSheet
+ProxyStyle = RibbonStyleEngine.ProxyStyle
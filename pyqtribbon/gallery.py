@@ -2,10 +2,12 @@ import typing
 
 from qtpy import QtCore, QtGui, QtWidgets
 
+from .iconloader import IconSource, iconLoader
 from .menu import RibbonPermanentMenu
+from .proxystyle import polishRibbonChild
 from .separator import RibbonHorizontalSeparator
 from .toolbutton import RibbonToolButton
-from .utils import DataFile
+from .utils import DataIcon
 
 
 class RibbonPopupWidget(QtWidgets.QFrame):
@@ -95,17 +97,17 @@ class RibbonGallery(QtWidgets.QFrame):
         self._mainLayout.setSpacing(5)
 
         self._upButton = RibbonGalleryButton(self)
-        self._upButton.setIcon(QtGui.QIcon(DataFile("icons/up.png")))
+        self._upButton.setIcon(DataIcon("icons/up.png"))
         self._upButton.setIconSize(QtCore.QSize(24, 24))
         self._upButton.setToolButtonStyle(QtCore.Qt.ToolButtonStyle.ToolButtonIconOnly)
         self._upButton.setAutoRaise(True)
         self._downButton = RibbonGalleryButton(self)
-        self._downButton.setIcon(QtGui.QIcon(DataFile("icons/down.png")))
+        self._downButton.setIcon(DataIcon("icons/down.png"))
         self._downButton.setIconSize(QtCore.QSize(24, 24))
         self._downButton.setToolButtonStyle(QtCore.Qt.ToolButtonStyle.ToolButtonIconOnly)
         self._downButton.setAutoRaise(True)
         self._moreButton = RibbonGalleryButton(self)
-        self._moreButton.setIcon(QtGui.QIcon(DataFile("icons/more.png")))
+        self._moreButton.setIcon(DataIcon("icons/more.png"))
         self._moreButton.setIconSize(QtCore.QSize(24, 24))
         self._moreButton.setToolButtonStyle(QtCore.Qt.ToolButtonStyle.ToolButtonIconOnly)
         self._moreButton.setAutoRaise(True)
@@ -212,6 +214,7 @@ class RibbonGallery(QtWidgets.QFrame):
         self._listWidget.setSpacing((self.height() - item.sizeHint().height()) // 2)
         self._listWidget.addItem(item)
         self._listWidget.setItemWidget(item, widget)
+        polishRibbonChild(self, widget)
 
     def _addPopupWidget(self, widget: QtWidgets.QWidget):
         """Add a widget to the popup gallery
@@ -223,6 +226,7 @@ class RibbonGallery(QtWidgets.QFrame):
         self._popupListWidget.setSpacing((self.height() - item.sizeHint().height()) // 2)
         self._popupListWidget.addItem(item)
         self._popupListWidget.setItemWidget(item, widget)
+        polishRibbonChild(self, widget)
 
     def setPopupHideOnClick(self, popupHideOnClick: bool):
         """Set the hide on click flag
@@ -234,7 +238,7 @@ class RibbonGallery(QtWidgets.QFrame):
     def addButton(
         self,
         text: str = None,
-        icon: QtGui.QIcon = None,
+        icon: IconSource = None,
         slot=None,
         shortcut=None,
         tooltip=None,
@@ -244,7 +248,8 @@ class RibbonGallery(QtWidgets.QFrame):
         """Add a button to the gallery
 
         :param text: text of the button
-        :param icon: icon of the button
+        :param icon: icon of the button, a QIcon, a QPixmap, or the path or the content of an image file decoded in a
+                     thread pool
         :param slot: slot to call when the button is clicked
         :param shortcut: shortcut of the button
         :param tooltip: tooltip of the button
@@ -258,8 +263,8 @@ class RibbonGallery(QtWidgets.QFrame):
             button.setText(text)
             popupButton.setText(text)
         if icon is not None:
-            button.setIcon(icon)
-            popupButton.setIcon(icon)
+            iconLoader().load(icon, button.setIcon)
+            iconLoader().load(icon, popupButton.setIcon)
         if slot is not None:
             button.clicked.connect(slot)  # type: ignore
             popupButton.clicked.connect(slot)  # type: ignore
@@ -295,7 +300,7 @@ class RibbonGallery(QtWidgets.QFrame):
     def addToggleButton(
         self,
         text: str = None,
-        icon: QtGui.QIcon = None,
+        icon: IconSource = None,
         slot=None,
         shortcut=None,
         tooltip=None,
@@ -304,7 +309,8 @@ class RibbonGallery(QtWidgets.QFrame):
         """Add a toggle button to the gallery
 
         :param text: text of the button
-        :param icon: icon of the button
+        :param icon: icon of the button, a QIcon, a QPixmap, or the path or the content of an image file decoded in a
+                     thread pool
         :param slot: slot to call when the button is clicked
         :param shortcut: shortcut of the button
         :param tooltip: tooltip of the button
@@ -0,0 +1,147 @@
+"""Asynchronous loading of the icons given as file paths or bytes.
+
+The images are decoded into QImages in a thread pool, the widgets show a placeholder icon until the image is decoded
+and the icon is set in the GUI thread. The decoded icons are cached, so an image is decoded once.
+"""
+
+import hashlib
+import os
+import typing
+
+from qtpy import QtCore, QtGui
+
+#: the sources of the icons, a QIcon, a QPixmap, the path of an image file or the content of an image file
+IconSource = typing.Union[QtGui.QIcon, QtGui.QPixmap, str, os.PathLike, bytes]
+
+
+class _RibbonIconDecodeTask(QtCore.QRunnable):
+    """Task that decodes an image in the thread pool."""
+
+    def __init__(self, loader: "RibbonIconLoader", key: str, source: typing.Union[str, bytes]):
+        """Create a new task.
+
+        :param loader: The icon loader notified when the image is decoded.
+        :param key: The key of the image in the cache of the loader.
+        :param source: The path or the content of the image file.
+        """
+        super().__init__()
+        self._loader = loader
+        self._key = key
+        self._source = source
+
+    def run(self):
+        """Decode the image."""
+        image = QtGui.QImage()
+        image.loadFromData(self._source) if isinstance(self._source, bytes) else image.load(self._source)
+        self._loader._decoded.emit(self._key, image)
+
+
+class RibbonIconLoader(QtCore.QObject):
+    """Loader of the icons given as file paths or bytes, the images are decoded in a thread pool."""
+
+    #: Signal, an image was decoded, emitted from the thread pool
+    _decoded = QtCore.Signal(str, QtGui.QImage)
+
+    #: the decoded icons, keyed by the path or the hash of the content of the image file
+    _icons: typing.Dict[str, QtGui.QIcon]
+
+    #: the setters waiting for an image being decoded, keyed like the icons
+    _pending: typing.Dict[str, typing.List[typing.Callable[[QtGui.QIcon], typing.Any]]]
+
+    #: the placeholder icon
+    _placeholder: typing.Optional[QtGui.QIcon] = None
+
+    def __init__(self, parent=None):
+        """Create a new icon loader.
+
+        :param parent: The parent object.
+        """
+        super().__init__(parent)
+        self._icons = {}
+        self._pending = {}
+        self._threadPool = QtCore.QThreadPool(self)
+        self._decoded.connect(self._iconDecoded)  # type: ignore
+
+    def threadPool(self) -> QtCore.QThreadPool:
+        """Return the thread pool that decodes the images."""
+        return self._threadPool
+
+    def placeholderIcon(self) -> QtGui.QIcon:
+        """Return the icon shown until the image is decoded, a transparent icon."""
+        if self._placeholder is None:
+            pixmap = QtGui.QPixmap(64, 64)
+            pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+            self._placeholder = QtGui.QIcon(pixmap)
+        return self._placeholder
+
+    @staticmethod
+    def _key(source: typing.Union[str, os.PathLike, bytes]) -> str:
+        """Return the key of an image file in the cache.
+
+        :param source: The path or the content of the image file.
+        :return: The key.
+        """
+        if isinstance(source, bytes):
+            return "sha1:" + hashlib.sha1(source).hexdigest()
+        return "path:" + os.path.abspath(os.fspath(source))
+
+    def load(self, source: IconSource, setter: typing.Callable[[QtGui.QIcon], typing.Any]):
+        """Load an icon and pass it to a setter, the placeholder icon is passed until the image is decoded.
+
+        :param source: The source of the icon, a QIcon or a QPixmap is passed to the setter immediately.
+        :param setter: The function setting the icon, e.g. the setIcon method of a button.
+        """
+        if isinstance(source, (QtGui.QIcon, QtGui.QPixmap)):
+            setter(QtGui.QIcon(source))
+            return
+        key = self._key(source)
+        if key in self._icons:
+            setter(self._icons[key])
+            return
+        setter(self.placeholderIcon())
+        if key not in self._pending:
+            self._pending[key] = []
+            self._threadPool.start(
+                _RibbonIconDecodeTask(self, key, source if isinstance(source, bytes) else os.fspath(source))
+            )
+        self._pending[key].append(setter)
+
+    def _iconDecoded(self, key: str, image: QtGui.QImage):
+        """Create the icon of a decoded image in the GUI thread and pass it to the waiting setters.
+
+        :param key: The key of the image.
+        :param image: The decoded image, null if the image could not be decoded.
+        """
+        icon = QtGui.QIcon(QtGui.QPixmap.fromImage(image)) if not image.isNull() else QtGui.QIcon()
+        self._icons[key] = icon
+        for setter in self._pending.pop(key, []):
+            try:
+                setter(icon)
+            except RuntimeError:  # the widget was deleted in the meantime
+                pass
+
+    def waitForDone(self, msecs: int = -1) -> bool:
+        """Wait until all the images are decoded and the icons are set.
+
+        :param msecs: The maximum time to wait in milliseconds, -1 to wait without a time limit.
+        :return: Whether all the images were decoded.
+        """
+        done = self._threadPool.waitForDone(msecs)
+        QtCore.QCoreApplication.processEvents()
+        return done
+
+    def clear(self):
+        """Remove the decoded icons from the cache."""
+        self._icons.clear()
+
+
+#: the shared icon loader, created the first time it is requested
+_iconLoader: typing.Optional[RibbonIconLoader] = None
+
+
+def iconLoader() -> RibbonIconLoader:
+    """Return the icon loader shared by the ribbon widgets."""
+    global _iconLoader
+    if _iconLoader is None:
+        _iconLoader = RibbonIconLoader()
+    return _iconLoader
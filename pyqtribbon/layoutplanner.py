@@ -0,0 +1,767 @@
+"""Layout planner of the ribbon panels.
+
+The placement of the widgets in a panel, i.e. the cells in the grid layout and the sizes of the widgets, only
+depends on the number of rows of the panel and a few geometry metrics. This module computes them in pure Python,
+without creating any widget, so layouts can be computed off the GUI thread, cached, tested and benchmarked
+without a ``QApplication``.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import warnings
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .constants import (
+    ColumnWise,
+    Large,
+    Medium,
+    RibbonButtonStyle,
+    RibbonPanelScale,
+    RibbonSpaceFindMode,
+    Small,
+)
+
+
+class RibbonGridLayoutManager(object):
+    """Grid Layout Manager.
+
+    The occupied cells are stored as one integer bitmask per row, bit ``c`` of a row is set when the cell in
+    column ``c`` is occupied, so adding columns to the grid never copies the cells. The longest run of available
+    rows of every column is tracked as well, together with the first column that can still hold a widget of a
+    given row span, so the columns that filled up long ago are skipped and appending a widget only looks at the
+    last columns of the grid.
+    """
+
+    #: number of rows in the grid
+    rows: int
+    #: number of columns in the grid
+    columns: int
+    #: bitmasks of the occupied cells, one for each row
+    occupied: List[int]
+    #: longest run of available rows in each column
+    _freeRuns: List[int]
+    #: first column whose longest run of available rows is at least the index
+    _firstColumns: List[int]
+    #: cells occupied by the last call of request_cells(), the first row, the number of rows and the bitmask of the
+    #: columns, see release_mask()
+    lastOccupied: Optional[Tuple[int, int, int]] = None
+
+    def __init__(self, rows: int):
+        """Create a new grid layout manager.
+
+        :param rows: The number of rows in the grid layout.
+        """
+        self.rows = rows
+        self.columns = 1
+        self.occupied = [0] * rows
+        self._freeRuns = [rows]
+        self._firstColumns = [0] * (rows + 1)
+
+    @property
+    def cells(self) -> List[List[bool]]:
+        """The availability of the cells in the grid, True if the cell is available.
+
+        :return: A rows x columns nested list of booleans.
+        """
+        return [[not (mask >> col) & 1 for col in range(self.columns)] for mask in self.occupied]
+
+    def state(self) -> Tuple[int, List[int]]:
+        """Return the state of the grid.
+
+        :return: columns, occupied, the number of columns and the bitmasks of the occupied cells.
+        """
+        return self.columns, list(self.occupied)
+
+    def restoreState(self, columns: int, occupied: List[int]):
+        """Restore a state of the grid returned by state().
+
+        :param columns: The number of columns.
+        :param occupied: The bitmasks of the occupied cells, one for each row.
+        """
+        self.columns = columns
+        self.occupied = list(occupied)
+        self._freeRuns = [0] * columns
+        for col in range(columns):
+            self._updateFreeRun(col)
+        self._firstColumns = [0] * (self.rows + 1)
+
+    def firstFreeColumn(self, rowSpan: int = 1) -> int:
+        """Return the first column that has enough available rows for the given row span.
+
+        :param rowSpan: The number of rows.
+        :return: The index of the column, equals to the number of columns if there is no such column.
+        """
+        col = self._firstColumns[rowSpan]
+        while col < self.columns and self._freeRuns[col] < rowSpan:
+            col += 1
+        self._firstColumns[rowSpan] = col
+        return col
+
+    def _addColumns(self, count: int):
+        """Append empty columns to the grid.
+
+        :param count: The number of columns to append.
+        """
+        if count > 0:
+            self.columns += count
+            self._freeRuns.extend([self.rows] * count)
+
+    def _updateFreeRun(self, col: int):
+        """Recompute the longest run of available rows of a column.
+
+        :param col: The index of the column.
+        """
+        longest = run = 0
+        for mask in self.occupied:
+            run = 0 if (mask >> col) & 1 else run + 1
+            longest = max(longest, run)
+        self._freeRuns[col] = longest
+
+    def _occupy(self, row: int, col: int, rowSpan: int, colSpan: int):
+        """Mark a block of cells as occupied.
+
+        :param row: The first row of the block.
+        :param col: The first column of the block.
+        :param rowSpan: The number of rows of the block.
+        :param colSpan: The number of columns of the block.
+        """
+        bits = ((1 << colSpan) - 1) << col
+        for r in range(row, min(row + rowSpan, self.rows)):
+            self.occupied[r] |= bits
+        for c in range(col, col + colSpan):
+            self._updateFreeRun(c)
+        self.lastOccupied = (row, min(rowSpan, self.rows - row), bits)
+
+    def release_cells(self, row: int, col: int, rowSpan: int = 1, colSpan: int = 1):
+        """Release a block of cells so that they can be requested again.
+
+        :param row: The first row of the block.
+        :param col: The first column of the block.
+        :param rowSpan: The number of rows of the block.
+        :param colSpan: The number of columns of the block.
+        """
+        colSpan = min(colSpan, self.columns - col)
+        if colSpan > 0:
+            self.release_mask(row, rowSpan, ((1 << colSpan) - 1) << col)
+
+    def release_mask(self, row: int, rowCount: int, bits: int):
+        """Release the cells of some columns in some rows, e.g. the cells occupied by a widget, see lastOccupied.
+
+        :param row: The first row.
+        :param rowCount: The number of rows.
+        :param bits: The bitmask of the columns.
+        """
+        bits &= (1 << self.columns) - 1
+        if not bits:
+            return
+        for r in range(row, min(row + rowCount, self.rows)):
+            self.occupied[r] &= ~bits
+        col = (bits & -bits).bit_length() - 1
+        for c in range(col, bits.bit_length()):
+            self._updateFreeRun(c) if (bits >> c) & 1 else None
+        self._firstColumns = [min(first, col) for first in self._firstColumns]
+
+    def request_cells(self, rowSpan: int = 1, colSpan: int = 1, mode: RibbonSpaceFindMode = ColumnWise):
+        """Request a number of available cells from the grid.
+
+        :param rowSpan: The number of rows the cell should span.
+        :param colSpan: The number of columns the cell should span.
+        :param mode: The mode of the grid.
+        :return: row, col, the row and column of the requested cell.
+        """
+        if rowSpan > self.rows:
+            raise ValueError("RowSpan is too large")
+        if mode == ColumnWise:
+            # no block can start before the first column that has enough available rows
+            first = self.firstFreeColumn(max(rowSpan, 1))
+            allColumns = (1 << (self.columns - first)) - 1
+            for row in range(self.rows - rowSpan + 1):
+                occupied = 0
+                for r in range(row, row + rowSpan):
+                    occupied |= self.occupied[r]
+                available = ~(occupied >> first) & allColumns
+                # bit c of fits is set when the columns c, c+1, ..., c+colSpan-1 are all available
+                fits = available
+                for shift in range(1, colSpan):
+                    fits &= available >> shift
+                if fits:
+                    col = first + (fits & -fits).bit_length() - 1
+                    self._occupy(row, col, rowSpan, colSpan)
+                    return row, col
+        else:
+            # the first column from which the first row is available up to the end
+            col = self.occupied[0].bit_length()
+            if col < self.columns:
+                self._addColumns(col + colSpan - self.columns)
+                self._occupy(0, col, 1, self.columns - col)
+                return 0, col
+        cols = self.columns
+        colSpan1 = colSpan
+        if self._freeRuns[-1] == self.rows:
+            cols -= 1
+            colSpan1 -= 1
+        self._addColumns(colSpan1)
+        self._occupy(0, cols, rowSpan, colSpan)
+        return 0, cols
+
+
+class RibbonPanelMetrics(NamedTuple):
+    """Geometry metrics of a panel that are used to compute the sizes of the widgets."""
+
+    #: height of the panel
+    height: int = 0
+    #: height of the title widget
+    titleHeight: int = 15
+    #: size hint height of the title label
+    titleLabelHeight: int = 15
+    #: top and bottom contents margins of the main layout
+    mainMargins: Tuple[int, int] = (0, 0)
+    #: spacing of the main layout
+    mainSpacing: int = 0
+    #: top and bottom contents margins of the actions layout
+    actionsMargins: Tuple[int, int] = (5, 5)
+    #: vertical spacing of the actions layout
+    verticalSpacing: int = 0
+    #: font size of the buttons in pixels
+    fontSize: float = 12
+
+
+class RibbonLayoutItem(NamedTuple):
+    """Layout specification of a widget in a panel."""
+
+    #: row span or button style of the widget
+    rowSpan: Union[int, RibbonButtonStyle] = Small
+    #: number of columns the widget spans
+    colSpan: int = 1
+    #: mode to find spaces
+    mode: RibbonSpaceFindMode = ColumnWise
+    #: whether to fix the height of the widget, see RibbonPanel.addWidget()
+    fixedHeight: Union[bool, float] = False
+    #: kind of the widget, "widget", "button" or "gallery"
+    kind: str = "widget"
+
+
+class RibbonLayoutPlacement(NamedTuple):
+    """Placement of a widget in a panel computed by the layout planner."""
+
+    #: row of the widget
+    row: int
+    #: column of the widget
+    col: int
+    #: number of rows the widget spans
+    rowSpan: int
+    #: number of columns the widget spans
+    colSpan: int
+    #: mode used to find the space
+    mode: RibbonSpaceFindMode
+    #: maximum height of the widget, None if it is computed when the placement is replayed
+    maximumHeight: Optional[int]
+    #: fixed height of the widget, None if the height is not fixed
+    fixedHeight: Optional[int] = None
+    #: maximum icon size of the button, None if it is not limited
+    maximumIconSize: Optional[int] = None
+    #: cells occupied in the grid, see RibbonGridLayoutManager.lastOccupied, None if unknown
+    occupied: Optional[Tuple[int, int, int]] = None
+
+
+class RibbonPanelLayoutPlanner(object):
+    """Compute the placements of the widgets in a panel."""
+
+    #: maximal number of rows
+    _maxRows: int = 6
+    #: rows for large widgets
+    _largeRows: int = 6
+    #: rows for medium widgets
+    _mediumRows: int = 3
+    #: rows for small widgets
+    _smallRows: int = 2
+    #: geometry metrics of the panel
+    _metrics: RibbonPanelMetrics
+    #: GridLayout manager to request available cells.
+    _gridLayoutManager: RibbonGridLayoutManager
+    #: placements computed since startRecording(), None if not recording
+    _recording: Optional[List[RibbonLayoutPlacement]] = None
+    #: cached placements to replay, see replay()
+    _replayPlacements: Optional[List[RibbonLayoutPlacement]] = None
+    #: layout specifications of the replayed placements
+    _replayedItems: List[RibbonLayoutItem]
+    #: grid states before and after the replayed placements
+    _replayStates: Tuple[Tuple[int, List[int]], Tuple[int, List[int]]]
+
+    def __init__(self, maxRows: int = 6, metrics: Optional[RibbonPanelMetrics] = None):
+        """Create a new layout planner.
+
+        :param maxRows: The maximal number of rows in the panel.
+        :param metrics: The geometry metrics of the panel.
+        """
+        self.setMaximumRows(maxRows)
+        self._gridLayoutManager = RibbonGridLayoutManager(maxRows)
+        self._metrics = metrics if metrics is not None else RibbonPanelMetrics()
+
+    def maximumRows(self) -> int:
+        """Return the maximal number of rows in the panel."""
+        return self._maxRows
+
+    def largeRows(self) -> int:
+        """Return the number of span rows for large widgets."""
+        return self._largeRows
+
+    def mediumRows(self) -> int:
+        """Return the number of span rows for medium widgets."""
+        return self._mediumRows
+
+    def smallRows(self) -> int:
+        """Return the number of span rows for small widgets."""
+        return self._smallRows
+
+    def setMaximumRows(self, maxRows: int):
+        """Set the maximal number of rows in the panel, the rows of the large, medium and small widgets are
+        derived from it.
+
+        :param maxRows: The maximal number of rows in the panel.
+        """
+        self._maxRows = maxRows
+        self._largeRows = maxRows
+        self._mediumRows = max(round(maxRows / 2), 1)
+        self._smallRows = max(round(maxRows / 3), 1)
+
+    def setLargeRows(self, rows: int):
+        """Set the number of span rows for large widgets.
+
+        :param rows: The number of span rows for large widgets.
+        """
+        assert rows <= self._maxRows, "Invalid number of rows"
+        self._largeRows = rows
+
+    def setMediumRows(self, rows: int):
+        """Set the number of span rows for medium widgets.
+
+        :param rows: The number of span rows for medium widgets.
+        """
+        assert 0 < rows <= self._maxRows, "Invalid number of rows"
+        self._mediumRows = rows
+
+    def setSmallRows(self, rows: int):
+        """Set the number of span rows for small widgets.
+
+        :param rows: The number of span rows for small widgets.
+        """
+        assert 0 < rows <= self._maxRows, "Invalid number of rows"
+        self._smallRows = rows
+
+    def defaultRowSpan(self, rowSpan: Union[int, RibbonButtonStyle]) -> int:
+        """Return the number of span rows for the given widget type.
+
+        :param rowSpan: row span or type.
+        :return: The number of span rows for the given widget type.
+        """
+        if not isinstance(rowSpan, RibbonButtonStyle):
+            return rowSpan
+        if rowSpan == Large:
+            return self._largeRows
+        elif rowSpan == Medium:
+            return self._mediumRows
+        elif rowSpan == Small:
+            return self._smallRows
+        else:
+            raise ValueError("Invalid row span")
+
+    def metrics(self) -> RibbonPanelMetrics:
+        """Return the geometry metrics of the panel."""
+        return self._metrics
+
+    def setMetrics(self, metrics: RibbonPanelMetrics):
+        """Set the geometry metrics of the panel.
+
+        :param metrics: The geometry metrics.
+        """
+        self._metrics = metrics
+
+    def gridLayoutManager(self) -> RibbonGridLayoutManager:
+        """Return the grid layout manager."""
+        return self._gridLayoutManager
+
+    def resetGrid(self):
+        """Start over with an empty grid, the following placements start from the first cell."""
+        self._gridLayoutManager = RibbonGridLayoutManager(self._maxRows)
+
+    def rowHeight(self) -> int:
+        """Return the height of a row."""
+        m = self._metrics
+        rows = self._gridLayoutManager.rows
+        return int(
+            (
+                m.height
+                - m.mainMargins[0]
+                - m.mainMargins[1]
+                - m.mainSpacing
+                - m.titleHeight
+                - m.actionsMargins[0]
+                - m.actionsMargins[1]
+                - m.verticalSpacing * (rows - 1)
+            )
+            / rows
+        )
+
+    def maximumHeight(self, rowSpan: int) -> int:
+        """Return the maximum height of a widget spanning the given number of rows.
+
+        :param rowSpan: The number of rows.
+        :return: The maximum height.
+        """
+        return self.rowHeight() * rowSpan + self._metrics.verticalSpacing * (rowSpan - 2)
+
+    @staticmethod
+    def fixedHeight(fixedHeight: Union[bool, float], maximumHeight: int) -> Optional[int]:
+        """Return the fixed height of a widget.
+
+        :param fixedHeight: a boolean, a percentage or a fixed height, see RibbonPanel.addWidget().
+        :param maximumHeight: The maximum height of the widget.
+        :return: The fixed height, None if the height is not fixed.
+        """
+        if not (fixedHeight is True or fixedHeight > 0):
+            return None
+        fixedHeight = (
+            int(fixedHeight * maximumHeight)
+            if 0 < fixedHeight <= 1
+            else fixedHeight if 1 < fixedHeight < maximumHeight else maximumHeight
+        )
+        return int(max(fixedHeight, 0.4 * maximumHeight))  # minimum height is 40% of the maximum height
+
+    def buttonMaximumIconSize(self, style: RibbonButtonStyle) -> Optional[int]:
+        """Return the maximum icon size of a button, only large buttons are limited.
+
+        :param style: The button style.
+        :return: The maximum icon size, None if it is not limited.
+        """
+        if style != Large:
+            return None
+        m = self._metrics
+        maximumHeight = m.height - m.titleLabelHeight - m.mainSpacing - m.mainMargins[0] - m.mainMargins[1]
+        arrowSize = m.fontSize
+        return int(max(maximumHeight - m.fontSize * 2 - arrowSize, 48))
+
+    def sizes(self, item: RibbonLayoutItem, rowSpan: int) -> Tuple[int, Optional[int], Optional[int]]:
+        """Return the sizes of a widget spanning the given number of rows.
+
+        :param item: The layout specification of the widget.
+        :param rowSpan: The number of rows the widget spans.
+        :return: maximumHeight, fixedHeight, maximumIconSize, the maximum height of the widget, its fixed height
+                 and the maximum icon size of the button, the last two are None if they are not set.
+        """
+        maximumHeight = self.maximumHeight(rowSpan)
+        fixedHeight = self.fixedHeight(item.fixedHeight, maximumHeight)
+        if item.kind == "gallery" and fixedHeight is None:
+            fixedHeight = maximumHeight
+        maximumIconSize = None
+        if item.kind == "button" and isinstance(item.rowSpan, RibbonButtonStyle):
+            maximumIconSize = self.buttonMaximumIconSize(item.rowSpan)
+        return maximumHeight, fixedHeight, maximumIconSize
+
+    def place(self, item: RibbonLayoutItem) -> RibbonLayoutPlacement:
+        """Compute the placement of a widget and occupy its cells.
+
+        :param item: The layout specification of the widget.
+        :return: The placement of the widget.
+        """
+        rowSpan = self.defaultRowSpan(item.rowSpan)
+        if self._replayPlacements is not None:
+            replayed = self._replayNext(item, rowSpan)
+            if replayed is not None:
+                return replayed
+        row, col = self._gridLayoutManager.request_cells(rowSpan, item.colSpan, item.mode)
+        placement = RibbonLayoutPlacement(
+            row,
+            col,
+            rowSpan,
+            item.colSpan,
+            item.mode,
+            *self.sizes(item, rowSpan),
+            occupied=self._gridLayoutManager.lastOccupied,
+        )
+        self._recording.append(placement) if self._recording is not None else None
+        return placement
+
+    def plan(self, items: Iterable[RibbonLayoutItem]) -> List[RibbonLayoutPlacement]:
+        """Compute the placements of multiple widgets.
+
+        :param items: The layout specifications of the widgets.
+        :return: The placements of the widgets.
+        """
+        return [self.place(item) for item in items]
+
+    def startRecording(self):
+        """Start recording the placements computed by place()."""
+        self._recording = []
+
+    def stopRecording(self) -> List[RibbonLayoutPlacement]:
+        """Stop recording the placements.
+
+        :return: The placements computed since startRecording().
+        """
+        recording, self._recording = self._recording or [], None
+        return recording
+
+    def replay(self, placements: List[RibbonLayoutPlacement], state: Tuple[int, List[int]]):
+        """Replay cached placements, the following calls of place() return them in order without searching the
+        grid, and the grid is set to the given state once all of them are returned.
+
+        A placement that does not match the row span, column span or mode of the placed widget cancels the replay,
+        the cells of the widgets placed so far are then requested again, so the result is the same as without cache.
+
+        :param placements: The cached placements, the sizes of the placements whose maximum height is None are computed
+                           when they are returned, e.g. for the placements precomputed by the ribbon compiler.
+        :param state: The state of the grid after the cached placements, see RibbonGridLayoutManager.state().
+        """
+        self._replayPlacements = list(reversed(placements))
+        self._replayedItems = []
+        self._replayStates = (self._gridLayoutManager.state(), state)
+        self.finishReplay() if not placements else None
+
+    def _replayNext(self, item: RibbonLayoutItem, rowSpan: int) -> Optional[RibbonLayoutPlacement]:
+        """Return the next cached placement, None if it does not match the widget and the replay is cancelled.
+
+        :param item: The layout specification of the widget.
+        :param rowSpan: The number of rows the widget spans.
+        :return: The cached placement.
+        """
+        placement = self._replayPlacements[-1]
+        if (placement.rowSpan, placement.colSpan, placement.mode) != (rowSpan, item.colSpan, item.mode):
+            warnings.warn(
+                f"The cached placement spanning {placement.rowSpan}x{placement.colSpan} cells does not match a widget "
+                f"spanning {rowSpan}x{item.colSpan} cells, the cells of the widgets are searched in the grid",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            self.finishReplay()
+            return None
+        self._replayPlacements.pop()
+        if placement.maximumHeight is None:
+            maximumHeight, fixedHeight, maximumIconSize = self.sizes(item, rowSpan)
+            placement = placement._replace(
+                maximumHeight=maximumHeight, fixedHeight=fixedHeight, maximumIconSize=maximumIconSize
+            )
+        self._replayedItems.append(item)
+        self._recording.append(placement) if self._recording is not None else None
+        self.finishReplay() if not self._replayPlacements else None
+        return placement
+
+    def finishReplay(self):
+        """Stop replaying the cached placements and bring the grid up to date with the placements returned so far."""
+        if self._replayPlacements is None:
+            return
+        pending, self._replayPlacements = self._replayPlacements, None
+        before, after = self._replayStates
+        if pending:
+            self._gridLayoutManager.restoreState(*before)
+            for item in self._replayedItems:
+                self._gridLayoutManager.request_cells(self.defaultRowSpan(item.rowSpan), item.colSpan, item.mode)
+        else:
+            self._gridLayoutManager.restoreState(*after)
+        self._replayedItems = []
+
+
+class RibbonLayoutPlanCache(object):
+    """On-disk cache of the layout plans of the panels.
+
+    A plan is stored in a JSON file named after a hash of everything the placements depend on: the layout
+    specifications of the widgets, the rows of the panel, its geometry metrics and the state of its grid before
+    the widgets are added. A change of any of them results in another key, so outdated plans are never used.
+    """
+
+    #: version of the format of the plans, part of the keys
+    version = 2
+
+    #: directory of the cached plans
+    _directory: str
+
+    def __init__(self, directory: str):
+        """Create a new layout plan cache.
+
+        :param directory: The directory of the cached plans, created when the first plan is saved.
+        """
+        self._directory = directory
+
+    def directory(self) -> str:
+        """Return the directory of the cached plans."""
+        return self._directory
+
+    def key(self, items: Iterable[RibbonLayoutItem], planner: RibbonPanelLayoutPlanner) -> str:
+        """Return the key of the plan of the widgets.
+
+        :param items: The layout specifications of the widgets.
+        :param planner: The layout planner of the panel.
+        :return: The key of the plan.
+        """
+        content = {
+            "version": self.version,
+            "items": [
+                [
+                    item.rowSpan.name if isinstance(item.rowSpan, RibbonButtonStyle) else item.rowSpan,
+                    item.colSpan,
+                    int(item.mode),
+                    item.fixedHeight,
+                    item.kind,
+                ]
+                for item in items
+            ],
+            "rows": [planner.maximumRows(), planner.largeRows(), planner.mediumRows(), planner.smallRows()],
+            "metrics": list(planner.metrics()),
+            "grid": planner.gridLayoutManager().state(),
+        }
+        return hashlib.sha256(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        """Return the path of the file of a plan.
+
+        :param key: The key of the plan.
+        :return: The path of the file.
+        """
+        return os.path.join(self._directory, f"{key}.json")
+
+    def load(self, key: str) -> Optional[Tuple[List[RibbonLayoutPlacement], Tuple[int, List[int]]]]:
+        """Load a plan.
+
+        :param key: The key of the plan.
+        :return: placements, state, the placements of the widgets and the state of the grid after them, None if
+                 the plan is not cached or cannot be read.
+        """
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                data = json.load(f)
+            placements = [
+                RibbonLayoutPlacement(
+                    row, col, rowSpan, colSpan, RibbonSpaceFindMode(mode), *sizes, tuple(occupied) if occupied else None
+                )
+                for row, col, rowSpan, colSpan, mode, *sizes, occupied in data["placements"]
+            ]
+            columns, occupied = data["grid"]
+            return placements, (columns, occupied)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, key: str, placements: List[RibbonLayoutPlacement], state: Tuple[int, List[int]]):
+        """Save a plan, the file is replaced atomically and errors are ignored since the cache is optional.
+
+        :param key: The key of the plan.
+        :param placements: The placements of the widgets.
+        :param state: The state of the grid after the placements.
+        """
+        data = {"placements": [[*placement[:4], int(placement.mode), *placement[5:]] for placement in placements]}
+        data["grid"] = state
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            fd, path = tempfile.mkstemp(suffix=".tmp", dir=self._directory)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(path, self._path(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        """Remove all the cached plans."""
+        if os.path.isdir(self._directory):
+            for filename in os.listdir(self._directory):
+                os.remove(os.path.join(self._directory, filename)) if filename.endswith(".json") else None
+
+
+def selectPanelScales(widths: Sequence[Sequence[int]], available: int) -> Tuple[RibbonPanelScale, ...]:
+    """Select the scales of the panels of a category to fit the available width.
+
+    The panels start at the large scale, and are scaled down one level at a time from the rightmost panel to the
+    leftmost one, first to the medium scale, then to the small scale and at last collapsed, until they fit.
+
+    :param widths: The widths of each panel at the Large, Medium, Small and Collapsed scales.
+    :param available: The available width.
+    :return: The scales of the panels.
+    """
+    scales = [RibbonPanelScale.Large] * len(widths)
+    total = sum(width[RibbonPanelScale.Large] for width in widths)
+    for scale in (RibbonPanelScale.Medium, RibbonPanelScale.Small, RibbonPanelScale.Collapsed):
+        for index in reversed(range(len(widths))):
+            if total <= available:
+                return tuple(scales)
+            width = widths[index]
+            if width[scale] < width[scales[index]]:
+                total += width[scale] - width[scales[index]]
+                scales[index] = scale
+    return tuple(scales)
+
+
+def layoutItemBy(
+    type: str, kwargs: Optional[Dict[str, Any]] = None, panelClass: Optional[type] = None
+) -> RibbonLayoutItem:
+    """Return the layout specification of a widget from its type and keyword arguments.
+
+    :param type: The type of the widget, e.g. Button, LargeButton, ComboBox, see RibbonPanel.addWidgetsBy().
+    :param kwargs: The keyword arguments of the widget.
+    :param panelClass: The class of the panel, the default row span and the kind of the widget are read from the
+                       factory of the type in its widgetFactories(), RibbonPanel if None. The unknown types are
+                       planned as small widgets.
+    :return: The layout specification.
+    """
+    if panelClass is None:
+        from .panel import RibbonPanel
+
+        panelClass = RibbonPanel
+    kwargs = kwargs or {}
+    factory = panelClass.widgetFactories().get(type.lower())
+    return RibbonLayoutItem(
+        rowSpan=kwargs.get("rowSpan", getattr(factory, "rowSpan", Small)),
+        colSpan=kwargs.get("colSpan", 1),
+        mode=kwargs.get("mode", ColumnWise),
+        fixedHeight=kwargs.get("fixedHeight", False),
+        kind=getattr(factory, "kind", "widget"),
+    )
+
+
+def planPanel(
+    widgets: Dict[str, Dict],
+    maxRows: int = 6,
+    metrics: Optional[RibbonPanelMetrics] = None,
+    panelClass: Optional[type] = None,
+) -> Dict[str, RibbonLayoutPlacement]:
+    """Compute the placements of the widgets of a panel.
+
+    :param widgets: The widgets of the panel, of the same form as the data of RibbonPanel.addWidgetsBy().
+    :param maxRows: The maximal number of rows in the panel.
+    :param metrics: The geometry metrics of the panel.
+    :param panelClass: The class of the panel the types of the widgets are resolved with, see layoutItemBy().
+    :return: The placements of the widgets, keyed by the names of the widgets.
+    """
+    planner = RibbonPanelLayoutPlanner(maxRows, metrics)
+    return {
+        name: planner.place(
+            layoutItemBy(data.get("type", ""), data.get("kwargs", data.get("arguments", {})), panelClass)
+        )
+        for name, data in widgets.items()
+    }
+
+
+def planCategory(
+    panels: Dict[str, Dict],
+    maxRows: int = 6,
+    metrics: Optional[RibbonPanelMetrics] = None,
+    panelClass: Optional[type] = None,
+) -> Dict[str, Dict[str, RibbonLayoutPlacement]]:
+    """Compute the placements of the widgets of all the panels in a category.
+
+    :param panels: The panels of the category, of the same form as the data of RibbonCategory.addPanelsBy().
+    :param maxRows: The maximal number of rows in the panels.
+    :param metrics: The geometry metrics of the panels.
+    :param panelClass: The class of the panels the types of the widgets are resolved with, see layoutItemBy().
+    :return: The placements of the widgets, keyed by the titles of the panels and the names of the widgets.
+    """
+    return {title: planPanel(data.get("widgets", {}), maxRows, metrics, panelClass) for title, data in panels.items()}
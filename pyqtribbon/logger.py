@@ -5,11 +5,15 @@ https://timlehr.com/python-exception-hooks-with-qt-message-box/
 import logging
 import sys
 import traceback
+import typing
 
 from qtpy import QtCore, QtWidgets
 
+__all__ = ["UncaughtHook", "installExceptionHook", "log"]
+
+#: the logger of the uncaught exceptions, without a handler of its own the records are handled by the handlers of the
+#: application, or written to stderr when the logging is not configured
 log = logging.getLogger(__name__)
-log.addHandler(logging.StreamHandler(stream=sys.stdout))
 
 
 class UncaughtHook(QtCore.QObject):
@@ -52,5 +56,26 @@ class UncaughtHook(QtCore.QObject):
             self.show_exception_box(log_msg)
 
 
-# create a global instance of our class to register the hook
-qt_exception_hook = UncaughtHook()
+#: the global instance of the hook, created when the hook is installed
+_qtExceptionHook: typing.Optional[UncaughtHook] = None
+
+
+def installExceptionHook() -> UncaughtHook:
+    """Install the hook showing the uncaught exceptions in a message box, the hook is installed once.
+
+    It is installed when the first RibbonBar is created if sys.excepthook has not been replaced, call it to install
+    the hook before, or set sys.excepthook to opt out.
+
+    :return: The hook.
+    """
+    global _qtExceptionHook
+    if _qtExceptionHook is None:
+        _qtExceptionHook = UncaughtHook()
+    return _qtExceptionHook
+
+
+def __getattr__(name: str):
+    # the hook is installed when it is accessed for the first time, not when the module is imported
+    if name == "qt_exception_hook":
+        return installExceptionHook()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
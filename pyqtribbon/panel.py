@@ -1,10 +1,22 @@
 from __future__ import annotations
 
+import contextlib
 import functools
-import re
-from typing import Any, Callable, Dict, List, Union, overload
+import inspect
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
 
-import numpy as np
 from qtpy import QtCore, QtGui, QtWidgets
 
 from .constants import (
@@ -12,13 +24,25 @@ from .constants import (
     Large,
     Medium,
     RibbonButtonStyle,
+    RibbonPanelScale,
     RibbonSpaceFindMode,
     Small,
 )
 from .gallery import RibbonGallery
+from .iconloader import IconSource, iconLoader
+from .layoutplanner import (  # noqa: F401
+    RibbonGridLayoutManager,
+    RibbonLayoutItem,
+    RibbonLayoutPlacement,
+    RibbonLayoutPlanCache,
+    RibbonPanelLayoutPlanner,
+    RibbonPanelMetrics,
+    layoutItemBy,
+)
+from .proxystyle import polishRibbonChild
 from .separator import RibbonSeparator
 from .toolbutton import RibbonToolButton
-from .utils import DataFile
+from .utils import DataIcon
 
 
 class RibbonPanelTitle(QtWidgets.QLabel):
@@ -27,50 +51,55 @@ class RibbonPanelTitle(QtWidgets.QLabel):
     pass
 
 
-class RibbonGridLayoutManager(object):
-    """Grid Layout Manager."""
+class RibbonPanelWidgetMethod(NamedTuple):
+    """Factory of a widget type calling an add method of the panel, see RibbonPanel.widgetFactories()."""
 
-    def __init__(self, rows: int):
-        """Create a new grid layout manager.
+    #: name of the add method, e.g. addSmallComboBox
+    name: str
+    #: default row span of the widgets, the layout of the widgets is planned with it, see layoutItemBy()
+    rowSpan: Union[int, RibbonButtonStyle] = Small
+    #: kind of the widgets, "widget", "button" or "gallery", see RibbonLayoutItem
+    kind: str = "widget"
 
-        :param rows: The number of rows in the grid layout.
-        """
-        self.rows = rows
-        self.cells = np.ones((rows, 1), dtype=bool)
+    def __call__(self, panel: RibbonPanel, *args, **kwargs) -> QtWidgets.QWidget:
+        return getattr(panel, self.name)(*args, **kwargs)
 
-    def request_cells(self, rowSpan: int = 1, colSpan: int = 1, mode: RibbonSpaceFindMode = ColumnWise):
-        """Request a number of available cells from the grid.
 
-        :param rowSpan: The number of rows the cell should span.
-        :param colSpan: The number of columns the cell should span.
-        :param mode: The mode of the grid.
-        :return: row, col, the row and column of the requested cell.
-        """
-        if rowSpan > self.rows:
-            raise ValueError("RowSpan is too large")
-        if mode == ColumnWise:
-            for row in range(self.cells.shape[0] - rowSpan + 1):
-                for col in range(self.cells.shape[1] - colSpan + 1):
-                    if self.cells[row : row + rowSpan, col : col + colSpan].all():
-                        self.cells[row : row + rowSpan, col : col + colSpan] = False
-                        return row, col
-        else:
-            for col in range(self.cells.shape[1]):
-                if self.cells[0, col:].all():
-                    if self.cells.shape[1] - col < colSpan:
-                        self.cells = np.append(
-                            self.cells, np.ones((self.rows, colSpan - (self.cells.shape[1] - col)), dtype=bool), axis=1
-                        )
-                    self.cells[0, col:] = False
-                    return 0, col
-        cols = self.cells.shape[1]
-        colSpan1 = colSpan
-        if self.cells[:, -1].all():
-            cols -= 1
-            colSpan1 -= 1
-        self.cells = np.append(self.cells, np.ones((self.rows, colSpan1), dtype=bool), axis=1)
-        self.cells[:rowSpan, cols : cols + colSpan] = False
-        return 0, cols
+class RibbonPanelWidgetFactory(NamedTuple):
+    """Factory of a widget type registered with RibbonPanel.registerWidgetType()."""
+
+    #: the function called with the panel and the arguments of the widget, it returns the added widget
+    factory: Callable[..., QtWidgets.QWidget]
+    #: default row span of the widgets, the layout of the widgets is planned with it, see layoutItemBy()
+    rowSpan: Union[int, RibbonButtonStyle] = Small
+    #: kind of the widgets, "widget", "button" or "gallery", see RibbonLayoutItem
+    kind: str = "widget"
+
+    def __call__(self, panel: RibbonPanel, *args, **kwargs) -> QtWidgets.QWidget:
+        return self.factory(panel, *args, **kwargs)
+
+
+class RibbonPanelItemPlacement(NamedTuple):
+    """Placement of a widget in the grid layout of a panel."""
+
+    #: widget that is inserted into the grid layout
+    item: QtWidgets.QWidget
+    #: row of the widget
+    row: int
+    #: column of the widget
+    col: int
+    #: number of rows the widget spans
+    rowSpan: int
+    #: number of columns the widget spans
+    colSpan: int
+    #: mode used to find the space of the widget
+    mode: RibbonSpaceFindMode
+    #: alignment of the widget
+    alignment: QtCore.Qt.AlignmentFlag
+    #: layout specification of the widget, used to recompute its sizes when the geometry of the panel changes
+    layoutItem: Optional[RibbonLayoutItem] = None
+    #: cells occupied by the widget in the grid, see RibbonGridLayoutManager.lastOccupied, None if unknown
+    occupied: Optional[Tuple[int, int, int]] = None
 
 
 class RibbonPanelItemWidget(QtWidgets.QFrame):
@@ -106,25 +135,34 @@ class RibbonPanelOptionButton(QtWidgets.QToolButton):
 class RibbonPanel(QtWidgets.QFrame):
     """Panel in the ribbon category."""
 
-    #: maximal number of rows
-    _maxRows: int = 6
-    #: rows for large widgets
-    _largeRows: int = 6
-    #: rows for medium widgets
-    _mediumRows: int = 3
-    #: rows for small widgets
-    _smallRows: int = 2
-    #: GridLayout manager to request available cells.
-    _gridLayoutManager: RibbonGridLayoutManager
+    #: layout planner to compute the placements of the widgets
+    _planner: RibbonPanelLayoutPlanner
+    #: cache of the layout plans used by addWidgetsBy(), None if the plans are not cached
+    _layoutPlanCache: Optional[RibbonLayoutPlanCache] = None
+    #: whether the widgets are wrapped in RibbonPanelItemWidget, otherwise they are put directly in the grid layout
+    _itemWidgetsEnabled: bool = True
+    #: whether the geometry metrics of the layout planner are up-to-date
+    _layoutMetricsValid: bool = False
+    #: scale of the panel, see RibbonCategory.setAdaptiveScaling()
+    _scale: RibbonPanelScale = RibbonPanelScale.Large
+    #: widths of the panel at the scales, measured on demand
+    _scaleWidths: Dict[RibbonPanelScale, int]
     #: whether to show the panel option button
     _showPanelOptionButton: bool
 
     #: widgets that are added to the panel
     _widgets: List[QtWidgets.QWidget] = []
+    #: placements of the widgets in the grid layout
+    _placements: Dict[QtWidgets.QWidget, RibbonPanelItemPlacement]
+    #: placements waiting to be inserted into the grid layout, None if the widgets are inserted immediately
+    _pendingPlacements: Optional[List[RibbonPanelItemPlacement]] = None
 
     # height of the title widget
     _titleHeight: int = 15
 
+    #: factories of the widget types of addWidgetsBy(), keyed by the lowercase type, built once per class
+    _widgetFactories: Dict[str, Callable[..., QtWidgets.QWidget]]
+
     # Panel options signal
     panelOptionClicked = QtCore.Signal(bool)
 
@@ -155,12 +193,11 @@ class RibbonPanel(QtWidgets.QFrame):
             showPanelOptionButton = True
             parent = args[0] if len(args) > 0 else kwargs.get("parent", None)
         super().__init__(parent)
-        self._maxRows = maxRows
-        self._largeRows = maxRows
-        self._mediumRows = max(round(maxRows / 2), 1)
-        self._smallRows = max(round(maxRows / 3), 1)
-        self._gridLayoutManager = RibbonGridLayoutManager(self._maxRows)
+        self._planner = RibbonPanelLayoutPlanner(maxRows)
         self._widgets = []
+        self._placements = {}
+        self._pendingPlacements = None
+        self._scaleWidths = {}
         self._showPanelOptionButton = showPanelOptionButton
 
         # Main layout
@@ -189,7 +226,7 @@ class RibbonPanel(QtWidgets.QFrame):
         if showPanelOptionButton:
             self._panelOption = RibbonPanelOptionButton()  # type: ignore
             self._panelOption.setAutoRaise(True)
-            self._panelOption.setIcon(QtGui.QIcon(DataFile("icons/linking.png")))
+            self._panelOption.setIcon(DataIcon("icons/linking.png"))
             self._panelOption.setIconSize(QtCore.QSize(self._titleHeight, self._titleHeight))
             self._panelOption.setToolTip("Panel options")
             self._panelOption.clicked.connect(self.panelOptionClicked)  # type: ignore
@@ -197,67 +234,75 @@ class RibbonPanel(QtWidgets.QFrame):
 
         self._mainLayout.addWidget(self._titleWidget, 0)
 
+    def childEvent(self, event: QtCore.QChildEvent):
+        """Set the proxy style of the ribbon on the widgets added to the panel."""
+        super().childEvent(event)
+        if event.type() == QtCore.QEvent.Type.ChildPolished:
+            polishRibbonChild(self, event.child())
+
     def maximumRows(self) -> int:
         """Return the maximal number of rows in the panel.
 
         :return: The maximal number of rows in the panel.
         """
-        return self._maxRows
+        return self._planner.maximumRows()
 
     def largeRows(self) -> int:
         """Return the number of span rows for large widgets.
 
         :return: The number of span rows for large widgets.
         """
-        return self._largeRows
+        return self._planner.largeRows()
 
     def mediumRows(self) -> int:
         """Return the number of span rows for medium widgets.
 
         :return: The number of span rows for medium widgets.
         """
-        return self._mediumRows
+        return self._planner.mediumRows()
 
     def smallRows(self) -> int:
         """Return the number of span rows for small widgets.
 
         :return: The number of span rows for small widgets.
         """
-        return self._smallRows
+        return self._planner.smallRows()
 
     def setMaximumRows(self, maxRows: int):
         """Set the maximal number of rows in the panel.
 
         :param maxRows: The maximal number of rows in the panel.
         """
-        self._maxRows = maxRows
-        self._largeRows = maxRows
-        self._mediumRows = max(round(maxRows / 2), 1)
-        self._smallRows = max(round(maxRows / 3), 1)
+        self._planner.setMaximumRows(maxRows)
+        self._scaleWidths.clear()
+        self._relayout()
 
     def setLargeRows(self, rows: int):
         """Set the number of span rows for large widgets.
 
         :param rows: The number of span rows for large widgets.
         """
-        assert rows <= self._maxRows, "Invalid number of rows"
-        self._largeRows = rows
+        self._planner.setLargeRows(rows)
+        self._scaleWidths.clear()
+        self._relayout()
 
     def setMediumRows(self, rows: int):
         """Set the number of span rows for medium widgets.
 
         :param rows: The number of span rows for medium widgets.
         """
-        assert 0 < rows <= self._maxRows, "Invalid number of rows"
-        self._mediumRows = rows
+        self._planner.setMediumRows(rows)
+        self._scaleWidths.clear()
+        self._relayout()
 
     def setSmallRows(self, rows: int):
         """Set the number of span rows for small widgets.
 
         :param rows: The number of span rows for small widgets.
         """
-        assert 0 < rows <= self._maxRows, "Invalid number of rows"
-        self._smallRows = rows
+        self._planner.setSmallRows(rows)
+        self._scaleWidths.clear()
+        self._relayout()
 
     def defaultRowSpan(self, rowSpan: Union[int, RibbonButtonStyle]) -> int:
         """Return the number of span rows for the given widget type.
@@ -265,16 +310,247 @@ class RibbonPanel(QtWidgets.QFrame):
         :param rowSpan: row span or type.
         :return: The number of span rows for the given widget type.
         """
-        if not isinstance(rowSpan, RibbonButtonStyle):
-            return rowSpan
-        if rowSpan == Large:
-            return self._largeRows
-        elif rowSpan == Medium:
-            return self._mediumRows
-        elif rowSpan == Small:
-            return self._smallRows
-        else:
-            raise ValueError("Invalid row span")
+        return self._planner.defaultRowSpan(rowSpan)
+
+    @property
+    def _gridLayoutManager(self) -> RibbonGridLayoutManager:
+        """GridLayout manager to request available cells."""
+        return self._planner.gridLayoutManager()
+
+    def layoutPlanner(self) -> RibbonPanelLayoutPlanner:
+        """Return the layout planner of the panel.
+
+        :return: The layout planner.
+        """
+        return self._planner
+
+    def layoutMetrics(self) -> RibbonPanelMetrics:
+        """Return the current geometry metrics of the panel used by the layout planner.
+
+        :return: The geometry metrics.
+        """
+        mainMargins = self._mainLayout.contentsMargins()
+        actionsMargins = self._actionsLayout.contentsMargins()
+        font = self.font()
+        return RibbonPanelMetrics(
+            height=self.size().height(),
+            titleHeight=self._titleWidget.height(),
+            titleLabelHeight=self._titleLabel.sizeHint().height(),
+            mainMargins=(mainMargins.top(), mainMargins.bottom()),
+            mainSpacing=self._mainLayout.spacing(),
+            actionsMargins=(actionsMargins.top(), actionsMargins.bottom()),
+            verticalSpacing=self._actionsLayout.verticalSpacing(),
+            fontSize=max(font.pointSize() * 4 / 3, font.pixelSize()),
+        )
+
+    def layoutPlanCache(self) -> Optional[RibbonLayoutPlanCache]:
+        """Return the cache of the layout plans.
+
+        :return: The cache, None if the plans are not cached.
+        """
+        return self._layoutPlanCache
+
+    def setLayoutPlanCache(self, cache: Optional[RibbonLayoutPlanCache]):
+        """Set the cache of the layout plans, the placements of the widgets added by addWidgetsBy() are then
+        loaded from the cache instead of being computed.
+
+        :param cache: The cache, None to disable caching.
+        """
+        self._layoutPlanCache = cache
+
+    def itemWidgetsEnabled(self) -> bool:
+        """Return whether the widgets are wrapped in item widgets.
+
+        :return: Whether the widgets are wrapped in item widgets.
+        """
+        return self._itemWidgetsEnabled
+
+    def setItemWidgetsEnabled(self, enabled: bool):
+        """Set whether the widgets added afterward are wrapped in item widgets.
+
+        By default, every widget is wrapped in a RibbonPanelItemWidget that centers it in its cells. When disabled,
+        the widgets are put directly in the grid layout with their alignment, which halves the number of widgets
+        and layouts of the panel, but the item widgets can no longer be styled.
+
+        :param enabled: Whether the widgets are wrapped in item widgets.
+        """
+        self._itemWidgetsEnabled = enabled
+
+    def _updateLayoutMetrics(self):
+        """Update the geometry metrics of the layout planner, and the sizes of the widgets if they have changed.
+
+        The metrics are memoized, they are only computed again after _invalidateLayoutMetrics() or when the height
+        of the panel has changed, e.g. by setFixedHeight() before the panel is shown.
+        """
+        if self._layoutMetricsValid and self._planner.metrics().height == self.height():
+            return
+        self._layoutMetricsValid = True
+        metrics = self.layoutMetrics()
+        if metrics != self._planner.metrics():
+            self._planner.setMetrics(metrics)
+            self._updateWidgetSizes() if self._widgets else None
+
+    def _invalidateLayoutMetrics(self):
+        """Invalidate the geometry metrics of the layout planner and update them."""
+        self._layoutMetricsValid = False
+        self._updateLayoutMetrics()
+
+    def _updateWidgetSizes(self):
+        """Recompute the sizes of all the widgets from the current geometry metrics in one pass."""
+        self._scaleWidths.clear()
+        updatesEnabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        for widget in self._widgets:
+            placement = self._placements[widget]
+            if placement.layoutItem is not None:
+                layoutItem = self._scaledLayoutItem(placement.layoutItem)
+                self._setWidgetSizes(widget, *self._planner.sizes(layoutItem, placement.rowSpan))
+        self.setUpdatesEnabled(updatesEnabled)
+
+    @staticmethod
+    def _setWidgetSizes(
+        widget: QtWidgets.QWidget, maximumHeight: int, fixedHeight: Optional[int], maximumIconSize: Optional[int]
+    ):
+        """Set the sizes of a widget computed by the layout planner.
+
+        :param widget: The widget.
+        :param maximumHeight: The maximum height of the widget.
+        :param fixedHeight: The fixed height of the widget, None if the height is not fixed.
+        :param maximumIconSize: The maximum icon size of the button, None if it is not limited.
+        """
+        widget.setMaximumHeight(maximumHeight)
+        widget.setFixedHeight(fixedHeight) if fixedHeight is not None else None
+        if maximumIconSize is not None and widget.maximumIconSize() != maximumIconSize:  # type: ignore
+            toolButtonStyle = widget.toolButtonStyle()  # type: ignore
+            widget.setMaximumIconSize(maximumIconSize)  # type: ignore
+            widget.setToolButtonStyle(toolButtonStyle)  # type: ignore
+
+    @staticmethod
+    def _setButtonStyle(button: RibbonToolButton, style: RibbonButtonStyle):
+        """Set the button style of a button, the icon only style of the buttons without text is kept.
+
+        :param button: The button.
+        :param style: The button style.
+        """
+        toolButtonStyle = button.toolButtonStyle()
+        button.setButtonStyle(style)
+        if toolButtonStyle == QtCore.Qt.ToolButtonStyle.ToolButtonIconOnly:
+            button.setToolButtonStyle(toolButtonStyle)
+
+    def scale(self) -> RibbonPanelScale:
+        """Return the scale of the panel.
+
+        :return: The scale of the panel.
+        """
+        return self._scale
+
+    def setScale(self, scale: RibbonPanelScale):
+        """Set the scale of the panel, the large buttons are shown as medium buttons at the medium scale, and the
+        large and medium buttons are shown as small buttons at the small scale. A collapsed panel is laid out as
+        at the large scale, since it is shown in a popup.
+
+        :param scale: The scale of the panel.
+        """
+        if scale != self._scale:
+            self._scale = scale
+            self._relayout()
+
+    def scaleWidth(self, scale: RibbonPanelScale) -> int:
+        """Return the width of the panel at the given scale.
+
+        The widgets are placed at the scale in a separate layout planner and the widths of the columns are computed
+        from the size hints of the widgets, the grid layout of the panel is not changed. The widths are cached until
+        the widgets, the rows or the height of the panel change.
+
+        :param scale: The scale of the panel.
+        :return: The width of the panel.
+        """
+        scale = RibbonPanelScale.Large if scale == RibbonPanelScale.Collapsed else scale
+        if scale not in self._scaleWidths:
+            self._scaleWidths[scale] = self._plannedWidth(scale)
+        return self._scaleWidths[scale]
+
+    def _plannedWidth(self, scale: RibbonPanelScale) -> int:
+        """Compute the width of the panel at the given scale without laying out the widgets.
+
+        :param scale: The scale of the panel.
+        :return: The width of the panel.
+        """
+        self._updateLayoutMetrics()
+        planner = RibbonPanelLayoutPlanner(self.maximumRows(), self._planner.metrics())
+        planner.setLargeRows(self._planner.largeRows())
+        planner.setMediumRows(self._planner.mediumRows())
+        planner.setSmallRows(self._planner.smallRows())
+        columnWidths: Dict[int, int] = {}
+        spanning = []
+        for widget in self._widgets:
+            placement = self._placements[widget]
+            if placement.item.isHidden() and not placement.item.sizePolicy().retainSizeWhenHidden():
+                continue
+            layoutItem = placement.layoutItem or RibbonLayoutItem(placement.rowSpan, placement.colSpan, placement.mode)
+            if not isinstance(layoutItem.rowSpan, RibbonButtonStyle) and layoutItem.rowSpan > self.maximumRows():
+                layoutItem = layoutItem._replace(rowSpan=self.maximumRows())
+            layoutItem = self._scaledLayoutItem(layoutItem, scale)
+            planned = planner.place(layoutItem)
+            if widget.isHidden():
+                width = 0
+            elif layoutItem.kind == "button" and isinstance(widget, RibbonToolButton):
+                width = widget.buttonStyleSizeHint(layoutItem.rowSpan, planned.maximumIconSize).width()  # type: ignore
+            else:
+                width = widget.sizeHint().width()
+            width = min(max(width, widget.minimumWidth()), widget.maximumWidth())
+            if planned.colSpan == 1:
+                columnWidths[planned.col] = max(columnWidths.get(planned.col, 0), width)
+            else:
+                spanning.append((planned.col, planned.colSpan, width))
+        for col, colSpan, width in spanning:
+            columns = range(col, col + colSpan)
+            deficit = width - sum(columnWidths.get(column, 0) for column in columns)
+            for column in columns:
+                columnWidths.setdefault(column, 0)
+            if deficit > 0:
+                columnWidths[col + colSpan - 1] += deficit
+        actionsMargins = self._actionsLayout.contentsMargins()
+        actionsWidth = (
+            sum(columnWidths.values())
+            + max(self._actionsLayout.horizontalSpacing(), 0) * max(len(columnWidths) - 1, 0)
+            + actionsMargins.left()
+            + actionsMargins.right()
+        )
+        mainMargins = self._mainLayout.contentsMargins()
+        margins = self.contentsMargins()
+        return (
+            max(actionsWidth, self._titleWidget.sizeHint().width())
+            + mainMargins.left()
+            + mainMargins.right()
+            + margins.left()
+            + margins.right()
+        )
+
+    def _scaledLayoutItem(
+        self, layoutItem: RibbonLayoutItem, scale: Optional[RibbonPanelScale] = None
+    ) -> RibbonLayoutItem:
+        """Return the layout specification of a widget at a scale.
+
+        :param layoutItem: The layout specification of the widget.
+        :param scale: The scale, the scale of the panel if None.
+        :return: The layout specification at the scale.
+        """
+        scale = self._scale if scale is None else scale
+        if (
+            layoutItem.kind != "button"
+            or not isinstance(layoutItem.rowSpan, RibbonButtonStyle)
+            or scale in (RibbonPanelScale.Large, RibbonPanelScale.Collapsed)
+        ):
+            return layoutItem
+        style = Medium if scale == RibbonPanelScale.Medium else Small
+        return layoutItem._replace(rowSpan=min(layoutItem.rowSpan, style))
+
+    def resizeEvent(self, a0: QtGui.QResizeEvent) -> None:
+        """Override the resize event to update the sizes of the widgets when the height changes."""
+        super().resizeEvent(a0)
+        if a0.size().height() != a0.oldSize().height():
+            self._invalidateLayoutMetrics()
 
     def panelOptionButton(self) -> RibbonPanelOptionButton:
         """Return the panel option button.
@@ -291,20 +567,9 @@ class RibbonPanel(QtWidgets.QFrame):
         self._panelOption.setToolTip(text)
 
     def rowHeight(self) -> int:
-        """Return the height of a row."""
-        return int(
-            (
-                self.size().height()
-                - self._mainLayout.contentsMargins().top()
-                - self._mainLayout.contentsMargins().bottom()
-                - self._mainLayout.spacing()
-                - self._titleWidget.height()
-                - self._actionsLayout.contentsMargins().top()
-                - self._actionsLayout.contentsMargins().bottom()
-                - self._actionsLayout.verticalSpacing() * (self._gridLayoutManager.rows - 1)
-            )
-            / self._gridLayoutManager.rows
-        )
+        """Return the height of a row, it is memoized until the geometry of the panel changes."""
+        self._updateLayoutMetrics()
+        return self._planner.rowHeight()
 
     def setTitle(self, title: str):
         """Set the title of the panel.
@@ -312,6 +577,9 @@ class RibbonPanel(QtWidgets.QFrame):
         :param title: The title to set.
         """
         self._titleLabel.setText(title)
+        # the title is part of the width of the panel, the widths at the scales are measured again
+        self._titleLayout.activate()
+        self._scaleWidths.clear()
 
     def title(self):
         """Get the title of the panel.
@@ -328,6 +596,7 @@ class RibbonPanel(QtWidgets.QFrame):
         self._titleHeight = height
         self._titleWidget.setFixedHeight(height)
         self._panelOption.setIconSize(QtCore.QSize(height, height))
+        self._invalidateLayoutMetrics()
 
     def titleHeight(self) -> int:
         """Get the height of the title widget.
@@ -336,6 +605,107 @@ class RibbonPanel(QtWidgets.QFrame):
         """
         return self._titleHeight
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._addSizeVariants()
+
+    @classmethod
+    def _addSizeVariants(cls):
+        """Add the Small, Medium and Large variants of the add methods defined by the class, e.g. addSmallComboBox()
+        for addComboBox(), the variants defined by the class itself are kept.
+        """
+        for name, method in list(cls.__dict__.items()):
+            if (
+                not name.startswith("add")
+                or name in ("addWidgets", "addWidgetsBy")
+                or name[3:].startswith(("Small", "Medium", "Large"))
+            ):
+                continue
+            for size in (Small, Medium, Large):
+                if f"add{size.name}{name[3:]}" not in cls.__dict__:
+                    setattr(cls, f"add{size.name}{name[3:]}", functools.partialmethod(method, rowSpan=size))
+
+    @classmethod
+    def widgetFactories(cls) -> Dict[str, Callable[..., QtWidgets.QWidget]]:
+        """Return the factories of the widget types of addWidgetsBy(), keyed by the lowercase type.
+
+        The table is built the first time it is requested for a class, from the factories of the base class and
+        the add methods defined by the class, e.g. addComboBox() for the ComboBox type and addSmallComboBox() for the
+        SmallComboBox type, the factories of the add methods are RibbonPanelWidgetMethod instances. A factory is
+        called with the panel and the arguments of the widget, and returns the added widget.
+
+        The factories of the add methods and of the registered types hold the default row span and the kind of
+        their widgets, the layouts planned ahead of time (see layoutItemBy()) are resolved through them.
+
+        :return: The factories.
+        """
+        if "_widgetFactories" not in cls.__dict__:
+            base = cls.__mro__[1]
+            factories = dict(base.widgetFactories()) if issubclass(base, RibbonPanel) else {}
+            own = {
+                name[3:].lower(): cls._widgetMethod(name)
+                for name in cls.__dict__
+                if name.startswith("add") and name not in ("addWidgets", "addWidgetsBy")
+            }
+            factories.update(own)
+            cls._widgetFactories = factories
+        return cls._widgetFactories
+
+    @classmethod
+    def _widgetMethod(cls, name: str) -> RibbonPanelWidgetMethod:
+        """Return the factory of an add method, the row span of the widgets is the default of the rowSpan argument
+        of the method, and the kind of the widgets is given by the class of the widget the method returns.
+
+        :param name: The name of the add method.
+        :return: The factory.
+        """
+        signature = inspect.signature(getattr(cls, name))
+        parameter = signature.parameters.get("rowSpan")
+        rowSpan = parameter.default if parameter is not None and parameter.default is not parameter.empty else Small
+        function = cls.__dict__[name]
+        while isinstance(function, functools.partialmethod):
+            function = function.func
+        returned = signature.return_annotation
+        if isinstance(returned, str):
+            returned = getattr(function, "__globals__", {}).get(returned)
+        kind = "widget"
+        if isinstance(returned, type) and issubclass(returned, RibbonToolButton):
+            kind = "button"
+        elif isinstance(returned, type) and issubclass(returned, RibbonGallery):
+            kind = "gallery"
+        return RibbonPanelWidgetMethod(name, rowSpan, kind)
+
+    @classmethod
+    def registerWidgetType(
+        cls,
+        type: str,
+        factory: Callable[..., QtWidgets.QWidget],
+        rowSpan: Union[int, RibbonButtonStyle] = Small,
+        kind: str = "widget",
+    ):
+        """Register a widget type for addWidgetsBy(), on the class and its subclasses.
+
+        .. code-block:: python
+
+            RibbonPanel.registerWidgetType(
+                "ColorButton", lambda panel, color, **kwargs: panel.addButton(color, **kwargs), Large, "button"
+            )
+
+        :param type: The type of the widget, case-insensitive.
+        :param factory: The factory of the widget, it is called with the panel and the args and kwargs of the widget,
+                        and returns the widget added to the panel.
+        :param rowSpan: The default row span of the widgets added by the factory. The cached layout plans of
+                        addWidgetsBy() and the cells precomputed by pyqtribbon.compiler are planned with it.
+        :param kind: The kind of the widgets added by the factory, "button" for the buttons of addButton(), "gallery"
+                     for the galleries of addGallery(), "widget" otherwise.
+        """
+        entry = RibbonPanelWidgetFactory(factory, rowSpan, kind)
+        classes = [cls]
+        for klass in classes:
+            classes.extend(klass.__subclasses__())
+            if klass is cls or "_widgetFactories" in klass.__dict__:
+                klass.widgetFactories()[type.lower()] = entry
+
     def addWidgetsBy(self, data: Dict[str, Dict]) -> Dict[str, QtWidgets.QWidget]:
         """Add widgets to the panel.
 
@@ -358,19 +728,150 @@ class RibbonPanel(QtWidgets.QFrame):
             ToggleButton, SmallToggleButton, MediumToggleButton, LargeToggleButton, ComboBox, FontComboBox,
             LineEdit, TextEdit, PlainTextEdit, Label, ProgressBar, SpinBox, DoubleSpinBox, DataEdit, TimeEdit,
             DateTimeEdit, TableWidget, TreeWidget, ListWidget, CalendarWidget, Separator, HorizontalSeparator,
-            VerticalSeparator, Gallery.
+            VerticalSeparator, Gallery, the Small, Medium and Large variants of the types, and the types registered
+            by registerWidgetType(). The types are case-insensitive and the data is not modified, so it can be used
+            for several panels.
+
+            When a layout plan cache is set, see setLayoutPlanCache(), the placements of the widgets are loaded
+            from the cache if the same widgets were added to a panel of the same geometry before.
         :return: A dictionary of the added widgets.
         """
         widgets = {}  # type: Dict[str, QtWidgets.QWidget]
-        for key, widget_data in data.items():
-            type = widget_data.pop("type", "").capitalize()
-            method = getattr(self, f"add{type}", None)  # type: Callable
-            assert callable(method), f"Method add{type} is not callable or does not exist"
-            args = widget_data.get("args", ())
-            kwargs = widget_data.get("kwargs", widget_data.get("arguments", {}))
-            widgets[key] = method(*args, **kwargs)
+        started = self._beginBatch()
+        cache, cacheKey, plan = self._layoutPlanCache, None, None
+        if cache is not None:
+            items = [
+                layoutItemBy(
+                    widget_data.get("type", ""),
+                    widget_data.get("kwargs", widget_data.get("arguments", {})),
+                    self.__class__,
+                )
+                for widget_data in data.values()
+            ]
+            cacheKey = cache.key(items, self._planner)
+            plan = cache.load(cacheKey)
+            self._planner.replay(*plan) if plan is not None else self._planner.startRecording()
+        try:
+            factories = self.widgetFactories()
+            for key, widget_data in data.items():
+                type = widget_data.get("type", "")
+                factory = factories.get(type.lower())
+                if factory is None:
+                    raise ValueError(f"Unknown widget type {type!r}")
+                args = widget_data.get("args", ())
+                kwargs = widget_data.get("kwargs", widget_data.get("arguments", {}))
+                widgets[key] = factory(self, *args, **kwargs)
+        finally:
+            self._planner.finishReplay()
+            placements = self._planner.stopRecording() if cacheKey is not None else []
+            self._endBatch() if started else None
+        if cacheKey is not None and plan is None:
+            cache.save(cacheKey, placements, self._gridLayoutManager.state())
         return widgets
 
+    def _beginBatch(self) -> bool:
+        """Start a batch of insertions, the widgets added afterward are inserted into the grid layout when the
+        batch ends.
+
+        :return: Whether a new batch is started, False if a batch is already in progress.
+        """
+        if self._pendingPlacements is not None:
+            return False
+        self._updateLayoutMetrics()
+        self._pendingPlacements = []
+        return True
+
+    def _endBatch(self):
+        """End the batch of insertions, insert the pending widgets with updates and the layout suspended, and
+        lay out the panel once.
+        """
+        placements = self._pendingPlacements or []
+        self._pendingPlacements = None
+        if not placements:
+            return
+        updatesEnabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        self._actionsLayout.setEnabled(False)
+        for placement in placements:
+            self._actionsLayout.addWidget(
+                placement.item, placement.row, placement.col, placement.rowSpan, placement.colSpan, placement.alignment
+            )
+        self._actionsLayout.setEnabled(True)
+        self._mainLayout.activate()
+        self.setUpdatesEnabled(updatesEnabled)
+
+    @contextlib.contextmanager
+    def batch(
+        self,
+        cells: Optional[Sequence[Tuple[int, int, int, int, int, Tuple[int, int, int]]]] = None,
+        state: Optional[Tuple[int, List[int]]] = None,
+        maxRows: Optional[int] = None,
+    ) -> Iterator[RibbonPanel]:
+        """Context manager adding widgets in a batch, the widgets added in the block are inserted into the grid
+        layout at once when the block ends.
+
+        .. code-block:: python
+
+            with panel.batch():
+                panel.addLargeButton("Paste")
+                panel.addSmallButton("Cut")
+
+        :param cells: The precomputed cells of the widgets added in the block, as tuples of row, column, row span,
+                      column span, mode and occupied cells (see RibbonGridLayoutManager.lastOccupied), e.g. in the
+                      modules generated by pyqtribbon.compiler. They are used if the panel is empty, the sizes of
+                      the widgets are computed from the current metrics of the panel.
+        :param state: The state of the grid after the precomputed cells, see RibbonGridLayoutManager.state().
+        :param maxRows: The maximal number of rows the cells were computed for, the cells are not used if the panel
+                        has a different number of rows.
+        :return: The panel.
+        """
+        started = self._beginBatch()
+        if cells is not None and state is not None and not self._widgets and maxRows in (None, self.maximumRows()):
+            self._planner.replay(
+                [
+                    RibbonLayoutPlacement(
+                        row, col, rowSpan, colSpan, RibbonSpaceFindMode(mode), None, occupied=occupied
+                    )
+                    for row, col, rowSpan, colSpan, mode, occupied in cells
+                ],
+                state,
+            )
+        try:
+            yield self
+        finally:
+            self._planner.finishReplay()
+            self._endBatch() if started else None
+
+    def addWidgets(self, widgets: List[Union[QtWidgets.QWidget, Dict[str, Any]]]) -> List[QtWidgets.QWidget]:
+        """Add multiple widgets to the panel at once.
+
+        The cells and maximum heights of all the widgets are computed first, then the widgets are inserted into
+        the grid layout with updates and the layout suspended, so the panel is laid out only once.
+
+        :param widgets: The widgets to add, each item is either a widget or a dict containing the widget and the
+                        keyword arguments of the addWidget() method, for example:
+
+            .. code-block:: python
+
+                [
+                    widget1,
+                    {"widget": widget2, "rowSpan": Medium, "colSpan": 2},
+                ]
+        :return: The added widgets.
+        """
+        added = []
+        started = self._beginBatch()
+        try:
+            for spec in widgets:
+                if isinstance(spec, QtWidgets.QWidget):
+                    added.append(self.addWidget(spec))
+                else:
+                    kwargs = dict(spec)
+                    added.append(self.addWidget(kwargs.pop("widget"), **kwargs))
+        finally:
+            self._endBatch() if started else None
+        return added
+
     def addWidget(
         self,
         widget: QtWidgets.QWidget,
@@ -395,31 +896,126 @@ class RibbonPanel(QtWidgets.QFrame):
                             minimum height is 40% of the maximum height allowed.
         :return: The added widget.
         """
-        rowSpan = self.defaultRowSpan(rowSpan)
+        return self._placeWidget(widget, RibbonLayoutItem(rowSpan, colSpan, mode, fixedHeight), alignment=alignment)
+
+    def _placeWidget(
+        self,
+        widget: QtWidgets.QWidget,
+        layoutItem: RibbonLayoutItem,
+        alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
+    ) -> QtWidgets.QWidget:
+        """Place a widget with the layout planner and insert it into the grid layout.
+
+        :param widget: The widget to add.
+        :param layoutItem: The layout specification of the widget.
+        :param alignment: The alignment of the widget.
+        :return: The added widget.
+        """
+        self._updateLayoutMetrics()
+        scaled = self._scaledLayoutItem(layoutItem)
+        planned = self._planner.place(scaled)
         self._widgets.append(widget)
-        row, col = self._gridLayoutManager.request_cells(rowSpan, colSpan, mode)
-        maximumHeight = self.rowHeight() * rowSpan + self._actionsLayout.verticalSpacing() * (rowSpan - 2)
-        widget.setMaximumHeight(maximumHeight)
-        if fixedHeight is True or fixedHeight > 0:
-            fixedHeight = (
-                int(fixedHeight * maximumHeight)
-                if 0 < fixedHeight <= 1
-                else fixedHeight if 1 < fixedHeight < maximumHeight else maximumHeight
-            )
-            fixedHeight = max(fixedHeight, 0.4 * maximumHeight)  # minimum height is 40% of the maximum height
-            widget.setFixedHeight(fixedHeight)
-        item = RibbonPanelItemWidget(self)
-        item.addWidget(widget)
-        self._actionsLayout.addWidget(item, row, col, rowSpan, colSpan, alignment)  # type: ignore
+        self._scaleWidths.clear()
+        self._setButtonStyle(widget, scaled.rowSpan) if scaled is not layoutItem else None  # type: ignore
+        self._setWidgetSizes(widget, planned.maximumHeight, planned.fixedHeight, planned.maximumIconSize)
+        if self._itemWidgetsEnabled:
+            item = RibbonPanelItemWidget(self)
+            item.addWidget(widget)
+        else:
+            item = widget
+            widget.setParent(self)
+        placement = RibbonPanelItemPlacement(
+            item,
+            planned.row,
+            planned.col,
+            planned.rowSpan,
+            planned.colSpan,
+            planned.mode,
+            alignment,
+            layoutItem,
+            planned.occupied,
+        )
+        self._placements[widget] = placement
+        if self._pendingPlacements is not None:
+            self._pendingPlacements.append(placement)
+        else:
+            self._actionsLayout.addWidget(
+                item, planned.row, planned.col, planned.rowSpan, planned.colSpan, alignment
+            )  # type: ignore
         return widget
 
     addSmallWidget = functools.partialmethod(addWidget, rowSpan=Small)
     addMediumWidget = functools.partialmethod(addWidget, rowSpan=Medium)
     addLargeWidget = functools.partialmethod(addWidget, rowSpan=Large)
 
-    def removeWidget(self, widget: QtWidgets.QWidget):
-        """Remove a widget from the panel."""
-        self._actionsLayout.removeWidget(widget)
+    def removeWidget(self, widget: QtWidgets.QWidget, compact: bool = False):
+        """Remove a widget from the panel.
+
+        The cells occupied by the widget are released, its item widget is deleted and the widget is detached
+        from the panel, the widget itself is not deleted.
+
+        :param widget: The widget to remove.
+        :param compact: Whether to re-place the remaining widgets to fill the released cells.
+        """
+        if widget not in self._placements:
+            raise ValueError("The widget is not in the panel")
+        placement = self._placements.pop(widget)
+        self._widgets.remove(widget)
+        self._scaleWidths.clear()
+        if self._pendingPlacements is not None and placement in self._pendingPlacements:
+            self._pendingPlacements.remove(placement)
+        if placement.occupied is not None:
+            self._gridLayoutManager.release_mask(*placement.occupied)
+        else:
+            self._gridLayoutManager.release_cells(placement.row, placement.col, placement.rowSpan, placement.colSpan)
+        self._actionsLayout.removeWidget(placement.item)
+        widget.setParent(None)  # type: ignore
+        placement.item.deleteLater() if placement.item is not widget else None
+        if compact:
+            self.compact()
+
+    def compact(self):
+        """Re-place all the widgets in the panel to fill the released cells."""
+        self._relayout()
+
+    def _relayout(self):
+        """Re-place all the widgets in the panel with a new grid layout manager.
+
+        The widgets keep their order, their row spans and sizes are computed again from the current rows and scale
+        of the panel, and only the widgets whose cells have changed are moved in the grid layout, with updates and the
+        layout suspended so the panel is laid out only once.
+        """
+        self._planner.resetGrid()
+        self._updateLayoutMetrics()
+        updatesEnabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        self._actionsLayout.setEnabled(False)
+        pending = self._pendingPlacements if self._pendingPlacements is not None else []
+        for widget in self._widgets:
+            placement = self._placements[widget]
+            layoutItem = placement.layoutItem or RibbonLayoutItem(placement.rowSpan, placement.colSpan, placement.mode)
+            if not isinstance(layoutItem.rowSpan, RibbonButtonStyle) and layoutItem.rowSpan > self.maximumRows():
+                layoutItem = layoutItem._replace(rowSpan=self.maximumRows())
+            layoutItem = self._scaledLayoutItem(layoutItem)
+            if layoutItem.kind == "button" and layoutItem.rowSpan != widget.buttonStyle():  # type: ignore
+                self._setButtonStyle(widget, layoutItem.rowSpan)  # type: ignore
+            planned = self._planner.place(layoutItem)
+            self._setWidgetSizes(widget, planned.maximumHeight, planned.fixedHeight, planned.maximumIconSize)
+            moved = (planned.row, planned.col, planned.rowSpan) != (placement.row, placement.col, placement.rowSpan)
+            replaced = placement._replace(
+                row=planned.row, col=planned.col, rowSpan=planned.rowSpan, occupied=planned.occupied
+            )
+            self._placements[widget] = replaced
+            if placement in pending:
+                pending[pending.index(placement)] = replaced
+            elif moved:
+                self._actionsLayout.removeWidget(placement.item)
+                self._actionsLayout.addWidget(
+                    placement.item, replaced.row, replaced.col, replaced.rowSpan, replaced.colSpan, replaced.alignment
+                )
+        self._actionsLayout.setEnabled(True)
+        self._mainLayout.activate()
+        self.setUpdatesEnabled(updatesEnabled)
 
     def widget(self, index: int) -> QtWidgets.QWidget:
         """Get the widget at the given index.
@@ -439,7 +1035,7 @@ class RibbonPanel(QtWidgets.QFrame):
     def addButton(
         self,
         text: str = None,
-        icon: QtGui.QIcon = None,
+        icon: IconSource = None,
         showText: bool = True,
         slot: Callable = None,
         shortcut: (
@@ -455,7 +1051,8 @@ class RibbonPanel(QtWidgets.QFrame):
         """Add a button to the panel.
 
         :param text: The text of the button.
-        :param icon: The icon of the button.
+        :param icon: The icon of the button, a QIcon, a QPixmap, or the path or the content of an image file which is
+                     decoded in a thread pool, a placeholder icon is shown until it is decoded.
         :param showText: Whether to show the text of the button.
         :param slot: The slot to call when the button is clicked.
         :param shortcut: The shortcut of the button.
@@ -472,34 +1069,16 @@ class RibbonPanel(QtWidgets.QFrame):
         button = RibbonToolButton(self)
         button.setButtonStyle(style)
         button.setText(text) if text else None
-        button.setIcon(icon) if icon else None
+        iconLoader().load(icon, button.setIcon) if icon else None
         button.clicked.connect(slot) if slot else None  # type: ignore
         button.setShortcut(shortcut) if shortcut else None
         button.setToolTip(tooltip) if tooltip else None
         button.setStatusTip(statusTip) if statusTip else None
-        maximumHeight = (
-            self.height()
-            - self._titleLabel.sizeHint().height()
-            - self._mainLayout.spacing()
-            - self._mainLayout.contentsMargins().top()
-            - self._mainLayout.contentsMargins().bottom()
-        )
-        button.setMaximumHeight(maximumHeight)
-        if style == Large:
-            fontSize = max(button.font().pointSize() * 4 / 3, button.font().pixelSize())
-            arrowSize = fontSize
-            maximumIconSize = max(maximumHeight - fontSize * 2 - arrowSize, 48)
-            button.setMaximumIconSize(int(maximumIconSize))
         if not showText:
             button.setToolButtonStyle(QtCore.Qt.ToolButtonStyle.ToolButtonIconOnly)
         button.setCheckable(checkable)
-        kwargs["rowSpan"] = (
-            self.defaultRowSpan(Small)
-            if style == Small
-            else self.defaultRowSpan(Medium) if style == Medium else self.defaultRowSpan(Large)
-        )
-        self.addWidget(button, **kwargs)  # noqa
-        return button
+        alignment = kwargs.pop("alignment", QtCore.Qt.AlignmentFlag.AlignCenter)
+        return self._placeWidget(button, RibbonLayoutItem(style, kind="button", **kwargs), alignment)  # noqa
 
     addSmallButton = functools.partialmethod(addButton, rowSpan=Small)
     addMediumButton = functools.partialmethod(addButton, rowSpan=Medium)
@@ -546,28 +1125,6 @@ class RibbonPanel(QtWidgets.QFrame):
             widget, rowSpan=rowSpan, colSpan=colSpan, mode=mode, alignment=alignment, fixedHeight=fixedHeight
         )
 
-    def __getattr__(self, method: str) -> Callable:
-        """Get the dynamic method `add[Small|Medium|Large][Widget]`.
-
-        :param method: The name of the method to get.
-        :return: The method of the widget to add.
-        """
-        # Match the method name
-        match = re.match(r"add(Small|Medium|Large)(\w+)", method)
-        assert match, "Invalid method name"
-
-        # Get the widget class and the size
-        size = match.group(1)
-        base_method_name = f"add{match.group(2)}"
-        assert hasattr(self, base_method_name), f"Invalid method name {base_method_name}"
-
-        # Get the base method
-        base_method = getattr(self, base_method_name)
-        rowSpan = Small if size == "Small" else Medium if size == "Medium" else Large
-
-        # Create the new method
-        return functools.partial(base_method, rowSpan=rowSpan)
-
     addCheckBox = functools.partialmethod(
         _addAnyWidget, cls=QtWidgets.QCheckBox, initializer=QtWidgets.QCheckBox.setText
     )
@@ -591,33 +1148,48 @@ class RibbonPanel(QtWidgets.QFrame):
     addListWidget = functools.partialmethod(_addAnyWidget, cls=QtWidgets.QListWidget, rowSpan=Large)
     addCalendarWidget = functools.partialmethod(_addAnyWidget, cls=QtWidgets.QCalendarWidget, rowSpan=Large)
 
-    def addSeparator(self, orientation=QtCore.Qt.Orientation.Vertical, width=6, **kwargs) -> RibbonSeparator:
+    def addSeparator(
+        self,
+        orientation=QtCore.Qt.Orientation.Vertical,
+        width=6,
+        *,
+        rowSpan: Union[int, RibbonButtonStyle] = Large,
+        **kwargs,
+    ) -> RibbonSeparator:
         """Add a separator to the panel.
 
         :param orientation: The orientation of the separator.
         :param width: The width of the separator.
+        :param rowSpan: The number of rows the separator spans.
         :param kwargs: keyword arguments to control the properties of the widget on the ribbon bar.
 
         :return: The separator.
         """
-        kwargs["rowSpan"] = Large if "rowSpan" not in kwargs else kwargs["rowSpan"]
-        return self.addWidget(RibbonSeparator(orientation, width), **kwargs)
+        return self.addWidget(RibbonSeparator(orientation, width), rowSpan=rowSpan, **kwargs)
 
     addHorizontalSeparator = functools.partialmethod(addSeparator, orientation=QtCore.Qt.Orientation.Horizontal)
     addVerticalSeparator = functools.partialmethod(addSeparator, orientation=QtCore.Qt.Orientation.Vertical)
 
-    def addGallery(self, minimumWidth=800, popupHideOnClick=False, **kwargs) -> RibbonGallery:
+    def addGallery(
+        self,
+        minimumWidth=800,
+        popupHideOnClick=False,
+        *,
+        rowSpan: Union[int, RibbonButtonStyle] = Large,
+        **kwargs,
+    ) -> RibbonGallery:
         """Add a gallery to the panel.
 
         :param minimumWidth: The minimum width of the gallery.
         :param popupHideOnClick: Whether the gallery popup should be hidden when a user clicks on it.
+        :param rowSpan: The number of rows the gallery spans.
         :param kwargs: keyword arguments to control the properties of the widget on the ribbon bar.
 
         :return: The gallery.
         """
-        kwargs["rowSpan"] = Large if "rowSpan" not in kwargs else kwargs["rowSpan"]
-        rowSpan = self.defaultRowSpan(kwargs["rowSpan"])
+        alignment = kwargs.pop("alignment", QtCore.Qt.AlignmentFlag.AlignCenter)
         gallery = RibbonGallery(minimumWidth, popupHideOnClick, self)
-        maximumHeight = self.rowHeight() * rowSpan + self._actionsLayout.verticalSpacing() * (rowSpan - 2)
-        gallery.setFixedHeight(maximumHeight)
-        return self.addWidget(gallery, **kwargs)
+        return self._placeWidget(gallery, RibbonLayoutItem(rowSpan, kind="gallery", **kwargs), alignment)  # type: ignore
+
+
+RibbonPanel._addSizeVariants()
@@ -1,23 +1,67 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, Iterable, List, Union, overload
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
 
-import numpy as np
 from qtpy import QtCore, QtGui, QtWidgets
 
-from .constants import ColumnWise, Large, RibbonButtonStyle, RibbonSpaceFindMode, Small
+from .constants import (
+    ColumnWise,
+    Large,
+    RibbonButtonStyle,
+    RibbonPanelScale,
+    RibbonSpaceFindMode,
+    Small,
+)
 from .gallery import RibbonGallery
+from .iconloader import IconSource
+from .layoutplanner import (
+    RibbonGridLayoutManager,
+    RibbonLayoutItem,
+    RibbonLayoutPlacement,
+    RibbonLayoutPlanCache,
+    RibbonPanelLayoutPlanner,
+    RibbonPanelMetrics,
+)
 from .separator import RibbonSeparator
 from .toolbutton import RibbonToolButton
 
 class RibbonPanelTitle(QtWidgets.QLabel): ...
 
-class RibbonGridLayoutManager(object):
-    rows: int
-    cells: np.ndarray
+class RibbonPanelWidgetMethod(NamedTuple):
+    name: str
+    rowSpan: Union[int, RibbonButtonStyle] = Small
+    kind: str = "widget"
+    def __call__(self, panel: RibbonPanel, *args, **kwargs) -> QtWidgets.QWidget: ...
 
-    def __init__(self, rows: int): ...
-    def request_cells(self, rowSpan: int = 1, colSpan: int = 1, mode: RibbonSpaceFindMode = ColumnWise): ...
+class RibbonPanelWidgetFactory(NamedTuple):
+    factory: Callable[..., QtWidgets.QWidget]
+    rowSpan: Union[int, RibbonButtonStyle] = Small
+    kind: str = "widget"
+    def __call__(self, panel: RibbonPanel, *args, **kwargs) -> QtWidgets.QWidget: ...
+
+class RibbonPanelItemPlacement(NamedTuple):
+    item: QtWidgets.QWidget
+    row: int
+    col: int
+    rowSpan: int
+    colSpan: int
+    mode: RibbonSpaceFindMode
+    alignment: QtCore.Qt.AlignmentFlag
+    layoutItem: Optional[RibbonLayoutItem] = None
+    occupied: Optional[Tuple[int, int, int]] = None
 
 class RibbonPanelItemWidget(QtWidgets.QFrame):
     def __init__(self, parent=None): ...
@@ -26,17 +70,22 @@ class RibbonPanelItemWidget(QtWidgets.QFrame):
 class RibbonPanelOptionButton(QtWidgets.QToolButton): ...
 
 class RibbonPanel(QtWidgets.QFrame):
-    _maxRows: int = 6
-    _largeRows: int = 6
-    _mediumRows: int = 3
-    _smallRows: int = 2
-    _gridLayoutManager: RibbonGridLayoutManager
+    _planner: RibbonPanelLayoutPlanner
+    _layoutPlanCache: Optional[RibbonLayoutPlanCache] = None
+    _itemWidgetsEnabled: bool = True
+    _layoutMetricsValid: bool = False
+    _scale: RibbonPanelScale = RibbonPanelScale.Large
+    _scaleWidths: Dict[RibbonPanelScale, int]
     _showPanelOptionButton: bool
 
     _widgets: List[QtWidgets.QWidget] = []
+    _placements: Dict[QtWidgets.QWidget, RibbonPanelItemPlacement]
+    _pendingPlacements: Optional[List[RibbonPanelItemPlacement]] = None
 
     _titleHeight: int = 20
 
+    _widgetFactories: Dict[str, Callable[..., QtWidgets.QWidget]]
+
     panelOptionClicked = QtCore.Signal(bool)
 
     _mainLayout: QtWidgets.QVBoxLayout
@@ -60,6 +109,31 @@ class RibbonPanel(QtWidgets.QFrame):
     def setMediumRows(self, rows: int): ...
     def setSmallRows(self, rows: int): ...
     def defaultRowSpan(self, rowSpan: Union[int, RibbonButtonStyle]) -> int: ...
+    @property
+    def _gridLayoutManager(self) -> RibbonGridLayoutManager: ...
+    def layoutPlanner(self) -> RibbonPanelLayoutPlanner: ...
+    def layoutMetrics(self) -> RibbonPanelMetrics: ...
+    def layoutPlanCache(self) -> Optional[RibbonLayoutPlanCache]: ...
+    def setLayoutPlanCache(self, cache: Optional[RibbonLayoutPlanCache]): ...
+    def itemWidgetsEnabled(self) -> bool: ...
+    def setItemWidgetsEnabled(self, enabled: bool): ...
+    def _updateLayoutMetrics(self): ...
+    def _invalidateLayoutMetrics(self): ...
+    def _updateWidgetSizes(self): ...
+    @staticmethod
+    def _setWidgetSizes(
+        widget: QtWidgets.QWidget, maximumHeight: int, fixedHeight: Optional[int], maximumIconSize: Optional[int]
+    ): ...
+    @staticmethod
+    def _setButtonStyle(button: RibbonToolButton, style: RibbonButtonStyle): ...
+    def scale(self) -> RibbonPanelScale: ...
+    def setScale(self, scale: RibbonPanelScale): ...
+    def scaleWidth(self, scale: RibbonPanelScale) -> int: ...
+    def _plannedWidth(self, scale: RibbonPanelScale) -> int: ...
+    def _scaledLayoutItem(
+        self, layoutItem: RibbonLayoutItem, scale: Optional[RibbonPanelScale] = None
+    ) -> RibbonLayoutItem: ...
+    def resizeEvent(self, a0: QtGui.QResizeEvent) -> None: ...
     def panelOptionButton(self) -> RibbonPanelOptionButton: ...
     def setPanelOptionToolTip(self, text: str): ...
     def rowHeight(self) -> int: ...
@@ -67,7 +141,28 @@ class RibbonPanel(QtWidgets.QFrame):
     def title(self) -> str: ...
     def setTitleHeight(self, height: int): ...
     def titleHeight(self) -> int: ...
+    @classmethod
+    def widgetFactories(cls) -> Dict[str, Callable[..., QtWidgets.QWidget]]: ...
+    @classmethod
+    def _widgetMethod(cls, name: str) -> RibbonPanelWidgetMethod: ...
+    @classmethod
+    def registerWidgetType(
+        cls,
+        type: str,
+        factory: Callable[..., QtWidgets.QWidget],
+        rowSpan: Union[int, RibbonButtonStyle] = Small,
+        kind: str = "widget",
+    ): ...
     def addWidgetsBy(self, data: Dict[str, Dict]) -> Dict[str, QtWidgets.QWidget]: ...
+    def _beginBatch(self) -> bool: ...
+    def _endBatch(self): ...
+    def batch(
+        self,
+        cells: Optional[Sequence[Tuple[int, int, int, int, int, Tuple[int, int, int]]]] = None,
+        state: Optional[Tuple[int, List[int]]] = None,
+        maxRows: Optional[int] = None,
+    ) -> ContextManager[RibbonPanel]: ...
+    def addWidgets(self, widgets: List[Union[QtWidgets.QWidget, Dict[str, Any]]]) -> List[QtWidgets.QWidget]: ...
     def addWidget(
         self,
         widget: QtWidgets.QWidget,
@@ -78,6 +173,12 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QWidget | Any: ...
+    def _placeWidget(
+        self,
+        widget: QtWidgets.QWidget,
+        layoutItem: RibbonLayoutItem,
+        alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
+    ) -> QtWidgets.QWidget: ...
     def addSmallWidget(
         self,
         widget: QtWidgets.QWidget,
@@ -105,13 +206,15 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QWidget | Any: ...
-    def removeWidget(self, widget: QtWidgets.QWidget): ...
+    def removeWidget(self, widget: QtWidgets.QWidget, compact: bool = False): ...
+    def compact(self): ...
+    def _relayout(self): ...
     def widget(self, index: int) -> QtWidgets.QWidget: ...
     def widgets(self) -> List[QtWidgets.QWidget]: ...
     def addButton(
         self,
         text: str = None,
-        icon: QtGui.QIcon = None,
+        icon: IconSource = None,
         showText: bool = True,
         slot: Callable = None,
         shortcut: (
@@ -130,7 +233,7 @@ class RibbonPanel(QtWidgets.QFrame):
     def addSmallButton(
         self,
         text: str = None,
-        icon: QtGui.QIcon = None,
+        icon: IconSource = None,
         showText: bool = True,
         slot: Callable = None,
         shortcut: (
@@ -148,7 +251,7 @@ class RibbonPanel(QtWidgets.QFrame):
     def addMediumButton(
         self,
         text: str = None,
-        icon: QtGui.QIcon = None,
+        icon: IconSource = None,
         showText: bool = True,
         slot: Callable = None,
         shortcut: (
@@ -166,7 +269,7 @@ class RibbonPanel(QtWidgets.QFrame):
     def addLargeButton(
         self,
         text: str = None,
-        icon: QtGui.QIcon = None,
+        icon: IconSource = None,
         showText: bool = True,
         slot: Callable = None,
         shortcut: (
@@ -184,7 +287,7 @@ class RibbonPanel(QtWidgets.QFrame):
     def addToggleButton(
         self,
         text: str = None,
-        icon: QtGui.QIcon = None,
+        icon: IconSource = None,
         showText: bool = True,
         slot: Callable = None,
         shortcut: (
@@ -202,7 +305,7 @@ class RibbonPanel(QtWidgets.QFrame):
     def addSmallToggleButton(
         self,
         text: str = None,
-        icon: QtGui.QIcon = None,
+        icon: IconSource = None,
         showText: bool = True,
         slot: Callable = None,
         shortcut: (
@@ -219,7 +322,7 @@ class RibbonPanel(QtWidgets.QFrame):
     def addMediumToggleButton(
         self,
         text: str = None,
-        icon: QtGui.QIcon = None,
+        icon: IconSource = None,
         showText: bool = True,
         slot: Callable = None,
         shortcut: (
@@ -236,7 +339,7 @@ class RibbonPanel(QtWidgets.QFrame):
     def addLargeToggleButton(
         self,
         text: str = None,
-        icon: QtGui.QIcon = None,
+        icon: IconSource = None,
         showText: bool = True,
         slot: Callable = None,
         shortcut: (
@@ -265,7 +368,19 @@ class RibbonPanel(QtWidgets.QFrame):
         fixedHeight: Union[bool, float] = False,
         **kwargs,
     ) -> QtWidgets.QWidget: ...
-    def __getattr__(self, method: str) -> Callable: ...
+    def addCheckBox(
+        self,
+        text: str,
+        *,
+        rowSpan: Union[int, RibbonButtonStyle] = Small,
+        colSpan: int = 1,
+        mode: RibbonSpaceFindMode = ColumnWise,
+        alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
+        fixedHeight: Union[bool, float] = False,
+    ) -> QtWidgets.QCheckBox: ...
+    addSmallCheckBox = addCheckBox
+    addMediumCheckBox = addCheckBox
+    addLargeCheckBox = addCheckBox
     def addComboBox(
         self,
         items: Iterable[str],
@@ -276,9 +391,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QComboBox: ...
-    addSmallComboBox = RibbonPanel.addComboBox
-    addMediumComboBox = RibbonPanel.addComboBox
-    addLargeComboBox = RibbonPanel.addComboBox
+    addSmallComboBox = addComboBox
+    addMediumComboBox = addComboBox
+    addLargeComboBox = addComboBox
     def addFontComboBox(
         self,
         *,
@@ -288,9 +403,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QFontComboBox: ...
-    addSmallFontComboBox = RibbonPanel.addFontComboBox
-    addMediumFontComboBox = RibbonPanel.addFontComboBox
-    addLargeFontComboBox = RibbonPanel.addFontComboBox
+    addSmallFontComboBox = addFontComboBox
+    addMediumFontComboBox = addFontComboBox
+    addLargeFontComboBox = addFontComboBox
     def addLineEdit(
         self,
         *,
@@ -300,9 +415,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QLineEdit: ...
-    addSmallLineEdit = RibbonPanel.addLineEdit
-    addMediumLineEdit = RibbonPanel.addLineEdit
-    addLargeLineEdit = RibbonPanel.addLineEdit
+    addSmallLineEdit = addLineEdit
+    addMediumLineEdit = addLineEdit
+    addLargeLineEdit = addLineEdit
     def addTextEdit(
         self,
         *,
@@ -312,9 +427,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QTextEdit: ...
-    addSmallTextEdit = RibbonPanel.addTextEdit
-    addMediumTextEdit = RibbonPanel.addTextEdit
-    addLargeTextEdit = RibbonPanel.addTextEdit
+    addSmallTextEdit = addTextEdit
+    addMediumTextEdit = addTextEdit
+    addLargeTextEdit = addTextEdit
     def addPlainTextEdit(
         self,
         *,
@@ -324,9 +439,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QPlainTextEdit: ...
-    addSmallPlainTextEdit = RibbonPanel.addPlainTextEdit
-    addMediumPlainTextEdit = RibbonPanel.addPlainTextEdit
-    addLargePlainTextEdit = RibbonPanel.addPlainTextEdit
+    addSmallPlainTextEdit = addPlainTextEdit
+    addMediumPlainTextEdit = addPlainTextEdit
+    addLargePlainTextEdit = addPlainTextEdit
     def addLabel(
         self,
         text: str,
@@ -337,9 +452,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QLabel: ...
-    addSmallLabel = RibbonPanel.addLabel
-    addMediumLabel = RibbonPanel.addLabel
-    addLargeLabel = RibbonPanel.addLabel
+    addSmallLabel = addLabel
+    addMediumLabel = addLabel
+    addLargeLabel = addLabel
     def addProgressBar(
         self,
         *,
@@ -349,9 +464,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QProgressBar: ...
-    addSmallProgressBar = RibbonPanel.addProgressBar
-    addMediumProgressBar = RibbonPanel.addProgressBar
-    addLargeProgressBar = RibbonPanel.addProgressBar
+    addSmallProgressBar = addProgressBar
+    addMediumProgressBar = addProgressBar
+    addLargeProgressBar = addProgressBar
     def addSlider(
         self,
         *,
@@ -361,9 +476,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QSlider: ...
-    addSmallSlider = RibbonPanel.addSlider
-    addMediumSlider = RibbonPanel.addSlider
-    addLargeSlider = RibbonPanel.addSlider
+    addSmallSlider = addSlider
+    addMediumSlider = addSlider
+    addLargeSlider = addSlider
     def addSpinBox(
         self,
         *,
@@ -373,9 +488,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QSpinBox: ...
-    addSmallSpinBox = RibbonPanel.addSpinBox
-    addMediumSpinBox = RibbonPanel.addSpinBox
-    addLargeSpinBox = RibbonPanel.addSpinBox
+    addSmallSpinBox = addSpinBox
+    addMediumSpinBox = addSpinBox
+    addLargeSpinBox = addSpinBox
     def addDoubleSpinBox(
         self,
         *,
@@ -385,9 +500,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QDoubleSpinBox: ...
-    addSmallDoubleSpinBox = RibbonPanel.addDoubleSpinBox
-    addMediumDoubleSpinBox = RibbonPanel.addDoubleSpinBox
-    addLargeDoubleSpinBox = RibbonPanel.addDoubleSpinBox
+    addSmallDoubleSpinBox = addDoubleSpinBox
+    addMediumDoubleSpinBox = addDoubleSpinBox
+    addLargeDoubleSpinBox = addDoubleSpinBox
     def addDateEdit(
         self,
         *,
@@ -397,9 +512,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QDateEdit: ...
-    addSmallDateEdit = RibbonPanel.addDateEdit
-    addMediumDateEdit = RibbonPanel.addDateEdit
-    addLargeDateEdit = RibbonPanel.addDateEdit
+    addSmallDateEdit = addDateEdit
+    addMediumDateEdit = addDateEdit
+    addLargeDateEdit = addDateEdit
     def addTimeEdit(
         self,
         *,
@@ -409,9 +524,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QTimeEdit: ...
-    addSmallTimeEdit = RibbonPanel.addTimeEdit
-    addMediumTimeEdit = RibbonPanel.addTimeEdit
-    addLargeTimeEdit = RibbonPanel.addTimeEdit
+    addSmallTimeEdit = addTimeEdit
+    addMediumTimeEdit = addTimeEdit
+    addLargeTimeEdit = addTimeEdit
     def addDateTimeEdit(
         self,
         *,
@@ -421,9 +536,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QDateTimeEdit: ...
-    addSmallDateTimeEdit = RibbonPanel.addDateTimeEdit
-    addMediumDateTimeEdit = RibbonPanel.addDateTimeEdit
-    addLargeDateTimeEdit = RibbonPanel.addDateTimeEdit
+    addSmallDateTimeEdit = addDateTimeEdit
+    addMediumDateTimeEdit = addDateTimeEdit
+    addLargeDateTimeEdit = addDateTimeEdit
     def addTableWidget(
         self,
         *,
@@ -433,9 +548,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QTableWidget: ...
-    addSmallTableWidget = RibbonPanel.addTableWidget
-    addMediumTableWidget = RibbonPanel.addTableWidget
-    addLargeTableWidget = RibbonPanel.addTableWidget
+    addSmallTableWidget = addTableWidget
+    addMediumTableWidget = addTableWidget
+    addLargeTableWidget = addTableWidget
     def addTreeWidget(
         self,
         *,
@@ -445,9 +560,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QTreeWidget: ...
-    addSmallTreeWidget = RibbonPanel.addTreeWidget
-    addMediumTreeWidget = RibbonPanel.addTreeWidget
-    addLargeTreeWidget = RibbonPanel.addTreeWidget
+    addSmallTreeWidget = addTreeWidget
+    addMediumTreeWidget = addTreeWidget
+    addLargeTreeWidget = addTreeWidget
     def addListWidget(
         self,
         *,
@@ -457,9 +572,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QListWidget: ...
-    addSmallListWidget = RibbonPanel.addListWidget
-    addMediumListWidget = RibbonPanel.addListWidget
-    addLargeListWidget = RibbonPanel.addListWidget
+    addSmallListWidget = addListWidget
+    addMediumListWidget = addListWidget
+    addLargeListWidget = addListWidget
     def addCalendarWidget(
         self,
         *,
@@ -469,9 +584,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> QtWidgets.QCalendarWidget: ...
-    addSmallCalendarWidget = RibbonPanel.addCalendarWidget
-    addMediumCalendarWidget = RibbonPanel.addCalendarWidget
-    addLargeCalendarWidget = RibbonPanel.addCalendarWidget
+    addSmallCalendarWidget = addCalendarWidget
+    addMediumCalendarWidget = addCalendarWidget
+    addLargeCalendarWidget = addCalendarWidget
     def addSeparator(
         self,
         orientation=QtCore.Qt.Orientation.Vertical,
@@ -483,9 +598,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> RibbonSeparator: ...
-    addSmallSeparator = RibbonPanel.addSeparator
-    addMediumSeparator = RibbonPanel.addSeparator
-    addLargeSeparator = RibbonPanel.addSeparator
+    addSmallSeparator = addSeparator
+    addMediumSeparator = addSeparator
+    addLargeSeparator = addSeparator
     def addHorizontalSeparator(
         self,
         width=6,
@@ -496,9 +611,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> RibbonSeparator: ...
-    addSmallHorizontalSeparator = RibbonPanel.addHorizontalSeparator
-    addMediumHorizontalSeparator = RibbonPanel.addHorizontalSeparator
-    addLargeHorizontalSeparator = RibbonPanel.addHorizontalSeparator
+    addSmallHorizontalSeparator = addHorizontalSeparator
+    addMediumHorizontalSeparator = addHorizontalSeparator
+    addLargeHorizontalSeparator = addHorizontalSeparator
     def addVerticalSeparator(
         self,
         width=6,
@@ -509,9 +624,9 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> RibbonSeparator: ...
-    addSmallVerticalSeparator = RibbonPanel.addVerticalSeparator
-    addMediumVerticalSeparator = RibbonPanel.addVerticalSeparator
-    addLargeVerticalSeparator = RibbonPanel.addVerticalSeparator
+    addSmallVerticalSeparator = addVerticalSeparator
+    addMediumVerticalSeparator = addVerticalSeparator
+    addLargeVerticalSeparator = addVerticalSeparator
     def addGallery(
         self,
         minimumWidth=800,
@@ -523,6 +638,6 @@ class RibbonPanel(QtWidgets.QFrame):
         alignment: QtCore.Qt.AlignmentFlag = QtCore.Qt.AlignmentFlag.AlignCenter,
         fixedHeight: Union[bool, float] = False,
     ) -> RibbonGallery: ...
-    addSmallGallery = RibbonPanel.addGallery
-    addMediumGallery = RibbonPanel.addGallery
-    addLargeGallery = RibbonPanel.addGallery
+    addSmallGallery = addGallery
+    addMediumGallery = addGallery
+    addLargeGallery = addGallery
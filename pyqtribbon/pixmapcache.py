@@ -0,0 +1,114 @@
+"""Cache of the icons of the ribbon buttons, pre-scaled to the sizes they are drawn at.
+
+Qt scales the source image of an icon every time it is painted at a size that is not one of its native sizes. The
+cache renders an icon once for each icon size, device pixel ratio and state, and keeps the rendered icons in a least
+recently used order, within a memory cap.
+"""
+
+import collections
+import typing
+
+from qtpy import QtCore, QtGui
+
+#: key of a rendered icon, the cache key of the icon, the width and height, the device pixel ratio and the state
+_PixmapKey = typing.Tuple[int, int, int, float, int]
+
+
+class RibbonPixmapCache(object):
+    """Least recently used cache of the icons rendered at the sizes of the ribbon buttons."""
+
+    #: the rendered icons and their costs in bytes, the least recently used first
+    _icons: "collections.OrderedDict[_PixmapKey, typing.Tuple[QtGui.QIcon, int]]"
+
+    #: the maximum total cost in bytes
+    _maximumCost: int
+
+    #: the total cost in bytes
+    _cost: int = 0
+
+    def __init__(self, maximumCost: int = 16 * 1024 * 1024):
+        """Create a new pixmap cache.
+
+        :param maximumCost: The maximum total cost of the rendered pixmaps in bytes.
+        """
+        self._icons = collections.OrderedDict()
+        self._maximumCost = maximumCost
+        self._cost = 0
+
+    def maximumCost(self) -> int:
+        """Return the maximum total cost of the rendered pixmaps in bytes."""
+        return self._maximumCost
+
+    def setMaximumCost(self, cost: int):
+        """Set the maximum total cost of the rendered pixmaps in bytes, the least recently used are evicted.
+
+        :param cost: The maximum total cost in bytes.
+        """
+        self._maximumCost = cost
+        self._evict()
+
+    def cost(self) -> int:
+        """Return the total cost of the rendered pixmaps in bytes."""
+        return self._cost
+
+    def __len__(self) -> int:
+        return len(self._icons)
+
+    def clear(self):
+        """Remove all the rendered icons."""
+        self._icons.clear()
+        self._cost = 0
+
+    def icon(
+        self,
+        icon: QtGui.QIcon,
+        size: QtCore.QSize,
+        devicePixelRatio: float = 1.0,
+        state: QtGui.QIcon.State = QtGui.QIcon.State.Off,
+    ) -> QtGui.QIcon:
+        """Return an icon with a single pixmap rendered from an icon at a size, drawing it does not scale it again.
+
+        :param icon: The source icon.
+        :param size: The size of the icon in device independent pixels.
+        :param devicePixelRatio: The device pixel ratio of the widget the icon is drawn on.
+        :param state: The state of the icon.
+        :return: The rendered icon.
+        """
+        key = (icon.cacheKey(), size.width(), size.height(), devicePixelRatio, int(state))
+        if key in self._icons:
+            self._icons.move_to_end(key)
+            return self._icons[key][0]
+        physicalSize = QtCore.QSize(round(size.width() * devicePixelRatio), round(size.height() * devicePixelRatio))
+        pixmap = icon.pixmap(physicalSize, QtGui.QIcon.Mode.Normal, state)
+        if pixmap.width() > physicalSize.width() or pixmap.height() > physicalSize.height():
+            pixmap = pixmap.scaled(
+                physicalSize,
+                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                QtCore.Qt.TransformationMode.SmoothTransformation,
+            )
+        pixmap.setDevicePixelRatio(devicePixelRatio)
+        rendered = QtGui.QIcon()
+        rendered.addPixmap(pixmap, QtGui.QIcon.Mode.Normal, state)
+        cost = pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+        self._icons[key] = (rendered, cost)
+        self._cost += cost
+        self._evict()
+        return rendered
+
+    def _evict(self):
+        """Remove the least recently used icons until the total cost is within the maximum cost."""
+        while self._cost > self._maximumCost and self._icons:
+            _, (_, cost) = self._icons.popitem(last=False)
+            self._cost -= cost
+
+
+#: the pixmap cache shared by the ribbon buttons, created the first time it is requested
+_pixmapCache: typing.Optional[RibbonPixmapCache] = None
+
+
+def pixmapCache() -> RibbonPixmapCache:
+    """Return the pixmap cache shared by the ribbon buttons."""
+    global _pixmapCache
+    if _pixmapCache is None:
+        _pixmapCache = RibbonPixmapCache()
+    return _pixmapCache
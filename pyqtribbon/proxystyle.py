@@ -0,0 +1,452 @@
+"""Proxy style of the ribbon styles.
+
+The proxy style is an alternative to the stylesheets of the ribbon styles: it draws the ribbon widgets with the same
+look as ``styles/base.qss`` and the qss file of the style, but it is set on the ribbon widgets only. The widgets
+embedded in the panels keep the native style and are not affected by the cascade of the stylesheet. The colors are
+the variables of the theme the stylesheets are compiled from, see :class:`pyqtribbon.theme.RibbonTheme`.
+"""
+
+import typing
+
+from qtpy import QtCore, QtGui, QtWidgets
+
+from .constants import RibbonButtonStyle, RibbonStyle
+from .stylesheets import styleTheme
+from .theme import RibbonTheme
+
+
+class RibbonWidgetLook(typing.NamedTuple):
+    """Border and background of a ribbon widget."""
+
+    #: color of the border, None for no border
+    borderColor: typing.Optional[str] = None
+    #: width of the border
+    borderWidth: int = 1
+    #: radius of the corners
+    borderRadius: int = 0
+    #: color of the background, None for a transparent background
+    backgroundColor: typing.Optional[str] = None
+
+
+class RibbonTabLook(typing.NamedTuple):
+    """Box and colors of the tabs of the ribbon tab bar, like the ``QTabBar::tab`` rules of the stylesheets."""
+
+    #: margins of the tabs, left, top, right and bottom
+    margins: typing.Tuple[int, int, int, int] = (0, 0, 0, 0)
+    #: padding of the tabs, left, top, right and bottom
+    padding: typing.Tuple[int, int, int, int] = (10, 0, 10, 0)
+    #: minimum width of the contents of the tabs
+    minimumWidth: int = 0
+    #: maximum width of the contents of the tabs
+    maximumWidth: int = 16777215
+    #: height of the contents of the tabs, None for the height given by the base style
+    height: typing.Optional[int] = None
+    #: color of the text of the tabs that are not selected, None for the color of the palette, the text color of the
+    #: selected tab is set by the tab bar
+    textColor: typing.Optional[str] = None
+    #: width of the line at the bottom of the selected and hovered tabs
+    lineWidth: int = 3
+    #: color of the line at the bottom of the selected tab
+    selectedColor: str = "blue"
+    #: color of the line at the bottom of the hovered tabs
+    hoverColor: str = "gray"
+
+
+def _looks(style: RibbonStyle, theme: RibbonTheme) -> typing.Dict[str, RibbonWidgetLook]:
+    """Return the looks of the ribbon widgets of a style, keyed by the class name.
+
+    :param style: The ribbon style.
+    :param theme: The theme of the colors of the looks.
+    :return: The looks.
+    """
+    borderColor, backgroundColor = theme.variable("borderColor"), theme.variable("backgroundColor")
+    looks = {
+        "RibbonPopupWidget": RibbonWidgetLook(borderColor, 1, 5, backgroundColor),
+        "RibbonGallery": RibbonWidgetLook(borderColor, 1, 5),
+        "RibbonGalleryButton": RibbonWidgetLook(borderColor, 1, 5),
+    }
+    if style == RibbonStyle.Default:
+        looks["RibbonStackedWidget"] = RibbonWidgetLook(None, 0, 10, backgroundColor)
+    elif style == RibbonStyle.Debug:
+        looks.update(
+            {
+                "RibbonApplicationButton": RibbonWidgetLook("blue", 2, 5),
+                "RibbonPanelOptionButton": RibbonWidgetLook("blue", 2, 5),
+                "QToolBar": RibbonWidgetLook("blue", 2, 5),
+                "RibbonTabBar": RibbonWidgetLook("purple", 2, 20),
+                "RibbonTitleLabel": RibbonWidgetLook("purple", 2, 20),
+                "RibbonBar": RibbonWidgetLook("red", 2, 20),
+                "RibbonCategory": RibbonWidgetLook("green", 2, 20),
+                "RibbonPanel": RibbonWidgetLook("brown", 2, 20),
+                "RibbonSeparator": RibbonWidgetLook("black", 2, 20),
+                "RibbonPanelTitle": RibbonWidgetLook("green", 2, 20),
+            }
+        )
+    return looks
+
+
+def _tabLook(style: RibbonStyle, theme: RibbonTheme) -> RibbonTabLook:
+    """Return the look of the tabs of the ribbon tab bar of a style.
+
+    :param style: The ribbon style.
+    :param theme: The theme of the colors of the tabs.
+    :return: The look of the tabs.
+    """
+    look = RibbonTabLook(selectedColor=theme.variable("accentColor"), hoverColor=theme.variable("hoverColor"))
+    if style == RibbonStyle.Debug:
+        look = look._replace(
+            margins=(6, 0, 0, 0),
+            padding=(10, 10, 10, 2),
+            minimumWidth=100,
+            maximumWidth=250,
+            height=25,
+            textColor="gray",
+        )
+    return look
+
+
+#: ribbon widgets drawn without a frame
+_frameless = ("RibbonCategoryScrollArea", "RibbonCategoryScrollAreaContents", "RibbonGalleryListWidget")
+
+#: cached proxy styles of the themes of the styles, keyed by the ribbon style, they are released when the application
+#: is about to quit
+_proxyStyles: typing.Dict[RibbonStyle, "RibbonProxyStyle"] = {}
+#: names of the classes in the method resolution order of the widget classes, keyed by the widget class
+_classNames: typing.Dict[type, typing.Tuple[str, ...]] = {}
+#: whether the widget classes are classes of this package, keyed by the widget class
+_ribbonClasses: typing.Dict[type, bool] = {}
+
+
+def isRibbonWidget(widget: typing.Optional[QtWidgets.QWidget]) -> bool:
+    """Return whether a widget is a ribbon widget, i.e. an instance of a class of this package, or a tool bar of the
+    title widget.
+
+    :param widget: The widget.
+    :return: Whether the widget is a ribbon widget.
+    """
+    if widget is None:
+        return False
+    cls = type(widget)
+    if cls not in _ribbonClasses:
+        _ribbonClasses[cls] = any(c.__module__.startswith("pyqtribbon.") for c in cls.__mro__)
+    if _ribbonClasses[cls]:
+        return True
+    if cls is not QtWidgets.QToolBar:
+        return False
+    # like the descendant selector "RibbonTitleWidget QToolBar" of the stylesheets
+    parent = widget.parentWidget()
+    while parent is not None and _inherits(parent, ("RibbonTitleWidget",)) is None:
+        parent = parent.parentWidget()
+    return parent is not None
+
+
+def _inherits(widget: typing.Optional[QtWidgets.QWidget], names: typing.Iterable[str]) -> typing.Optional[str]:
+    """Return the first class name of the widget that is in names, like a type selector of a stylesheet.
+
+    :param widget: The widget.
+    :param names: The class names.
+    :return: The class name, or None if the widget does not inherit any of the classes.
+    """
+    if widget is None:
+        return None
+    cls = type(widget)
+    if cls not in _classNames:
+        _classNames[cls] = tuple(c.__name__ for c in cls.__mro__)
+    for name in _classNames[cls]:
+        if name in names:
+            return name
+    return None
+
+
+class RibbonProxyStyle(QtWidgets.QProxyStyle):
+    """Proxy style that draws the ribbon widgets with the look of a ribbon style.
+
+    The style is propagated to the ribbon descendants of the ribbon widgets it polishes, and to the ribbon widgets
+    added to the containers of the ribbon (see :func:`polishRibbonChild`). The other widgets keep their own style.
+    """
+
+    #: the ribbon style
+    _ribbonStyle: RibbonStyle
+    #: the theme of the colors
+    _ribbonTheme: RibbonTheme
+    #: looks of the ribbon widgets, keyed by the class name
+    _looks: typing.Dict[str, RibbonWidgetLook]
+    #: looks of the widget classes, keyed by the widget class
+    _classLooks: typing.Dict[type, typing.Optional[RibbonWidgetLook]]
+    #: look of the tabs of the ribbon tab bar
+    _tabLook: RibbonTabLook
+
+    def __init__(self, style: RibbonStyle = RibbonStyle.Default, theme: typing.Optional[RibbonTheme] = None):
+        """Create a new proxy style.
+
+        :param style: The ribbon style to draw.
+        :param theme: The theme of the colors, the theme of the style if None. The colors are read when the proxy
+                      style is created.
+        """
+        super().__init__()
+        self._ribbonStyle = style
+        self._ribbonTheme = theme if theme is not None else styleTheme(style)
+        self._looks = _looks(style, self._ribbonTheme)
+        self._classLooks = {}
+        self._tabLook = _tabLook(style, self._ribbonTheme)
+
+    def ribbonStyle(self) -> RibbonStyle:
+        """Return the ribbon style drawn by the proxy style."""
+        return self._ribbonStyle
+
+    def ribbonTheme(self) -> RibbonTheme:
+        """Return the theme of the colors of the proxy style."""
+        return self._ribbonTheme
+
+    def tabLook(self) -> RibbonTabLook:
+        """Return the look of the tabs of the ribbon tab bar."""
+        return self._tabLook
+
+    def look(self, widget: typing.Optional[QtWidgets.QWidget]) -> typing.Optional[RibbonWidgetLook]:
+        """Return the look of a widget.
+
+        :param widget: The widget.
+        :return: The look, or None if the widget is drawn by the base style.
+        """
+        if widget is None:
+            return None
+        cls = type(widget)
+        if cls not in self._classLooks:
+            name = _inherits(widget, self._looks)
+            self._classLooks[cls] = self._looks[name] if name is not None else None
+        return self._classLooks[cls]
+
+    def polish(self, widget):
+        """Polish a widget, or a palette or the application.
+
+        The ribbon widgets with a look get a styled background, the look is drawn as their PE_Widget primitive, and
+        the style is set on their ribbon children.
+        """
+        super().polish(widget)
+        if isinstance(widget, QtWidgets.QWidget):
+            if self.look(widget) is not None:
+                widget.setAttribute(QtCore.Qt.WidgetAttribute.WA_StyledBackground, True)
+            self._polishChildren(widget)
+
+    def unpolish(self, widget):
+        """Unpolish a widget or the application."""
+        if isinstance(widget, QtWidgets.QWidget) and self.look(widget) is not None:
+            widget.setAttribute(QtCore.Qt.WidgetAttribute.WA_StyledBackground, False)
+        super().unpolish(widget)
+
+    def _polishChildren(self, widget: QtWidgets.QWidget):
+        """Set the style on the ribbon children of a widget, the children are polished with the style.
+
+        :param widget: The widget.
+        """
+        for child in widget.findChildren(QtWidgets.QWidget, options=QtCore.Qt.FindChildOption.FindDirectChildrenOnly):
+            if not isRibbonWidget(child):
+                self._polishChildren(child)
+            elif child.style() is not self:
+                child.setStyle(self)
+
+    def apply(self, widget: QtWidgets.QWidget, recursive: bool = True):
+        """Set the proxy style on a widget and on all its ribbon descendants.
+
+        :param widget: The ribbon widget.
+        :param recursive: Whether to set the style on the ribbon descendants too.
+        """
+        for w in [widget, *widget.findChildren(QtWidgets.QWidget)] if recursive else [widget]:
+            if isRibbonWidget(w) and w.style() is not self:
+                w.setStyle(self)
+
+    @staticmethod
+    def _drawLook(painter: QtGui.QPainter, rect: QtCore.QRect, look: RibbonWidgetLook):
+        """Draw the border and the background of a widget, before the widget paints itself.
+
+        :param painter: The painter.
+        :param rect: The rectangle of the widget.
+        :param look: The look of the widget.
+        """
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        if look.borderColor is not None and look.borderWidth > 0:
+            painter.setPen(QtGui.QPen(QtGui.QColor(look.borderColor), look.borderWidth))
+            margin = look.borderWidth / 2
+        else:
+            painter.setPen(QtCore.Qt.PenStyle.NoPen)
+            margin = 0
+        painter.setBrush(
+            QtGui.QColor(look.backgroundColor) if look.backgroundColor is not None else QtCore.Qt.BrushStyle.NoBrush
+        )
+        painter.drawRoundedRect(
+            QtCore.QRectF(rect).adjusted(margin, margin, -margin, -margin), look.borderRadius, look.borderRadius
+        )
+        painter.restore()
+
+    def drawPrimitive(self, element, option, painter, widget=None):
+        """Draw a primitive element."""
+        if element == QtWidgets.QStyle.PrimitiveElement.PE_Widget:
+            look = self.look(widget)
+            if look is not None:
+                self._drawLook(painter, option.rect, look)
+                return
+        if widget is not None and isRibbonWidget(widget):
+            if element in (
+                QtWidgets.QStyle.PrimitiveElement.PE_PanelMenuBar,
+                QtWidgets.QStyle.PrimitiveElement.PE_FrameTabBarBase,
+            ):
+                return  # transparent ribbon bar and tab bar
+            if element == QtWidgets.QStyle.PrimitiveElement.PE_IndicatorArrowDown and _inherits(
+                widget, ("RibbonApplicationButton",)
+            ):
+                return  # the application button has no menu indicator
+        super().drawPrimitive(element, option, painter, widget)
+
+    def drawComplexControl(self, control, option, painter, widget=None):
+        """Draw a complex control."""
+        if (
+            control == QtWidgets.QStyle.ComplexControl.CC_ToolButton
+            and _inherits(widget, ("RibbonToolButton",))
+            and option.features & QtWidgets.QStyleOptionToolButton.ToolButtonFeature.HasMenu
+            and not option.features & QtWidgets.QStyleOptionToolButton.ToolButtonFeature.MenuButtonPopup
+        ):
+            # the menu indicator is drawn at the right of the small and medium buttons and at the bottom of the large
+            # buttons, like the menu-indicator rules of the stylesheets
+            button = QtWidgets.QStyleOptionToolButton(option)
+            button.features &= ~QtWidgets.QStyleOptionToolButton.ToolButtonFeature.HasMenu
+            super().drawComplexControl(control, button, painter, widget)
+            indicator = QtWidgets.QStyleOption(option)
+            indicator.rect = self._menuIndicatorRect(option, widget)
+            self.drawPrimitive(QtWidgets.QStyle.PrimitiveElement.PE_IndicatorArrowDown, indicator, painter, widget)
+            return
+        super().drawComplexControl(control, option, painter, widget)
+
+    def _menuIndicatorRect(self, option: QtWidgets.QStyleOption, widget: QtWidgets.QWidget) -> QtCore.QRect:
+        """Return the rectangle of the menu indicator of a ribbon tool button.
+
+        :param option: The style option of the button.
+        :param widget: The button.
+        :return: The rectangle.
+        """
+        size = self.pixelMetric(QtWidgets.QStyle.PixelMetric.PM_MenuButtonIndicator, option, widget) - 6
+        rect = option.rect  # type: QtCore.QRect
+        if widget.property("buttonStyle") == RibbonButtonStyle.Large.name:
+            return QtCore.QRect(rect.center().x() - size // 2, rect.bottom() - size + 1, size, size)
+        return QtCore.QRect(rect.right() - size + 1, rect.center().y() - size // 2, size, size)
+
+    def drawControl(self, element, option, painter, widget=None):
+        """Draw a control element."""
+        if (
+            element == QtWidgets.QStyle.ControlElement.CE_MenuBarEmptyArea
+            and widget is not None
+            and isRibbonWidget(widget)
+        ):
+            return
+        if element == QtWidgets.QStyle.ControlElement.CE_ShapedFrame and _inherits(widget, _frameless):
+            return
+        if element == QtWidgets.QStyle.ControlElement.CE_TabBarTabShape and _inherits(widget, ("RibbonTabBar",)):
+            self._drawTabShape(option, painter)
+            return
+        if element == QtWidgets.QStyle.ControlElement.CE_TabBarTabLabel and _inherits(widget, ("RibbonTabBar",)):
+            option = QtWidgets.QStyleOptionTab(option)
+            # the base style lays the text out in the rectangle without the spacing of the tabs
+            hspace = self.pixelMetric(QtWidgets.QStyle.PixelMetric.PM_TabBarTabHSpace, option, widget) // 2
+            vspace = self.pixelMetric(QtWidgets.QStyle.PixelMetric.PM_TabBarTabVSpace, option, widget) // 2
+            option.rect = self._tabContentsRect(option.rect).adjusted(-hspace, -vspace, hspace, vspace)
+            role = widget.foregroundRole()
+            color = option.palette.color(role)
+            selected = option.state & QtWidgets.QStyle.StateFlag.State_Selected
+            if not selected and self._tabLook.textColor is not None and color == widget.palette().color(role):
+                # tabs without a text color of their own
+                color = QtGui.QColor(self._tabLook.textColor)
+            # the text color of the tabs is set on the foreground role, the base style draws the text of the tabs
+            # with the window text role
+            option.palette.setColor(QtGui.QPalette.ColorRole.WindowText, color)
+        super().drawControl(element, option, painter, widget)
+
+    def _tabRect(self, rect: QtCore.QRect) -> QtCore.QRect:
+        """Return the rectangle of a tab without its margins.
+
+        :param rect: The rectangle of the tab.
+        :return: The rectangle without the margins.
+        """
+        left, top, right, bottom = self._tabLook.margins
+        return rect.adjusted(left, top, -right, -bottom)
+
+    def _tabContentsRect(self, rect: QtCore.QRect) -> QtCore.QRect:
+        """Return the rectangle of the contents of a tab, without its margins, padding and bottom line.
+
+        :param rect: The rectangle of the tab.
+        :return: The rectangle of the contents.
+        """
+        left, top, right, bottom = self._tabLook.padding
+        return self._tabRect(rect).adjusted(left, top, -right, -bottom - self._tabLook.lineWidth)
+
+    def _drawTabShape(self, option: QtWidgets.QStyleOption, painter: QtGui.QPainter):
+        """Draw the shape of a tab of the ribbon tab bar, a line at the bottom of the selected or hovered tab.
+
+        :param option: The style option of the tab.
+        :param painter: The painter.
+        """
+        if option.state & QtWidgets.QStyle.StateFlag.State_Selected:
+            color = QtGui.QColor(self._tabLook.selectedColor)
+        elif option.state & QtWidgets.QStyle.StateFlag.State_MouseOver:
+            color = QtGui.QColor(self._tabLook.hoverColor)
+        else:
+            return
+        rect = self._tabRect(option.rect)
+        lineWidth = self._tabLook.lineWidth
+        painter.fillRect(QtCore.QRect(rect.left(), rect.bottom() - lineWidth + 1, rect.width(), lineWidth), color)
+
+    def sizeFromContents(self, type, option, size, widget=None):
+        """Return the size of an element from the size of its contents."""
+        if type == QtWidgets.QStyle.ContentsType.CT_TabBarTab and _inherits(widget, ("RibbonTabBar",)):
+            # the box of the tabs replaces the spacing of the base style, like the QTabBar::tab rules
+            look = self._tabLook
+            width = size.width() - self.pixelMetric(QtWidgets.QStyle.PixelMetric.PM_TabBarTabHSpace, option, widget)
+            width = min(max(width, look.minimumWidth), look.maximumWidth)
+            height = size.height() - self.pixelMetric(QtWidgets.QStyle.PixelMetric.PM_TabBarTabVSpace, option, widget)
+            height = look.height if look.height is not None else height
+            return QtCore.QSize(
+                width + look.margins[0] + look.padding[0] + look.padding[2] + look.margins[2],
+                height + look.margins[1] + look.padding[1] + look.padding[3] + look.margins[3] + look.lineWidth,
+            )
+        return super().sizeFromContents(type, option, size, widget)
+
+
+def ribbonProxyStyle(style: RibbonStyle) -> RibbonProxyStyle:
+    """Return the proxy style of a ribbon style, it is created the first time it is requested.
+
+    :param style: The ribbon style.
+    :return: The proxy style.
+    """
+    if style not in _proxyStyles:
+        app = QtCore.QCoreApplication.instance()
+        if not _proxyStyles and app is not None:
+            # the styles are deleted before the application, the widgets fall back to the application style
+            app.aboutToQuit.connect(_proxyStyles.clear)  # type: ignore
+        _proxyStyles[style] = RibbonProxyStyle(style)
+    return _proxyStyles[style]
+
+
+def polishRibbonChild(parent: QtWidgets.QWidget, child: QtCore.QObject):
+    """Set the proxy style of a ribbon widget on a ribbon widget added to it, and on the ribbon descendants of the
+    added widget. The ribbon widgets are polished with the style of the application when they are added after their
+    container was polished.
+
+    :param parent: The ribbon widget.
+    :param child: The added widget.
+    """
+    style = parent.style()
+    if isinstance(style, RibbonProxyStyle) and isinstance(child, QtWidgets.QWidget):
+        style.apply(child)
+
+
+def setRibbonWidgetsStyle(widget: QtWidgets.QWidget, style: typing.Optional[RibbonProxyStyle]):
+    """Set the proxy style on a widget and on all its ribbon descendants, the other descendants are left untouched.
+
+    :param widget: The top level ribbon widget.
+    :param style: The proxy style to set, None to restore the application style.
+    """
+    if style is not None:
+        style.apply(widget)
+    else:
+        for w in [widget, *widget.findChildren(QtWidgets.QWidget)]:
+            if isRibbonWidget(w):
+                w.setStyle(None)  # type: ignore
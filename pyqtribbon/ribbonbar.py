@@ -1,3 +1,4 @@
+import sys
 import typing
 
 from qtpy import QtCore, QtGui, QtWidgets
@@ -8,11 +9,26 @@ from .category import (
     RibbonContextCategory,
     RibbonNormalCategory,
 )
-from .constants import RibbonCategoryStyle, RibbonStyle, contextColors
+from .constants import (
+    RibbonCategoryStyle,
+    RibbonStyle,
+    RibbonStyleEngine,
+    contextColors,
+)
+from .layoutplanner import RibbonLayoutPlanCache
+from .logger import installExceptionHook
 from .menu import RibbonMenu
+from .proxystyle import (
+    RibbonProxyStyle,
+    polishRibbonChild,
+    ribbonProxyStyle,
+    setRibbonWidgetsStyle,
+)
+from .stylesheets import repolish, scopedStyleSheet, styleSheet, styleTheme
 from .tabbar import RibbonTabBar
+from .theme import RibbonTheme
 from .titlewidget import RibbonApplicationButton, RibbonTitleWidget
-from .utils import DataFile
+from .utils import DataIcon
 
 
 class RibbonStackedWidget(QtWidgets.QStackedWidget):
@@ -28,6 +44,12 @@ class RibbonStackedWidget(QtWidgets.QStackedWidget):
         effect.setOffset(2, 2)
         self.setGraphicsEffect(effect)
 
+    def childEvent(self, event: QtCore.QChildEvent):
+        """Set the proxy style of the ribbon on the categories added to the stacked widget."""
+        super().childEvent(event)
+        if event.type() == QtCore.QEvent.Type.ChildPolished:
+            polishRibbonChild(self, event.child())
+
 
 class RibbonBar(QtWidgets.QMenuBar):
     """The RibbonBar class is the top level widget that contains the ribbon."""
@@ -45,6 +67,25 @@ class RibbonBar(QtWidgets.QMenuBar):
     #: Maximum rows
     _maxRows = 6
 
+    #: cache of the layout plans of the panels
+    _layoutPlanCache: typing.Optional[RibbonLayoutPlanCache] = None
+
+    #: whether the widgets of the panels are wrapped in item widgets
+    _itemWidgetsEnabled = True
+
+    #: style of the ribbon and the engine that draws it
+    _ribbonStyle = RibbonStyle.Default
+    _styleEngine = RibbonStyleEngine.StyleSheet
+
+    #: custom theme of the ribbon, None if the theme of the style is used
+    _ribbonTheme: typing.Optional[RibbonTheme] = None
+    #: proxy style drawing the custom theme with the ProxyStyle engine
+    _themeProxyStyle: typing.Optional[RibbonProxyStyle] = None
+
+    #: whether the hidden categories are restyled when they are shown instead of when the style is set
+    _lazyStyleSwitch = False
+    _dirtyCategories: typing.Set[RibbonCategory] = set()
+
     #: Whether the ribbon is visible.
     _ribbonVisible = True
 
@@ -78,7 +119,12 @@ class RibbonBar(QtWidgets.QMenuBar):
             maxRows = 6
             parent = args[1] if len(args) > 1 else kwargs.get("parent", None)
         super().__init__(parent)
+        # the uncaught exceptions are shown in a message box from the first ribbon on, unless the application has
+        # installed an exception hook of its own
+        if sys.excepthook is sys.__excepthook__ and QtWidgets.QApplication.instance() is not None:
+            installExceptionHook()
         self._categories = {}
+        self._dirtyCategories = set()
         self._maxRows = maxRows
         self.setFixedHeight(self._ribbonHeight)
 
@@ -97,6 +143,8 @@ class RibbonBar(QtWidgets.QMenuBar):
         self._titleWidget.helpButtonClicked.connect(self.helpButtonClicked)
         self._titleWidget.collapseRibbonButtonClicked.connect(self._collapseButtonClicked)
         self._titleWidget.tabBar().currentChanged.connect(self.showCategoryByIndex)  # type: ignore
+        self._stackedWidget.currentChanged.connect(self._buildCategoryPanels)  # type: ignore
+        self._stackedWidget.currentChanged.connect(self._restyleDirtyCategory)  # type: ignore
         self.setRibbonStyle(RibbonStyle.Default)
 
     def autoHideRibbon(self) -> bool:
@@ -113,6 +161,15 @@ class RibbonBar(QtWidgets.QMenuBar):
         """
         self._autoHideRibbon = autoHide
 
+    def event(self, a0: QtCore.QEvent) -> bool:
+        """Apply the stylesheet again when the font of the application changes, the font sizes depend on it."""
+        if a0.type() == QtCore.QEvent.Type.ApplicationFontChange and self._styleEngine == RibbonStyleEngine.StyleSheet:
+            if self._ribbonTheme is not None:
+                self._applyStyleSheet(self._ribbonTheme.styleSheet())
+            else:
+                self.setRibbonStyle(self._ribbonStyle)
+        return super().event(a0)
+
     def eventFilter(self, a0: QtCore.QObject, a1: QtCore.QEvent) -> bool:
         if self._autoHideRibbon and a1.type() == QtCore.QEvent.Type.HoverMove:
             self.setRibbonVisible(self.underMouse())
@@ -171,10 +228,133 @@ class RibbonBar(QtWidgets.QMenuBar):
 
         :param style: The style to set.
         """
-        self.setStyleSheet(
-            open(DataFile("styles/base.qss"), "r").read()
-            + open(DataFile(f"styles/{style.name.lower()}.qss"), "r").read()
-        )
+        self._ribbonStyle = style
+        self._ribbonTheme = None
+        self._themeProxyStyle = None
+        self.setProperty("ribbonStyle", style.name)
+        if self._styleEngine == RibbonStyleEngine.ProxyStyle:
+            self.setStyleSheet("")
+            if not self._lazyStyleSwitch:
+                setRibbonWidgetsStyle(self, self._proxyStyle())
+                return
+        elif not self._lazyStyleSwitch:
+            self._applyStyleSheet(styleSheet(style))
+            return
+        elif self.styleSheet() != scopedStyleSheet():
+            self._applyStyleSheet(scopedStyleSheet())  # all the widgets are polished with the new stylesheet
+            return
+        # restyle the visible widgets only, the hidden categories are restyled when they are shown
+        self._dirtyCategories = set(self._categories.values())
+        self._restyleWidget(self, False)
+        self._restyleWidget(self._titleWidget)
+        self._restyleWidget(self._stackedWidget, False)
+        self._restyleDirtyCategory(self._stackedWidget.currentIndex())
+
+    def ribbonTheme(self) -> RibbonTheme:
+        """Return the theme of the ribbon, the custom theme or the theme of the style."""
+        return self._ribbonTheme if self._ribbonTheme is not None else styleTheme(self._ribbonStyle)
+
+    def setRibbonTheme(self, theme: RibbonTheme):
+        """Set a custom theme of the ribbon, it is replaced by the theme of the style when the style is set.
+
+        The stylesheet of the theme is compiled once and applied with the StyleSheet engine in a single pass, the
+        ProxyStyle engine draws the ribbon with the colors of the theme. A custom theme can be derived from the theme
+        of a style, e.g. ``RibbonTheme(styleTheme(RibbonStyle.Default).template(), accentColor="red")``.
+
+        :param theme: The theme to set.
+        """
+        self._ribbonTheme = theme
+        self._dirtyCategories.clear()
+        if self._styleEngine == RibbonStyleEngine.ProxyStyle:
+            self._themeProxyStyle = RibbonProxyStyle(self._ribbonStyle, theme)
+            setRibbonWidgetsStyle(self, self._themeProxyStyle)
+        else:
+            self._applyStyleSheet(theme.styleSheet())
+
+    def _proxyStyle(self) -> RibbonProxyStyle:
+        """Return the proxy style of the ProxyStyle engine, drawing the custom theme or the theme of the style."""
+        return self._themeProxyStyle if self._themeProxyStyle is not None else ribbonProxyStyle(self._ribbonStyle)
+
+    def _applyStyleSheet(self, styleSheet: str):
+        """Set the stylesheet of the ribbon with the updates disabled, so that the ribbon is repainted once.
+
+        :param styleSheet: The stylesheet.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            self.setStyleSheet(styleSheet)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def lazyStyleSwitch(self) -> bool:
+        """Return whether the hidden categories are restyled when they are shown instead of when the style is set."""
+        return self._lazyStyleSwitch
+
+    def setLazyStyleSwitch(self, lazy: bool):
+        """Set whether the hidden categories are restyled when they are shown instead of when the style is set.
+
+        When enabled, setting the style only restyles the title widget and the current category, the cost of
+        switching the style is proportional to the visible widgets. With the StyleSheet engine, the ribbon bar uses
+        the stylesheet of all the styles scoped by its ``ribbonStyle`` property.
+
+        :param lazy: Whether to restyle the hidden categories lazily.
+        """
+        self._lazyStyleSwitch = lazy
+        self._dirtyCategories.clear()
+        self.setRibbonStyle(self._ribbonStyle)
+
+    def _restyleWidget(self, widget: QtWidgets.QWidget, recursive: bool = True):
+        """Restyle a widget with the current style.
+
+        :param widget: The widget to restyle.
+        :param recursive: Whether to restyle the descendants of the widget too.
+        """
+        if self._styleEngine == RibbonStyleEngine.ProxyStyle:
+            self._proxyStyle().apply(widget, recursive)
+        else:
+            repolish(widget, recursive)
+
+    def _buildCategoryPanels(self, index: int):
+        """Build the pending panels of a category of the stacked widget when it becomes the current category.
+
+        :param index: The index of the category in the stacked widget.
+        """
+        category = self._stackedWidget.widget(index)
+        category.buildPendingPanels() if isinstance(category, RibbonCategory) else None
+
+    def _restyleDirtyCategory(self, index: int):
+        """Restyle a category of the stacked widget if the style was set while it was hidden.
+
+        :param index: The index of the category in the stacked widget.
+        """
+        category = self._stackedWidget.widget(index)
+        if category in self._dirtyCategories:
+            self._dirtyCategories.discard(category)
+            self._restyleWidget(category)
+
+    def ribbonStyle(self) -> RibbonStyle:
+        """Return the style of the ribbon."""
+        return self._ribbonStyle
+
+    def styleEngine(self) -> RibbonStyleEngine:
+        """Return the engine that draws the style of the ribbon."""
+        return self._styleEngine
+
+    def setStyleEngine(self, engine: RibbonStyleEngine):
+        """Set the engine that draws the style of the ribbon.
+
+        The StyleSheet engine sets the stylesheet of the style on the ribbon bar, it cascades to all the widgets of the
+        ribbon including the widgets embedded in the panels. The ProxyStyle engine sets a proxy style with the same
+        look on the ribbon widgets only, the embedded widgets keep the native style.
+
+        :param engine: The style engine.
+        """
+        if engine == self._styleEngine:
+            return
+        if self._styleEngine == RibbonStyleEngine.ProxyStyle:
+            setRibbonWidgetsStyle(self, None)
+        self._styleEngine = engine
+        self.setRibbonStyle(self._ribbonStyle)
 
     def applicationOptionButton(self) -> RibbonApplicationButton:
         """Return the application button."""
@@ -249,6 +429,7 @@ class RibbonBar(QtWidgets.QMenuBar):
         """
         button.setAutoRaise(True)
         self._titleWidget.quickAccessToolBar().addWidget(button)
+        polishRibbonChild(self._titleWidget, button)
 
     def setQuickAccessButtonHeight(self, height: int):
         """Set the height of the quick access buttons.
@@ -351,12 +532,68 @@ class RibbonBar(QtWidgets.QMenuBar):
         """
         return self._categories
 
+    def maximumRows(self) -> int:
+        """Return the maximum number of rows of the panels.
+
+        :return: The maximum number of rows.
+        """
+        return self._maxRows
+
+    def setMaximumRows(self, rows: int):
+        """Set the maximum number of rows of the panels, the widgets of the existing panels are re-placed.
+
+        :param rows: The maximum number of rows.
+        """
+        self._maxRows = rows
+        for category in self._categories.values():
+            category.setMaximumRows(rows)
+
+    def layoutPlanCache(self) -> typing.Optional[RibbonLayoutPlanCache]:
+        """Return the cache of the layout plans of the panels.
+
+        :return: The cache, None if the plans are not cached.
+        """
+        return self._layoutPlanCache
+
+    def setLayoutPlanCache(self, cache: typing.Union[str, RibbonLayoutPlanCache, None]):
+        """Set the cache of the layout plans of the panels.
+
+        The placements of the widgets added by addCategoriesBy() are stored in the cache, and loaded from it on the
+        next runs instead of being computed, as long as the widgets, the rows and the geometry of the panels are
+        the same.
+
+        :param cache: The cache or the directory of the cache, None to disable caching.
+        """
+        self._layoutPlanCache = RibbonLayoutPlanCache(cache) if isinstance(cache, str) else cache
+        for category in self._categories.values():
+            category.setLayoutPlanCache(self._layoutPlanCache)
+
+    def itemWidgetsEnabled(self) -> bool:
+        """Return whether the widgets of the panels are wrapped in item widgets.
+
+        :return: Whether the widgets are wrapped in item widgets.
+        """
+        return self._itemWidgetsEnabled
+
+    def setItemWidgetsEnabled(self, enabled: bool):
+        """Set whether the widgets added afterward to the panels are wrapped in item widgets.
+
+        Disabling the item widgets puts the widgets directly in the grid layouts of the panels, which halves the
+        number of widgets of large ribbons, see RibbonPanel.setItemWidgetsEnabled().
+
+        :param enabled: Whether the widgets are wrapped in item widgets.
+        """
+        self._itemWidgetsEnabled = enabled
+        for category in self._categories.values():
+            category.setItemWidgetsEnabled(enabled)
+
     def addCategoriesBy(
         self,
         data: typing.Dict[
             str,  # title of the category
             typing.Dict,  # data of the category
         ],
+        lazy: bool = False,
     ) -> typing.Dict[str, RibbonCategory]:
         """Add categories from a dict.
 
@@ -385,6 +622,8 @@ class RibbonBar(QtWidgets.QMenuBar):
                         },
                     }
                 }
+        :param lazy: Whether to build the panels of a category when it is shown for the first time or its panels are
+                     requested, only the current category is built immediately.
         :return: A dict of categories of the ribbon.
         """
         categories = {}
@@ -392,9 +631,18 @@ class RibbonBar(QtWidgets.QMenuBar):
             style = category_data.get("style", RibbonCategoryStyle.Normal)
             color = category_data.get("color", None)
             categories[title] = self.addCategory(title, style, color)
-            categories[title].addPanelsBy(category_data.get("panels", {}))
+            categories[title].addPanelsBy(
+                category_data.get("panels", {}),
+                lazy=lazy and categories[title] is not self._stackedWidget.currentWidget(),
+            )
         return categories
 
+    def _nextContextColor(self) -> QtGui.QColor:
+        """Return the default color of the next context category, the context colors of the theme are used in turn."""
+        name = f"contextColor{self._contextCategoryCount % len(contextColors)}"
+        self._contextCategoryCount += 1
+        return QtGui.QColor(self.ribbonTheme().variable(name))
+
     def addCategory(
         self,
         title: str,
@@ -413,14 +661,15 @@ class RibbonBar(QtWidgets.QMenuBar):
             raise ValueError(f"Category with title {title} already exists.")
         if style == RibbonCategoryStyle.Context:
             if color is None:
-                color = contextColors[self._contextCategoryCount % len(contextColors)]
-                self._contextCategoryCount += 1
+                color = self._nextContextColor()
         category = (
             RibbonContextCategory(title, color, self)  # noqa
             if style == RibbonCategoryStyle.Context
             else RibbonNormalCategory(title, self)  # noqa
         )
         category.setMaximumRows(self._maxRows)
+        category.setLayoutPlanCache(self._layoutPlanCache)
+        category.setItemWidgetsEnabled(self._itemWidgetsEnabled)
         category.setFixedHeight(
             self._ribbonHeight
             - self._mainLayout.spacing() * 2
@@ -474,8 +723,7 @@ class RibbonBar(QtWidgets.QMenuBar):
         :return: The newly created category.
         """
         if color is None:
-            color = contextColors[self._contextCategoryCount % len(contextColors)]
-            self._contextCategoryCount += 1
+            color = self._nextContextColor()
         categories = RibbonContextCategories(
             name,
             color,
@@ -538,6 +786,7 @@ class RibbonBar(QtWidgets.QMenuBar):
         """
         self.tabBar().removeTab(self._titleWidget.tabBar().indexOf(category.title()))
         self._stackedWidget.removeWidget(category)
+        self._dirtyCategories.discard(category)
 
     def removeCategories(self, categories: RibbonContextCategories):
         """Remove a list of categories from the ribbon.
@@ -584,7 +833,7 @@ class RibbonBar(QtWidgets.QMenuBar):
         if not self._ribbonVisible:
             self._ribbonVisible = True
             self.collapseRibbonButton().setToolTip("Collapse Ribbon")
-            self.collapseRibbonButton().setIcon(QtGui.QIcon(DataFile("icons/up.png")))
+            self.collapseRibbonButton().setIcon(DataIcon("icons/up.png"))
             self._stackedWidget.setVisible(True)
             self.setFixedSize(self.sizeHint())
 
@@ -593,7 +842,7 @@ class RibbonBar(QtWidgets.QMenuBar):
         if self._ribbonVisible:
             self._ribbonVisible = False
             self.collapseRibbonButton().setToolTip("Expand Ribbon")
-            self.collapseRibbonButton().setIcon(QtGui.QIcon(DataFile("icons/down.png")))
+            self.collapseRibbonButton().setIcon(DataIcon("icons/down.png"))
             self._stackedWidget.setVisible(False)
             self.setFixedSize(self.sizeHint().width(), self._titleWidget.size().height() + 5)  # type: ignore
 
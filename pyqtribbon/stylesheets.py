@@ -0,0 +1,126 @@
+"""Stylesheets of the ribbon styles.
+
+The stylesheet of a style is compiled from a theme whose template is the concatenation of ``styles/base.qss.in``,
+``styles/fonts.qss.in`` and the template of the style, the template is read from disk the first time it is requested
+and cached for the rest of the process.
+"""
+
+import re
+import typing
+
+from qtpy import QtCore, QtWidgets
+
+from .constants import RibbonStyle
+from .theme import RibbonTheme, defaultFontSizes
+from .utils import readDataFile
+
+#: cached themes of the styles, keyed by the ribbon style
+_styleThemes: typing.Dict[RibbonStyle, RibbonTheme] = {}
+
+#: cached stylesheet of all the styles scoped by the ribbonStyle property of the ribbon bar
+_scopedStyleSheet: typing.Optional[str] = None
+
+#: the default font sizes the scoped stylesheet was compiled with
+_scopedFontSizes: typing.Optional[typing.Dict[str, str]] = None
+
+#: the rules of a stylesheet, the selectors and the declarations
+_rulePattern = re.compile(r"([^{}]+)\{([^{}]*)\}")
+
+
+def _readStyleFile(filename: str) -> str:
+    """Read a qss file or a qss template of the package.
+
+    :param filename: The filename of the file, relative to the package.
+    :return: The content of the file.
+    """
+    return readDataFile(filename)
+
+
+def styleTheme(style: RibbonStyle) -> RibbonTheme:
+    """Return the theme of a ribbon style, with the default values of the variables.
+
+    :param style: The ribbon style.
+    :return: The theme, its template can be used to create custom themes.
+    """
+    if style not in _styleThemes:
+        _styleThemes[style] = RibbonTheme(
+            _readStyleFile("styles/base.qss.in")
+            + _readStyleFile("styles/fonts.qss.in")
+            + _readStyleFile(f"styles/{style.name.lower()}.qss.in")
+        )
+    return _styleThemes[style]
+
+
+def styleSheet(style: RibbonStyle) -> str:
+    """Return the stylesheet of a ribbon style.
+
+    :param style: The ribbon style.
+    :return: The stylesheet.
+    """
+    return styleTheme(style).styleSheet()
+
+
+def invalidateStyleSheets(style: typing.Optional[RibbonStyle] = None):
+    """Remove stylesheets from the cache, so that they are read from disk again the next time they are requested.
+
+    :param style: The ribbon style to remove, None to remove all the styles.
+    """
+    global _scopedStyleSheet
+    _scopedStyleSheet = None
+    if style is None:
+        _styleThemes.clear()
+    else:
+        _styleThemes.pop(style, None)
+
+
+def _scopeStyleSheet(sheet: str, style: RibbonStyle) -> str:
+    """Scope the rules of a stylesheet to the ribbon bars whose ribbonStyle property is the style.
+
+    :param sheet: The stylesheet.
+    :param style: The ribbon style.
+    :return: The scoped stylesheet.
+    """
+    scope = f'RibbonBar[ribbonStyle="{style.name}"]'
+    rules = []
+    for selectors, declarations in _rulePattern.findall(re.sub(r"/\*.*?\*/", "", sheet, flags=re.DOTALL)):
+        scoped = []
+        for selector in selectors.split(","):
+            selector = selector.strip()
+            if re.match(r"RibbonBar\b", selector):
+                scoped.append(scope + selector[len("RibbonBar") :])
+            else:
+                scoped.append(f"{scope} {selector}")
+        rules.append(",\n".join(scoped) + " {" + declarations + "}")
+    return "\n\n".join(rules) + "\n"
+
+
+def scopedStyleSheet() -> str:
+    """Return the stylesheet of all the ribbon styles, the rules of a style apply to the ribbon bars whose
+    ``ribbonStyle`` property is the name of the style.
+
+    Switching the style of a ribbon bar with this stylesheet only changes the property, the widgets are restyled when
+    they are polished again, which allows restyling the visible widgets only.
+
+    :return: The scoped stylesheet.
+    """
+    global _scopedStyleSheet, _scopedFontSizes
+    fontSizes = defaultFontSizes()
+    if _scopedStyleSheet is None or fontSizes != _scopedFontSizes:
+        _scopedStyleSheet = "".join(_scopeStyleSheet(styleSheet(style), style) for style in RibbonStyle)
+        _scopedFontSizes = fontSizes
+    return _scopedStyleSheet
+
+
+def repolish(widget: QtWidgets.QWidget, recursive: bool = True):
+    """Polish a widget again, so that the stylesheet rules depending on the properties of its ancestors are applied.
+
+    :param widget: The widget.
+    :param recursive: Whether to polish the descendants of the widget too.
+    """
+    widgets = [widget, *widget.findChildren(QtWidgets.QWidget)] if recursive else [widget]
+    for w in widgets:
+        style = w.style()
+        style.unpolish(w)
+        style.polish(w)
+        QtCore.QCoreApplication.sendEvent(w, QtCore.QEvent(QtCore.QEvent.Type.StyleChange))
+        w.update()
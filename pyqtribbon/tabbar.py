@@ -86,12 +86,38 @@ class RibbonTabBar(QtWidgets.QTabBar):
         return self._tabColors[self.tabText(self.currentIndex())]
 
     def changeColor(self, inx: int) -> None:
-        """Change tab's color."""
+        """Change tab's color.
+
+        The text color of the current tab is painted by paintEvent(), it is not overridden by the stylesheets.
+        """
 
         if self.count() > 0:
+            for i in range(self.count()):
+                if i != inx and self.tabTextColor(i).isValid():
+                    self.setTabTextColor(i, QtGui.QColor())
             currentTabText = self.tabText(inx)
             currentTabColor = self._tabColors[currentTabText]
             if currentTabColor is not None:
-                self.setStyleSheet("RibbonTabBar::tab:selected {color: %s;}" % QtGui.QColor(currentTabColor).name())
+                self.setTabTextColor(inx, QtGui.QColor(currentTabColor))
             else:
-                self.setStyleSheet("RibbonTabBar::tab:selected {color: black;}")
+                self.setTabTextColor(inx, QtGui.QColor(QtCore.Qt.GlobalColor.black))
+
+    def paintEvent(self, event: QtGui.QPaintEvent):
+        """Paint the tabs, the text color of the tabs is set on the window text role the styles draw the text with.
+
+        :param event: The paint event.
+        """
+        painter = QtWidgets.QStylePainter(self)
+        current = self.currentIndex()
+        # the current tab is drawn last to be on top of the other tabs
+        for i in [i for i in range(self.count()) if i != current] + ([current] if current >= 0 else []):
+            option = QtWidgets.QStyleOptionTab()
+            self.initStyleOption(option, i)
+            if not option.rect.intersects(event.rect()):
+                continue
+            color = self.tabTextColor(i)
+            if color.isValid():
+                option.palette.setColor(QtGui.QPalette.ColorRole.WindowText, color)
+            if not self.isTabEnabled(i):
+                option.palette.setCurrentColorGroup(QtGui.QPalette.ColorGroup.Disabled)
+            painter.drawControl(QtWidgets.QStyle.ControlElement.CE_TabBarTab, option)
@@ -0,0 +1,122 @@
+"""Themes of the ribbon.
+
+A theme is a QSS template with ``$variable`` placeholders (see :class:`string.Template`) and a map of the values of
+the variables. The template is compiled into a stylesheet the first time the stylesheet is requested, the stylesheet
+is cached until a variable or the font of the application is changed, the font sizes that are not set are resolved
+from the font of the application when the stylesheet is compiled.
+
+The templates of the bundled styles are the ``styles/*.qss.in`` files, the ``styles/*.qss`` files are the same
+stylesheets compiled with the default values of the colors.
+"""
+
+import string
+import typing
+
+from qtpy import QtGui, QtWidgets
+
+from .constants import contextColors
+
+
+def _colorName(color: typing.Union[str, QtGui.QColor]) -> str:
+    """Return the name of a color that can be used in a stylesheet.
+
+    :param color: The color, a QColor or a color name.
+    :return: The color name.
+    """
+    return color.name() if isinstance(color, QtGui.QColor) else str(color)
+
+
+#: default values of the theme variables, the context colors are the default colors of the context categories
+defaultThemeVariables: typing.Dict[str, str] = {
+    "accentColor": "blue",
+    "hoverColor": "gray",
+    "borderColor": "gray",
+    "backgroundColor": "white",
+    "selectedColor": "#e0e0e0",
+    **{f"contextColor{i}": _colorName(color) for i, color in enumerate(contextColors)},
+}
+
+
+def defaultFontSizes() -> typing.Dict[str, str]:
+    """Return the default values of the font size variables of the themes, the font of the tab bar and the title is
+    3 points larger than the font of the application.
+
+    :return: The font sizes keyed by the name of the variable.
+    """
+    font = QtWidgets.QApplication.font() if QtWidgets.QApplication.instance() is not None else None
+    if font is None:
+        size = "12pt"  # the default font of Qt is 9 points
+    elif font.pointSize() > 0:
+        size = f"{font.pointSize() + 3}pt"
+    else:
+        size = f"{font.pixelSize() + 4}px"
+    return {"tabFontSize": size, "titleFontSize": size}
+
+
+class RibbonTheme(object):
+    """Theme of the ribbon, a QSS template and the values of its variables."""
+
+    #: the QSS template
+    _template: string.Template
+
+    #: the values of the variables, without the default font sizes
+    _variables: typing.Dict[str, str]
+
+    #: the compiled stylesheet, None if it is not compiled yet
+    _styleSheet: typing.Optional[str] = None
+
+    #: the default font sizes the stylesheet was compiled with
+    _fontSizes: typing.Optional[typing.Dict[str, str]] = None
+
+    def __init__(self, template: str, variables: typing.Optional[typing.Dict[str, typing.Any]] = None, **kwargs):
+        """Create a new theme.
+
+        :param template: The QSS template, the variables are written as ``$name`` or ``${name}``.
+        :param variables: The values of the variables, the default values are used for the missing variables, colors
+                          can be given as QColor. The missing font sizes follow the font of the application.
+        :param kwargs: More values of the variables.
+        """
+        self._template = string.Template(template)
+        self._variables = dict(defaultThemeVariables)
+        for name, value in {**(variables or {}), **kwargs}.items():
+            self._variables[name] = _colorName(value)
+        self._styleSheet = None
+
+    def template(self) -> str:
+        """Return the QSS template of the theme."""
+        return self._template.template
+
+    def variables(self) -> typing.Dict[str, str]:
+        """Return a copy of the values of the variables, with the current default font sizes."""
+        return {**defaultFontSizes(), **self._variables}
+
+    def variable(self, name: str) -> str:
+        """Return the value of a variable.
+
+        :param name: The name of the variable.
+        :return: The value of the variable.
+        """
+        return self._variables[name] if name in self._variables else defaultFontSizes()[name]
+
+    def setVariable(self, name: str, value: typing.Union[str, QtGui.QColor]):
+        """Set the value of a variable, the stylesheet is compiled again the next time it is requested.
+
+        :param name: The name of the variable.
+        :param value: The value of the variable, colors can be given as QColor.
+        """
+        value = _colorName(value)
+        if self._variables.get(name) != value:
+            self._variables[name] = value
+            self._styleSheet = None
+
+    def styleSheet(self) -> str:
+        """Return the stylesheet of the theme, compiled from the template the first time it is requested and again
+        when the default font sizes have changed.
+
+        :return: The stylesheet.
+        """
+        fontSizes = defaultFontSizes()
+        if self._styleSheet is None or fontSizes != self._fontSizes:
+            self._styleSheet = self._template.substitute({**fontSizes, **self._variables})
+            self._fontSizes = fontSizes
+        return self._styleSheet
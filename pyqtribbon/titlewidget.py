@@ -3,8 +3,9 @@ import typing
 from qtpy import QtCore, QtGui, QtWidgets
 
 from .menu import RibbonMenu
+from .proxystyle import polishRibbonChild
 from .tabbar import RibbonTabBar
-from .utils import DataFile
+from .utils import DataIcon
 
 
 class RibbonApplicationButton(QtWidgets.QToolButton):
@@ -75,7 +76,7 @@ class RibbonTitleWidget(QtWidgets.QFrame):
 
         # Application
         self._applicationButton = RibbonApplicationButton()  # type: ignore
-        self._applicationButton.setIcon(QtGui.QIcon(DataFile("icons/python.png")))
+        self._applicationButton.setIcon(DataIcon("icons/python.png"))
         self._applicationButton.setIconSize(QtCore.QSize(self._quickAccessButtonHeight, self._quickAccessButtonHeight))
         self._applicationButton.setText("PyQtRibbon")
         self._applicationButton.setToolTip("PyQtRibbon")
@@ -97,14 +98,14 @@ class RibbonTitleWidget(QtWidgets.QFrame):
         self._rightToolBar.setIconSize(QtCore.QSize(self._rightButtonHeight, self._rightButtonHeight))
         self._collapseRibbonButton = QtWidgets.QToolButton(self)
         self._collapseRibbonButton.setIconSize(QtCore.QSize(self._rightButtonHeight, self._rightButtonHeight))
-        self._collapseRibbonButton.setIcon(QtGui.QIcon(DataFile("icons/up.png")))
+        self._collapseRibbonButton.setIcon(DataIcon("icons/up.png"))
         self._collapseRibbonButton.setAutoRaise(True)
         self._collapseRibbonButton.setToolTip("Collapse Ribbon")
         self._collapseRibbonButton.clicked.connect(self.collapseRibbonButtonClicked)  # type: ignore
         self._collapseRibbonButtonAction = self.addRightToolButton(self._collapseRibbonButton)
         self._helpButton = QtWidgets.QToolButton(self)
         self._helpButton.setIconSize(QtCore.QSize(self._rightButtonHeight, self._rightButtonHeight))
-        self._helpButton.setIcon(QtGui.QIcon(DataFile("icons/help.png")))
+        self._helpButton.setIcon(DataIcon("icons/help.png"))
         self._helpButton.setAutoRaise(True)
         self._helpButton.setToolTip("Help")
         self._helpButton.clicked.connect(self.helpButtonClicked)  # type: ignore
@@ -151,6 +152,7 @@ class RibbonTitleWidget(QtWidgets.QFrame):
         :param widget: The widget to add.
         """
         self._tabBarLayout.addWidget(widget)
+        polishRibbonChild(self, widget)
 
     def insertTitleWidget(self, index: int, widget: QtWidgets.QWidget):
         """Insert a widget to the title layout.
@@ -159,6 +161,7 @@ class RibbonTitleWidget(QtWidgets.QFrame):
         :param widget: The widget to insert.
         """
         self._tabBarLayout.insertWidget(index, widget)
+        polishRibbonChild(self, widget)
 
     def removeTitleWidget(self, widget: QtWidgets.QWidget):
         """Remove a widget from the title layout.
@@ -195,7 +198,9 @@ class RibbonTitleWidget(QtWidgets.QFrame):
         """
         button.setIconSize(QtCore.QSize(self._quickAccessButtonHeight, self._quickAccessButtonHeight))
         self._quickAccessButtons.append(button)
-        return self._quickAccessToolBar.addWidget(button)
+        action = self._quickAccessToolBar.addWidget(button)
+        polishRibbonChild(self, button)
+        return action
 
     def removeQuickAccessButton(self, button: QtWidgets.QToolButton, action: QtWidgets.QAction):
         """Remove a widget from the quick access bar.
@@ -243,7 +248,9 @@ class RibbonTitleWidget(QtWidgets.QFrame):
         """
         button.setIconSize(QtCore.QSize(self._rightButtonHeight, self._rightButtonHeight))
         self._rightToolButtons.append(button)
-        return self._rightToolBar.addWidget(button)
+        action = self._rightToolBar.addWidget(button)
+        polishRibbonChild(self, button)
+        return action
 
     def removeRightToolButton(self, button: QtWidgets.QToolButton, action: QtWidgets.QAction):
         """Remove a widget from the right button bar.
@@ -1,7 +1,10 @@
-from qtpy import QtCore, QtWidgets
+import typing
+
+from qtpy import QtCore, QtGui, QtWidgets
 
 from .constants import RibbonButtonStyle
 from .menu import RibbonMenu
+from .pixmapcache import pixmapCache
 
 
 class RibbonToolButton(QtWidgets.QToolButton):
@@ -53,48 +56,22 @@ class RibbonToolButton(QtWidgets.QToolButton):
             height = min(height, self._maximumIconSize)
             self.setIconSize(QtCore.QSize(height, height))
             self.setToolButtonStyle(QtCore.Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
-            self.setStyleSheet(
-                """
-                RibbonToolButton::menu-indicator {
-                    subcontrol-origin: padding;
-                    subcontrol-position: right;
-                    right: -5px;
-                }
-                """
-            )
         elif style == RibbonButtonStyle.Medium:
             height = self._mediumButtonIconSize
             height = min(height, self._maximumIconSize)
             self.setIconSize(QtCore.QSize(height, height))
             self.setToolButtonStyle(QtCore.Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
-            self.setStyleSheet(
-                """
-                RibbonToolButton::menu-indicator {
-                    subcontrol-origin: padding;
-                    subcontrol-position: right;
-                    right: -5px;
-                }
-                """
-            )
         elif style == RibbonButtonStyle.Large:
             height = self._largeButtonIconSize
             height = min(height, self._maximumIconSize)
             self.setIconSize(QtCore.QSize(height, height))
             self.setToolButtonStyle(QtCore.Qt.ToolButtonStyle.ToolButtonTextUnderIcon)
-            self.setStyleSheet(
-                """
-                RibbonToolButton[popupMode="0"]::menu-indicator {
-                    subcontrol-origin: padding;
-                    subcontrol-position: bottom;
-                    bottom: -5px;
-                }
-                RibbonToolButton[popupMode="2"]::menu-indicator {
-                    subcontrol-origin: padding;
-                    subcontrol-position: bottom;
-                    bottom: -5px;
-                }
-                """
-            )
+        if self.property("buttonStyle") != style.name:
+            # the menu indicator is styled by the ribbon stylesheet according to the buttonStyle property
+            self.setProperty("buttonStyle", style.name)
+            if self.testAttribute(QtCore.Qt.WidgetAttribute.WA_WState_Polished):
+                self.style().unpolish(self)
+                self.style().polish(self)
 
     def buttonStyle(self) -> RibbonButtonStyle:
         """Get the button style of the button.
@@ -103,6 +80,65 @@ class RibbonToolButton(QtWidgets.QToolButton):
         """
         return self._buttonStyle
 
+    def buttonStyleSizeHint(
+        self, style: RibbonButtonStyle, maximumIconSize: typing.Optional[int] = None
+    ) -> QtCore.QSize:
+        """Return the size hint of the button with a button style, computed like QToolButton.sizeHint() without
+        changing the button. The icon only style of the buttons is kept.
+
+        :param style: The button style.
+        :param maximumIconSize: The maximum icon size, the maximum icon size of the button if None.
+        :return: The size hint.
+        """
+        option = QtWidgets.QStyleOptionToolButton()
+        self.initStyleOption(option)
+        iconSize = {
+            RibbonButtonStyle.Small: self._smallButtonIconSize,
+            RibbonButtonStyle.Medium: self._mediumButtonIconSize,
+            RibbonButtonStyle.Large: self._largeButtonIconSize,
+        }[style]
+        iconSize = min(iconSize, maximumIconSize if maximumIconSize is not None else self._maximumIconSize)
+        option.iconSize = QtCore.QSize(iconSize, iconSize)
+        if option.toolButtonStyle in (
+            QtCore.Qt.ToolButtonStyle.ToolButtonTextUnderIcon,
+            QtCore.Qt.ToolButtonStyle.ToolButtonTextBesideIcon,
+        ):
+            option.toolButtonStyle = (
+                QtCore.Qt.ToolButtonStyle.ToolButtonTextUnderIcon
+                if style == RibbonButtonStyle.Large
+                else QtCore.Qt.ToolButtonStyle.ToolButtonTextBesideIcon
+            )
+        width = height = 0
+        if option.toolButtonStyle != QtCore.Qt.ToolButtonStyle.ToolButtonTextOnly:
+            width, height = iconSize, iconSize
+        if option.toolButtonStyle != QtCore.Qt.ToolButtonStyle.ToolButtonIconOnly:
+            metrics = self.fontMetrics()
+            textSize = metrics.size(QtCore.Qt.TextFlag.TextShowMnemonic, self.text())
+            textWidth, textHeight = textSize.width() + metrics.horizontalAdvance(" ") * 2, textSize.height()
+            if option.toolButtonStyle == QtCore.Qt.ToolButtonStyle.ToolButtonTextUnderIcon:
+                width, height = max(width, textWidth), height + 4 + textHeight
+            elif option.toolButtonStyle == QtCore.Qt.ToolButtonStyle.ToolButtonTextBesideIcon:
+                width, height = width + 4 + textWidth, max(height, textHeight)
+            else:
+                width, height = textWidth, textHeight
+        option.rect.setSize(QtCore.QSize(width, height))
+        if self.popupMode() == QtWidgets.QToolButton.ToolButtonPopupMode.MenuButtonPopup:
+            width += self.style().pixelMetric(QtWidgets.QStyle.PixelMetric.PM_MenuButtonIndicator, option, self)
+        return self.style().sizeFromContents(
+            QtWidgets.QStyle.ContentsType.CT_ToolButton, option, QtCore.QSize(width, height), self
+        )
+
+    def paintEvent(self, a0: QtGui.QPaintEvent) -> None:
+        """Paint the button with its icon pre-scaled by the pixmap cache, so that the style does not scale it."""
+        if self.icon().isNull():
+            return super().paintEvent(a0)
+        option = QtWidgets.QStyleOptionToolButton()
+        self.initStyleOption(option)
+        state = QtGui.QIcon.State.On if self.isChecked() else QtGui.QIcon.State.Off
+        option.icon = pixmapCache().icon(self.icon(), option.iconSize, self.devicePixelRatioF(), state)
+        painter = QtWidgets.QStylePainter(self)
+        painter.drawComplexControl(QtWidgets.QStyle.ComplexControl.CC_ToolButton, option)
+
     def addRibbonMenu(self) -> RibbonMenu:
         """Add a ribbon menu for the button.
 
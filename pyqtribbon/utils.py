@@ -1,4 +1,13 @@
 import os
+import typing
+
+from qtpy import QtCore, QtGui
+
+#: whether the compiled resource bundle of the package is registered, None if it is not tried yet
+_resourcesRegistered: typing.Optional[bool] = None
+
+#: cached icons of the package, keyed by the filename
+_dataIcons: typing.Dict[str, QtGui.QIcon] = {}
 
 
 def DataFile(filename):
@@ -8,3 +17,56 @@ def DataFile(filename):
     :return: The path to the data file.
     """
     return os.path.join(os.path.dirname(__file__), filename)
+
+
+def DataResource(filename):
+    """Return the path of a data file in the compiled resource bundle of the package, ``:/pyqtribbon/<filename>``.
+
+    The bundle is registered the first time a data file is requested, all the data files are then read from memory
+    instead of opening the loose files. The path of the loose file is returned if the bundle can not be registered
+    with the Qt binding, e.g. PyQt6.
+
+    :param filename: The filename of the data file.
+    :return: The path to the data file.
+    """
+    global _resourcesRegistered
+    if _resourcesRegistered is None:
+        try:
+            from . import _resources  # noqa: F401
+
+            _resourcesRegistered = True
+        except (ImportError, AttributeError):
+            _resourcesRegistered = False
+    return ":/pyqtribbon/" + filename if _resourcesRegistered else DataFile(filename)
+
+
+def readDataFile(filename: str) -> str:
+    """Read a text data file of the package, from the resource bundle if it is registered.
+
+    :param filename: The filename of the data file.
+    :return: The content of the file.
+    """
+    file = QtCore.QFile(DataResource(filename))
+    if not file.open(QtCore.QIODevice.OpenModeFlag.ReadOnly):
+        raise FileNotFoundError(f"Data file {filename} not found.")
+    try:
+        return bytes(file.readAll()).decode("utf-8")
+    finally:
+        file.close()
+
+
+def DataIcon(filename: str) -> QtGui.QIcon:
+    """Return the icon of a data file, the icon is shared by all the widgets, so the file is read and decoded once
+    for each size it is drawn at.
+
+    :param filename: The filename of the data file.
+    :return: The icon.
+    """
+    if filename not in _dataIcons:
+        _dataIcons[filename] = QtGui.QIcon(DataResource(filename))
+    return _dataIcons[filename]
+
+
+def clearDataCache():
+    """Remove the icons of the data files from the cache."""
+    _dataIcons.clear()
@@ -1,7 +1,7 @@
 from pytestqt.qtbot import QtBot
 from qtpy import QtWidgets
 
-from pyqtribbon import RibbonBar
+from pyqtribbon import RibbonBar, RibbonButtonStyle, RibbonPanelScale
 
 
 def test_category(qtbot: QtBot):
@@ -21,3 +21,65 @@ def test_category(qtbot: QtBot):
 
     # Show the window
     window.resize(1800, 350)
+
+
+def test_category_adaptive_scaling(qtbot: QtBot):
+    window = QtWidgets.QMainWindow()
+    ribbonbar = RibbonBar()
+    window.setMenuBar(ribbonbar)
+    window.resize(1800, 350)
+    window.show()
+    qtbot.addWidget(window)
+
+    category = ribbonbar.addCategory("Category 1")
+    for i in range(4):
+        panel = category.addPanel(f"Panel {i}")
+        for j in range(3):
+            panel.addLargeButton(f"Button {j}")
+    category.setAdaptiveScaling(True)
+    panels = list(category.panels().values())
+    assert all(panel.scale() == RibbonPanelScale.Large for panel in panels)
+
+    # the panels are scaled down from the right
+    window.resize(panels[0].scaleWidth(RibbonPanelScale.Large) * 3, 350)
+    qtbot.wait(10)
+    scales = [panel.scale() for panel in panels]
+    assert scales == sorted(scales) and scales[-1] != RibbonPanelScale.Large
+    assert panels[-1].widget(0).buttonStyle() != RibbonButtonStyle.Large
+
+    # the collapsed panels are replaced by buttons showing them in a popup
+    window.resize(200, 350)
+    qtbot.wait(10)
+    assert panels[-1].scale() == RibbonPanelScale.Collapsed and not panels[-1].isVisible()
+    assert category._collapsedButtons["Panel 3"].isVisible()
+    category.showPanelPopup("Panel 3")
+    assert panels[-1].parent() is category._panelPopup and panels[-1].isVisible()
+    category._panelPopup.hide()
+    assert panels[-1].parent() is category._categoryScrollAreaContents
+
+    category.setAdaptiveScaling(False)
+    assert all(panel.scale() == RibbonPanelScale.Large and panel.isVisible() for panel in panels)
+    assert panels[-1].widget(0).buttonStyle() == RibbonButtonStyle.Large
+
+
+def test_category_adaptive_scaling_rename_panel(qtbot: QtBot):
+    window = QtWidgets.QMainWindow()
+    ribbonbar = RibbonBar()
+    window.setMenuBar(ribbonbar)
+    window.show()
+    qtbot.addWidget(window)
+
+    category = ribbonbar.addCategory("Category 1")
+    panel = category.addPanel("Panel")
+    for j in range(3):
+        panel.addLargeButton(f"Button {j}")
+    category.setAdaptiveScaling(True)
+    window.resize(panel.scaleWidth(RibbonPanelScale.Large) + 100, 350)
+    qtbot.wait(10)
+    assert panel.scale() == RibbonPanelScale.Large
+
+    # a longer title makes the panel wider than the category, it is scaled down
+    panel.setTitle("Panel with a title much longer than its buttons " * 2)
+    assert panel.scaleWidth(RibbonPanelScale.Large) > window.width()
+    category.updatePanelScales()
+    assert panel.scale() != RibbonPanelScale.Large
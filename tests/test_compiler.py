@@ -0,0 +1,131 @@
+import copy
+import json
+
+import pytest
+from pytestqt.qtbot import QtBot
+from qtpy import QtWidgets
+
+from pyqtribbon import RibbonBar
+from pyqtribbon.compiler import compileFile, compileSpec, main
+from pyqtribbon.constants import Large, Small
+from pyqtribbon.layoutplanner import RibbonGridLayoutManager
+from pyqtribbon.panel import RibbonPanel, RibbonPanelWidgetFactory
+
+spec = {
+    "Home": {
+        "panels": {
+            "Clipboard": {
+                "widgets": {
+                    "paste": {"type": "Button", "kwargs": {"text": "Paste"}},
+                    "cut": {"type": "Button", "args": ("Cut",), "kwargs": {"rowSpan": Small}},
+                    "copy": {"type": "Button", "kwargs": {"text": "Copy", "rowSpan": Small}},
+                    "label": {"type": "Label", "args": ("Label",), "kwargs": {"colSpan": 2}},
+                    "separator": {"type": "Separator"},
+                }
+            },
+            "Empty": {"showPanelOptionButton": False},
+        }
+    },
+    "Context": {"style": "Context", "color": "red", "panels": {"Panel": {"widgets": {"b": {"type": "LargeButton"}}}}},
+}
+
+
+def placements(categories):
+    return {
+        (title, panelTitle): [
+            (p.row, p.col, p.rowSpan, p.colSpan, widget.maximumHeight())
+            for widget, p in panel._placements.items()  # noqa
+        ]
+        for title, category in categories.items()
+        for panelTitle, panel in category.panels().items()
+    }
+
+
+def test_compiler(qtbot: QtBot, monkeypatch, tmp_path):
+    interpreted = RibbonBar()
+    qtbot.addWidget(interpreted)
+    data = copy.deepcopy(spec)
+    data["Context"]["style"] = 1
+    data["Context"]["panels"]["Panel"]["widgets"]["b"]["type"] = "Button"
+    expected = interpreted.addCategoriesBy(data)
+
+    code = compileSpec(spec)
+    assert "getattr" not in code and "panel.addLargeButton()" in code
+    namespace = {}
+    exec(compile(code, "builder.py", "exec"), namespace)
+
+    # the cells are not searched at runtime
+    requested = []
+    request_cells = RibbonGridLayoutManager.request_cells
+    monkeypatch.setattr(
+        RibbonGridLayoutManager, "request_cells", lambda self, *a: requested.append(a) or request_cells(self, *a)
+    )
+    compiled = RibbonBar()
+    qtbot.addWidget(compiled)
+    categories, widgets = namespace["build"](compiled)
+    assert requested == []
+    assert placements(categories) == placements(expected)
+    assert widgets["Home", "Clipboard", "cut"].text() == "Cut"
+    assert categories["Context"].color().name() == "#ff0000"
+
+    # the cells are searched if the panels have a different number of rows
+    other = RibbonBar(maxRows=4)
+    qtbot.addWidget(other)
+    namespace["build"](other)
+    assert requested
+
+    # command line
+    (tmp_path / "spec.json").write_text(json.dumps(spec))
+    assert main([str(tmp_path / "spec.json"), "-o", str(tmp_path / "builder.py")]) == 0
+    assert (tmp_path / "builder.py").read_text() == compileFile(tmp_path / "spec.json")
+
+
+def test_compiler_widget_factories(qtbot: QtBot, monkeypatch):
+    class Panel(RibbonPanel):
+        def addSwitch(self, **kwargs):
+            return self.addWidget(QtWidgets.QCheckBox(), **kwargs)
+
+    # the types are resolved through the widget factories of the panel class, the registered types included
+    monkeypatch.setitem(
+        RibbonPanel.widgetFactories(), "colorlabel", lambda panel, color, **kwargs: panel.addLabel(color, **kwargs)
+    )
+    monkeypatch.setitem(
+        RibbonPanel.widgetFactories(),
+        "colorbutton",
+        RibbonPanelWidgetFactory(lambda panel, color, **kwargs: panel.addButton(color, **kwargs), Large, "button"),
+    )
+    data = {
+        "Home": {
+            "panels": {
+                "Panel": {
+                    "widgets": {
+                        "switch": {"type": "SmallSwitch"},
+                        "color": {"type": "ColorLabel", "args": ("red",), "kwargs": {"colSpan": 2}},
+                    }
+                }
+            }
+        }
+    }
+    assert "panel.addSmallSwitch()" in compileSpec(data, panelClass=Panel)
+    with pytest.raises(ValueError):
+        compileSpec(data)
+
+    del data["Home"]["panels"]["Panel"]["widgets"]["switch"]
+    data["Home"]["panels"]["Panel"]["widgets"]["button"] = {"type": "ColorButton", "args": ("blue",)}
+    code = compileSpec(data)
+    assert "panel.widgetFactories()['colorlabel'](panel, 'red', colSpan=2)" in code
+    namespace = {}
+    exec(compile(code, "builder.py", "exec"), namespace)
+
+    # the cells of the registered types are planned with the row span of their factories
+    requested = []
+    request_cells = RibbonGridLayoutManager.request_cells
+    monkeypatch.setattr(
+        RibbonGridLayoutManager, "request_cells", lambda self, *a: requested.append(a) or request_cells(self, *a)
+    )
+    ribbon = RibbonBar()
+    qtbot.addWidget(ribbon)
+    _, widgets = namespace["build"](ribbon)
+    assert requested == []
+    assert widgets["Home", "Panel", "color"].text() == "red"
+    assert widgets["Home", "Panel", "button"].buttonStyle() == Large
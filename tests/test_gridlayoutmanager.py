@@ -0,0 +1,67 @@
+import pytest
+
+from pyqtribbon.constants import ColumnWise, RowWise
+from pyqtribbon.panel import RibbonGridLayoutManager
+
+
+def test_gridlayoutmanager_columnwise():
+    manager = RibbonGridLayoutManager(6)
+
+    # Small widgets fill the first column from top to bottom
+    assert manager.request_cells(2) == (0, 0)
+    assert manager.request_cells(2) == (2, 0)
+    assert manager.request_cells(2) == (4, 0)
+
+    # A large widget needs a new column
+    assert manager.request_cells(6) == (0, 1)
+    assert manager.columns == 2
+
+    # Medium widgets spanning multiple columns
+    assert manager.request_cells(3, 2) == (0, 2)
+    assert manager.request_cells(3) == (3, 2)
+    assert manager.request_cells(3) == (3, 3)
+    assert manager.columns == 4
+    assert all(not any(row) for row in manager.cells)
+
+
+def test_gridlayoutmanager_rowwise():
+    manager = RibbonGridLayoutManager(6)
+
+    assert manager.request_cells(2, 1, RowWise) == (0, 0)
+    assert manager.request_cells(2, 2, RowWise) == (0, 1)
+    assert manager.columns == 3
+    assert manager.cells[0] == [False, False, False]
+    assert manager.cells[1] == [True, False, False]
+    assert manager.cells[2] == [True, True, True]
+
+    # The remaining cells are still found in the column-wise mode
+    assert manager.request_cells(2, 1, ColumnWise) == (1, 0)
+
+
+def test_gridlayoutmanager_rowspan_too_large():
+    manager = RibbonGridLayoutManager(3)
+    with pytest.raises(ValueError):
+        manager.request_cells(4)
+
+
+def test_gridlayoutmanager_skip_cursor(monkeypatch: pytest.MonkeyPatch):
+    manager = RibbonGridLayoutManager(6)
+    rowSpans = [2, 3, 6, 2, 2, 3, 2, 6, 3, 2]  # mixed small, medium and large widgets
+
+    # number of columns scanned by each request, from the first free column to the end of the grid
+    scanned = []
+    firstFreeColumn = manager.firstFreeColumn
+
+    def recordScanned(rowSpan: int = 1) -> int:
+        col = firstFreeColumn(rowSpan)
+        scanned.append(manager.columns - col)
+        return col
+
+    monkeypatch.setattr(manager, "firstFreeColumn", recordScanned)
+    for i in range(10000):
+        manager.request_cells(rowSpans[i % len(rowSpans)])
+
+    # the filled columns are skipped by the following requests, which only scan the last columns of the grid
+    assert manager.columns > 1000 and len(scanned) == 10000
+    assert max(scanned) <= 5
+    assert manager.firstFreeColumn(2) >= manager.columns - 5
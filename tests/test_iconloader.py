@@ -0,0 +1,40 @@
+from pytestqt.qtbot import QtBot
+from qtpy import QtCore, QtGui
+
+from pyqtribbon import RibbonBar
+from pyqtribbon.iconloader import iconLoader
+from pyqtribbon.utils import DataFile
+
+
+def test_iconloader(qtbot: QtBot, tmp_path):
+    loader = iconLoader()
+    loader.clear()
+    ribbonbar = RibbonBar()
+    qtbot.addWidget(ribbonbar)
+    panel = ribbonbar.addCategory("Category").addPanel("Panel")
+    gallery = panel.addGallery()
+
+    # icons given as paths and bytes show a placeholder until they are decoded
+    with open(DataFile("icons/python.png"), "rb") as f:
+        data = f.read()
+    pathButton = panel.addLargeButton("Path", DataFile("icons/python.png"))
+    bytesButton = panel.addSmallButton("Bytes", data)
+    galleryButton, popupButton = gallery.addButton("Gallery", DataFile("icons/python.png"))
+    assert pathButton.icon().cacheKey() == loader.placeholderIcon().cacheKey()
+    assert loader.waitForDone(5000)
+    for button in (pathButton, bytesButton, galleryButton, popupButton):
+        assert button.icon().cacheKey() != loader.placeholderIcon().cacheKey()
+        assert button.icon().pixmap(QtCore.QSize(32, 32)).toImage().pixelColor(16, 16).alpha() > 0
+
+    # the decoded icons are cached, QIcons are set immediately
+    cachedButton = panel.addSmallButton("Cached", DataFile("icons/python.png"))
+    assert cachedButton.icon().cacheKey() == pathButton.icon().cacheKey()
+    icon = QtGui.QIcon(DataFile("icons/help.png"))
+    assert panel.addSmallButton("Icon", icon).icon().cacheKey() == icon.cacheKey()
+
+    # an image that cannot be decoded results in a null icon
+    invalid = tmp_path / "invalid.png"
+    invalid.write_bytes(b"not an image")
+    invalidButton = panel.addSmallButton("Invalid", str(invalid))
+    assert loader.waitForDone(5000)
+    assert invalidButton.icon().isNull()
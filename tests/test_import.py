@@ -0,0 +1,38 @@
+import os
+import subprocess
+import sys
+
+#: budget of the time spent in the modules of the package when it is imported, the Qt bindings are not included
+IMPORT_TIME_BUDGET = 0.5
+
+CHECKS = """
+import logging, sys
+import pyqtribbon
+assert sys.excepthook is sys.__excepthook__, "the exception hook is installed at import"
+assert "numpy" not in sys.modules, "numpy is imported"
+assert not logging.getLogger("pyqtribbon.logger").handlers, "a handler is added to the logger"
+hook = pyqtribbon.qt_exception_hook
+assert sys.excepthook == hook.exception_hook and pyqtribbon.logger.installExceptionHook() is hook
+try:
+    1 / 0
+except ZeroDivisionError:
+    hook.exception_hook(*sys.exc_info())
+"""
+
+
+def test_import_time():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHECKS], cwd=root, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    # the traceback of the uncaught exception is written to stderr without a QApplication
+    assert "Traceback (most recent call last)" in result.stderr and "ZeroDivisionError" in result.stderr
+
+    # lines of the form "import time: self [us] | cumulative | imported package"
+    elapsed = 0
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            selfTime, _, name = line[len("import time:") :].split("|")
+            elapsed += int(selfTime) if name.strip().startswith("pyqtribbon") else 0
+    assert 0 < elapsed / 1e6 < IMPORT_TIME_BUDGET, f"Importing pyqtribbon took {elapsed / 1e6:.3f}s"
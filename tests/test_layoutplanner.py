@@ -0,0 +1,116 @@
+import pytest
+
+from pyqtribbon.constants import Large, Medium, RibbonPanelScale, Small
+from pyqtribbon.layoutplanner import (
+    RibbonLayoutItem,
+    RibbonLayoutPlanCache,
+    RibbonPanelLayoutPlanner,
+    RibbonPanelMetrics,
+    layoutItemBy,
+    planCategory,
+    planPanel,
+    selectPanelScales,
+)
+from pyqtribbon.panel import RibbonPanel
+from pyqtribbon.toolbutton import RibbonToolButton
+
+
+def test_layoutplanner_place():
+    metrics = RibbonPanelMetrics(height=130, titleHeight=15, actionsMargins=(5, 5))
+    planner = RibbonPanelLayoutPlanner(6, metrics)
+    assert planner.rowHeight() == 17
+
+    small = planner.place(RibbonLayoutItem(Small))
+    assert (small.row, small.col, small.rowSpan) == (0, 0, 2)
+    assert small.maximumHeight == 34
+    assert small.fixedHeight is None and small.maximumIconSize is None
+
+    medium = planner.place(RibbonLayoutItem(Medium, fixedHeight=0.5))
+    assert (medium.row, medium.col, medium.rowSpan) == (2, 0, 3)
+    assert medium.fixedHeight == 25
+
+    button = planner.place(RibbonLayoutItem(Large, kind="button"))
+    assert (button.row, button.col, button.rowSpan) == (0, 1, 6)
+    assert button.maximumIconSize == 79
+
+    gallery = planner.place(RibbonLayoutItem(Large, kind="gallery"))
+    assert gallery.fixedHeight == gallery.maximumHeight
+
+
+def test_layoutplanner_plan_panel():
+    assert layoutItemBy("SmallButton") == RibbonLayoutItem(Small, kind="button")
+    assert layoutItemBy("ComboBox", {"colSpan": 2}) == RibbonLayoutItem(Small, 2)
+    assert layoutItemBy("HorizontalSeparator") == RibbonLayoutItem(Large)
+    assert layoutItemBy("MediumGallery") == RibbonLayoutItem(Medium, kind="gallery")
+
+    # the defaults are read from the add methods of the panel class
+    class Panel(RibbonPanel):
+        def addSwitch(self, text: str, *, rowSpan=Medium, **kwargs) -> RibbonToolButton:
+            return self.addButton(text, rowSpan=rowSpan, **kwargs)
+
+    assert layoutItemBy("Switch", panelClass=Panel) == RibbonLayoutItem(Medium, kind="button")
+    assert layoutItemBy("LargeSwitch", panelClass=Panel) == RibbonLayoutItem(Large, kind="button")
+    assert layoutItemBy("Switch") == RibbonLayoutItem(Small)
+
+    placements = planPanel(
+        {
+            "button": {"type": "LargeButton"},
+            "combo1": {"type": "ComboBox"},
+            "combo2": {"type": "ComboBox"},
+            "list": {"type": "ListWidget"},
+        }
+    )
+    assert [(p.row, p.col) for p in placements.values()] == [(0, 0), (0, 1), (2, 1), (0, 2)]
+
+    panels = planCategory({"panel1": {"widgets": {"a": {"type": "Label"}}}, "panel2": {}}, maxRows=3)
+    assert panels["panel1"]["a"].rowSpan == 1
+    assert panels["panel2"] == {}
+
+
+def test_layoutplanner_cache(tmp_path):
+    items = [RibbonLayoutItem(Large, kind="button"), RibbonLayoutItem(Small), RibbonLayoutItem(Medium, 2)]
+    cache = RibbonLayoutPlanCache(str(tmp_path))
+
+    planner = RibbonPanelLayoutPlanner(6, RibbonPanelMetrics(height=130))
+    key = cache.key(items, planner)
+    assert cache.load(key) is None
+    planner.startRecording()
+    placements = planner.plan(items)
+    assert planner.stopRecording() == placements
+    cache.save(key, placements, planner.gridLayoutManager().state())
+
+    # a warm start returns the cached placements and restores the grid
+    warm = RibbonPanelLayoutPlanner(6, RibbonPanelMetrics(height=130))
+    assert cache.key(items, warm) == key
+    warm.replay(*cache.load(key))
+    assert warm.plan(items) == placements
+    assert warm.gridLayoutManager().state() == planner.gridLayoutManager().state()
+    assert warm.place(RibbonLayoutItem(Small)) == planner.place(RibbonLayoutItem(Small))
+
+    # any change of the inputs results in another key
+    assert cache.key(items, RibbonPanelLayoutPlanner(6, RibbonPanelMetrics(height=140))) != key
+    assert cache.key(items, RibbonPanelLayoutPlanner(3, RibbonPanelMetrics(height=130))) != key
+    assert cache.key(items[:2], RibbonPanelLayoutPlanner(6, RibbonPanelMetrics(height=130))) != key
+
+    # a placement that does not match the widget cancels the replay
+    cold = RibbonPanelLayoutPlanner(6, RibbonPanelMetrics(height=130))
+    expected = cold.plan([items[0], RibbonLayoutItem(Large)])
+    mismatched = RibbonPanelLayoutPlanner(6, RibbonPanelMetrics(height=130))
+    mismatched.replay(*cache.load(key))
+    with pytest.warns(RuntimeWarning):
+        assert mismatched.plan([items[0], RibbonLayoutItem(Large)]) == expected
+    assert mismatched.gridLayoutManager().state() == cold.gridLayoutManager().state()
+
+
+def test_select_panel_scales():
+    widths = [(300, 200, 100, 50)] * 3
+    L, M, S, C = RibbonPanelScale
+    assert selectPanelScales(widths, 900) == (L, L, L)
+    assert selectPanelScales(widths, 800) == (L, L, M)
+    assert selectPanelScales(widths, 600) == (M, M, M)
+    assert selectPanelScales(widths, 450) == (M, S, S)
+    assert selectPanelScales(widths, 250) == (S, S, C)
+    assert selectPanelScales(widths, 200) == (S, C, C)
+    assert selectPanelScales(widths, 0) == (C, C, C)
+    # a scale that is not narrower is skipped
+    assert selectPanelScales([(100, 100, 100, 50)], 60) == (C,)
@@ -1,7 +1,14 @@
+import ast
+import inspect
+import pathlib
+
+import pytest
 from pytestqt.qtbot import QtBot
-from qtpy import QtWidgets
+from qtpy import QtGui, QtWidgets
 
-from pyqtribbon import RibbonBar
+from pyqtribbon import Large, RibbonBar, RibbonPanelScale, RowWise
+from pyqtribbon.panel import RibbonPanel, RibbonPanelItemWidget
+from pyqtribbon.toolbutton import RibbonToolButton
 
 
 def test_panel(qtbot: QtBot):
@@ -33,3 +40,216 @@ def test_panel(qtbot: QtBot):
 
     # Show the window
     window.resize(1800, 350)
+
+
+def test_panel_remove_widget(qtbot: QtBot):
+    window = QtWidgets.QMainWindow()
+    window.show()
+    qtbot.addWidget(window)
+
+    ribbonbar = RibbonBar()
+    window.setMenuBar(ribbonbar)
+    panel = ribbonbar.addCategory("Category 1").addPanel("Panel 1")
+
+    button1 = panel.addSmallButton("Button 1")
+    button2 = panel.addSmallButton("Button 2")
+    button3 = panel.addSmallButton("Button 3")
+    button4 = panel.addSmallButton("Button 4")
+    assert (panel._placements[button4].row, panel._placements[button4].col) == (0, 1)
+
+    # The cells of the removed widget are reused
+    panel.removeWidget(button2)
+    assert button2 not in panel.widgets()
+    assert button2.parent() is None
+    button5 = panel.addSmallButton("Button 5")
+    assert (panel._placements[button5].row, panel._placements[button5].col) == (2, 0)
+
+    # Compact the panel after removing a widget
+    panel.removeWidget(button1, compact=True)
+    assert panel.widgets() == [button3, button4, button5]
+    assert [(panel._placements[b].row, panel._placements[b].col) for b in panel.widgets()] == [(0, 0), (2, 0), (4, 0)]
+    assert panel._gridLayoutManager.columns == 1
+
+    with pytest.raises(ValueError):
+        panel.removeWidget(button1)
+
+
+def test_panel_add_widgets(qtbot: QtBot):
+    window = QtWidgets.QMainWindow()
+    window.show()
+    qtbot.addWidget(window)
+
+    ribbonbar = RibbonBar()
+    window.setMenuBar(ribbonbar)
+    panel = ribbonbar.addCategory("Category 1").addPanel("Panel 1")
+
+    buttons = [RibbonToolButton() for _ in range(200)]
+    large = QtWidgets.QLabel("Large label")
+    added = panel.addWidgets(buttons[:100] + [{"widget": large, "rowSpan": Large}] + buttons[100:])
+    assert added == buttons[:100] + [large] + buttons[100:]
+    assert panel.widgets() == added
+    assert panel._actionsLayout.count() == 201
+    assert panel._actionsLayout.isEnabled()
+    assert panel._placements[large].rowSpan == panel.largeRows()
+    assert panel._placements[large].row == 0
+    assert panel._placements[buttons[0]].rowSpan == panel.smallRows()
+
+
+def test_panel_row_height(qtbot: QtBot):
+    window = QtWidgets.QMainWindow()
+    window.show()
+    qtbot.addWidget(window)
+
+    ribbonbar = RibbonBar()
+    window.setMenuBar(ribbonbar)
+    panel = ribbonbar.addCategory("Category 1").addPanel("Panel 1")
+    button = panel.addLargeButton("Button")
+    label = panel.addWidget(QtWidgets.QLabel("Label"), fixedHeight=True)
+
+    # the row height is memoized until the geometry changes
+    rowHeight = panel.rowHeight()
+    metrics = panel.layoutPlanner().metrics()
+    panel.addSmallButton("Small")
+    assert panel.layoutPlanner().metrics() is metrics
+
+    # resizing the panel updates the sizes of the existing widgets
+    panel.setFixedHeight(panel.height() + 60)
+    assert panel.rowHeight() == rowHeight + 10
+    assert button.maximumHeight() == panel.layoutPlanner().maximumHeight(panel.largeRows())
+    assert label.height() == label.maximumHeight() == panel.rowHeight() * panel.smallRows()
+
+    panel.setTitleHeight(panel.titleHeight() + 12)
+    assert panel.rowHeight() == rowHeight + 8
+
+
+def test_panel_set_maximum_rows(qtbot: QtBot):
+    window = QtWidgets.QMainWindow()
+    window.show()
+    qtbot.addWidget(window)
+
+    ribbonbar = RibbonBar()
+    window.setMenuBar(ribbonbar)
+    panel = ribbonbar.addCategory("Category 1").addPanel("Panel 1")
+    large = panel.addLargeButton("Large")
+    smalls = [panel.addSmallButton(f"Small {i}") for i in range(4)]
+    tall = panel.addWidget(QtWidgets.QLabel("Tall"), rowSpan=6)
+    assert [panel._placements[w].col for w in smalls] == [1, 1, 1, 2]
+
+    # the same widgets are re-placed with the new rows in one pass
+    ribbonbar.setMaximumRows(3)
+    assert panel.maximumRows() == 3 and panel._gridLayoutManager.rows == 3
+    assert (panel._placements[large].row, panel._placements[large].rowSpan) == (0, 3)
+    assert [(panel._placements[w].row, panel._placements[w].col) for w in smalls] == [(0, 1), (1, 1), (2, 1), (0, 2)]
+    assert panel._placements[tall].rowSpan == 3
+    assert panel._actionsLayout.count() == 6
+    item = panel._placements[smalls[3]].item
+    assert panel._actionsLayout.getItemPosition(panel._actionsLayout.indexOf(item)) == (0, 2, 1, 1)
+    assert large.maximumHeight() == panel.layoutPlanner().maximumHeight(3)
+
+    panel.setSmallRows(3)
+    assert [panel._placements[w].col for w in smalls] == [1, 2, 3, 4]
+
+    panel.setMaximumRows(6)
+    assert [panel._placements[w].col for w in smalls] == [1, 1, 1, 2]
+    assert panel._placements[tall].rowSpan == 6
+
+
+def test_panel_without_item_widgets(qtbot: QtBot):
+    window = QtWidgets.QMainWindow()
+    window.show()
+    qtbot.addWidget(window)
+
+    ribbonbar = RibbonBar()
+    ribbonbar.setItemWidgetsEnabled(False)
+    window.setMenuBar(ribbonbar)
+    panel = ribbonbar.addCategory("Category 1").addPanel("Panel 1")
+    assert not panel.itemWidgetsEnabled()
+
+    buttons = [panel.addSmallButton(f"Button {i}") for i in range(10)]
+    label = panel.addLabel("Label", rowSpan=Large)
+    assert panel._actionsLayout.count() == 11
+    assert panel._actionsLayout.indexOf(label) >= 0
+    assert all(button.parent() is panel for button in buttons)
+    assert not panel.findChildren(RibbonPanelItemWidget)
+
+    panel.removeWidget(buttons[0], compact=True)
+    assert buttons[0].parent() is None
+    assert panel._actionsLayout.indexOf(buttons[0]) == -1
+    assert panel._actionsLayout.getItemPosition(panel._actionsLayout.indexOf(buttons[1])) == (0, 0, 2, 1)
+
+
+def test_panel_size_variants(qtbot: QtBot):
+    class Panel(RibbonPanel):
+        def addSwitch(self, **kwargs):
+            return self.addWidget(QtWidgets.QCheckBox(), **kwargs)
+
+    # the variants are class attributes, created once per class
+    assert "addSmallComboBox" in RibbonPanel.__dict__ and "addLargeSwitch" in Panel.__dict__
+    assert "addSmallSmallButton" not in RibbonPanel.__dict__
+
+    panel = Panel("Panel")
+    qtbot.addWidget(panel)
+    combo = panel.addMediumComboBox(["1", "2"])
+    switch = panel.addLargeSwitch()
+    assert [panel._placements[w].rowSpan for w in (combo, switch)] == [3, 6]
+    assert "smallswitch" in panel.widgetFactories()
+
+    with pytest.raises(AttributeError):
+        panel.addSmallUnknown()
+
+
+def test_panel_stub_size_variants():
+    # every add method of the panels, and its generated variants, is declared in the stub
+    stub = ast.parse(pathlib.Path(inspect.getfile(RibbonPanel)).with_suffix(".pyi").read_text())
+    (cls,) = [node for node in stub.body if isinstance(node, ast.ClassDef) and node.name == "RibbonPanel"]
+    declared = {node.name for node in cls.body if isinstance(node, ast.FunctionDef)}
+    declared |= {target.id for node in cls.body if isinstance(node, ast.Assign) for target in node.targets}
+    defined = {name for name in RibbonPanel.__dict__ if name.startswith("add")}
+    assert defined - declared == set()
+
+
+def test_panel_remove_rowwise_widget(qtbot: QtBot):
+    panel = RibbonPanel("Panel", maxRows=6)
+    qtbot.addWidget(panel)
+    labels = [panel.addWidget(QtWidgets.QLabel(), rowSpan=2) for _ in range(3)]
+    panel.removeWidget(labels[0])
+
+    # the row-wise widget only occupies the first row, the second row is taken by a column-wise widget
+    rowwise = panel.addWidget(QtWidgets.QLabel(), rowSpan=2, mode=RowWise)
+    below = panel.addWidget(QtWidgets.QLabel(), rowSpan=1)
+    assert (panel._placements[rowwise].row, panel._placements[below].row) == (0, 1)
+
+    # removing the row-wise widget only releases its own cells
+    panel.removeWidget(rowwise)
+    assert panel._gridLayoutManager.cells[1][0] is False
+    for _ in range(4):
+        panel.addWidget(QtWidgets.QLabel(), rowSpan=1)
+    cells = [
+        (p.row + r, p.col + c) for p in panel._placements.values() for r in range(p.rowSpan) for c in range(p.colSpan)
+    ]
+    assert len(cells) == len(set(cells))
+
+
+def test_panel_scale_width(qtbot: QtBot, monkeypatch: pytest.MonkeyPatch):
+    window = RibbonBar()
+    qtbot.addWidget(window)
+    panel = window.addCategory("Category").addPanel("Panel")
+    icon = QtGui.QIcon(QtGui.QPixmap(16, 16))
+    for i in range(3):
+        panel.addLargeButton(f"Large {i}", icon=icon)
+    for i in range(4):
+        panel.addMediumButton(f"Medium {i}", icon=icon)
+    panel.addComboBox(["1", "2"])
+    window.show()
+
+    # the widths are those of the panel laid out at the scales, but the widgets are not laid out again
+    measured = {}
+    for scale in (RibbonPanelScale.Large, RibbonPanelScale.Medium, RibbonPanelScale.Small):
+        panel.setScale(scale)
+        measured[scale] = panel.sizeHint().width()
+    panel.setScale(RibbonPanelScale.Large)
+    monkeypatch.setattr(panel, "_relayout", lambda: pytest.fail("the panel is laid out again"))
+    panel._scaleWidths.clear()
+    assert {scale: panel.scaleWidth(scale) for scale in measured} == measured
+    assert measured[RibbonPanelScale.Small] < min(measured[RibbonPanelScale.Large], measured[RibbonPanelScale.Medium])
+    assert panel.scale() == RibbonPanelScale.Large
@@ -0,0 +1,39 @@
+from pytestqt.qtbot import QtBot
+from qtpy import QtCore, QtGui
+
+from pyqtribbon import RibbonBar
+from pyqtribbon.pixmapcache import RibbonPixmapCache, pixmapCache
+from pyqtribbon.utils import DataFile
+
+
+def test_pixmapcache_lru(qtbot: QtBot):
+    icon = QtGui.QIcon(DataFile("icons/python.png"))
+    cache = RibbonPixmapCache(maximumCost=2 * 64 * 64 * 4)
+    large = cache.icon(icon, QtCore.QSize(64, 64))
+    assert cache.icon(icon, QtCore.QSize(64, 64)) is large
+    assert large.availableSizes() == [QtCore.QSize(64, 64)]
+    # the icons are rendered at the physical size
+    cache.icon(icon, QtCore.QSize(32, 32), 2.0)
+    assert len(cache) == 2 and cache.cost() == 2 * 64 * 64 * 4
+
+    # the least recently used icon is evicted when the cost exceeds the maximum cost
+    cache.icon(icon, QtCore.QSize(64, 64))
+    cache.icon(icon, QtCore.QSize(48, 48))
+    assert len(cache) == 2
+    assert cache.icon(icon, QtCore.QSize(64, 64)) is large
+    cache.setMaximumCost(0)
+    assert len(cache) == 0 and cache.cost() == 0
+
+
+def test_pixmapcache_toolbutton(qtbot: QtBot):
+    pixmapCache().clear()
+    ribbonbar = RibbonBar()
+    qtbot.addWidget(ribbonbar)
+    ribbonbar.show()
+    panel = ribbonbar.addCategory("Category").addPanel("Panel")
+    icon = QtGui.QIcon(DataFile("icons/python.png"))
+    buttons = [panel.addLargeButton(f"Button {i}", icon) for i in range(3)]
+    for button in buttons:
+        button.grab()
+    # the buttons of the same size share the rendered icon
+    assert len(pixmapCache()) == 1
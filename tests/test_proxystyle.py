@@ -0,0 +1,104 @@
+from pytestqt.qtbot import QtBot
+from qtpy import QtCore, QtWidgets
+
+from pyqtribbon import RibbonBar, RibbonStyle, RibbonStyleEngine, proxystyle
+from pyqtribbon.proxystyle import RibbonProxyStyle, ribbonProxyStyle
+from pyqtribbon.stylesheets import styleTheme
+from pyqtribbon.theme import RibbonTheme
+from pyqtribbon.toolbutton import RibbonToolButton
+
+
+def test_proxystyle_engine(qtbot: QtBot):
+    ribbonbar = RibbonBar()
+    qtbot.addWidget(ribbonbar)
+    ribbonbar.show()
+    ribbonbar.setStyleEngine(RibbonStyleEngine.ProxyStyle)
+    assert ribbonbar.styleSheet() == ""
+    assert ribbonbar.style() is ribbonProxyStyle(RibbonStyle.Default)
+
+    # the style is propagated to the ribbon widgets added later, not to the embedded widgets
+    panel = ribbonbar.addCategory("Category").addPanel("Panel")
+    button = panel.addLargeButton("Button")
+    table = panel.addTableWidget()
+    QtWidgets.QApplication.processEvents()
+    assert isinstance(panel.style(), RibbonProxyStyle)
+    assert isinstance(button.style(), RibbonProxyStyle)
+    assert not isinstance(table.style(), RibbonProxyStyle)
+
+    ribbonbar.setRibbonStyle(RibbonStyle.Debug)
+    assert button.style() is ribbonProxyStyle(RibbonStyle.Debug)
+    assert ribbonProxyStyle(RibbonStyle.Debug).look(panel).borderColor == "brown"
+    assert ribbonProxyStyle(RibbonStyle.Default).look(panel) is None
+    ribbonbar.grab()
+
+    # the looks are drawn as the styled background of the ribbon widgets
+    assert panel.testAttribute(QtCore.Qt.WidgetAttribute.WA_StyledBackground)
+    image = panel.grab().toImage()
+    assert any(image.pixelColor(x, y).name() == "#a52a2a" for x in range(image.width()) for y in range(image.height()))
+    quickAccessButton = RibbonToolButton()
+    ribbonbar.addQuickAccessButton(quickAccessButton)
+    assert quickAccessButton.style() is ribbonProxyStyle(RibbonStyle.Debug)
+
+    # back to the stylesheet
+    ribbonbar.setStyleEngine(RibbonStyleEngine.StyleSheet)
+    assert not isinstance(button.style(), RibbonProxyStyle)
+    assert ribbonbar.ribbonStyle() == RibbonStyle.Debug
+    assert "RibbonPanel" in ribbonbar.styleSheet()
+
+
+def test_proxystyle_matches_stylesheet(qtbot: QtBot):
+    ribbonbar = RibbonBar()
+    qtbot.addWidget(ribbonbar)
+    ribbonbar.resize(1000, 200)
+    ribbonbar.show()
+    ribbonbar.addCategory("Home")
+    ribbonbar.addCategory("A much longer category title")
+    tabBar = ribbonbar.tabBar()
+
+    # the tabs have the same geometry with the stylesheets and the proxy style
+    for style in RibbonStyle:
+        rects = []
+        for engine in RibbonStyleEngine:
+            ribbonbar.setStyleEngine(engine)
+            ribbonbar.setRibbonStyle(style)
+            QtWidgets.QApplication.processEvents()
+            rects.append([tabBar.tabRect(i) for i in range(tabBar.count())])
+        assert rects[0] == rects[1], style
+
+    # the looks are the variables of the theme, the tool bars of the title widget have a border
+    proxyStyle = ribbonProxyStyle(RibbonStyle.Debug)
+    assert proxyStyle.look(ribbonbar.quickAccessToolBar()).borderColor == "blue"
+    assert isinstance(ribbonbar.quickAccessToolBar().style(), RibbonProxyStyle)
+    assert proxyStyle.tabLook().selectedColor == styleTheme(RibbonStyle.Debug).variable("accentColor")
+    theme = RibbonTheme(styleTheme(RibbonStyle.Debug).template(), accentColor="red", borderColor="green")
+    ribbonbar.setRibbonTheme(theme)
+    assert ribbonbar.styleEngine() == RibbonStyleEngine.ProxyStyle and ribbonbar.styleSheet() == ""
+    assert tabBar.style().ribbonTheme() is theme and tabBar.style().tabLook().selectedColor == "red"
+    popup = ribbonbar.addCategory("Category").addPanel("Panel").addGallery()._popupWidget  # noqa
+    assert tabBar.style().look(popup).borderColor == "green"
+
+
+def test_proxystyle_menu_indicator(qtbot: QtBot):
+    ribbonbar = RibbonBar()
+    qtbot.addWidget(ribbonbar)
+    ribbonbar.setStyleEngine(RibbonStyleEngine.ProxyStyle)
+    panel = ribbonbar.addCategory("Category").addPanel("Panel")
+    small, large = panel.addSmallButton("Small"), panel.addLargeButton("Large")
+    for button in (small, large):
+        button.addRibbonMenu()
+        button.setPopupMode(QtWidgets.QToolButton.ToolButtonPopupMode.InstantPopup)
+
+    # at the right of the small buttons and at the bottom of the large buttons
+    rects = []
+    for button in (small, large):
+        option = QtWidgets.QStyleOptionToolButton()
+        button.initStyleOption(option)
+        rects.append(ribbonProxyStyle(RibbonStyle.Default)._menuIndicatorRect(option, button))  # noqa
+    assert rects[0].right() == small.rect().right() and abs(rects[0].center().y() - small.rect().center().y()) <= 1
+    assert rects[1].bottom() == large.rect().bottom() and abs(rects[1].center().x() - large.rect().center().x()) <= 1
+
+
+def test_proxystyle_cache_released():
+    ribbonProxyStyle(RibbonStyle.Default)
+    QtWidgets.QApplication.instance().aboutToQuit.emit()
+    assert proxystyle._proxyStyles == {}
@@ -1,7 +1,10 @@
+import sys
+
+import pytest
 from pytestqt.qtbot import QtBot
 from qtpy import QtWidgets
 
-from pyqtribbon import RibbonBar
+from pyqtribbon import RibbonBar, logger
 
 
 def test_ribbonbar(qtbot: QtBot):
@@ -18,3 +21,16 @@ def test_ribbonbar(qtbot: QtBot):
 
     # Show the window
     window.resize(1800, 350)
+
+
+def test_ribbon_exception_hook(qtbot: QtBot, monkeypatch: pytest.MonkeyPatch):
+    # the hook is installed by the first ribbon, but a hook of the application is kept
+    hook = lambda *args: None  # noqa: E731
+    monkeypatch.setattr(logger, "_qtExceptionHook", None)
+    monkeypatch.setattr(sys, "excepthook", hook)
+    qtbot.addWidget(RibbonBar())
+    assert sys.excepthook is hook and logger._qtExceptionHook is None
+
+    monkeypatch.setattr(sys, "excepthook", sys.__excepthook__)
+    qtbot.addWidget(RibbonBar())
+    assert sys.excepthook == logger._qtExceptionHook.exception_hook
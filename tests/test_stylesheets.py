@@ -0,0 +1,56 @@
+from pytestqt.qtbot import QtBot
+
+from pyqtribbon import RibbonBar, RibbonStyle, stylesheets
+
+
+def test_stylesheets_cache(qtbot: QtBot, monkeypatch):
+    reads = []
+    readStyleFile = stylesheets._readStyleFile
+    monkeypatch.setattr(
+        stylesheets, "_readStyleFile", lambda filename: reads.append(filename) or readStyleFile(filename)
+    )
+    stylesheets.invalidateStyleSheets()
+
+    # each style is read once per process
+    for _ in range(3):
+        ribbonbar = RibbonBar()
+        qtbot.addWidget(ribbonbar)
+        ribbonbar.setRibbonStyle(RibbonStyle.Debug)
+        ribbonbar.setRibbonStyle(RibbonStyle.Default)
+    templates = ["styles/base.qss.in", "styles/fonts.qss.in"]
+    assert reads == [*templates, "styles/default.qss.in", *templates, "styles/debug.qss.in"]
+    assert ribbonbar.styleSheet() == stylesheets.styleSheet(RibbonStyle.Default)
+    assert "RibbonPanel" in stylesheets.styleSheet(RibbonStyle.Debug)
+
+    # an invalidated style is read again
+    stylesheets.invalidateStyleSheets(RibbonStyle.Debug)
+    stylesheets.styleSheet(RibbonStyle.Debug)
+    stylesheets.styleSheet(RibbonStyle.Default)
+    assert reads[6:] == [*templates, "styles/debug.qss.in"]
+
+
+def test_lazy_style_switch(qtbot: QtBot):
+    ribbonbar = RibbonBar()
+    qtbot.addWidget(ribbonbar)
+    ribbonbar.show()
+    category1 = ribbonbar.addCategory("Category 1")
+    panel1 = category1.addPanel("Panel")
+    category2 = ribbonbar.addCategory("Category 2")
+    panel2 = category2.addPanel("Panel")
+    ribbonbar.setLazyStyleSwitch(True)
+    assert ribbonbar.styleSheet() == stylesheets.scopedStyleSheet()
+    assert 'RibbonBar[ribbonStyle="Debug"] RibbonPanel {' in ribbonbar.styleSheet()
+
+    # only the current category is restyled, the debug style draws a border around the panels
+    ribbonbar.setRibbonStyle(RibbonStyle.Debug)
+    assert ribbonbar.property("ribbonStyle") == "Debug"
+    assert (panel1.frameWidth(), panel2.frameWidth()) == (2, 0)
+
+    # the hidden category is restyled when it is shown
+    ribbonbar.setCurrentCategory(category2)
+    assert (panel1.frameWidth(), panel2.frameWidth()) == (2, 2)
+
+    ribbonbar.setLazyStyleSwitch(False)
+    ribbonbar.setRibbonStyle(RibbonStyle.Default)
+    assert (panel1.frameWidth(), panel2.frameWidth()) == (0, 0)
+    assert ribbonbar.styleSheet() == stylesheets.styleSheet(RibbonStyle.Default)
@@ -0,0 +1,67 @@
+from pytestqt.qtbot import QtBot
+from qtpy import QtCore, QtGui, QtWidgets
+
+from pyqtribbon import RibbonBar
+from pyqtribbon.constants import RibbonStyle, RibbonStyleEngine
+
+
+def test_tabbar_change_color(qtbot: QtBot):
+    window = QtWidgets.QMainWindow()
+    window.show()
+    qtbot.addWidget(window)
+
+    ribbonbar = RibbonBar()
+    window.setMenuBar(ribbonbar)
+    ribbonbar.addCategory("Category 1")
+    ribbonbar.addCategory("Category 2")
+    context = ribbonbar.addContextCategory("Context 1", QtCore.Qt.GlobalColor.red)
+    context.showContextCategory()
+    tabBar = ribbonbar.tabBar()
+
+    contextIndex = tabBar.indexOf("Context 1")
+    tabBar.setCurrentIndex(contextIndex)
+    assert tabBar.tabTextColor(contextIndex) == QtGui.QColor(QtCore.Qt.GlobalColor.red)
+
+    # only the current tab is colored
+    index = tabBar.indexOf("Category 2")
+    tabBar.setCurrentIndex(index)
+    assert tabBar.tabTextColor(index) == QtGui.QColor(QtCore.Qt.GlobalColor.black)
+    assert [tabBar.tabTextColor(i).isValid() for i in range(tabBar.count())] == [
+        i == index for i in range(tabBar.count())
+    ]
+    assert tabBar.styleSheet() == ""  # the tab bar is not restyled when the current tab changes
+
+
+def redPixels(tabBar, index):
+    QtWidgets.QApplication.processEvents()
+    image = tabBar.grab(tabBar.tabRect(index)).toImage()
+    return sum(
+        1
+        for x in range(image.width())
+        for y in range(image.height())
+        if (lambda c: c.red() > 150 and c.green() < 100 and c.blue() < 100)(image.pixelColor(x, y))
+    )
+
+
+def test_tabbar_context_color_painted(qtbot: QtBot):
+    ribbonbar = RibbonBar()
+    qtbot.addWidget(ribbonbar)
+    ribbonbar.resize(800, 200)
+    ribbonbar.show()
+    ribbonbar.addCategory("Category 1")
+    context = ribbonbar.addContextCategory("Context 1", QtCore.Qt.GlobalColor.red)
+    context.showContextCategory()
+    tabBar = ribbonbar.tabBar()
+    contextIndex = tabBar.indexOf("Context 1")
+    tabBar.setCurrentIndex(contextIndex)
+
+    # the text of the selected context tab is painted red with the stylesheets of the styles and the proxy style
+    for engine in RibbonStyleEngine:
+        ribbonbar.setStyleEngine(engine)
+        for style in (RibbonStyle.Default, RibbonStyle.Debug):
+            ribbonbar.setRibbonStyle(style)
+            assert redPixels(tabBar, contextIndex) > 0, (engine, style)
+    assert tabBar.styleSheet() == ""  # the proxy style is not replaced by a stylesheet
+
+    tabBar.setCurrentIndex(tabBar.indexOf("Category 1"))
+    assert redPixels(tabBar, tabBar.indexOf("Category 1")) == 0
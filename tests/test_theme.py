@@ -0,0 +1,105 @@
+import string
+
+import pytest
+from pytestqt.qtbot import QtBot
+from qtpy import QtGui, QtWidgets
+
+from pyqtribbon import RibbonBar, RibbonStyle
+from pyqtribbon.stylesheets import styleSheet, styleTheme
+from pyqtribbon.theme import RibbonTheme, defaultFontSizes
+from pyqtribbon.utils import readDataFile
+
+
+def test_theme_compile(monkeypatch):
+    substitutions = []
+    substitute = string.Template.substitute
+    monkeypatch.setattr(string.Template, "substitute", lambda *args: substitutions.append(1) or substitute(*args))
+
+    theme = RibbonTheme("RibbonTabBar::tab { color: $accentColor; font-size: $fontSize; }", fontSize="10pt")
+    assert theme.styleSheet() == "RibbonTabBar::tab { color: blue; font-size: 10pt; }"
+    assert theme.styleSheet() is theme.styleSheet()
+    assert len(substitutions) == 1
+
+    # changing a variable compiles the template again
+    theme.setVariable("accentColor", QtGui.QColor(255, 0, 0))
+    theme.setVariable("fontSize", "10pt")
+    assert theme.styleSheet() == "RibbonTabBar::tab { color: #ff0000; font-size: 10pt; }"
+    assert len(substitutions) == 2
+    assert theme.variable("contextColor0") == "#c9599c"
+
+    # the bundled styles are themes with the default values
+    assert "$" not in styleSheet(RibbonStyle.Default)
+    assert "solid red" in RibbonTheme(styleTheme(RibbonStyle.Default).template(), accentColor="red").styleSheet()
+    assert "font-size: 14pt" in RibbonTheme(styleTheme(RibbonStyle.Default).template(), tabFontSize="14pt").styleSheet()
+
+
+def test_theme_style_files():
+    # the shipped qss files are valid stylesheets, the templates compiled with the default colors
+    for name in ("base", "default", "debug"):
+        sheet = readDataFile(f"styles/{name}.qss")
+        assert "$" not in sheet
+        assert sheet == RibbonTheme(readDataFile(f"styles/{name}.qss.in")).styleSheet(), f"{name}.qss is outdated"
+
+
+def test_theme_variables(qtbot: QtBot):
+    ribbonbar = RibbonBar()
+    qtbot.addWidget(ribbonbar)
+
+    # the font of the tabs and the title is 3 points larger than the font of the application
+    font = QtWidgets.QApplication.font()
+    assert defaultFontSizes()["tabFontSize"] == f"{font.pointSize() + 3}pt"
+    assert f"font-size: {font.pointSize() + 3}pt" in ribbonbar.styleSheet()
+    assert ribbonbar.tabBar().font().pointSize() == font.pointSize() + 3
+
+    # the font sizes follow the font of the application
+    larger = QtGui.QFont(font)
+    larger.setPointSize(font.pointSize() + 2)
+    QtWidgets.QApplication.setFont(larger)
+    try:
+        assert f"font-size: {font.pointSize() + 5}pt" in styleTheme(RibbonStyle.Default).styleSheet()
+        assert f"font-size: {font.pointSize() + 5}pt" in ribbonbar.styleSheet()
+    finally:
+        QtWidgets.QApplication.setFont(font)
+    assert f"font-size: {font.pointSize() + 3}pt" in ribbonbar.styleSheet()
+
+    # the context categories take their default colors from the theme
+    assert ribbonbar.addContextCategory("Context 1", None).color().name() == ribbonbar.ribbonTheme().variable(
+        "contextColor0"
+    )
+    ribbonbar.setRibbonTheme(RibbonTheme(styleTheme(RibbonStyle.Default).template(), contextColor1="red"))
+    assert ribbonbar.addContextCategory("Context 2", None).color().name() == "#ff0000"
+
+
+def test_theme_switch_benchmark(qtbot: QtBot, monkeypatch: pytest.MonkeyPatch):
+    ribbonbar = RibbonBar()
+    qtbot.addWidget(ribbonbar)
+    ribbonbar.show()
+    for i in range(5):
+        category = ribbonbar.addCategory(f"Category {i}")
+        for j in range(4):
+            panel = category.addPanel(f"Panel {j}")
+            for k in range(6):
+                panel.addSmallButton(f"Button {k}")
+
+    # each switch sets the stylesheet of the ribbon bar once, with the updates disabled
+    calls = []
+    setStyleSheet = QtWidgets.QWidget.setStyleSheet
+
+    def recordStyleSheet(widget, sheet):
+        calls.append((widget, widget.updatesEnabled()))
+        setStyleSheet(widget, sheet)
+
+    monkeypatch.setattr(QtWidgets.QWidget, "setStyleSheet", recordStyleSheet)
+    template = styleTheme(RibbonStyle.Default).template()
+    themes = [RibbonTheme(template, accentColor=color) for color in ("red", "green")]
+    for i in range(10):
+        ribbonbar.setRibbonTheme(themes[i % 2])
+    assert calls == [(ribbonbar, False)] * 10
+    monkeypatch.undo()
+
+    assert ribbonbar.ribbonTheme() is themes[1]
+    assert ribbonbar.styleSheet() == themes[1].styleSheet()
+    assert ribbonbar.updatesEnabled()
+
+    ribbonbar.setRibbonStyle(RibbonStyle.Default)
+    assert ribbonbar.ribbonTheme() is styleTheme(RibbonStyle.Default)
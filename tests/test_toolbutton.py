@@ -0,0 +1,27 @@
+from pytestqt.qtbot import QtBot
+from qtpy import QtWidgets
+
+from pyqtribbon import Large, RibbonBar, Small
+
+
+def test_toolbutton_button_style(qtbot: QtBot):
+    window = QtWidgets.QMainWindow()
+    window.show()
+    qtbot.addWidget(window)
+
+    ribbonbar = RibbonBar()
+    window.setMenuBar(ribbonbar)
+    panel = ribbonbar.addCategory("Category 1").addPanel("Panel 1")
+    buttons = [panel.addLargeButton("Large"), panel.addSmallButton("Small")]
+
+    # the buttons only set a property, the menu indicator is styled by the ribbon stylesheet
+    assert [button.property("buttonStyle") for button in buttons] == ["Large", "Small"]
+    assert all(button.styleSheet() == "" for button in buttons)
+    assert 'RibbonToolButton[buttonStyle="Small"]::menu-indicator' in ribbonbar.styleSheet()
+
+    buttons[0].setButtonStyle(Small)
+    assert buttons[0].property("buttonStyle") == "Small"
+    buttons[0].setButtonStyle(Large)
+    buttons[0].setMaximumIconSize(32)
+    assert buttons[0].property("buttonStyle") == "Large"
+    assert buttons[0].iconSize().height() == 32
@@ -1,7 +1,19 @@
+import copy
+import warnings
+
+import pytest
 from pytestqt.qtbot import QtBot
 from qtpy import QtWidgets
 
 from pyqtribbon import RibbonBar, RibbonCategoryStyle
+from pyqtribbon.constants import Large
+from pyqtribbon.layoutplanner import (
+    RibbonGridLayoutManager,
+    RibbonLayoutItem,
+    RibbonLayoutPlanCache,
+    layoutItemBy,
+)
+from pyqtribbon.panel import RibbonPanel
 
 
 def test_filemenu(qtbot: QtBot):
@@ -79,3 +91,119 @@ def test_filemenu(qtbot: QtBot):
 
     # Show the window
     window.resize(1800, 350)
+
+
+def test_layout_plan_cache(qtbot: QtBot, monkeypatch, tmp_path):
+    def spec():
+        return {
+            "Category": {
+                "panels": {
+                    "Panel": {
+                        "widgets": {
+                            "Button": {"type": "Button", "arguments": {"text": "Button"}},
+                            "Label": {"type": "Label", "args": ("Label",)},
+                            "Label 2": {"type": "Label", "args": ("Label 2",), "kwargs": {"colSpan": 2}},
+                        },
+                    },
+                },
+            },
+        }
+
+    requested = []
+    request_cells = RibbonGridLayoutManager.request_cells
+    monkeypatch.setattr(
+        RibbonGridLayoutManager, "request_cells", lambda self, *a: requested.append(a) or request_cells(self, *a)
+    )
+
+    placements, searches = [], []
+    for _ in range(2):
+        ribbonbar = RibbonBar()
+        qtbot.addWidget(ribbonbar)
+        ribbonbar.setLayoutPlanCache(str(tmp_path))
+        requested.clear()
+        panel = ribbonbar.addCategoriesBy(spec())["Category"].panel("Panel")
+        searches.append(len(requested))
+        placements.append([(p.row, p.col, p.rowSpan, p.colSpan) for p in panel._placements.values()])
+        assert len(list(tmp_path.glob("*.json"))) == 1
+    assert placements[0] == placements[1]
+
+    # the cells are searched in the cold run only, the warm run replays the cached plan
+    assert searches == [3, 0]
+
+
+def test_lazy_categories(qtbot: QtBot):
+    def panels(text):
+        return {"Panel": {"widgets": {"Button": {"type": "Button", "arguments": {"text": text}}}}}
+
+    ribbonbar = RibbonBar()
+    qtbot.addWidget(ribbonbar)
+    ribbonbar.show()
+    categories = ribbonbar.addCategoriesBy(
+        {
+            "Category 1": {"panels": panels("Button 1")},
+            "Category 2": {"panels": panels("Button 2")},
+            "Category 3": {"style": RibbonCategoryStyle.Context, "panels": panels("Button 3")},
+        },
+        lazy=True,
+    )
+
+    # only the current category is built
+    assert [category.hasPendingPanels() for category in categories.values()] == [False, True, True]
+    assert categories["Category 1"]._panels["Panel"].widgets()[0].text() == "Button 1"
+
+    # the panels are built when the category is shown
+    ribbonbar.showCategoryByIndex(1)
+    assert not categories["Category 2"].hasPendingPanels()
+    assert categories["Category 2"]._panels["Panel"].widgets()[0].text() == "Button 2"
+
+    # or when the panels are requested
+    assert categories["Category 3"].panels()["Panel"].widgets()[0].text() == "Button 3"
+    assert not categories["Category 3"].hasPendingPanels()
+
+
+def test_widget_factories(qtbot: QtBot, tmp_path):
+    # the type is registered on throwaway classes, the registration does not leak into RibbonPanel
+    class BasePanel(RibbonPanel):
+        pass
+
+    class ColorPanel(BasePanel):
+        pass
+
+    assert "colorlabel" not in ColorPanel.widgetFactories()  # the table of the subclass is updated once built
+    BasePanel.registerWidgetType("ColorLabel", lambda panel, color, **kwargs: panel.addLabel(color, **kwargs))
+    assert ColorPanel.widgetFactories()["colorlabel"] is BasePanel.widgetFactories()["colorlabel"]
+    assert "colorlabel" not in RibbonPanel.widgetFactories()
+
+    data = {
+        "combo": {"type": "SmallComboBox", "args": (["1", "2"],)},
+        "toggle": {"type": "largetogglebutton", "kwargs": {"text": "Toggle"}},
+        "color": {"type": "ColorLabel", "args": ("red",), "kwargs": {"colSpan": 2}},
+    }
+    expected = copy.deepcopy(data)
+    for panel in (BasePanel("Panel 1"), ColorPanel("Panel 2")):
+        qtbot.addWidget(panel)
+        widgets = panel.addWidgetsBy(data)
+        assert isinstance(widgets["combo"], QtWidgets.QComboBox) and widgets["combo"].count() == 2
+        assert widgets["toggle"].isCheckable()
+        assert widgets["color"].text() == "red"
+        assert panel._placements[widgets["color"]].colSpan == 2  # noqa
+    assert data == expected
+
+    with pytest.raises(ValueError):
+        RibbonPanel("Panel 3").addWidgetsBy({"color": {"type": "ColorLabel", "args": ("red",)}})
+
+    # the cached plans of the registered types are planned with their row span and kind
+    BasePanel.registerWidgetType(
+        "ColorButton", lambda panel, color, **kwargs: panel.addButton(color, **kwargs), Large, "button"
+    )
+    assert layoutItemBy("ColorButton", panelClass=ColorPanel) == RibbonLayoutItem(Large, kind="button")
+    cache = RibbonLayoutPlanCache(str(tmp_path))
+    data = {"button": {"type": "ColorButton", "args": ("blue",)}, "label": {"type": "ColorLabel", "args": ("red",)}}
+    for title in ("Panel 4", "Panel 5"):
+        panel = ColorPanel(title)
+        qtbot.addWidget(panel)
+        panel.setLayoutPlanCache(cache)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")  # the cached placements match the widgets
+            widgets = panel.addWidgetsBy(data)
+        assert panel._placements[widgets["button"]].rowSpan == 6  # noqa
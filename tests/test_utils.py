@@ -0,0 +1,31 @@
+from pytestqt.qtbot import QtBot
+from qtpy import QtCore
+
+from pyqtribbon import RibbonBar, utils
+from pyqtribbon.utils import DataIcon
+
+
+def test_data_icon_cache(qtbot: QtBot):
+    utils.clearDataCache()
+    assert DataIcon("icons/up.png") is DataIcon("icons/up.png")
+    assert not DataIcon("icons/up.png").isNull()
+
+    # the bundled icons of the ribbon widgets are shared
+    ribbonbar = RibbonBar()
+    qtbot.addWidget(ribbonbar)
+    panels = [ribbonbar.addCategory(f"Category {i}").addPanel("Panel") for i in range(2)]
+    assert panels[0].panelOptionButton().icon().cacheKey() == panels[1].panelOptionButton().icon().cacheKey()
+    assert panels[0].panelOptionButton().icon().cacheKey() == DataIcon("icons/linking.png").cacheKey()
+
+
+def test_data_resources(qtbot: QtBot, monkeypatch):
+    # the data files are read from the compiled resource bundle
+    assert utils.DataResource("icons/up.png") == ":/pyqtribbon/icons/up.png"
+    assert QtCore.QFile.exists(":/pyqtribbon/styles/base.qss")
+    with open(utils.DataFile("styles/base.qss"), encoding="utf-8") as f:
+        assert utils.readDataFile("styles/base.qss") == f.read()
+
+    # the loose files are used when the bundle can not be registered
+    monkeypatch.setattr(utils, "_resourcesRegistered", False)
+    assert utils.DataResource("icons/up.png") == utils.DataFile("icons/up.png")
+    assert "RibbonTabBar" in utils.readDataFile("styles/base.qss")